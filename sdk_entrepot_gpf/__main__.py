@@ -18,6 +18,7 @@ from sdk_entrepot_gpf.io.Color import Color
 from sdk_entrepot_gpf.io.DescriptorFileReader import DescriptorFileReader
 from sdk_entrepot_gpf.io.Errors import ConflictError, NotFoundError
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 from sdk_entrepot_gpf.store.Annexe import Annexe
 from sdk_entrepot_gpf.store.Metadata import Metadata
 from sdk_entrepot_gpf.store.Static import Static
@@ -238,7 +239,7 @@ class Main:
         # Requêtage
         o_response = ApiRequester().route_request("me_get")
         # Formatage
-        d_info = o_response.json()
+        d_info = JsonConverter().loads(o_response.content)
         # Info de base
         l_texts = [
             "Vos informations :",
@@ -480,8 +481,7 @@ class Main:
         else:
             d_infos_filter = StoreEntity.filter_dict_from_str(self.o_args.infos)
             d_tags_filter = StoreEntity.filter_dict_from_str(self.o_args.tags)
-            l_uploads = Upload.api_list(infos_filter=d_infos_filter, tags_filter=d_tags_filter, datastore=self.datastore)
-            for o_upload in l_uploads:
+            for o_upload in Upload.api_iter(infos_filter=d_infos_filter, tags_filter=d_tags_filter, datastore=self.datastore):
                 Config().om.info(f"{o_upload}")
 
     def dataset(self) -> None:
@@ -710,8 +710,7 @@ class Main:
         else:
             # on liste toutes les annexes selon les filtres
             d_infos_filter = StoreEntity.filter_dict_from_str(self.o_args.infos)
-            l_annexes = Annexe.api_list(infos_filter=d_infos_filter, datastore=self.datastore)
-            for o_annexe in l_annexes:
+            for o_annexe in Annexe.api_iter(infos_filter=d_infos_filter, datastore=self.datastore):
                 Config().om.info(f"{o_annexe}")
 
     @staticmethod
@@ -763,8 +762,7 @@ class Main:
         else:
             # on liste toutes les fichiers static selon les filtres
             d_infos_filter = StoreEntity.filter_dict_from_str(self.o_args.infos)
-            l_statics = Static.api_list(infos_filter=d_infos_filter, datastore=self.datastore)
-            for o_static in l_statics:
+            for o_static in Static.api_iter(infos_filter=d_infos_filter, datastore=self.datastore):
                 Config().om.info(f"{o_static}")
 
     @staticmethod
@@ -823,8 +821,7 @@ class Main:
         else:
             # on liste toutes les fichiers métadonnées selon les filtres
             d_infos_filter = StoreEntity.filter_dict_from_str(self.o_args.infos)
-            l_metadatas = Metadata.api_list(infos_filter=d_infos_filter, datastore=self.datastore)
-            for o_metadata in l_metadatas:
+            for o_metadata in Metadata.api_iter(infos_filter=d_infos_filter, datastore=self.datastore):
                 Config().om.info(f"{o_metadata}")
 
     @staticmethod
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Dict, Optional
+
+from sdk_entrepot_gpf.pattern.ScopedSingleton import ScopedSingleton
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
+
+
+class AsyncAuthentifier(metaclass=ScopedSingleton):
+    """Singleton, pendant asyncio de l'Authentifier.
+
+    Le jeton est géré par l'Authentifier (même configuration, même jeton partagé avec les appels synchrones).
+    Tant que le jeton actuel est valide, il est renvoyé directement, sans verrou ni thread. S'il doit être récupéré
+    ou renouvelé auprès de KeyCloak, la requête est faite dans le pool de threads de l'AsyncApiRequester et une seule
+    coroutine à la fois la déclenche : les autres attendent son résultat.
+
+    Attributes:
+        __lock (Optional[asyncio.Lock]): verrou sérialisant la récupération du jeton (créé dans la boucle courante)
+        __loop (Optional[asyncio.AbstractEventLoop]): boucle d'événements à laquelle le verrou est rattaché
+    """
+
+    def __init__(self) -> None:
+        self.__lock: Optional[asyncio.Lock] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __get_lock(self) -> asyncio.Lock:
+        """Renvoie le verrou rattaché à la boucle d'événements courante (un verrou asyncio ne peut pas changer de boucle).
+
+        Returns:
+            verrou de la boucle courante
+        """
+        o_loop = asyncio.get_running_loop()
+        if self.__lock is None or self.__loop is not o_loop:
+            self.__lock = asyncio.Lock()
+            self.__loop = o_loop
+        return self.__lock
+
+    async def get_access_token_string(self) -> str:
+        """Retourne le jeton d'authentification sous forme de chaîne de caractères, cf. `Authentifier.get_access_token_string`.
+
+        Returns:
+            Un jeton valide
+
+        Raises:
+            AuthentificationError : Levée si la récupération de jeton échoue au bout de `nb_attempts` tentatives
+        """
+        # Jeton valide et pas encore à renouveler : ni verrou ni thread
+        s_token = Authentifier().get_current_access_token_string()
+        if s_token is not None:
+            return s_token
+        async with self.__get_lock():
+            return await AsyncApiRequester().run_sync(Authentifier().get_access_token_string)
+
+    async def get_http_header(self, json_content_type: bool = False) -> Dict[str, str]:
+        """Renvoie une entête HTTP d'authentification, cf. `Authentifier.get_http_header`.
+
+        Args:
+            json_content_type (bool): indique si le `content-type` `application/json` doit être spécifié
+
+        Returns:
+            Dictionnaire de la forme : `{"Authorization": "Bearer <JETON>", "content-type":"application/json"}`
+
+        Raises:
+            AuthentificationError: Levée si la récupération de jeton a posé problème
+        """
+        d_http_header = {"Authorization": f"Bearer {await self.get_access_token_string()}"}
+        if json_content_type:
+            d_http_header["content-type"] = "application/json"
+        return d_http_header
+
+    def revoke_token(self, access_token: Optional[str] = None) -> None:
+        """Révoque le token actuellement utilisé pour forcer la récupération d'un nouveau token, cf. `Authentifier.revoke_token`.
+
+        Args:
+            access_token (Optional[str], optional): jeton refusé par l'API (révoqué seulement s'il est toujours le jeton actuel)
+        """
+        Authentifier().revoke_token(access_token)
@@ -1,35 +1,76 @@
+import threading
 import time
 import traceback
 from http import HTTPStatus
+from urllib.parse import urlencode
 from typing import Dict, Optional
 import requests
 import pyotp
 
-from sdk_entrepot_gpf.pattern.Singleton import Singleton
+from sdk_entrepot_gpf.pattern.ScopedSingleton import ScopedSingleton
 from sdk_entrepot_gpf.auth.Token import Token
+from sdk_entrepot_gpf.auth.TokenCache import TokenCache
+from sdk_entrepot_gpf.auth.TokenRefresher import TokenRefresher
 from sdk_entrepot_gpf.auth.Errors import AuthentificationError
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError
+from sdk_entrepot_gpf.io.Metrics import Metrics
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy, RetryStats
 
 
-class Authentifier(metaclass=Singleton):
+class Authentifier(metaclass=ScopedSingleton):
     """Singleton permettant de s'authentifier auprès du serveur KeyCloak.
 
+    Le jeton est renouvelé par anticipation, `sec_refresh_ahead` secondes avant son expiration (au plus la moitié de
+    sa durée de validité) : une requête ne part jamais avec un jeton expirant pendant son exécution. Si le
+    renouvellement anticipé échoue, le jeton actuel est utilisé tant qu'il est valide. Le renouvellement peut aussi
+    être fait par un thread d'arrière-plan (`background_refresh`, `start_background_refresh()`) : les requêtes
+    (synchrones ou asyncio) n'attendent alors jamais le serveur KeyCloak.
+
+    Le renouvellement utilise le jeton de rafraîchissement renvoyé par KeyCloak (grant `refresh_token`) tant qu'il est
+    valide, sans renvoyer les identifiants ni générer de code TOTP ; sinon (ou s'il est refusé) le grant complet
+    (`password` ou `client_credentials`) est utilisé.
+
+    La récupération du jeton est protégée par un verrou (« single-flight ») : quand le jeton est à récupérer, un seul
+    appelant (thread, ou coroutine via l'AsyncAuthentifier) interroge KeyCloak, les autres attendent puis utilisent le
+    jeton obtenu. Pendant un renouvellement anticipé, les autres appelants utilisent le jeton actuel sans attendre.
+
+    Si un répertoire de cache est configuré (`token_cache_directory`), le jeton est stocké sur disque et réutilisé
+    par les exécutions suivantes tant qu'il est valide (ou rafraîchi via son jeton de rafraîchissement).
+
     Attributes:
         __token_url (str): url permettant de récupérer le jeton d'authentification
         __login (str): login pour l'authentification
         __password (str): password pour l'authentification
         __client_id (str): identification client devant être donné au serveur d'authentification
-        __nb_attempts (int): nombre de tentatives possibles en cas de problème rencontré pendant la récupération du jeton
-        __sec_between_attempt (int): nombre de secondes entre deux tentatives en cas de problème rencontré pendant la récupération du jeton
+        __retry_policy (RetryPolicy): politique de nouvelles tentatives en cas de problème rencontré pendant la récupération du jeton
+        __timeout (TimeoutType): délais d'attente (connexion, lecture) des requêtes au serveur d'authentification
+        __request_params (Dict[str, str]): paramètres du grant complet (`password` ou `client_credentials`)
+        __refresh_params (Optional[Dict[str, str]]): paramètres du grant `refresh_token` (None si désactivé)
         __last_token (Token): sauvegarde du dernier jeton récupéré (pour éviter de multiples requêtes au serveur KeyCloak)
+        __refresh_margin (float): marge (en secondes) avant l'expiration du jeton à partir de laquelle il est renouvelé
+        __refresher (Optional[TokenRefresher]): thread de renouvellement en arrière-plan (None si désactivé)
+        __token_cache (Optional[TokenCache]): cache disque du jeton (None si désactivé)
+        __lock (threading.Lock): verrou sérialisant la récupération, le renouvellement et la révocation du jeton
     """
 
+    # Nom de route sous lequel les récupérations de jeton sont enregistrées dans les métriques (cf. `Metrics`)
+    METRICS_ROUTE = "token"
+    # Délai (en secondes) avant un nouvel essai du renouvellement en arrière-plan si celui-ci a échoué
+    REFRESH_RETRY_DELAY = 10.0
+
     def __init__(self) -> None:
         # Sauvegarde de la conf comme attributs d'instance
         self.__token_url: str = Config().get_str("store_authentification", "token_url")
-        self.__nb_attempts: int = Config().get_int("store_authentification", "nb_attempts")
-        self.__sec_between_attempt: int = Config().get_int("store_authentification", "sec_between_attempt")
+        # Politique de tentatives : nb_attempts correspond ici au nombre de nouvelles tentatives après la première
+        self.__retry_policy = RetryPolicy.from_config("store_authentification", nb_attempts=Config().get_int("store_authentification", "nb_attempts") + 1)
+        self.__timeout = Deadline.timeout_from_config("store_authentification")
         self.__request_params = self.__get_request_params()
+        # Paramètres du grant refresh_token : identification du client, sans les identifiants de l'utilisateur
+        self.__refresh_params: Optional[Dict[str, str]] = None
+        if Config().get_bool("store_authentification", "use_refresh_token", fallback=True):
+            self.__refresh_params = {"grant_type": "refresh_token", **{k: v for k, v in self.__request_params.items() if k in ("client_id", "client_secret")}}
         # Gestion TOTP
         self.__totp: Optional[pyotp.TOTP] = None
         s_totp_key: Optional[str] = Config().get("store_authentification", "totp_key")
@@ -42,6 +83,14 @@ class Authentifier(metaclass=Singleton):
         }
         # Permettra la sauvegarde du dernier jeton récupéré (pour éviter de multiples requêtes au serveur KeyCloak)
         self.__last_token: Optional[Token] = None
+        # Cache disque du jeton, partagé entre les exécutions (lu quand aucun jeton n'a encore été récupéré)
+        self.__token_cache = TokenCache.from_config()
+        self.__lock = threading.Lock()
+        # Renouvellement anticipé du jeton, éventuellement en arrière-plan (thread démarré à la première récupération)
+        self.__refresh_margin = Config().get_float("store_authentification", "sec_refresh_ahead", fallback=30)
+        self.__refresher: Optional[TokenRefresher] = None
+        if Config().get_bool("store_authentification", "background_refresh", fallback=False):
+            self.__refresher = TokenRefresher(self.__background_refresh)
 
     def __get_request_params(self) -> Dict[str, str]:
         """Lit la config, la compile et renvoie un dictionnaire contenant les prams de connection.
@@ -70,56 +119,94 @@ class Authentifier(metaclass=Singleton):
             raise AuthentificationError(f"Type d'authentification « {s_grant_type} » inconnue. Vérifiez le paramétrage 'store_authentification.grant_type'.")
         return d_params
 
-    def __request_new_token(self, nb_attempts: int) -> None:
-        """Récupère un nouveau jeton de zéro et le sauvegarde.
-
-        En cas de problème pendant la récupération, essaie `nb_attempts` fois en attendant `__sec_between_attempt` secondes entre plusieurs tentatives.
+    def __get_request_data(self, refresh_token: Optional[str]) -> Dict[str, str]:
+        """Renvoie les données de la requête de récupération du jeton.
 
         Args:
-            nb_attempts (int): Nombre de tentatives en cas d'échec
+            refresh_token (Optional[str]): jeton de rafraîchissement à utiliser, None pour le grant complet
+
+        Returns:
+            Dict[str, str]: données du grant `refresh_token` ou du grant complet (avec code TOTP si besoin)
+        """
+        if refresh_token is not None and self.__refresh_params is not None:
+            return {**self.__refresh_params, "refresh_token": refresh_token}
+        d_data = self.__request_params.copy()
+        if self.__totp:
+            d_data["totp"] = self.__totp.now()
+        return d_data
+
+    def __request_new_token(self) -> None:
+        """Récupère un nouveau jeton et le sauvegarde.
+
+        Le jeton est rafraîchi (grant `refresh_token`) si le dernier jeton récupéré a un jeton de rafraîchissement
+        encore valide, sinon il est récupéré de zéro. Si le rafraîchissement est refusé (session expirée ou fermée
+        côté KeyCloak), le jeton est aussitôt récupéré de zéro.
+
+        En cas de problème pendant la récupération, retente selon la politique de tentatives
+        (attente exponentielle avec gigue, respect de `Retry-After`, budgets par catégorie d'erreur et délai total).
 
         Raises:
-            Exception: liée à la requête http, levée si la récupération de jeton au bout de `nb_attempts` tentatives
+            DeadlineExceededError: levée si l'échéance de l'opération en cours (cf. `Deadline`) est dépassée ou arrête les tentatives
+            GpfSdkError: levée si la récupération de jeton échoue après épuisement des tentatives (chaînée à la dernière erreur)
         """
-        o_response = None
-        try:
-            # Préparation données d'authentification
-            d_data = self.__request_params.copy()
-            if self.__totp:
-                d_data["totp"] = self.__totp.now()
-            # Requête KeyCloak de récupération du jeton
-            o_response = requests.post(
-                self.__token_url,
-                data=d_data,
-                headers={
-                    "content-type": "application/x-www-form-urlencoded",
-                },
-                proxies=self.__proxy,
-            )
-            if o_response.status_code == HTTPStatus.OK:
-                self.__last_token = Token(o_response.json())
-            else:
+        o_attempts = self.__retry_policy.start()
+        s_refresh_token = self.__last_token.get_refresh_string() if self.__last_token is not None and self.__refresh_params is not None else None
+        while True:
+            # L'échéance de l'opération en cours ne doit pas être dépassée
+            Deadline.check_current()
+            f_start = time.perf_counter()
+            i_sent = 0
+            try:
+                # Préparation données d'authentification : rafraîchissement ou grant complet
+                d_data = self.__get_request_data(s_refresh_token)
+                i_sent = len(urlencode(d_data))
+                # Requête KeyCloak de récupération du jeton
+                o_response = requests.post(
+                    self.__token_url,
+                    data=d_data,
+                    headers={
+                        "content-type": "application/x-www-form-urlencoded",
+                    },
+                    proxies=self.__proxy,
+                    timeout=Deadline.clamp(self.__timeout),  # type: ignore
+                )
+                if o_response.status_code == HTTPStatus.OK:
+                    self.__last_token = Token(o_response.json())
+                    if self.__token_cache is not None:
+                        self.__token_cache.save(self.__last_token)
+                    Metrics().record(Authentifier.METRICS_ROUTE, "POST", time.perf_counter() - f_start, i_sent, len(o_response.content))
+                    return
+                if s_refresh_token is not None and o_response.status_code in (HTTPStatus.BAD_REQUEST, HTTPStatus.UNAUTHORIZED):
+                    # Rafraîchissement refusé (jeton de rafraîchissement expiré ou révoqué) : on passe au grant complet
+                    Metrics().record(Authentifier.METRICS_ROUTE, "POST", time.perf_counter() - f_start, i_sent, len(o_response.content))
+                    Config().om.debug(f"Rafraîchissement du jeton refusé (code retour {o_response.status_code}), récupération d'un nouveau jeton.")
+                    s_refresh_token = None
+                    continue
                 # On tente de récupérer le message
                 try:
                     s_message = o_response.json()["error_description"]
                 except Exception:
                     s_message = "pas de raison indiqué"
                 raise requests.exceptions.HTTPError(f"Code retour authentification KeyCloak = {o_response.status_code} ({s_message})", response=o_response, request=o_response.request)
-        except Exception as e_error:
-            if isinstance(e_error, requests.exceptions.HTTPError):
-                Config().om.warning(e_error.args[0])
-            else:
-                Config().om.warning("La récupération du jeton d'authentification a échoué...")
-            # Affiche la pile d'exécution
-            Config().om.debug(traceback.format_exc())
-            # Une erreur s'est produite : attend un peu et relance une nouvelle fois la fonction
-            if nb_attempts > 0:
-                time.sleep(self.__sec_between_attempt)
-                self.__request_new_token(nb_attempts - 1)
-            # Le nombre de tentatives est atteint : comme dirait Jim, this is the end...
-            else:
-                Config().om.error(f"La récupération du jeton d'authentification a échoué après {self.__nb_attempts} tentatives")
-                raise e_error
+            except Exception as e_error:
+                Metrics().record(Authentifier.METRICS_ROUTE, "POST", time.perf_counter() - f_start, i_sent, 0, e_error)
+                if isinstance(e_error, requests.exceptions.HTTPError):
+                    Config().om.warning(e_error.args[0])
+                else:
+                    Config().om.warning("La récupération du jeton d'authentification a échoué...")
+                # Affiche la pile d'exécution
+                Config().om.debug(traceback.format_exc())
+                f_delay = o_attempts.next_delay(e_error)
+                # Une erreur s'est produite : attend un peu (sans dépasser l'échéance en cours) et relance une nouvelle fois la requête
+                if f_delay is not None:
+                    Metrics().add_retry(Authentifier.METRICS_ROUTE, "POST")
+                    time.sleep(Deadline.clamp_delay(f_delay))
+                # Le nombre de tentatives est atteint : comme dirait Jim, this is the end...
+                else:
+                    s_message = f"La récupération du jeton d'authentification a échoué après {self.__retry_policy.nb_attempts - 1} tentatives"
+                    Config().om.error(s_message)
+                    # (DeadlineExceededError si c'est l'échéance de l'opération en cours qui a arrêté les tentatives)
+                    raise o_attempts.give_up_error(s_message) from e_error
 
     def get_access_token_string(self) -> str:
         """Retourne le jeton d'authentification sous forme de chaîne de caractères.
@@ -129,16 +216,113 @@ class Authentifier(metaclass=Singleton):
 
         Raises:
             AuthentificationError : Levée si la récupération de jeton échoue au bout de `nb_attempts` tentatives
+            DeadlineExceededError : Levée si l'échéance de l'opération en cours (cf. `Deadline`) est dépassée
         """
         try:
-            while (self.__last_token is None) or (self.__last_token.is_valid() is False):
-                self.__request_new_token(self.__nb_attempts)
-            return self.__last_token.get_access_string()
+            o_token = self.__last_token
+            # Jeton valide et pas encore à renouveler : pas besoin du verrou
+            if o_token is not None and o_token.is_valid(self.__refresh_margin):
+                return o_token.get_access_string()
+            # Jeton encore valide mais à renouveler : si un autre appelant le renouvelle déjà, on utilise le jeton actuel
+            b_blocking = o_token is None or not o_token.is_valid()
+            if not self.__lock.acquire(blocking=b_blocking) and o_token is not None:  # pylint:disable=consider-using-with
+                return o_token.get_access_string()
+            try:
+                s_token = self.__get_valid_token()
+            finally:
+                self.__lock.release()
+            if self.__refresher is not None:
+                self.__refresher.start()
+            return s_token
+        except DeadlineExceededError:
+            # L'échéance de l'opération en cours est dépassée : l'appelant doit le savoir
+            raise
         except Exception as e_error:
-            s_error_message = f"La récupération du jeton d'authentification a échoué après {self.__nb_attempts} tentatives"
+            s_error_message = f"La récupération du jeton d'authentification a échoué après {self.__retry_policy.nb_attempts - 1} tentatives"
             Config().om.error(s_error_message)
             raise AuthentificationError(s_error_message) from e_error
 
+    def get_current_access_token_string(self) -> Optional[str]:
+        """Retourne le jeton actuel s'il est valide et pas encore à renouveler, sans requête ni attente du verrou.
+
+        Returns:
+            Le jeton actuel, None s'il doit être récupéré ou renouvelé (cf. `get_access_token_string`)
+        """
+        o_token = self.__last_token
+        if o_token is not None and o_token.is_valid(self.__refresh_margin):
+            return o_token.get_access_string()
+        return None
+
+    def __get_valid_token(self) -> str:
+        """Renvoie un jeton valide, renouvelé si besoin (à appeler sous verrou).
+
+        Le jeton est vérifié à nouveau une fois le verrou obtenu : s'il a été renouvelé par un autre appelant
+        pendant l'attente, il est utilisé sans nouvelle requête.
+
+        Returns:
+            Un jeton valide
+        """
+        self.__load_cached_token()
+        o_previous_token = self.__last_token
+        if (o_previous_token is None) or (o_previous_token.is_valid(self.__refresh_margin) is False):
+            try:
+                self.__request_new_token()
+            except Exception:
+                # Échec du renouvellement anticipé : on utilise le jeton actuel tant qu'il est valide
+                if o_previous_token is not None and o_previous_token.is_valid():
+                    Config().om.warning("Le renouvellement anticipé du jeton d'authentification a échoué, le jeton actuel (encore valide) est utilisé.")
+                    return o_previous_token.get_access_string()
+                raise
+        while (self.__last_token is None) or (self.__last_token.is_valid() is False):
+            self.__request_new_token()
+        return self.__last_token.get_access_string()
+
+    def __load_cached_token(self) -> None:
+        """Si aucun jeton n'a encore été récupéré, reprend celui du cache disque (s'il est configuré)."""
+        if self.__last_token is None and self.__token_cache is not None:
+            self.__last_token = self.__token_cache.load()
+
+    def __background_refresh(self) -> float:
+        """Renouvelle le jeton s'il est à renouveler (fonction du thread de renouvellement en arrière-plan).
+
+        Returns:
+            délai (en secondes) avant le prochain renouvellement
+        """
+        with self.__lock:
+            self.__load_cached_token()
+            o_token = self.__last_token
+            if o_token is None or not o_token.is_valid(self.__refresh_margin):
+                try:
+                    self.__request_new_token()
+                except Exception:
+                    Config().om.warning(f"Le renouvellement du jeton d'authentification en arrière-plan a échoué, nouvel essai dans {Authentifier.REFRESH_RETRY_DELAY:g} s.")
+                    return Authentifier.REFRESH_RETRY_DELAY
+                o_token = self.__last_token
+                if o_token is None:
+                    return Authentifier.REFRESH_RETRY_DELAY
+            return o_token.expires_in - o_token.refresh_margin(self.__refresh_margin)
+
+    def start_background_refresh(self) -> None:
+        """Démarre le renouvellement du jeton en arrière-plan (le jeton est récupéré immédiatement s'il n'y en a pas)."""
+        if self.__refresher is None:
+            self.__refresher = TokenRefresher(self.__background_refresh)
+        self.__refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """Arrête le renouvellement du jeton en arrière-plan (il n'est plus redémarré automatiquement)."""
+        if self.__refresher is not None:
+            self.__refresher.stop()
+            self.__refresher = None
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Renvoie les statistiques des nouvelles tentatives de récupération du jeton.
+
+        Returns:
+            statistiques des tentatives
+        """
+        return self.__retry_policy.stats
+
     def get_http_header(self, json_content_type: bool = False) -> Dict[str, str]:
         """Renvoie une entête HTTP d'authentification à destination de KeyCloak et consommable par une requête via le module requests.
 
@@ -156,6 +340,25 @@ class Authentifier(metaclass=Singleton):
             d_http_header["content-type"] = "application/json"
         return d_http_header
 
-    def revoke_token(self) -> None:
-        """Révoque le token actuellement utilisé pour forcer la récupération d'un nouveau token."""
-        self.__last_token = None
+    def revoke_token(self, access_token: Optional[str] = None) -> None:
+        """Révoque le token actuellement utilisé pour forcer la récupération d'un nouveau token (y compris dans le cache disque).
+
+        Seul le jeton d'accès est révoqué : s'il y a un jeton de rafraîchissement encore utilisable, il est conservé
+        et le nouveau jeton est obtenu par rafraîchissement (le grant complet étant utilisé si le rafraîchissement est refusé).
+
+        Args:
+            access_token (Optional[str], optional): jeton refusé par l'API : il n'est révoqué que s'il est toujours
+                le jeton actuel (un jeton récupéré entre-temps par un autre appelant est conservé). None : révoque le jeton actuel.
+        """
+        with self.__lock:
+            o_token = self.__last_token
+            if access_token is not None and (o_token is None or o_token.get_access_string() != access_token):
+                return
+            self.__last_token = o_token.revoked() if o_token is not None and o_token.get_refresh_string() is not None else None
+            if self.__token_cache is not None:
+                o_cached_token = self.__token_cache.load()
+                if o_cached_token is None or access_token is None or o_cached_token.get_access_string() == access_token:
+                    if self.__last_token is not None:
+                        self.__token_cache.save(self.__last_token)
+                    else:
+                        self.__token_cache.clear()
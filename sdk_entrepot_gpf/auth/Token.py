@@ -1,32 +1,87 @@
 from datetime import datetime
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class Token:
     """Représente un jeton KeyCloak. Ce jeton est caractérisé par ensemble d'informations clé-valeur et une date d'expiration.
 
+    Le jeton peut être accompagné d'un jeton de rafraîchissement (`refresh_token`) permettant d'en obtenir un nouveau
+    sans renvoyer les identifiants, jusqu'à l'expiration de ce dernier (`refresh_expires_in`, 0 : pas d'expiration).
+
     Attributes:
         __token_dict (dict): Stockage du jeton `{"access_token": "valeur-du-jeton", "expires_in": temps-en-secondes}`
+        __issued_at (datetime): Date de récupération du jeton
+        __lifetime (float): Durée de validité du jeton (en secondes)
         __expiration_date (datetime): Date d'expiration du jeton
+        __refresh_expiration_date (Optional[datetime]): Date d'expiration du jeton de rafraîchissement (None si pas d'expiration)
     """
 
-    def __init__(self, token_dict: Dict[str, Any]) -> None:
+    # Marge (en secondes) avant l'expiration du jeton de rafraîchissement en deçà de laquelle il n'est plus utilisé
+    REFRESH_MARGIN = 5
+
+    def __init__(self, token_dict: Dict[str, Any], issued_at: Optional[float] = None) -> None:
         """À l'instanciation : on stocke l'ensemble d'informations clé-valeur et on calcule la date d'expiration à partir de son délai d'expiration.
 
         Args:
             token_dict (dict): Jeton tel que renvoyé par le service d'authentification : `{"access_token": "valeur-du-jeton", "expires_in": temps-en-secondes}`
+            issued_at (Optional[float], optional): instant (timestamp) de récupération du jeton, maintenant si non indiqué.
         """
         self.__token_dict: Dict[str, Any] = token_dict
-        self.__expiration_date: datetime = datetime.now() + timedelta(seconds=token_dict["expires_in"])
+        self.__issued_at: datetime = datetime.fromtimestamp(issued_at) if issued_at is not None else datetime.now()
+        self.__lifetime: float = float(token_dict["expires_in"])
+        self.__expiration_date: datetime = self.__issued_at + timedelta(seconds=self.__lifetime)
+        f_refresh_expires_in = float(token_dict.get("refresh_expires_in") or 0)
+        self.__refresh_expiration_date: Optional[datetime] = self.__issued_at + timedelta(seconds=f_refresh_expires_in) if f_refresh_expires_in > 0 else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Token":
+        """Instancie un jeton à partir de sa sérialisation (cf. `to_dict`).
+
+        Args:
+            data (Dict[str, Any]): jeton sérialisé `{"token": jeton-renvoyé-par-le-service, "issued_at": timestamp}`
+
+        Returns:
+            Token: jeton (dates d'expiration calculées à partir de son instant de récupération)
+        """
+        return cls(data["token"], float(data["issued_at"]))
 
-    def is_valid(self) -> bool:
+    def to_dict(self) -> Dict[str, Any]:
+        """Sérialise le jeton (ex. : pour le stocker sur disque).
+
+        Returns:
+            Dict[str, Any]: `{"token": jeton-renvoyé-par-le-service, "issued_at": timestamp}`
+        """
+        return {"token": self.__token_dict, "issued_at": self.__issued_at.timestamp()}
+
+    @property
+    def expires_in(self) -> float:
+        """Temps restant (en secondes) avant l'expiration du jeton (négatif s'il a expiré)."""
+        return (self.__expiration_date - datetime.now()).total_seconds()
+
+    def refresh_margin(self, margin: float) -> float:
+        """Renvoie la marge d'anticipation du renouvellement effectivement appliquée au jeton : au plus la moitié
+        de sa durée de validité, pour qu'un jeton de courte durée ne soit pas renouvelé à chaque utilisation.
+
+        Args:
+            margin (float): marge d'anticipation souhaitée (en secondes)
+
+        Returns:
+            float: marge appliquée (en secondes)
+        """
+        return max(0.0, min(margin, self.__lifetime / 2))
+
+    def is_valid(self, margin: float = 0) -> bool:
         """Indique si le jeton est valide par rapport à sa date d'expiration.
 
+        Args:
+            margin (float, optional): marge (en secondes) avant l'expiration en deçà de laquelle le jeton est
+                considéré comme à renouveler (cf. `refresh_margin`).
+
         Returns:
-            bool: `True` si le jeton est valide
+            bool: `True` si le jeton est valide (et n'expire pas dans la marge indiquée)
         """
-        return datetime.now() < self.__expiration_date
+        return self.expires_in > self.refresh_margin(margin)
 
     def get_access_string(self) -> str:
         """Retourne le jeton d'authentification sous forme de chaîne de caractères.
@@ -35,3 +90,25 @@ class Token:
             str: Jeton d'accès
         """
         return str(self.__token_dict["access_token"])
+
+    def revoked(self) -> "Token":
+        """Renvoie une copie du jeton dont le jeton d'accès est expiré (refusé par l'API par exemple), le jeton de
+        rafraîchissement restant utilisable jusqu'à sa propre expiration.
+
+        Returns:
+            Token: jeton dont le jeton d'accès n'est plus valide
+        """
+        return Token({**self.__token_dict, "expires_in": 0}, self.__issued_at.timestamp())
+
+    def get_refresh_string(self) -> Optional[str]:
+        """Retourne le jeton de rafraîchissement s'il est encore utilisable.
+
+        Returns:
+            Optional[str]: Jeton de rafraîchissement, None s'il n'y en a pas ou s'il expire (à `REFRESH_MARGIN` secondes près)
+        """
+        s_refresh_token = self.__token_dict.get("refresh_token")
+        if not s_refresh_token:
+            return None
+        if self.__refresh_expiration_date is not None and (self.__refresh_expiration_date - datetime.now()).total_seconds() <= Token.REFRESH_MARGIN:
+            return None
+        return str(s_refresh_token)
@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import Optional
+
+from sdk_entrepot_gpf.auth.Token import Token
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class TokenCache:
+    """Cache disque du jeton d'authentification, partagé entre les exécutions (ex. : commandes successives en ligne de commande).
+
+    Le jeton est stocké dans un fichier nommé d'après l'empreinte de l'espace de nom (url du service, client et
+    utilisateur) : plusieurs comptes peuvent partager le même répertoire. Le répertoire est créé en mode 0700 et le
+    fichier, écrit de manière atomique, en mode 0600 (lisible par son seul propriétaire) ; sous un système POSIX,
+    un fichier accessible à d'autres utilisateurs est ignoré.
+
+    Attributes:
+        __path (Path): fichier du jeton
+        __lock (threading.Lock): verrou protégeant l'écriture du fichier
+    """
+
+    def __init__(self, directory: Path, namespace: str) -> None:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.__path = directory / f"{hashlib.sha256(namespace.encode('utf-8')).hexdigest()}.token.json"
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> Optional["TokenCache"]:
+        """Instancie le cache à partir de la section `store_authentification` de la configuration.
+
+        Returns:
+            cache du jeton, None si aucun répertoire n'est configuré (`token_cache_directory`)
+        """
+        s_directory = Config().get("store_authentification", "token_cache_directory")
+        if not s_directory:
+            return None
+        s_namespace = "|".join(str(Config().get("store_authentification", s_option, fallback="")) for s_option in ["token_url", "grant_type", "client_id", "login"])
+        return cls(Path(s_directory).expanduser(), s_namespace)
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def load(self) -> Optional[Token]:
+        """Lit le jeton stocké.
+
+        Returns:
+            jeton stocké (éventuellement expiré), None s'il n'y en a pas ou s'il est illisible
+        """
+        try:
+            if os.name == "posix" and stat.S_IMODE(self.__path.stat().st_mode) & 0o077:
+                Config().om.warning(f"Le cache du jeton d'authentification {self.__path} est accessible à d'autres utilisateurs : il est ignoré.")
+                return None
+            return Token.from_dict(json.loads(self.__path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, token: Token) -> None:
+        """Stocke le jeton (écriture atomique, fichier lisible par son seul propriétaire).
+
+        Args:
+            token (Token): jeton à stocker
+        """
+        p_tmp = self.__path.with_name(f"{self.__path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with self.__lock:
+                i_fd = os.open(p_tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(i_fd, "w", encoding="utf-8") as o_file:
+                    json.dump(token.to_dict(), o_file)
+                os.replace(p_tmp, self.__path)
+        except OSError as e_error:
+            Config().om.warning(f"Impossible d'écrire le cache du jeton d'authentification ({e_error}).")
+
+    def clear(self) -> None:
+        """Supprime le jeton stocké."""
+        with self.__lock:
+            try:
+                self.__path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,59 @@
+import contextvars
+import threading
+from typing import Callable, Optional
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class TokenRefresher:
+    """Thread d'arrière-plan renouvelant le jeton d'authentification avant son expiration.
+
+    La fonction de renouvellement est appelée en boucle : elle renouvelle le jeton si besoin et renvoie le délai
+    (en secondes) avant son prochain appel. Le thread est un « daemon » : il ne bloque pas la fin du processus.
+
+    Attributes:
+        __refresh (Callable[[], float]): fonction de renouvellement, renvoie le délai avant le prochain appel
+        __stop_event (threading.Event): événement signalant l'arrêt du thread
+        __thread (Optional[threading.Thread]): thread de renouvellement (None s'il n'est pas démarré)
+    """
+
+    def __init__(self, refresh: Callable[[], float]) -> None:
+        self.__refresh = refresh
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self) -> None:
+        """Démarre le thread de renouvellement (sans effet s'il est déjà démarré)."""
+        if self.running:
+            return
+        self.__stop_event.clear()
+        # Le thread s'exécute dans une copie du contexte courant (contexte client, cf. `ClientContext`)
+        self.__thread = threading.Thread(target=contextvars.copy_context().run, args=(self.__run,), name="sdk_entrepot_gpf_token_refresher", daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Arrête le thread de renouvellement et attend sa fin.
+
+        Args:
+            timeout (Optional[float], optional): durée maximale d'attente de la fin du thread (en secondes)
+        """
+        self.__stop_event.set()
+        o_thread = self.__thread
+        if o_thread is not None and o_thread is not threading.current_thread():
+            o_thread.join(timeout)
+        self.__thread = None
+
+    def __run(self) -> None:
+        """Boucle de renouvellement, jusqu'à l'arrêt du thread."""
+        f_delay = 0.0
+        while not self.__stop_event.wait(f_delay):
+            try:
+                f_delay = max(self.__refresh(), 0.0)
+            except Exception as e_error:  # pylint:disable=broad-except
+                # La fonction de renouvellement gère ses erreurs : on évite juste d'arrêter le thread
+                Config().om.warning(f"Le renouvellement du jeton d'authentification en arrière-plan a échoué ({e_error.__class__.__name__}).")
+                f_delay = 1.0
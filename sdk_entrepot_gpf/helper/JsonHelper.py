@@ -6,10 +6,34 @@ from jsonc_parser.errors import ParserError  # type: ignore
 
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.helper.FileHelper import FileHelper
+from sdk_entrepot_gpf.io.JsonBackend import JsonBackend
 
 
 class JsonHelper:
-    """Classe d'aide pour gérer les fichiers JSON."""
+    """Classe d'aide pour gérer les fichiers JSON.
+
+    Le JSON est d'abord parsé par le backend JSON courant (cf. `JsonBackend`) ; s'il contient des commentaires (JSONC),
+    il est parsé par `JsoncParser`.
+    """
+
+    @staticmethod
+    def __parse(str_data: str) -> Any:
+        """Parse du JSON ou du JSONC.
+
+        Arguments:
+            str_data (str): données en texte
+
+        Raises:
+            ParserError: levée si les données ne sont pas parsables
+
+        Returns:
+            Any: données en objet python
+        """
+        try:
+            return JsonBackend.get().loads(str_data)
+        except ValueError:
+            # JSON avec commentaires ou invalide : JsoncParser lèvera l'erreur s'il y a lieu
+            return JsoncParser.parse_str(str_data)
 
     @staticmethod
     def load(
@@ -34,7 +58,7 @@ class JsonHelper:
         """
         try:
             s_data = FileHelper.read(json_path, file_not_found_pattern.replace("json_path", "path"), encoding=encoding)
-            return JsoncParser.parse_str(s_data)
+            return JsonHelper.__parse(s_data)
         except ParserError as e_json_decode_error:
             s_message = file_not_parsable_pattern.format(
                 json_path=json_path,
@@ -58,7 +82,7 @@ class JsonHelper:
             Any: données en objet python
         """
         try:
-            o_data = JsoncParser.parse_str(str_data)
+            o_data = JsonHelper.__parse(str_data)
             return o_data
         except ParserError as e_json_decode_error:
             s_message = message_pattern.format(
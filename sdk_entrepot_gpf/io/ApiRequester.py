@@ -1,24 +1,57 @@
 from __future__ import unicode_literals
 from io import BufferedReader
-import json
 from pathlib import Path
 import re
+import threading
 import time
 import traceback
-from typing import Any, Dict, Optional, Tuple, List, Union
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Tuple, List, Type, Union
 import requests
-from requests_toolbelt import MultipartEncoder
+from requests.adapters import HTTPAdapter
 
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.auth.Authentifier import Authentifier
-from sdk_entrepot_gpf.pattern.Singleton import Singleton
+from sdk_entrepot_gpf.pattern.ScopedSingleton import ScopedSingleton
 from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
-from sdk_entrepot_gpf.io.Errors import ApiError, ConflictError, RouteNotFoundError, InternalServerError, NotFoundError, NotAuthorizedError, BadRequestError, StatusCodeError
+from sdk_entrepot_gpf.io.Errors import (
+    ApiError,
+    ConflictError,
+    RouteNotFoundError,
+    InternalServerError,
+    NotFoundError,
+    NotAuthorizedError,
+    BadRequestError,
+    RangeNotSatisfiableError,
+    StatusCodeError,
+)
 from sdk_entrepot_gpf.io.Config import Config
-
-
-class ApiRequester(metaclass=Singleton):
-    """Classe singleton pour gérer l'enrobage des requêtes à l'API GPF : gestion du proxy, du HTTPS et des erreurs."""
+from sdk_entrepot_gpf.io.Deadline import Deadline, TimeoutType
+from sdk_entrepot_gpf.io.FileDownloader import FileDownloader
+from sdk_entrepot_gpf.io.HedgePolicy import HedgePolicy
+from sdk_entrepot_gpf.io.Metrics import Metrics
+from sdk_entrepot_gpf.io.MultipartBody import MultipartBody
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy, RetryStats
+from sdk_entrepot_gpf.io.RateLimiter import RateLimiter
+from sdk_entrepot_gpf.io.ResponseCache import CachedResponse, ResponseCache
+from sdk_entrepot_gpf.io.RouteTable import RouteTable
+from sdk_entrepot_gpf.io.SingleFlight import SingleFlight
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
+
+
+class ApiRequester(metaclass=ScopedSingleton):
+    """Classe singleton pour gérer l'enrobage des requêtes à l'API GPF : gestion du proxy, du HTTPS et des erreurs.
+
+    Les requêtes passent par une session HTTP partagée (`requests.Session`) disposant d'un pool de connexions
+    persistantes (keep-alive) : les connexions TCP/TLS vers l'API sont réutilisées d'une requête à l'autre.
+    La session est créée à la première requête et peut être fermée explicitement via `close()` ou en
+    utilisant l'instance comme gestionnaire de contexte (`with ApiRequester() as o_requester: ...`).
+    Une nouvelle session est recréée automatiquement si une requête est faite après la fermeture.
+
+    Attributes:
+        __session (Optional[requests.Session]): session HTTP partagée (None tant qu'aucune requête n'a été faite)
+        __session_lock (threading.Lock): verrou protégeant la création et la fermeture de la session
+    """
 
     GET = "GET"
     POST = "POST"
@@ -31,13 +64,108 @@ class ApiRequester(metaclass=Singleton):
     def __init__(self) -> None:
         # Récupération du convertisseur Json
         self.__jsonConverter = JsonConverter()
-        self.__nb_attempts = Config().get_int("store_api", "nb_attempts")
-        self.__sec_between_attempt = Config().get_int("store_api", "sec_between_attempt")
+        # Politique de nouvelles tentatives en cas d'erreur
+        self.__retry_policy = RetryPolicy.from_config("store_api")
+        # Limiteur de débit partagé par toutes les requêtes du processus
+        self.__rate_limiter = RateLimiter.from_config()
+        # Table des routes (construite à la première requête)
+        self.__route_table: Optional[RouteTable] = None
+        # Cache des réponses (durées de vie par route, requêtes conditionnelles)
+        self.__response_cache = ResponseCache.from_config()
         # Récupération des paramètres du proxy
         self.__proxy = {
             "http": Config().get_str("store_api", "http_proxy"),
             "https": Config().get_str("store_api", "https_proxy"),
         }
+        # Regroupement des requêtes GET identiques simultanées (None si désactivé)
+        self.__single_flight: Optional[SingleFlight[requests.Response]] = SingleFlight() if Config().get_bool("store_api", "coalesce_get", fallback=True) else None
+        # Requêtes GET couvertes par une requête supplémentaire si elles tardent (None si désactivé)
+        self.__hedge_policy = HedgePolicy.from_config()
+        # Délais d'attente (connexion, lecture) par type de requête : JSON (None), envoi et téléchargement de fichiers
+        self.__timeouts: Dict[Optional[str], TimeoutType] = {s_kind: Deadline.timeout_from_config("store_api", s_kind) for s_kind in [None, "upload", "download"]}
+        # Taille des blocs lus lors des téléchargements
+        self.__download_chunk_size = Config().get_int("store_api", "download_chunk_size", fallback=1048576)
+        # Session HTTP partagée (créée à la première requête)
+        self.__session: Optional[requests.Session] = None
+        self.__session_lock = threading.Lock()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Renvoie les statistiques des nouvelles tentatives effectuées (nombre par catégorie d'erreur, temps d'attente).
+
+        Returns:
+            statistiques des tentatives
+        """
+        return self.__retry_policy.stats
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        """Renvoie le cache des réponses (pour invalider ou vider le cache explicitement).
+
+        Returns:
+            cache des réponses
+        """
+        return self.__response_cache
+
+    @response_cache.setter
+    def response_cache(self, response_cache: ResponseCache) -> None:
+        """Remplace le cache des réponses (ex. : cache avec d'autres niveaux de stockage).
+
+        Args:
+            response_cache (ResponseCache): nouveau cache des réponses
+        """
+        self.__response_cache = response_cache
+
+    @property
+    def session(self) -> requests.Session:
+        """Renvoie la session HTTP partagée, en la créant si besoin.
+
+        Returns:
+            session HTTP disposant d'un pool de connexions persistantes
+        """
+        with self.__session_lock:
+            if self.__session is None:
+                self.__session = self.__create_session()
+            return self.__session
+
+    def __create_session(self) -> requests.Session:
+        """Crée une session HTTP avec un pool de connexions dimensionné selon la configuration.
+
+        Returns:
+            nouvelle session HTTP
+        """
+        o_session = requests.Session()
+        # Un adaptateur par schéma : pool_connections = nb d'hôtes gardés en cache, pool_maxsize = nb de connexions par hôte
+        i_pool_connections = Config().get_int("store_api", "pool_connections", fallback=10)
+        # Le pool doit pouvoir garder une connexion par requête simultanée des exécutions parallèles du SDK (sinon
+        # urllib3 ferme les connexions en trop et le keep-alive est perdu) : on prend la plus grande de ces valeurs
+        i_pool_maxsize = max(
+            Config().get_int("store_api", "pool_maxsize", fallback=10),
+            Config().get_int("store_api", "async_max_workers", fallback=32),
+            Config().get_int("store_api", "list_max_workers", fallback=8),
+            Config().get_int("store_api", "list_read_ahead", fallback=1) + 1,
+            Config().get_int("store_api", "batch_max_workers", fallback=8),
+            Config().get_int("store_api", "download_segments", fallback=4),
+        )
+        o_adapter = HTTPAdapter(pool_connections=i_pool_connections, pool_maxsize=i_pool_maxsize)
+        o_session.mount("https://", o_adapter)
+        o_session.mount("http://", o_adapter)
+        return o_session
+
+    def close(self) -> None:
+        """Ferme la session HTTP, les connexions ouvertes et le pool de threads des requêtes couvertes. Une nouvelle session sera créée à la prochaine requête."""
+        with self.__session_lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
+        if self.__hedge_policy is not None:
+            self.__hedge_policy.close()
+
+    def __enter__(self) -> "ApiRequester":
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException], exc_traceback: Optional[TracebackType]) -> None:
+        self.close()
 
     def route_request(
         self,
@@ -46,7 +174,10 @@ class ApiRequester(metaclass=Singleton):
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], List[Any]]] = None,
-        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+        files: Optional[Union[Dict[str, Tuple[str, BufferedReader]], MultipartBody]] = None,
+        stream: bool = False,
+        header: Optional[Dict[str, str]] = None,
+        retry_timeout: bool = True,
     ) -> requests.Response:
         """Exécute une requête à l'API à partir du nom d'une route. La requête est retentée plusieurs fois s'il y a un problème.
 
@@ -56,14 +187,19 @@ class ApiRequester(metaclass=Singleton):
             params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
             method (str, optional): méthode de la requête.
             data (Optional[Dict[str, Any]], optional): Données de la requête.
-            files (Optional[Dict[str, Tuple[Any]]], optional): Liste des fichiers à envoyer {"file":('fichier.ext', File)}.
+            files (Optional[Union[Dict[str, Tuple[Any]], MultipartBody]], optional): Liste des fichiers à envoyer {"file":('fichier.ext', File)} ou corps multipart.
+            stream (bool, optional): si True, le contenu de la réponse n'est pas téléchargé d'avance (cf. `url_request`).
+            header (Optional[Dict[str, str]], optional): en-têtes supplémentaires (ajoutés à ceux de la route).
+            retry_timeout (bool, optional): si False, la requête n'est pas retentée si le délai d'attente est dépassé (cf. `url_request`).
 
         Raises:
             RouteNotFoundError: levée si la route demandée n'est pas définie dans les paramètres
+            DeadlineExceededError: levée si l'échéance de l'opération en cours (cf. `Deadline`) est dépassée
             InternalServerError: levée si erreur interne de l'API
             NotFoundError: levée si l'entité demandée n'est pas trouvée par l'API
             NotAuthorizedError: levée si l'action effectuée demande d'autres autorisations
             BadRequestError: levée si la requête envoyée n'est pas correcte
+            RangeNotSatisfiableError: levée si la plage demandée (`Range`) n'est pas satisfiable (416)
             StatusCodeError: levée si un "status code" non prévu est récupéré
 
         Returns:
@@ -83,24 +219,31 @@ class ApiRequester(metaclass=Singleton):
         if not route_params.get("datastore", None):
             Config().om.warning("Le datastore (entrepôt) à utiliser n'est pas défini. Consultez l'aide pour corriger ce problème.")
 
-        # On convertie les données Python en text puis en JSON
-        data = self.__jsonConverter.convert(data)
-
-        # On récupère la route
-        s_route = Config().get("routing", route_name, fallback=None)
-        if s_route is None:
+        # On récupère la route (table précompilée)
+        o_route = self.__get_route_table().get(route_name)
+        if o_route is None:
             raise RouteNotFoundError(route_name)
         # On formate l'URL
-        s_url = s_route.format(**route_params)
+        s_url = o_route.url(route_params)
 
         # récupération du header additionnel
-        s_header = Config().get("routing", route_name + "_header", fallback=None)
-        d_header = {}
-        if s_header is not None:
-            d_header = json.loads(s_header)
+        d_header = o_route.header
+        if header is not None:
+            d_header.update(header)
 
         # Exécution de la requête en boucle jusqu'au succès (ou erreur au bout d'un certains temps)
-        return self.url_request(s_url, method, params, data, files, d_header)
+        return self.url_request(s_url, method, params, data, files, d_header, route_name=route_name, stream=stream, retry_timeout=retry_timeout)
+
+    def __get_route_table(self) -> RouteTable:
+        """Renvoie la table des routes, reconstruite seulement si un nouveau fichier de configuration a été lu.
+
+        Returns:
+            table des routes à jour
+        """
+        o_route_table = self.__route_table
+        if o_route_table is None or o_route_table.version != Config().version:
+            o_route_table = self.__route_table = RouteTable.from_config()
+        return o_route_table
 
     def url_request(
         self,
@@ -108,30 +251,149 @@ class ApiRequester(metaclass=Singleton):
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], List[Any]]] = None,
-        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+        files: Optional[Union[Dict[str, Tuple[str, BufferedReader]], MultipartBody]] = None,
         header: Dict[str, str] = {},
+        route_name: Optional[str] = None,
+        stream: bool = False,
+        retry_timeout: bool = True,
     ) -> requests.Response:
         """Effectue une requête à l'API à partir d'une url. La requête est retentée plusieurs fois s'il y a un problème.
 
+        Les réponses aux requêtes GET des routes concernées sont mises en cache et revalidées par requête conditionnelle
+        (cf. `ResponseCache`). Les requêtes de modification invalident les réponses en cache de la ressource concernée.
+
+        Les requêtes GET identiques (url, paramètres et en-têtes) lancées simultanément sont regroupées : une seule
+        requête HTTP est envoyée et chaque appelant reçoit sa propre copie de la réponse (cf. `SingleFlight`).
+
         Args:
             url (str): url absolue de la requête
             method (str, optional): méthode de la requête
             params (Optional[Dict[str, Any]], optional): paramètres de la requête (ajouté à l'url)
             data (Optional[Union[Dict[str, Any], List[Any]]], optional): contenue de la requête (ajouté au corp)
-            files (Optional[Dict[str, Tuple[Any]]], optional): fichiers à envoyer
+            files (Optional[Union[Dict[str, Tuple[Any]], MultipartBody]], optional): fichiers à envoyer ou corps multipart
             header (Dict[str, str], optional): Header additionnel pour la requête
+            route_name (Optional[str], optional): nom de la route requêtée (si requête faite via `route_request`)
+            stream (bool, optional): si True, le contenu de la réponse n'est pas téléchargé d'avance : il doit être lu
+                (`iter_content`) puis la réponse fermée par l'appelant. Les réponses en flux ne sont pas mises en cache.
+            retry_timeout (bool, optional): si False, une tentative dont le délai d'attente est dépassé n'est pas retentée :
+                l'erreur (`GpfSdkError` causée par `requests.Timeout`) est levée aussitôt, pour que l'appelant puisse
+                adapter sa requête (ex. : taille des pages d'un listing, cf. `PageSizePolicy`).
 
         Returns:
             réponse si succès
         """
         Config().om.debug(f"url_request({url}, {method}, {params}, {data})")
 
-        i_nb_attempts = 0
+        if method != ApiRequester.GET:
+            try:
+                return self.__retry_url_request(url, method, params, data, files, header, route_name, stream, retry_timeout)
+            finally:
+                # Que la requête ait réussi ou non, la ressource a pu être modifiée
+                self.__response_cache.invalidate(url)
+
+        if stream or data is not None or files:
+            return self.__retry_url_request(url, method, params, data, files, header, route_name, stream, retry_timeout)
+
+        o_single_flight = self.__single_flight
+        if o_single_flight is None:
+            return self.__get_request(url, params, header, route_name, retry_timeout)
+        # Clef de regroupement : url, paramètres, en-têtes additionnels et politique de tentatives
+        s_flight_key = ResponseCache.key(url, params) + "|" + "|".join(f"{k.lower()}={v}" for k, v in sorted(header.items())) + f"|retry_timeout={retry_timeout}"
+        o_response, b_shared = o_single_flight.run(s_flight_key, lambda: self.__get_request(url, params, header, route_name, retry_timeout))
+        if not b_shared:
+            return o_response
+        # Réponse obtenue par une autre requête : chaque appelant reçoit sa propre copie (contenu déjà téléchargé)
+        Metrics().add_coalesced(route_name, method)
+        return CachedResponse.from_response(o_response.url, o_response).to_response()
+
+    def __get_request(self, url: str, params: Optional[Dict[str, Any]], header: Dict[str, str], route_name: Optional[str], retry_timeout: bool = True) -> requests.Response:
+        """Effectue une requête GET (contenu téléchargé d'avance), en utilisant le cache des réponses si la route est concernée.
+
+        Args:
+            url (str): url absolue de la requête
+            params (Optional[Dict[str, Any]]): paramètres de la requête (ajouté à l'url)
+            header (Dict[str, str]): Header additionnel pour la requête
+            route_name (Optional[str]): nom de la route requêtée
+            retry_timeout (bool, optional): si False, la requête n'est pas retentée si le délai d'attente est dépassé
+
+        Returns:
+            réponse si succès
+        """
+        if not self.__response_cache.is_cacheable(route_name):
+            return self.__retry_url_request(url, ApiRequester.GET, params, None, None, header, route_name, retry_timeout=retry_timeout)
+
+        s_key = ResponseCache.key(url, params)
+        o_cached = self.__response_cache.get(s_key)
+        if o_cached is not None:
+            # Réponse sans validateur encore récente : on la réutilise sans requête
+            if self.__response_cache.is_fresh(o_cached, route_name):
+                return o_cached.to_response()
+            # Sinon requête conditionnelle
+            header = {**header, **o_cached.validators()}
+
+        o_response = self.__retry_url_request(url, ApiRequester.GET, params, None, None, header, route_name, retry_timeout=retry_timeout)
+        if o_response.status_code == 304 and o_cached is not None:
+            # Pas de modification : on réutilise la réponse en cache
+            o_cached.revalidate(o_response.headers)
+            self.__response_cache.put(s_key, o_cached, route_name)
+            return o_cached.to_response()
+        if o_response.status_code == 200:
+            self.__response_cache.put(s_key, CachedResponse.from_response(url, o_response), route_name)
+        return o_response
+
+    def __retry_url_request(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Union[Dict[str, Any], List[Any]]],
+        files: Optional[Union[Dict[str, Tuple[str, BufferedReader]], MultipartBody]],
+        header: Dict[str, str],
+        route_name: Optional[str],
+        stream: bool = False,
+        retry_timeout: bool = True,
+    ) -> requests.Response:
+        """Effectue une requête à l'API en la retentant selon la politique de tentatives.
+
+        Chaque tentative respecte le débit défini pour la route (cf. `RateLimiter`) et l'échéance active (cf. `Deadline`).
+        Les tentatives de requête GET (sans corps, hors flux) des routes concernées peuvent être couvertes par une requête
+        supplémentaire si elles tardent (cf. `HedgePolicy`).
+
+        Args:
+            url (str): url absolue de la requête
+            method (str): méthode de la requête
+            params (Optional[Dict[str, Any]]): paramètres de la requête (ajouté à l'url)
+            data (Optional[Union[Dict[str, Any], List[Any]]]): contenue de la requête (ajouté au corp)
+            files (Optional[Union[Dict[str, Tuple[Any]], MultipartBody]]): fichiers à envoyer ou corps multipart
+            header (Dict[str, str]): Header additionnel pour la requête
+            route_name (Optional[str]): nom de la route requêtée
+            stream (bool, optional): si True, le contenu de la réponse n'est pas téléchargé d'avance
+            retry_timeout (bool, optional): si False, la requête n'est pas retentée si le délai d'attente est dépassé
+
+        Returns:
+            réponse si succès
+        """
+        # Les données sont sérialisées une seule fois (dates converties, JSON encodé en UTF-8), pour toutes les tentatives
+        o_body = None if files or data is None else self.__jsonConverter.encode(data)
+        # Les fichiers sont envoyés via un corps multipart rejouable (fichiers replacés au début à chaque tentative)
+        o_multipart = None if not files else files if isinstance(files, MultipartBody) else MultipartBody(dict(files))
+
+        def request() -> requests.Response:
+            return self.__measured_url_request(route_name, url, method, params=params, data=data, files=o_multipart, header=header, body=o_body, stream=stream)
+
+        # Seules les requêtes idempotentes dont la réponse est lue d'avance peuvent être doublées
+        b_hedged = method == ApiRequester.GET and not stream and o_body is None and o_multipart is None
+        o_attempts = self.__retry_policy.start()
         while True:
-            i_nb_attempts += 1
+            # L'échéance de l'opération en cours ne doit pas être dépassée
+            Deadline.check_current()
             try:
+                # On attend si besoin de pouvoir envoyer la requête sans dépasser le débit autorisé
+                self.__rate_limiter.acquire(route_name)
                 # On fait la requête
-                return self.__url_request(url, method, params=params, data=data, files=files, header=header)
+                o_response = self.__hedged_request(route_name, method, request) if b_hedged else request()
+                self.__rate_limiter.speed_up(route_name)
+                return o_response
             except NotFoundError as e_error:
                 # S'il on a un 404, on ne retente pas, on ne fait rien. On propage l'erreur.
                 raise e_error
@@ -150,20 +412,106 @@ class ApiRequester(metaclass=Singleton):
                 # S'il y a un conflit, on ne retente pas, on ne fait rien. On propage l'erreur.
                 raise e_error
 
+            except RangeNotSatisfiableError as e_error:
+                # Si la plage demandée est refusée (416), on ne retente pas : l'appelant redemande sans Range.
+                raise e_error
+
             except (ApiError, requests.RequestException) as e_error:
-                # Pour les autres erreurs, on retente selon les paramètres indiqués.
-                # On récupère la classe de l'erreur histoire que ce soit plus parlant...
-                s_title = e_error.__class__.__name__
-                Config().om.warning(f"L'exécution d'une requête a échoué (tentative {i_nb_attempts}/{self.__nb_attempts})... ({s_title})")
+                # Pour les autres erreurs, on retente selon la politique de tentatives.
+                # Délai d'attente dépassé : l'appelant peut vouloir adapter sa requête plutôt que de la retenter
+                if not retry_timeout and isinstance(e_error, requests.Timeout):
+                    raise GpfSdkError("L'exécution d'une requête a dépassé le délai d'attente.") from e_error
+                # Le serveur demande de ralentir (429, 503) : on diminue le débit
+                if RetryPolicy.category(e_error) == RetryPolicy.THROTTLING:
+                    self.__rate_limiter.slow_down(route_name)
+                # On affiche la classe de l'erreur histoire que ce soit plus parlant...
+                Config().om.warning(f"L'exécution d'une requête a échoué (tentative {o_attempts.nb_attempts}/{self.__retry_policy.nb_attempts})... ({e_error.__class__.__name__})")
                 # Affiche la pile d'exécution
                 Config().om.debug(traceback.format_exc())
+                i_nb_attempts = o_attempts.nb_attempts
+                f_delay = o_attempts.next_delay(e_error)
                 # Une erreur s'est produite : attend un peu et relance une nouvelle fois la fonction
-                if i_nb_attempts < self.__nb_attempts:
-                    time.sleep(self.__sec_between_attempt)
-                # Le nombre de tentatives est atteint : comme dirait Jim, this is the end...
+                if f_delay is not None:
+                    Metrics().add_retry(route_name, method)
+                    time.sleep(Deadline.clamp_delay(f_delay))
+                # Le nombre de tentatives, le budget ou le délai est atteint : comme dirait Jim, this is the end...
                 else:
-                    s_message = f"L'exécution d'une requête a échoué après {i_nb_attempts} tentatives."
-                    raise GpfSdkError(s_message) from e_error
+                    # (DeadlineExceededError si c'est l'échéance de l'opération en cours qui est atteinte)
+                    raise o_attempts.give_up_error(f"L'exécution d'une requête a échoué après {i_nb_attempts} tentatives.") from e_error
+
+    def __hedged_request(self, route_name: Optional[str], method: str, request: Callable[[], requests.Response]) -> requests.Response:
+        """Effectue une tentative de requête, couverte par une requête supplémentaire si elle tarde (cf. `HedgePolicy`).
+
+        Args:
+            route_name (Optional[str]): nom de la route requêtée
+            method (str): méthode de la requête
+            request (Callable[[], requests.Response]): fonction effectuant la tentative
+
+        Returns:
+            réponse si succès
+        """
+        o_hedge_policy = self.__hedge_policy
+        if o_hedge_policy is None:
+            return request()
+
+        def hedge_request() -> requests.Response:
+            # La requête supplémentaire respecte aussi le débit autorisé
+            self.__rate_limiter.acquire(route_name)
+            return request()
+
+        # La réponse de la requête perdante est fermée (connexion rendue au pool) dès qu'elle est reçue
+        return o_hedge_policy.run(route_name, method, request, hedge_request, discard=requests.Response.close)
+
+    def __measured_url_request(
+        self,
+        route_name: Optional[str],
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Union[Dict[str, Any], List[Any]]],
+        files: Optional[MultipartBody],
+        header: Dict[str, str],
+        body: Optional[bytes],
+        stream: bool,
+    ) -> requests.Response:
+        """Effectue une tentative de requête (cf. `__url_request`) en enregistrant ses métriques (cf. `Metrics`) :
+        durée (jusqu'à la réception des en-têtes si la réponse est lue en flux), octets envoyés et reçus, erreur.
+
+        Args:
+            route_name (Optional[str]): nom de la route requêtée
+            url (str): url absolue de la requête
+            method (str): méthode de la requête
+            params (Optional[Dict[str, Any]]): paramètres.
+            data (Optional[Union[Dict[str, Any], List[Any]]]): données (pour les messages d'erreur).
+            files (Optional[MultipartBody]): fichiers.
+            header (Dict[str, str]): Header additionnel pour la requête.
+            body (Optional[bytes]): corps de la requête (JSON sérialisé).
+            stream (bool): si True, le contenu de la réponse n'est pas téléchargé d'avance.
+
+        Returns:
+            réponse si succès
+        """
+        f_start = time.perf_counter()
+        try:
+            o_response = self.__url_request(url, method, params=params, data=data, files=files, header=header, body=body, stream=stream)
+        except Exception as e_error:
+            Metrics().record(route_name, method, time.perf_counter() - f_start, self.__sent_size(files, body), 0, e_error)
+            raise
+        if stream:
+            # Contenu lu plus tard, en flux : taille annoncée
+            s_length = o_response.headers.get("Content-Length", "")
+            i_received = int(s_length) if s_length.isdigit() else 0
+        else:
+            i_received = len(o_response.content)
+        Metrics().record(route_name, method, time.perf_counter() - f_start, self.__sent_size(files, body), i_received)
+        return o_response
+
+    @staticmethod
+    def __sent_size(files: Optional[MultipartBody], body: Optional[bytes]) -> int:
+        """Renvoie la taille du corps envoyé (fichiers ou JSON sérialisé)."""
+        if files is not None:
+            return files.progress.total or 0
+        return len(body) if body is not None else 0
 
     def __url_request(
         self,
@@ -171,8 +519,10 @@ class ApiRequester(metaclass=Singleton):
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], List[Any]]] = None,
-        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+        files: Optional[MultipartBody] = None,
         header: Dict[str, str] = {},
+        body: Optional[bytes] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Effectue une requête à l'API à partir d'une url. Ne retente pas plusieurs fois si problème.
 
@@ -180,9 +530,11 @@ class ApiRequester(metaclass=Singleton):
             url (str): url absolue de la requête
             method (str, optional): méthode de la requête.
             params (Optional[Dict[str, Any]], optional): paramètres.
-            data (Optional[Union[Dict[str, Any], List[Any]]], optional): données.
-            files (Optional[Dict[str, Tuple[Any]]], optional): fichiers.
+            data (Optional[Union[Dict[str, Any], List[Any]]], optional): données (pour les messages d'erreur).
+            files (Optional[MultipartBody], optional): fichiers (corps multipart, un nouvel encodeur étant créé à chaque appel).
             header (Dict[str, str], optional): Header additionnel pour la requête.
+            body (Optional[bytes], optional): corps de la requête, `data` sérialisé en JSON (ignoré si des fichiers sont envoyés).
+            stream (bool, optional): si True, le contenu de la réponse n'est pas téléchargé d'avance.
 
         Returns:
             réponse si succès
@@ -193,31 +545,40 @@ class ApiRequester(metaclass=Singleton):
         d_headers = Authentifier().get_http_header(json_content_type=files is None)
         d_headers.update(header)
 
-        # Création du MultipartEncoder (cf. https://github.com/requests/toolbelt#multipartform-data-encoder)
+        # Paramètres de la requête
         d_requests: Dict[str, Any] = {
             "url": url,
             "method": method,
             "headers": d_headers,
+            # Proxies lus une seule fois à l'instanciation, passés à chaque requête car, définis sur la session,
+            # ils seraient écrasés par les variables d'environnement (HTTP_PROXY, ...)
             "proxies": self.__proxy,
             "params": params,
+            "stream": stream,
+            # Délais d'attente selon le type de requête, réduits au temps restant avant l'échéance active
+            "timeout": Deadline.clamp(self.__timeouts["upload" if files else "download" if stream else None]),
         }
         if files:
-            d_fields = {**files}
-            o_me = MultipartEncoder(fields=d_fields)
+            # Nouvel encodeur multipart, lu en flux (cf. https://github.com/requests/toolbelt#multipartform-data-encoder)
+            o_me = files.encoder()
             d_headers["content-type"] = o_me.content_type
             # Execution de la requête
             # TODO : contournement pour les uploads, supprimer `"verify": False` une fois le problème résolu + suppression proxy
             d_requests.update({"data": o_me})
-        else:
-            d_requests.update({"params": params, "json": data})
+        elif body is not None:
+            # Corps déjà sérialisé en JSON : transmis tel quel
+            d_requests["data"] = body
 
-        # exécution de la requête
-        r = requests.request(**d_requests)
+        # exécution de la requête (via le pool de connexions de la session)
+        r = self.session.request(**d_requests)
 
         # Vérification du résultat...
         if r.status_code >= 200 and r.status_code < 300:
             # Si c'est ok, on renvoie la réponse
             return r
+        if r.status_code == 304:
+            # Pas de modification (requête conditionnelle) : la réponse en cache sera utilisée
+            return r
         # Erreur sans retour attendu/possible
         if r.status_code == 500:
             # Erreur interne (pas de retour)
@@ -228,7 +589,9 @@ class ApiRequester(metaclass=Singleton):
             raise NotFoundError(url, method, params, data, r.text)
         if r.status_code in (403, 401):
             # Action non autorisée
-            Authentifier().revoke_token()  # On révoque le token
+            # On révoque le token utilisé (sauf s'il a déjà été remplacé par un autre appelant)
+            s_authorization = d_headers.get("Authorization", "")
+            Authentifier().revoke_token(s_authorization[len("Bearer ") :] if s_authorization.startswith("Bearer ") else None)
             raise NotAuthorizedError(url, method, params, data, r.text)
         if r.status_code == 400:
             # Requête incorrecte
@@ -236,8 +599,11 @@ class ApiRequester(metaclass=Singleton):
         if r.status_code == 409:
             # Conflit
             raise ConflictError(url, method, params, data, r.text)
+        if r.status_code == 416:
+            # Plage demandée non satisfiable
+            raise RangeNotSatisfiableError(url, method, params, data, r.status_code, r.text, r.headers)
         # Autre erreur
-        raise StatusCodeError(url, method, params, data, r.status_code, r.text)
+        raise StatusCodeError(url, method, params, data, r.status_code, r.text, r.headers)
 
     def route_upload_file(
         self,
@@ -248,9 +614,13 @@ class ApiRequester(metaclass=Singleton):
         method: str = "POST",
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        callback: Optional[Callable[[TransferProgress], None]] = None,
     ) -> requests.Response:
         """Exécute une requête à l'API à partir du nom d'une route. La requête est retentée plusieurs fois s'il y a un problème.
 
+        Le fichier est envoyé en flux (lu par blocs, jamais chargé entièrement en mémoire) et le corps multipart est
+        recréé à chaque tentative à partir du fichier déjà ouvert, replacé à son début (cf. `MultipartBody`).
+
         Args:
             route_name (str): Route à utiliser
             file_path (Path): Chemin du fichier à uploader
@@ -259,6 +629,8 @@ class ApiRequester(metaclass=Singleton):
             params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
             method (str, optional): méthode de la requête.
             data (Optional[Dict[str, Any]], optional): Données de la requête.
+            callback (Optional[Callable[[TransferProgress], None]], optional): fonction de suivi (octets envoyés, débit)
+                appelée au fil de l'envoi (repart de zéro à chaque tentative).
 
         Returns:
             réponse vérifiée
@@ -266,10 +638,64 @@ class ApiRequester(metaclass=Singleton):
         # Ouverture du fichier et remplissage du tuple de fichier
         with file_path.open("rb") as o_file_binary:
             o_tuple_file = (file_path.name, o_file_binary)
-            o_dict_files = {file_key: o_tuple_file}
+            o_body = MultipartBody({file_key: o_tuple_file}, callback)
 
             # Requête
-            return self.route_request(route_name, route_params=route_params, method=method, params=params, data=data, files=o_dict_files)
+            o_response = self.route_request(route_name, route_params=route_params, method=method, params=params, data=data, files=o_body)
+        Config().om.debug(f"Fichier {file_path} envoyé : {o_body.progress}")
+        return o_response
+
+    def route_download_file(
+        self,
+        route_name: str,
+        file_path: Path,
+        route_params: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        checksum: Optional[str] = None,
+        checksum_algorithm: str = "md5",
+        callback: Optional[Callable[[TransferProgress], None]] = None,
+    ) -> TransferProgress:
+        """Télécharge un fichier depuis l'API à partir du nom d'une route, en flux et à mémoire constante.
+
+        Le contenu est lu par blocs (`store_api.download_chunk_size`) et écrit dans un fichier temporaire
+        (`<fichier>.part`) renommé en `file_path` une fois le téléchargement terminé (et vérifié) :
+        `file_path` n'est jamais laissé partiellement écrit.
+
+        Si le serveur gère les requêtes `Range`, les gros fichiers sont téléchargés en plusieurs segments parallèles
+        (`store_api.download_segments`, `store_api.download_segment_min_size`), chaque segment coupé étant
+        redemandé à partir du dernier octet reçu, et un téléchargement interrompu reprend là où il s'était arrêté
+        (état enregistré dans `<fichier>.part.json`, cf. `FileDownloader`).
+
+        Args:
+            route_name (str): Route à utiliser
+            file_path (Path): chemin local où enregistrer le fichier
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
+            checksum (Optional[str], optional): empreinte attendue du fichier.
+            checksum_algorithm (str, optional): algorithme de l'empreinte (cf. `hashlib`).
+            callback (Optional[Callable[[TransferProgress], None]], optional): fonction de suivi appelée après chaque bloc.
+
+        Raises:
+            GpfSdkError: levée si l'empreinte du fichier téléchargé n'est pas celle attendue
+
+        Returns:
+            avancement final du téléchargement (taille, durée, débit)
+        """
+
+        def request(header: Dict[str, str]) -> requests.Response:
+            return self.route_request(route_name, route_params=dict(route_params) if route_params is not None else None, params=params, stream=True, header=header)
+
+        o_downloader = FileDownloader(
+            request,
+            file_path,
+            self.__download_chunk_size,
+            nb_segments=Config().get_int("store_api", "download_segments", fallback=4),
+            segment_min_size=Config().get_int("store_api", "download_segment_min_size", fallback=16777216),
+            retry_policy=self.__retry_policy,
+        )
+        o_progress = o_downloader.download(checksum, checksum_algorithm, callback)
+        Config().om.debug(f"Fichier {file_path} téléchargé : {o_progress}")
+        return o_progress
 
     @staticmethod
     def range_next_page(content_range: Optional[str], length: int) -> bool:
@@ -283,15 +709,29 @@ class ApiRequester(metaclass=Singleton):
         Returns:
             True s'il faut continuer, False sinon
         """
-        # On regarde le Content-Range de la réponse pour savoir si on doit refaire une requête pour récupérer la fin
-        if content_range is None:
-            # S'il n'est pas renseigné, on arrête là
+        i_total = ApiRequester.range_length(content_range)
+        # Si le nombre total n'est pas connu, on arrête là
+        if i_total is None:
             return False
-        # Sinon on tente de le parser
+        # Sinon, on compare la len indiquée par le serveur à celle de notre liste, si c'est égal ou supérieur on arrête
+        return not length >= i_total
+
+    @staticmethod
+    def range_length(content_range: Optional[str]) -> Optional[int]:
+        """Fonction analysant le `Content-Range` d'une réponse pour renvoyer le nombre total d'éléments.
+
+        Args:
+            content_range (Optional[str]): Content-Range renvoyé par l'API
+
+        Returns:
+            nombre total d'éléments, None si le Content-Range est absent ou non analysable
+        """
+        if content_range is None:
+            return None
+        # On tente de le parser
         o_result = ApiRequester.regex_content_range.search(content_range)
         if o_result is None:
-            # Si le parsing a raté, on met un warning en on s'arrête là niveau requête
+            # Si le parsing a raté, on met un warning
             Config().om.warning(f"Impossible d'analyser le nombre d'éléments à requêter. Contactez le support. (Content-Range : {content_range})")
-            return False
-        # Sinon, on compare la len indiquée par le serveur à celle de notre liste, si c'est égal ou supérieur on arrête
-        return not length >= int(o_result.group("len"))
+            return None
+        return int(o_result.group("len"))
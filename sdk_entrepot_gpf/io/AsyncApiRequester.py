@@ -0,0 +1,196 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BufferedReader
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+import requests
+
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
+
+R = TypeVar("R")
+
+
+class AsyncApiRequester(metaclass=Singleton):
+    """Classe singleton permettant d'appeler l'ApiRequester depuis du code asyncio sans bloquer la boucle d'événements.
+
+    Il ne s'agit pas d'un client HTTP asynchrone : chaque requête est exécutée par l'ApiRequester (même routage, mêmes
+    tentatives et même gestion des erreurs : `NotFoundError`, `ConflictError`, ...) dans un pool de threads borné,
+    et la coroutine attend son résultat. Le nombre de requêtes en cours simultanément est donc limité par la taille
+    de ce pool (`store_api.async_max_workers`) ; les requêtes partagent le pool de connexions de l'ApiRequester.
+
+    Attributes:
+        __max_workers (int): nombre maximal de requêtes exécutées simultanément
+        __executor (Optional[ThreadPoolExecutor]): pool de threads exécutant les requêtes (None tant qu'aucune requête n'a été faite)
+        __lock (threading.Lock): verrou protégeant la création et la fermeture du pool de threads
+    """
+
+    def __init__(self) -> None:
+        self.__max_workers = Config().get_int("store_api", "async_max_workers", fallback=32)
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__lock = threading.Lock()
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        """Renvoie le pool de threads, créé à la première requête (une seule fois, même depuis plusieurs threads).
+
+        Returns:
+            pool de threads exécutant les requêtes
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="sdk_entrepot_gpf")
+            return self.__executor
+
+    async def run_sync(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Exécute une fonction bloquante dans le pool de threads et attend son résultat sans bloquer la boucle d'événements.
+
+        Le contexte (`contextvars`) de l'appelant est propagé au thread d'exécution.
+
+        Args:
+            function (Callable[..., R]): fonction bloquante à exécuter
+            *args (Any): arguments positionnels de la fonction
+            **kwargs (Any): arguments nommés de la fonction
+
+        Returns:
+            résultat de la fonction
+        """
+        o_executor = self.__get_executor()
+        o_context = contextvars.copy_context()
+
+        def run_in_context() -> R:
+            return o_context.run(function, *args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(o_executor, run_in_context)
+
+    async def route_request(
+        self,
+        route_name: str,
+        route_params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+    ) -> requests.Response:
+        """Exécute une requête à l'API à partir du nom d'une route, cf. `ApiRequester.route_request`.
+
+        Args:
+            route_name (str): Route à utiliser
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            method (str, optional): méthode de la requête.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
+            data (Optional[Dict[str, Any]], optional): Données de la requête.
+            files (Optional[Dict[str, Tuple[Any]]], optional): Liste des fichiers à envoyer {"file":('fichier.ext', File)}.
+
+        Returns:
+            réponse vérifiée
+        """
+        return await self.run_sync(ApiRequester().route_request, route_name, route_params=route_params, method=method, params=params, data=data, files=files)
+
+    async def url_request(
+        self,
+        url: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+        header: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Effectue une requête à l'API à partir d'une url, cf. `ApiRequester.url_request`.
+
+        Args:
+            url (str): url absolue de la requête
+            method (str, optional): méthode de la requête
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête (ajouté à l'url)
+            data (Optional[Union[Dict[str, Any], List[Any]]], optional): contenue de la requête (ajouté au corp)
+            files (Optional[Dict[str, Tuple[Any]]], optional): fichiers à envoyer
+            header (Optional[Dict[str, str]], optional): Header additionnel pour la requête
+
+        Returns:
+            réponse si succès
+        """
+        return await self.run_sync(ApiRequester().url_request, url, method, params, data, files, header if header is not None else {})
+
+    async def route_upload_file(
+        self,
+        route_name: str,
+        file_path: Path,
+        file_key: str,
+        route_params: Optional[Dict[str, Any]] = None,
+        method: str = "POST",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        callback: Optional[Callable[[TransferProgress], None]] = None,
+    ) -> requests.Response:
+        """Envoie un fichier à l'API à partir du nom d'une route, cf. `ApiRequester.route_upload_file`.
+
+        Args:
+            route_name (str): Route à utiliser
+            file_path (Path): Chemin du fichier à uploader
+            file_key (str): nom de la clef dans le dictionnaire
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            method (str, optional): méthode de la requête.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
+            data (Optional[Dict[str, Any]], optional): Données de la requête.
+            callback (Optional[Callable[[TransferProgress], None]], optional): fonction de suivi appelée au fil de l'envoi (depuis un thread).
+
+        Returns:
+            réponse vérifiée
+        """
+        return await self.run_sync(ApiRequester().route_upload_file, route_name, file_path, file_key, route_params=route_params, method=method, params=params, data=data, callback=callback)
+
+    async def route_download_file(
+        self,
+        route_name: str,
+        file_path: Path,
+        route_params: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        checksum: Optional[str] = None,
+        checksum_algorithm: str = "md5",
+        callback: Optional[Callable[[TransferProgress], None]] = None,
+    ) -> TransferProgress:
+        """Télécharge un fichier depuis l'API en flux, cf. `ApiRequester.route_download_file`.
+
+        La fonction de suivi est appelée depuis le thread effectuant le téléchargement.
+
+        Args:
+            route_name (str): Route à utiliser
+            file_path (Path): chemin local où enregistrer le fichier
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
+            checksum (Optional[str], optional): empreinte attendue du fichier.
+            checksum_algorithm (str, optional): algorithme de l'empreinte.
+            callback (Optional[Callable[[TransferProgress], None]], optional): fonction de suivi appelée après chaque bloc.
+
+        Returns:
+            avancement final du téléchargement
+        """
+        return await self.run_sync(
+            ApiRequester().route_download_file,
+            route_name,
+            file_path,
+            route_params=route_params,
+            params=params,
+            checksum=checksum,
+            checksum_algorithm=checksum_algorithm,
+            callback=callback,
+        )
+
+    def close(self) -> None:
+        """Attend la fin des requêtes en cours et libère le pool de threads. Un nouveau pool sera créé à la prochaine requête."""
+        with self.__lock:
+            o_executor = self.__executor
+            self.__executor = None
+        if o_executor is not None:
+            o_executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncApiRequester":
+        return self
+
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException], exc_traceback: Optional[TracebackType]) -> None:
+        # La fermeture attend la fin des requêtes en cours : on ne bloque pas la boucle pendant ce temps
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,222 @@
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.pattern.ScopedSingleton import SingletonScope
+
+R = TypeVar("R")
+
+
+class ClientContext(SingletonScope):
+    """Contexte client nommé, permettant à un même processus d'agir pour plusieurs comptes (multi-tenant).
+
+    Chaque contexte a sa propre configuration, construite à partir de la configuration courante surchargée par des
+    fichiers et/ou des paramètres (identifiants, url racine, entrepôt par défaut, ...), et ses propres instances de
+    `Config`, `Authentifier`, `AsyncAuthentifier` et `ApiRequester` : jeton et cache du jeton, session HTTP (pool de
+    connexions), cache des réponses et limiteur de débit ne sont pas partagés entre les contextes.
+
+    Un contexte est sélectionné :
+
+    * pour un bloc de code, via une variable de contexte (`contextvars`) : `with ClientContext.use("producteur_a"): ...`
+      (ou `with o_client.activate(): ...`) ; tout le code du SDK appelé dans le bloc (entités, actions, workflows)
+      utilise alors les instances du contexte, y compris dans les threads de l'AsyncApiRequester et les coroutines ;
+    * pour un appel : `o_client.run(fonction, *args, **kwargs)`.
+
+    Plusieurs threads ou tâches asyncio peuvent utiliser simultanément des contextes différents. En dehors de tout
+    contexte, les instances du processus sont utilisées, comme auparavant.
+
+    Attributes:
+        __name (str): nom du contexte
+    """
+
+    # Contextes enregistrés par nom
+    __clients: Dict[str, "ClientContext"] = {}
+    __clients_lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str,
+        settings: Optional[Dict[str, Dict[str, Any]]] = None,
+        config_files: Optional[List[Union[str, Path]]] = None,
+        datastore: Optional[str] = None,
+    ) -> None:
+        """Crée un contexte client (non enregistré, cf. `register`).
+
+        Args:
+            name (str): nom du contexte
+            settings (Optional[Dict[str, Dict[str, Any]]], optional): paramètres surchargeant la configuration,
+                par section (ex. : `{"store_authentification": {"login": "...", "password": "..."}}`).
+            config_files (Optional[List[Union[str, Path]]], optional): fichiers de configuration à lire (avant `settings`).
+            datastore (Optional[str], optional): entrepôt par défaut du contexte (paramètre `store_api.datastore`).
+        """
+        super().__init__()
+        self.__name = name
+        d_settings: Dict[str, Dict[str, Any]] = {s_section: dict(d_options) for s_section, d_options in (settings or {}).items()}
+        if datastore is not None:
+            d_settings.setdefault("store_api", {})["datastore"] = datastore
+        self.set_instance(Config, ClientContext.__build_config(d_settings, config_files or []))
+
+    @staticmethod
+    def __build_config(settings: Dict[str, Dict[str, Any]], config_files: List[Union[str, Path]]) -> Config:
+        """Construit la configuration d'un contexte : copie de la configuration courante, surchargée par les fichiers
+        puis par les paramètres indiqués (les valeurs sont copiées non interpolées : une url racine surchargée
+        s'applique aux routes).
+
+        Args:
+            settings (Dict[str, Dict[str, Any]]): paramètres par section
+            config_files (List[Union[str, Path]]): fichiers de configuration à lire
+
+        Returns:
+            configuration du contexte
+        """
+        o_current = Config()
+        o_config: Config = type.__call__(Config)
+        o_config.set_output_manager(o_current.om)
+        o_parser = o_current.get_parser()
+        o_config.get_parser().read_dict({s_section: dict(o_parser.items(s_section, raw=True)) for s_section in o_parser.sections()})
+        if config_files:
+            o_config.read(config_files)
+        o_config.get_parser().read_dict({s_section: {s_option: str(o_value) for s_option, o_value in d_options.items()} for s_section, d_options in settings.items()})
+        return o_config
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def config(self) -> Config:
+        """Configuration du contexte."""
+        with self.activate():
+            return Config()
+
+    @property
+    def authentifier(self) -> Authentifier:
+        """Authentifier du contexte."""
+        with self.activate():
+            return Authentifier()
+
+    @property
+    def api_requester(self) -> ApiRequester:
+        """ApiRequester du contexte."""
+        with self.activate():
+            return ApiRequester()
+
+    def run(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Exécute une fonction dans le contexte.
+
+        Args:
+            function (Callable[..., R]): fonction à exécuter
+            *args (Any): arguments positionnels de la fonction
+            **kwargs (Any): arguments nommés de la fonction
+
+        Returns:
+            résultat de la fonction
+        """
+        with self.activate():
+            return function(*args, **kwargs)
+
+    def close(self) -> None:
+        """Ferme les connexions du contexte et arrête le renouvellement du jeton en arrière-plan."""
+        for o_instance in self.instances().values():
+            if isinstance(o_instance, ApiRequester):
+                o_instance.close()
+            elif isinstance(o_instance, Authentifier):
+                o_instance.stop_background_refresh()
+
+    @staticmethod
+    def current() -> Optional["ClientContext"]:
+        """Renvoie le contexte client actif dans le contexte courant.
+
+        Returns:
+            contexte client actif, None si ce sont les instances du processus qui sont utilisées
+        """
+        o_scope = SingletonScope.current()
+        return o_scope if isinstance(o_scope, ClientContext) else None
+
+    @classmethod
+    def register(
+        cls,
+        name: str,
+        settings: Optional[Dict[str, Dict[str, Any]]] = None,
+        config_files: Optional[List[Union[str, Path]]] = None,
+        datastore: Optional[str] = None,
+    ) -> "ClientContext":
+        """Crée et enregistre un contexte client (un contexte déjà enregistré sous ce nom est fermé et remplacé).
+
+        Args:
+            name (str): nom du contexte
+            settings (Optional[Dict[str, Dict[str, Any]]], optional): paramètres surchargeant la configuration, par section.
+            config_files (Optional[List[Union[str, Path]]], optional): fichiers de configuration à lire.
+            datastore (Optional[str], optional): entrepôt par défaut du contexte.
+
+        Returns:
+            contexte enregistré
+        """
+        o_client = cls(name, settings, config_files, datastore)
+        with cls.__clients_lock:
+            o_previous = cls.__clients.get(name)
+            cls.__clients[name] = o_client
+        if o_previous is not None:
+            o_previous.close()
+        return o_client
+
+    @classmethod
+    def unregister(cls, name: str) -> None:
+        """Ferme et retire un contexte enregistré (sans effet s'il n'existe pas).
+
+        Args:
+            name (str): nom du contexte
+        """
+        with cls.__clients_lock:
+            o_client = cls.__clients.pop(name, None)
+        if o_client is not None:
+            o_client.close()
+
+    @classmethod
+    def get(cls, name: str) -> "ClientContext":
+        """Renvoie un contexte enregistré.
+
+        Args:
+            name (str): nom du contexte
+
+        Raises:
+            GpfSdkError: levée si aucun contexte n'est enregistré sous ce nom
+
+        Returns:
+            contexte client
+        """
+        with cls.__clients_lock:
+            o_client = cls.__clients.get(name)
+        if o_client is None:
+            raise GpfSdkError(f"Le contexte client « {name} » n'est pas défini.")
+        return o_client
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Renvoie les noms des contextes enregistrés.
+
+        Returns:
+            noms des contextes
+        """
+        with cls.__clients_lock:
+            return sorted(cls.__clients)
+
+    @classmethod
+    @contextmanager
+    def use(cls, name: str) -> Iterator["ClientContext"]:
+        """Active un contexte enregistré le temps d'un bloc `with`.
+
+        Args:
+            name (str): nom du contexte
+
+        Yields:
+            le contexte client
+        """
+        o_client = cls.get(name)
+        with o_client.activate():
+            yield o_client
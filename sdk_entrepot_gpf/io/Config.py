@@ -1,13 +1,57 @@
 import configparser
+import itertools
 from pathlib import Path
 from typing import Any, Iterable, List, Optional, Union
 
-from sdk_entrepot_gpf.pattern.Singleton import Singleton
+from sdk_entrepot_gpf.pattern.ScopedSingleton import ScopedSingleton
 from sdk_entrepot_gpf.io.OutputManager import OutputManager
 from sdk_entrepot_gpf.io.Errors import ConfigReaderError
 
 
-class Config(metaclass=Singleton):
+class _VersionedConfigParser(configparser.ConfigParser):
+    """ConfigParser dont la version change à chaque modification : lecture de fichier, de chaîne ou de dictionnaire
+    (`read_dict` passe par `set`), modification (`set`, `parser[section][option] = ...`) ou suppression.
+
+    Attributes:
+        version (int): version du contenu (unique dans le processus)
+    """
+
+    # Compteur des versions de configuration (partagé par toutes les instances)
+    __versions = itertools.count()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.version = next(_VersionedConfigParser.__versions)
+        super().__init__(*args, **kwargs)
+
+    def __changed(self) -> None:
+        """Change la version du contenu."""
+        self.version = next(_VersionedConfigParser.__versions)
+
+    def read(self, filenames: Any, encoding: Optional[str] = None) -> List[str]:
+        l_files = super().read(filenames, encoding=encoding)
+        self.__changed()
+        return l_files
+
+    def read_file(self, f: Iterable[str], source: Optional[str] = None) -> None:
+        super().read_file(f, source=source)
+        self.__changed()
+
+    def set(self, section: str, option: str, value: Optional[str] = None) -> None:
+        super().set(section, option, value)
+        self.__changed()
+
+    def remove_option(self, section: str, option: str) -> bool:
+        b_removed = super().remove_option(section, option)
+        self.__changed()
+        return b_removed
+
+    def remove_section(self, section: str) -> bool:
+        b_removed = super().remove_section(section)
+        self.__changed()
+        return b_removed
+
+
+class Config(metaclass=ScopedSingleton):
     """Lit le fichier de configuration (classe Singleton).
     Attributes:
         __config_parser (configparser): ConfigParser
@@ -31,7 +75,7 @@ class Config(metaclass=Singleton):
         if not Config.ini_file_path.exists():
             raise ConfigReaderError("Fichier de configuration par défaut {ConfigReader.ini_file_path} non trouvé.")
 
-        self.__config_parser: configparser.ConfigParser = configparser.ConfigParser(interpolation=configparser.ExtendedInterpolation())
+        self.__config_parser = _VersionedConfigParser(interpolation=configparser.ExtendedInterpolation())
         with Config.ini_file_path.open(encoding="UTF-8") as f_ini:
             self.__config_parser.read_file(f_ini)
 
@@ -60,6 +104,17 @@ class Config(metaclass=Singleton):
         """
         return self.__config_parser.read(filenames)
 
+    @property
+    def version(self) -> int:
+        """Version de la configuration : elle change à chaque modification (lecture de fichier via `read`, ou
+        modification du parser via `get_parser().read_dict(...)`, `set`, ...), ce qui permet de savoir si des valeurs
+        précalculées à partir de la configuration (ex. : table des routes) doivent être recalculées.
+
+        Returns:
+            version de la configuration
+        """
+        return self.__config_parser.version
+
     def get_parser(self) -> configparser.ConfigParser:
         """Retourne le config_parser.
 
@@ -0,0 +1,168 @@
+import math
+import time
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Optional, Tuple, Type
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError
+
+# Délais d'attente d'une requête (connexion, lecture) en secondes, None : pas de limite
+TimeoutType = Tuple[Optional[float], Optional[float]]
+
+
+class Deadline:
+    """Échéance d'une opération, propagée à toutes les requêtes HTTP lancées pendant l'opération.
+
+    L'échéance est active dans un bloc `with` et portée par une variable de contexte (`contextvars`) : elle suit
+    l'appelant jusqu'à chaque tentative de requête (ApiRequester, Authentifier), y compris dans les threads lancés
+    par l'AsyncApiRequester et les téléchargements parallèles. Chaque tentative vérifie que l'échéance n'est pas
+    dépassée et ses délais d'attente (connexion, lecture) sont réduits au temps restant ; aucune nouvelle tentative
+    n'est lancée si l'attente avant celle-ci dépasse l'échéance.
+
+    Les échéances s'imbriquent : une opération lancée dans une autre ne peut pas dépasser l'échéance englobante.
+
+    Attributes:
+        __name (str): nom de l'opération (pour les messages d'erreur)
+        __seconds (float): durée accordée à l'opération (en secondes), infinie si pas de limite
+        __expires_at (float): instant de l'échéance (horloge monotone)
+        __token (Optional[Token[Optional[Deadline]]]): jeton de restauration de l'échéance englobante
+    """
+
+    # Échéance active dans le contexte courant
+    __current: ContextVar[Optional["Deadline"]] = ContextVar("sdk_entrepot_gpf_deadline", default=None)
+
+    def __init__(self, seconds: float, name: str = "opération") -> None:
+        self.__name = name
+        self.__seconds = seconds if seconds > 0 else math.inf
+        self.__expires_at = time.monotonic() + self.__seconds
+        self.__token: Optional[Token[Optional[Deadline]]] = None
+
+    @classmethod
+    def from_config(cls, option: str, name: str) -> "Deadline":
+        """Instancie une échéance dont la durée est lue dans la section `deadline` de la configuration.
+
+        Args:
+            option (str): paramètre de la section `deadline` (durée en secondes, 0 ou vide : pas de limite)
+            name (str): nom de l'opération
+
+        Returns:
+            échéance (démarrée à l'instanciation)
+        """
+        s_seconds = Config().get("deadline", option)
+        return cls(float(s_seconds) if s_seconds else 0, name)
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def remaining(self) -> float:
+        """Temps restant avant l'échéance (en secondes), infini si pas de limite."""
+        return self.__expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining <= 0
+
+    def check(self) -> None:
+        """Vérifie que l'échéance n'est pas dépassée.
+
+        Raises:
+            DeadlineExceededError: levée si l'échéance est dépassée
+        """
+        if self.expired:
+            raise self.exceeded_error()
+
+    def exceeded_error(self) -> DeadlineExceededError:
+        """Construit l'erreur signalant le dépassement de l'échéance.
+
+        Returns:
+            erreur à lever
+        """
+        return DeadlineExceededError(f"Délai de {self.__seconds:g} s dépassé pour l'opération « {self.__name} ».")
+
+    def __enter__(self) -> "Deadline":
+        o_parent = Deadline.current()
+        # L'échéance englobante reste active si elle est plus proche
+        self.__token = Deadline.__current.set(o_parent if o_parent is not None and o_parent.remaining <= self.remaining else self)
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException], exc_traceback: Optional[TracebackType]) -> None:
+        if self.__token is not None:
+            Deadline.__current.reset(self.__token)
+            self.__token = None
+
+    @staticmethod
+    def current() -> Optional["Deadline"]:
+        """Renvoie l'échéance active dans le contexte courant.
+
+        Returns:
+            échéance active, None s'il n'y en a pas
+        """
+        return Deadline.__current.get()
+
+    @staticmethod
+    def check_current() -> None:
+        """Vérifie que l'échéance active (s'il y en a une) n'est pas dépassée.
+
+        Raises:
+            DeadlineExceededError: levée si l'échéance active est dépassée
+        """
+        o_deadline = Deadline.current()
+        if o_deadline is not None:
+            o_deadline.check()
+
+    @staticmethod
+    def clamp(timeout: TimeoutType) -> TimeoutType:
+        """Réduit les délais d'attente d'une requête au temps restant avant l'échéance active.
+
+        Args:
+            timeout (TimeoutType): délais d'attente de connexion et de lecture (None : pas de limite)
+
+        Returns:
+            délais d'attente à passer à `requests`
+        """
+        o_deadline = Deadline.current()
+        if o_deadline is None or math.isinf(o_deadline.remaining):
+            return timeout
+        f_remaining = max(o_deadline.remaining, 0.001)
+        f_connect, f_read = timeout
+        return (f_remaining if f_connect is None else min(f_connect, f_remaining), f_remaining if f_read is None else min(f_read, f_remaining))
+
+    @staticmethod
+    def clamp_delay(delay: float) -> float:
+        """Réduit une attente (ex. : avant une nouvelle tentative) au temps restant avant l'échéance active.
+
+        Args:
+            delay (float): attente prévue (en secondes)
+
+        Returns:
+            attente à effectuer (en secondes)
+        """
+        o_deadline = Deadline.current()
+        if o_deadline is None or math.isinf(o_deadline.remaining):
+            return delay
+        return max(0.0, min(delay, o_deadline.remaining))
+
+    @staticmethod
+    def timeout_from_config(section: str, kind: Optional[str] = None) -> TimeoutType:
+        """Lit les délais d'attente (connexion, lecture) d'un type de requête dans la configuration.
+
+        Les paramètres `sec_timeout[_<type>]_connect` et `sec_timeout[_<type>]_read` sont lus dans la section indiquée
+        puis, s'ils n'y sont pas définis, dans la section `store_api` (0 ou vide : pas de limite).
+
+        Args:
+            section (str): section de la configuration à lire
+            kind (Optional[str], optional): type de requête (`upload`, `download`), None pour les requêtes JSON.
+
+        Returns:
+            délais d'attente de connexion et de lecture (en secondes, None : pas de limite)
+        """
+        s_prefix = "sec_timeout" if kind is None else f"sec_timeout_{kind}"
+
+        def get(option: str) -> Optional[float]:
+            s_value = Config().get(section, option, fallback=Config().get("store_api", option))
+            return float(s_value) if s_value and float(s_value) > 0 else None
+
+        return (get(f"{s_prefix}_connect"), get(f"{s_prefix}_read"))
@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Dict, Mapping, Optional, List, Union
 
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.io.Color import Color
@@ -21,6 +21,14 @@ class RoutingReaderError(GpfSdkError):
     """
 
 
+class DeadlineExceededError(GpfSdkError):
+    """Erreur levée quand l'échéance d'une opération est dépassée (cf. `Deadline`).
+
+    Attributes:
+        __message (str): message décrivant le problème
+    """
+
+
 class ApiError(Exception):
     """Erreur API : classe abstraite pour gérer les erreurs API en général."""
 
@@ -169,6 +177,7 @@ class StatusCodeError(_WithResponseError):
         data: Optional[Union[Dict[str, Any], List[Any]]],
         status_code: int,
         response: str,
+        headers: Optional[Mapping[str, str]] = None,
     ):
         """Instanciée à partir de l'URL, la méthode, les paramètres et les données posant problème ainsi que la réponse et le code de retour de l'API.
 
@@ -179,9 +188,11 @@ class StatusCodeError(_WithResponseError):
             data (Optional[Union[Dict[str, Any], List[Any]]]): données envoyées
             status_code (int): code de retour
             response (str): données reçues
+            headers (Optional[Mapping[str, str]]): en-têtes de la réponse (pour récupérer `Retry-After` par exemple)
         """
         super().__init__(url, method, params, data, response)
         self.status_code = status_code
+        self.headers: Mapping[str, str] = headers if headers is not None else {}
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -193,3 +204,7 @@ class StatusCodeError(_WithResponseError):
                 f"   * status_code: {self.status_code}",
             ]
         )
+
+
+class RangeNotSatisfiableError(StatusCodeError):
+    """Erreur API : plage demandée (`Range`) non satisfiable (416), par exemple pour un fichier vide."""
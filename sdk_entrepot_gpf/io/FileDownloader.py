@@ -0,0 +1,463 @@
+import contextvars
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import StatusCodeError
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
+
+
+class RangeNotSatisfiedError(Exception):
+    """Levée quand le serveur ne renvoie pas le segment demandé (pas de support des requêtes `Range` ou fichier modifié)."""
+
+
+class Segment:
+    """Segment d'un fichier à télécharger (octets `start` à `end` inclus, `end` None si la taille est inconnue).
+
+    Attributes:
+        start (int): premier octet du segment
+        end (Optional[int]): dernier octet du segment (None : jusqu'à la fin du fichier)
+        done (int): nombre d'octets du segment déjà téléchargés
+    """
+
+    def __init__(self, start: int, end: Optional[int], done: int = 0) -> None:
+        self.start = start
+        self.end = end
+        self.done = done
+
+    @property
+    def position(self) -> int:
+        """Position du prochain octet à télécharger."""
+        return self.start + self.done
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Nombre d'octets restant à télécharger (None si la taille est inconnue)."""
+        return None if self.end is None else self.end + 1 - self.position
+
+    @property
+    def complete(self) -> bool:
+        return self.remaining == 0
+
+    def range_header(self) -> str:
+        """Valeur de l'en-tête `Range` demandant la partie restante du segment."""
+        return f"bytes={self.position}-{'' if self.end is None else self.end}"
+
+
+class DownloadState:
+    """État d'un téléchargement : taille du fichier, validateur et segments, enregistrable pour une reprise.
+
+    Pendant le téléchargement, l'état est enregistré au plus tous les `save_bytes` octets ou toutes les
+    `save_interval` secondes (cf. `checkpoint`) : une reprise redemande au pire les octets reçus depuis.
+
+    Attributes:
+        path (Path): fichier où est enregistré l'état (`<fichier>.part.json`)
+        total (Optional[int]): taille du fichier (None si inconnue)
+        validator (Optional[str]): validateur du fichier (`ETag` ou `Last-Modified`), envoyé via `If-Range`
+        resumable (bool): indique si le téléchargement peut être repris (taille connue et requêtes `Range` gérées)
+        segments (List[Segment]): segments du fichier
+        __unsaved (int): nombre d'octets téléchargés depuis le dernier enregistrement
+        __saved_at (float): date (monotone) du dernier enregistrement
+    """
+
+    save_bytes = 8388608
+    save_interval = 1.0
+
+    def __init__(self, path: Path, total: Optional[int] = None, validator: Optional[str] = None, resumable: bool = False, segments: Optional[List[Segment]] = None) -> None:
+        self.path = path
+        self.total = total
+        self.validator = validator
+        self.resumable = resumable
+        self.segments: List[Segment] = segments if segments is not None else []
+        self.__unsaved = 0
+        self.__saved_at = time.monotonic()
+
+    @property
+    def done(self) -> int:
+        """Nombre d'octets déjà téléchargés."""
+        return sum(o_segment.done for o_segment in self.segments)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["DownloadState"]:
+        """Charge l'état enregistré d'un téléchargement reprenable.
+
+        Args:
+            path (Path): fichier de l'état
+
+        Returns:
+            état du téléchargement, None si absent ou invalide
+        """
+        if not path.exists():
+            return None
+        try:
+            d_state = json.loads(path.read_text(encoding="utf-8"))
+            return cls(path, int(d_state["total"]), d_state["validator"], True, [Segment(*l_segment) for l_segment in d_state["segments"]])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self) -> None:
+        """Enregistre (de manière atomique) l'état si le téléchargement est reprenable."""
+        if not self.resumable:
+            return
+        d_state = {
+            "total": self.total,
+            "validator": self.validator,
+            "segments": [[o_segment.start, o_segment.end, o_segment.done] for o_segment in self.segments],
+        }
+        p_tmp = self.path.with_name(self.path.name + ".tmp")
+        p_tmp.write_text(json.dumps(d_state), encoding="utf-8")
+        os.replace(p_tmp, self.path)
+        self.__unsaved = 0
+        self.__saved_at = time.monotonic()
+
+    def checkpoint(self, nb_bytes: int) -> None:
+        """Compte les octets téléchargés et enregistre l'état si `save_bytes` octets ont été reçus ou si
+        `save_interval` secondes se sont écoulées depuis le dernier enregistrement.
+
+        Args:
+            nb_bytes (int): nombre d'octets téléchargés
+        """
+        self.__unsaved += nb_bytes
+        if self.__unsaved >= DownloadState.save_bytes or time.monotonic() - self.__saved_at >= DownloadState.save_interval:
+            self.save()
+
+
+class FileDownloader:
+    """Téléchargement d'un fichier en flux, par segments parallèles (requêtes `Range`) et avec reprise.
+
+    Le fichier est écrit dans `<fichier>.part` puis renommé une fois complet (et vérifié). L'état du téléchargement
+    (segments, taille, validateur `ETag`/`Last-Modified`) est enregistré dans `<fichier>.part.json` : un téléchargement
+    interrompu reprend là où il s'était arrêté (le validateur est envoyé via `If-Range` : si le fichier a changé
+    côté serveur, le téléchargement repart de zéro).
+
+    La première requête demande tout le fichier (`Range: bytes=0-`). Si le serveur répond 206 avec la taille du fichier
+    et que celle-ci le justifie, le reste du fichier est découpé en segments téléchargés en parallèle, la première
+    réponse servant au premier segment. Sinon, le fichier est téléchargé en un seul flux. Si le serveur refuse cette
+    plage (416, fichier vide : `Content-Range: bytes */0`), le fichier est redemandé sans en-tête `Range`.
+
+    Attributes:
+        __request (Callable[[Dict[str, str]], requests.Response]): exécute la requête (en flux) avec les en-têtes donnés
+        __file_path (Path): chemin du fichier final
+        __chunk_size (int): taille des blocs lus
+        __nb_segments (int): nombre maximal de segments téléchargés en parallèle
+        __segment_min_size (int): taille minimale d'un segment
+        __retry_policy (RetryPolicy): politique de nouvelles tentatives en cas de coupure pendant la lecture d'un segment
+        __state (DownloadState): état du téléchargement
+        __progress (TransferProgress): avancement du téléchargement
+    """
+
+    regex_content_range = re.compile(r"bytes\s+(?P<start>\d+)-(?P<end>\d+)/(?P<total>\d+)")
+    regex_content_range_empty = re.compile(r"bytes\s+\*/0\b")
+
+    def __init__(
+        self,
+        request: Callable[[Dict[str, str]], requests.Response],
+        file_path: Path,
+        chunk_size: int,
+        nb_segments: int = 1,
+        segment_min_size: int = 16777216,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        self.__request = request
+        self.__file_path = file_path
+        self.__chunk_size = chunk_size
+        self.__nb_segments = max(1, nb_segments)
+        self.__segment_min_size = max(1, segment_min_size)
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy(1, 0, 0)
+        self.__lock = threading.Lock()
+        self.__state = DownloadState(self.state_path)
+        self.__progress = TransferProgress()
+        self.__callback: Optional[Callable[[TransferProgress], None]] = None
+        self.__hash: Optional[Any] = None
+
+    @property
+    def part_path(self) -> Path:
+        """Fichier temporaire du téléchargement."""
+        return self.__file_path.with_name(self.__file_path.name + ".part")
+
+    @property
+    def state_path(self) -> Path:
+        """Fichier où est enregistré l'état du téléchargement."""
+        return self.__file_path.with_name(self.__file_path.name + ".part.json")
+
+    def download(self, checksum: Optional[str] = None, checksum_algorithm: str = "md5", callback: Optional[Callable[[TransferProgress], None]] = None) -> TransferProgress:
+        """Télécharge le fichier.
+
+        L'empreinte est calculée pendant le téléchargement s'il se fait en un seul flux depuis le début du fichier,
+        sinon sur le fichier une fois complet.
+
+        Args:
+            checksum (Optional[str], optional): empreinte attendue du fichier.
+            checksum_algorithm (str, optional): algorithme de l'empreinte (cf. `hashlib`).
+            callback (Optional[Callable[[TransferProgress], None]], optional): fonction de suivi appelée après chaque bloc
+                (depuis le thread téléchargeant le bloc en cas de téléchargement parallèle).
+
+        Raises:
+            GpfSdkError: levée si l'empreinte du fichier téléchargé n'est pas celle attendue
+
+        Returns:
+            avancement final du téléchargement (taille, durée, débit)
+        """
+        self.__callback = callback
+        try:
+            if self.__load_state():
+                Config().om.debug(f"Reprise du téléchargement de {self.__file_path} ({self.__progress.done} octets déjà téléchargés)")
+                try:
+                    self.__download_segments()
+                except RangeNotSatisfiedError:
+                    Config().om.debug(f"Reprise impossible pour {self.__file_path} : nouveau téléchargement.")
+                    self.__reset()
+                    self.__download_first(checksum_algorithm if checksum is not None else None)
+            else:
+                self.__reset()
+                self.__download_first(checksum_algorithm if checksum is not None else None)
+        except BaseException:
+            # Téléchargement non reprenable : on ne garde pas le fichier temporaire
+            if not self.state_path.exists():
+                self.__remove_part()
+            raise
+        self.__finalize(checksum, checksum_algorithm)
+        return self.__progress
+
+    def __reset(self) -> None:
+        """Supprime un éventuel téléchargement précédent."""
+        self.__remove_part()
+        self.__state = DownloadState(self.state_path)
+        self.__progress = TransferProgress()
+
+    def __remove_part(self) -> None:
+        for p_file in [self.part_path, self.state_path]:
+            if p_file.exists():
+                p_file.unlink()
+
+    def __load_state(self) -> bool:
+        """Charge l'état d'un téléchargement précédent interrompu.
+
+        Returns:
+            True si le téléchargement peut être repris
+        """
+        if not self.part_path.exists():
+            return False
+        o_state = DownloadState.load(self.state_path)
+        if o_state is None or self.part_path.stat().st_size != o_state.total:
+            return False
+        self.__state = o_state
+        self.__progress = TransferProgress(o_state.total, o_state.done)
+        return True
+
+    def __download_first(self, checksum_algorithm: Optional[str]) -> None:
+        """Premier téléchargement : une requête pour tout le fichier, découpé ensuite en segments si le serveur le permet.
+
+        Args:
+            checksum_algorithm (Optional[str]): algorithme de l'empreinte à calculer pendant le téléchargement (si un seul flux)
+        """
+        try:
+            o_response = self.__request({"Range": "bytes=0-"})
+        except Exception as e_error:
+            if not FileDownloader.range_not_satisfiable(e_error):
+                raise
+            o_response = None
+        if o_response is not None and (o_response.status_code == 416 or FileDownloader.regex_content_range_empty.search(o_response.headers.get("Content-Range", ""))):
+            o_response.close()
+            o_response = None
+        if o_response is None:
+            # Plage refusée (fichier vide) : on redemande le fichier sans Range
+            Config().om.debug(f"Requête Range refusée pour {self.__file_path} : fichier demandé en entier.")
+            o_response = self.__request({})
+        o_match = FileDownloader.regex_content_range.search(o_response.headers.get("Content-Range", ""))
+        o_state = self.__state
+        o_state.validator = o_response.headers.get("ETag", o_response.headers.get("Last-Modified"))
+        if o_response.status_code == 206 and o_match is not None and int(o_match.group("start")) == 0:
+            # Le serveur gère les requêtes Range : on connaît la taille du fichier
+            o_state.total = int(o_match.group("total"))
+            o_state.resumable = True
+            o_state.segments = self.__split(o_state.total)
+        else:
+            # Fichier envoyé en entier : un seul flux, reprenable si le serveur annonce la taille et accepte les requêtes Range
+            s_length = o_response.headers.get("Content-Length")
+            if s_length is not None and s_length.isdigit() and "Content-Encoding" not in o_response.headers:
+                o_state.total = int(s_length)
+                o_state.resumable = o_response.headers.get("Accept-Ranges") == "bytes"
+            o_state.segments = [Segment(0, None if o_state.total is None else o_state.total - 1)]
+        self.__progress = TransferProgress(o_state.total)
+        # Fichier temporaire à la taille finale (les segments y sont écrits à leur position)
+        with self.part_path.open("wb") as o_file:
+            if o_state.total is not None:
+                o_file.truncate(o_state.total)
+        if len(o_state.segments) == 1 and checksum_algorithm is not None:
+            self.__hash = hashlib.new(checksum_algorithm)
+        with self.__lock:
+            o_state.save()
+        self.__download_segments(o_response)
+
+    @staticmethod
+    def range_not_satisfiable(error: BaseException) -> bool:
+        """Indique si une erreur (ou l'erreur qui l'a causée, ex. : après épuisement des tentatives) est un refus de la
+        plage demandée (416).
+
+        Args:
+            error (BaseException): erreur levée par la requête
+
+        Returns:
+            True si le serveur a répondu 416
+        """
+        o_error: Optional[BaseException] = error
+        while o_error is not None:
+            if isinstance(o_error, StatusCodeError) and o_error.status_code == 416:
+                return True
+            o_error = o_error.__cause__
+        return False
+
+    def __split(self, total: int) -> List[Segment]:
+        """Découpe le fichier en segments.
+
+        Args:
+            total (int): taille du fichier
+
+        Returns:
+            segments
+        """
+        i_nb_segments = max(1, min(self.__nb_segments, total // self.__segment_min_size))
+        i_size = math.ceil(total / i_nb_segments)
+        return [Segment(i_start, min(i_start + i_size, total) - 1) for i_start in range(0, total, i_size)] if total > 0 else [Segment(0, -1)]
+
+    def __download_segments(self, first_response: Optional[requests.Response] = None) -> None:
+        """Télécharge les segments incomplets, en parallèle s'il y en a plusieurs.
+
+        Args:
+            first_response (Optional[requests.Response], optional): réponse déjà obtenue pour le premier segment
+        """
+        l_segments = [o_segment for o_segment in self.__state.segments if not o_segment.complete]
+        if first_response is not None and (not l_segments or l_segments[0] is not self.__state.segments[0]):
+            first_response.close()
+            first_response = None
+        if len(l_segments) <= 1:
+            for o_segment in l_segments:
+                self.__download_segment(o_segment, first_response)
+            return
+        with ThreadPoolExecutor(max_workers=len(l_segments), thread_name_prefix="sdk_entrepot_gpf_download") as o_executor:
+            # Chaque segment est téléchargé dans une copie du contexte de l'appelant (échéance active, ...)
+            l_futures = [o_executor.submit(self.__run_in_context, contextvars.copy_context(), o_segment, first_response if i == 0 else None) for i, o_segment in enumerate(l_segments)]
+            # On attend tous les segments (pour ne pas écrire après un renommage), puis on propage la première erreur
+            l_errors = [o_future.exception() for o_future in l_futures]
+        for e_error in l_errors:
+            if e_error is not None:
+                raise e_error
+
+    def __run_in_context(self, context: contextvars.Context, segment: Segment, response: Optional[requests.Response]) -> None:
+        """Télécharge un segment dans le contexte donné (thread de téléchargement parallèle)."""
+        context.run(self.__download_segment, segment, response)
+
+    def __download_segment(self, segment: Segment, response: Optional[requests.Response] = None) -> None:
+        """Télécharge un segment, en relançant une requête pour la partie restante en cas de coupure.
+
+        Args:
+            segment (Segment): segment à télécharger
+            response (Optional[requests.Response], optional): réponse déjà obtenue pour ce segment
+
+        Raises:
+            RangeNotSatisfiedError: levée si le serveur ne renvoie pas la partie demandée
+        """
+        o_attempts = self.__retry_policy.start()
+        while not segment.complete:
+            if response is None:
+                d_header = {"Range": segment.range_header()}
+                if self.__state.validator is not None:
+                    d_header["If-Range"] = self.__state.validator
+                response = self.__request(d_header)
+                o_match = FileDownloader.regex_content_range.search(response.headers.get("Content-Range", ""))
+                if response.status_code != 206 or o_match is None or int(o_match.group("start")) != segment.position:
+                    response.close()
+                    raise RangeNotSatisfiedError(f"Segment {segment.range_header()} non renvoyé par le serveur (code {response.status_code}).")
+            try:
+                self.__read_segment(segment, response)
+            except requests.RequestException as e_error:
+                # Coupure pendant la lecture : on redemande la partie restante si le serveur le permet
+                f_delay = o_attempts.next_delay(e_error) if self.__state.resumable else None
+                if f_delay is None:
+                    raise
+                Config().om.warning(f"Téléchargement interrompu ({e_error.__class__.__name__}), reprise à l'octet {segment.position}...")
+                time.sleep(f_delay)
+            response = None
+
+    def __read_segment(self, segment: Segment, response: requests.Response) -> None:
+        """Écrit le flux d'une réponse dans le segment, puis enregistre l'état (segment terminé ou interrompu).
+
+        Args:
+            segment (Segment): segment à télécharger
+            response (requests.Response): réponse (en flux) contenant la partie restante du segment
+
+        Raises:
+            requests.RequestException: levée si le flux est coupé avant la fin du segment
+        """
+        try:
+            with response, self.part_path.open("r+b") as o_file:
+                o_file.seek(segment.position)
+                for o_chunk in response.iter_content(chunk_size=self.__chunk_size):
+                    i_remaining = segment.remaining
+                    if i_remaining is not None:
+                        o_chunk = o_chunk[:i_remaining]
+                    o_file.write(o_chunk)
+                    self.__chunk_written(segment, o_chunk)
+                    if segment.complete:
+                        break
+            if segment.end is None:
+                # Taille inconnue : le segment est complet à la fin du flux
+                segment.end = segment.position - 1
+            elif not segment.complete:
+                raise requests.exceptions.ChunkedEncodingError(f"Flux terminé avant la fin du segment ({segment.remaining} octets manquants).")
+        finally:
+            with self.__lock:
+                self.__state.save()
+
+    def __chunk_written(self, segment: Segment, chunk: bytes) -> None:
+        """Enregistre l'écriture d'un bloc : état du téléchargement (cf. `DownloadState.checkpoint`), empreinte et suivi.
+
+        Args:
+            segment (Segment): segment du bloc
+            chunk (bytes): bloc écrit
+        """
+        with self.__lock:
+            segment.done += len(chunk)
+            if self.__hash is not None:
+                self.__hash.update(chunk)
+            self.__state.checkpoint(len(chunk))
+        self.__progress.add(len(chunk))
+        if self.__callback is not None:
+            self.__callback(self.__progress)
+
+    def __finalize(self, checksum: Optional[str], checksum_algorithm: str) -> None:
+        """Vérifie l'empreinte puis renomme le fichier temporaire en fichier final.
+
+        Args:
+            checksum (Optional[str]): empreinte attendue
+            checksum_algorithm (str): algorithme de l'empreinte
+
+        Raises:
+            GpfSdkError: levée si l'empreinte du fichier téléchargé n'est pas celle attendue
+        """
+        if checksum is not None:
+            if self.__hash is None:
+                # Téléchargement par segments ou repris : empreinte calculée sur le fichier complet
+                self.__hash = hashlib.new(checksum_algorithm)
+                with self.part_path.open("rb") as o_file:
+                    for o_chunk in iter(lambda: o_file.read(self.__chunk_size), b""):
+                        self.__hash.update(o_chunk)
+            s_hash = self.__hash.hexdigest()
+            if s_hash.lower() != checksum.lower():
+                self.__remove_part()
+                raise GpfSdkError(f"L'empreinte du fichier téléchargé ({s_hash}) ne correspond pas à celle attendue ({checksum}).")
+        os.replace(self.part_path, self.__file_path)
+        if self.state_path.exists():
+            self.state_path.unlink()
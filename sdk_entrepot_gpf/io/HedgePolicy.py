@@ -0,0 +1,230 @@
+import contextvars
+import fnmatch
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, TypeVar
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Metrics import Metrics
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """Politique de requêtes « couvertes » (hedging) pour les requêtes idempotentes sensibles à la latence.
+
+    Si une requête d'une route concernée n'a pas abouti dans le délai correspondant au percentile observé des
+    durées de la route (p95 par défaut, cf. `Metrics`), une seconde requête identique est envoyée et la première
+    réponse reçue est utilisée (l'autre est libérée dès sa réception). Si l'une des deux requêtes échoue, la réponse
+    de l'autre est attendue.
+
+    La charge supplémentaire est plafonnée : le nombre de requêtes supplémentaires ne peut pas dépasser un
+    pourcentage du nombre de requêtes concernées. Une route n'est couverte qu'une fois assez de durées mesurées.
+
+    Si les métriques sont désactivées (`metrics.enabled`), aucune durée n'est mesurée : le délai fixe `fallback_delay`
+    est utilisé pour toutes les routes concernées (pas de requête couverte s'il est nul, ce qui est signalé).
+
+    Attributes:
+        __routes (List[str]): motifs des noms des routes concernées
+        __ratio (float): percentile des durées utilisé comme délai avant la requête supplémentaire (entre 0 et 1)
+        __max_extra (float): nombre max de requêtes supplémentaires, en proportion des requêtes concernées
+        __min_samples (int): nombre min de durées mesurées pour la route avant de couvrir ses requêtes
+        __min_delay (float): délai min (en secondes) avant la requête supplémentaire
+        __fallback_delay (float): délai fixe (en secondes) utilisé si les métriques sont désactivées (0 : pas de requête couverte)
+        __max_workers (int): nombre max de requêtes couvertes (et supplémentaires) exécutées simultanément
+        __nb_requests (int): nombre de requêtes concernées
+        __nb_hedged (int): nombre de requêtes supplémentaires envoyées
+        __nb_running (int): nombre de requêtes en cours ou en attente dans le pool de threads
+        __executor (Optional[ThreadPoolExecutor]): pool de threads exécutant les requêtes couvertes (None tant qu'aucune requête n'a été couverte)
+    """
+
+    def __init__(
+        self,
+        routes: List[str],
+        ratio: float = 0.95,
+        max_extra: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.0,
+        max_workers: int = 16,
+        fallback_delay: float = 0.0,
+    ) -> None:
+        self.__lock = threading.Lock()
+        self.__routes = routes
+        self.__ratio = ratio
+        self.__max_extra = max_extra
+        self.__min_samples = min_samples
+        self.__min_delay = min_delay
+        self.__fallback_delay = fallback_delay
+        self.__max_workers = max(2, max_workers)
+        if not Metrics().enabled:
+            if fallback_delay > 0:
+                Config().om.warning(f"Requêtes couvertes : métriques désactivées, délai fixe de {max(fallback_delay, min_delay):g} s avant la requête supplémentaire.")
+            else:
+                Config().om.warning("Requêtes couvertes activées mais métriques désactivées et pas de délai fixe (hedging.fallback_delay) : aucune requête ne sera couverte.")
+        self.__nb_requests = 0
+        self.__nb_hedged = 0
+        self.__nb_running = 0
+        self.__executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_config(cls) -> Optional["HedgePolicy"]:
+        """Instancie la politique à partir de la section `hedging` de la configuration.
+
+        Returns:
+            politique de requêtes couvertes, None si elle n'est pas activée (`enabled`)
+        """
+        if not Config().get_bool("hedging", "enabled", fallback=False):
+            return None
+        s_routes = Config().get("hedging", "routes")
+        return cls(
+            [s_route.strip() for s_route in s_routes.split(";") if s_route.strip()] if s_routes else [],
+            Config().get_float("hedging", "percentile", fallback=0.95),
+            Config().get_float("hedging", "max_extra_percent", fallback=5) / 100,
+            Config().get_int("hedging", "min_samples", fallback=20),
+            Config().get_float("hedging", "min_delay", fallback=0),
+            Config().get_int("hedging", "max_workers", fallback=16),
+            Config().get_float("hedging", "fallback_delay", fallback=0),
+        )
+
+    def is_hedged(self, route_name: Optional[str]) -> bool:
+        """Indique si les requêtes de la route sont concernées.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+
+        Returns:
+            True si les requêtes de la route peuvent être couvertes
+        """
+        return route_name is not None and any(fnmatch.fnmatchcase(route_name, s_pattern) for s_pattern in self.__routes)
+
+    def delay(self, route_name: Optional[str], method: str) -> Optional[float]:
+        """Renvoie le délai avant l'envoi d'une requête supplémentaire pour la route.
+
+        Args:
+            route_name (Optional[str]): nom de la route
+            method (str): méthode de la requête
+
+        Returns:
+            délai (en secondes), None si la route n'est pas concernée ou si trop peu de durées sont mesurées
+            (métriques désactivées : délai fixe, None s'il est nul)
+        """
+        if not self.is_hedged(route_name):
+            return None
+        if not Metrics().enabled:
+            return max(self.__fallback_delay, self.__min_delay) if self.__fallback_delay > 0 else None
+        d_metrics = Metrics().get(route_name, method)
+        if d_metrics is None or d_metrics["nb_calls"] < self.__min_samples:
+            return None
+        f_percentile = Metrics().percentile(route_name, method, self.__ratio)
+        return None if f_percentile is None else max(f_percentile, self.__min_delay)
+
+    def __acquire(self) -> bool:
+        """Réserve si possible une requête supplémentaire dans la limite de charge configurée et une place dans le pool.
+
+        Returns:
+            True si la requête supplémentaire peut être envoyée
+        """
+        with self.__lock:
+            if self.__nb_hedged + 1 > self.__max_extra * self.__nb_requests or self.__nb_running + 1 > self.__max_workers:
+                return False
+            self.__nb_hedged += 1
+            self.__nb_running += 1
+            return True
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        """Renvoie le pool de threads exécutant les requêtes couvertes (créé à la première requête couverte).
+
+        Returns:
+            pool de threads de la politique
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="sdk_entrepot_gpf_hedged_request")
+            return self.__executor
+
+    def __release(self, future: "Future[T]") -> None:  # pylint:disable=unused-argument
+        """Libère la place réservée dans le pool par une requête terminée."""
+        with self.__lock:
+            self.__nb_running -= 1
+
+    def __submit(self, function: Callable[[], T]) -> "Future[T]":
+        """Exécute une requête dans le pool de threads, avec une copie du contexte courant (échéance, contexte client).
+
+        Args:
+            function (Callable[[], T]): fonction exécutant la requête
+
+        Returns:
+            résultat à venir de la requête
+        """
+        o_context = contextvars.copy_context()
+        o_future: "Future[T]" = self.__get_executor().submit(lambda: o_context.run(function))
+        o_future.add_done_callback(self.__release)
+        return o_future
+
+    def run(
+        self,
+        route_name: Optional[str],
+        method: str,
+        function: Callable[[], T],
+        hedge_function: Optional[Callable[[], T]] = None,
+        discard: Optional[Callable[[T], None]] = None,
+    ) -> T:
+        """Exécute une requête, couverte par une requête supplémentaire si elle tarde.
+
+        Les requêtes couvertes sont exécutées dans le pool de threads (borné, `max_workers`) de la politique, avec une
+        copie du contexte courant (échéance, contexte client). Si le pool est occupé, la requête est exécutée
+        directement, sans couverture. La réponse de la requête perdante est passée à `discard` dès qu'elle est reçue.
+
+        Args:
+            route_name (Optional[str]): nom de la route
+            method (str): méthode de la requête
+            function (Callable[[], T]): fonction exécutant la requête
+            hedge_function (Optional[Callable[[], T]], optional): fonction exécutant la requête supplémentaire (`function` par défaut)
+            discard (Optional[Callable[[T], None]], optional): fonction libérant la réponse non utilisée (ex. : fermeture de la réponse)
+
+        Returns:
+            résultat de la première requête ayant abouti (erreur de la première requête si les deux échouent)
+        """
+        f_delay = self.delay(route_name, method)
+        if f_delay is None:
+            return function()
+        with self.__lock:
+            self.__nb_requests += 1
+            b_budget = self.__nb_hedged + 1 <= self.__max_extra * self.__nb_requests
+            # Place pour les deux requêtes dans le pool (sinon la requête attendrait un thread libre)
+            b_workers = self.__nb_running + 2 <= self.__max_workers
+            if b_budget and b_workers:
+                self.__nb_running += 1
+        # Limite de charge atteinte ou pool occupé : inutile de lancer la requête dans un thread
+        if not b_budget or not b_workers:
+            return function()
+
+        l_futures = [self.__submit(function)]
+        if not wait(l_futures, timeout=f_delay).done:
+            # La requête tarde : requête supplémentaire si la limite de charge et le pool le permettent
+            if self.__acquire():
+                l_futures.append(self.__submit(hedge_function or function))
+        # Première requête terminée ; si elle a échoué, on attend l'autre
+        o_done = next(iter(wait(l_futures, return_when=FIRST_COMPLETED).done))
+        o_result = o_done
+        if o_done.exception() is not None and len(l_futures) > 1:
+            o_other = l_futures[1] if o_done is l_futures[0] else l_futures[0]
+            if o_other.exception() is None:
+                o_result = o_other
+        # Réponse de la requête perdante libérée dès qu'elle est reçue
+        if discard is not None:
+            o_discard: Callable[[T], None] = discard
+            for o_future in l_futures:
+                if o_future is not o_result:
+                    o_future.add_done_callback(lambda o_loser: None if o_loser.exception() is not None else o_discard(o_loser.result()))
+        if len(l_futures) > 1:
+            Metrics().add_hedged(route_name, method, o_result.exception() is None and o_result is l_futures[1])
+        return o_result.result()
+
+    def close(self) -> None:
+        """Libère le pool de threads, sans attendre les requêtes en cours. Un nouveau pool sera créé à la prochaine requête couverte."""
+        with self.__lock:
+            o_executor = self.__executor
+            self.__executor = None
+        if o_executor is not None:
+            o_executor.shutdown(wait=False)
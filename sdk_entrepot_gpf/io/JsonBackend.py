@@ -0,0 +1,112 @@
+import json as JSON
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+from sdk_entrepot_gpf.io.Config import Config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None  # type: ignore
+
+
+class JsonBackend:
+    """Backend de (dé)sérialisation JSON, partagé par le JsonConverter, le JsonHelper et le décodage des réponses de l'API.
+
+    Le backend utilisé est choisi par le paramètre `json_converter.backend` de la configuration :
+    `auto` (orjson s'il est installé, sinon le module json standard), `json` ou `orjson`.
+    Il peut aussi être remplacé via `JsonBackend.set()`.
+    """
+
+    name = "json"
+
+    # Backend courant (None tant qu'il n'a pas été choisi)
+    __current: Optional["JsonBackend"] = None
+
+    def dumps(self, data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Sérialise des données en JSON (encodé en UTF-8).
+
+        Args:
+            data (Any): données à sérialiser
+            default (Optional[Callable[[Any], Any]], optional): fonction de conversion des objets non gérés nativement
+
+        Returns:
+            JSON encodé en UTF-8
+        """
+        return JSON.dumps(data, default=default).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Désérialise du JSON.
+
+        Args:
+            data (Union[str, bytes]): JSON (texte ou octets)
+
+        Raises:
+            ValueError: levée si le JSON n'est pas valide
+
+        Returns:
+            données désérialisées
+        """
+        return JSON.loads(data)
+
+    @staticmethod
+    def available() -> Dict[str, Type["JsonBackend"]]:
+        """Renvoie les backends disponibles.
+
+        Returns:
+            classes des backends disponibles par nom
+        """
+        d_backends: Dict[str, Type[JsonBackend]] = {JsonBackend.name: JsonBackend}
+        if orjson is not None:
+            d_backends[OrjsonBackend.name] = OrjsonBackend
+        return d_backends
+
+    @staticmethod
+    def get() -> "JsonBackend":
+        """Renvoie le backend courant, en le choisissant selon la configuration si besoin.
+
+        Returns:
+            backend courant
+        """
+        if JsonBackend.__current is None:
+            s_name = Config().get("json_converter", "backend", fallback="auto")
+            d_backends = JsonBackend.available()
+            if s_name in (None, "auto"):
+                s_name = OrjsonBackend.name if OrjsonBackend.name in d_backends else JsonBackend.name
+            if s_name not in d_backends:
+                Config().om.warning(f"Backend JSON « {s_name} » non disponible, utilisation du module json standard.")
+                s_name = JsonBackend.name
+            JsonBackend.__current = d_backends[str(s_name)]()
+        return JsonBackend.__current
+
+    @staticmethod
+    def set(backend: Optional["JsonBackend"]) -> None:
+        """Remplace le backend courant.
+
+        Args:
+            backend (Optional[JsonBackend]): nouveau backend (None pour le choisir à nouveau selon la configuration)
+        """
+        JsonBackend.__current = backend
+
+
+class OrjsonBackend(JsonBackend):
+    """Backend JSON rapide s'appuyant sur orjson (dépendance optionnelle : `pip install orjson`).
+
+    Les dates et heures sont passées à la fonction de conversion (comme avec le module json standard) et les clefs
+    non textuelles sont acceptées. Les données qu'orjson ne sait pas traiter (ex. : entiers de plus de 64 bits)
+    sont sérialisées par le module json standard.
+    """
+
+    name = "orjson"
+
+    def dumps(self, data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        try:
+            return orjson.dumps(data, default=default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().dumps(data, default=default)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Encodage autre que UTF-8 (UTF-16, ...) ou JSON invalide (le module standard lèvera l'erreur)
+            return super().loads(data)
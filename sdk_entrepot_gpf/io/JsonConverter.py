@@ -2,15 +2,18 @@ from __future__ import unicode_literals
 
 import datetime
 import json as JSON
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from sdk_entrepot_gpf.pattern.Singleton import Singleton
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.JsonBackend import JsonBackend
 
 
 class JsonConverter(metaclass=Singleton):
     """Classe de conversion des objects python en json. Le but est de convertir
-    les objets qui ne sont pas nativement gérés par Python comme les dates."""
+    les objets qui ne sont pas nativement gérés par Python comme les dates.
+
+    La (dé)sérialisation est faite par le backend JSON courant (cf. `JsonBackend`)."""
 
     def __init__(self) -> None:
         """initialisation : liste des routes et adresse site"""
@@ -32,8 +35,33 @@ class JsonConverter(metaclass=Singleton):
         """
         if data is None:
             return None
-        s_json = JSON.dumps(data, default=self.__converter)
-        return s_json
+        return self.encode(data).decode("utf-8")
+
+    def encode(self, data: Any) -> bytes:
+        """Sérialise en une seule passe des données Python en JSON encodé en UTF-8, prêt à être envoyé à l'API.
+        Les dates, times et datetimes sont convertis selon les patterns de la configuration.
+
+        Args:
+            data (Any): données à envoyer à l'api avec des classes python
+
+        Returns:
+            bytes: JSON encodé en UTF-8
+        """
+        return JsonBackend.get().dumps(data, default=self.__converter)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Désérialise du JSON (ex. : contenu d'une réponse de l'API) avec le backend JSON courant.
+
+        Args:
+            data (Union[str, bytes]): JSON (texte ou octets)
+
+        Raises:
+            ValueError: levée si le JSON n'est pas valide
+
+        Returns:
+            Any: données désérialisées
+        """
+        return JsonBackend.get().loads(data)
 
     def convert(self, data: Any) -> Any:
         """Passe en string les objets non gérés nativement en JSON par Python.
@@ -47,8 +75,7 @@ class JsonConverter(metaclass=Singleton):
         """
         if data is None:
             return None
-        s_json = self.dumps(data)
-        return JSON.loads(s_json)
+        return self.loads(self.encode(data))
 
     def __converter(self, obj: object) -> Optional[str]:
         """Converter spécialisé pour passer des classes python au json.
@@ -0,0 +1,352 @@
+import atexit
+import json
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class LatencyHistogram:
+    """Histogramme de durées à bornes fixes (compatible Prometheus), avec estimation des percentiles.
+
+    N'est pas thread-safe : les accès sont protégés par le verrou du registre (cf. `Metrics`).
+
+    Attributes:
+        __counts (List[int]): nombre de durées par intervalle (la dernière borne est infinie)
+        __count (int): nombre de durées enregistrées
+        __sum (float): somme des durées (en secondes)
+        __max (float): durée maximale (en secondes)
+    """
+
+    # Bornes supérieures des intervalles (en secondes)
+    BOUNDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, math.inf]
+
+    def __init__(self) -> None:
+        self.__counts = [0] * len(LatencyHistogram.BOUNDS)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Enregistre une durée.
+
+        Args:
+            seconds (float): durée (en secondes)
+        """
+        i_bucket = next(i for i, f_bound in enumerate(LatencyHistogram.BOUNDS) if seconds <= f_bound)
+        self.__counts[i_bucket] += 1
+        self.__count += 1
+        self.__sum += seconds
+        self.__max = max(self.__max, seconds)
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def sum(self) -> float:
+        return self.__sum
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Renvoie les intervalles cumulés (borne supérieure, nombre de durées inférieures ou égales)."""
+        l_buckets = []
+        i_cumulative = 0
+        for f_bound, i_count in zip(LatencyHistogram.BOUNDS, self.__counts):
+            i_cumulative += i_count
+            l_buckets.append((f_bound, i_cumulative))
+        return l_buckets
+
+    def percentile(self, ratio: float) -> Optional[float]:
+        """Estime un percentile par interpolation linéaire dans l'intervalle qui le contient.
+
+        Args:
+            ratio (float): percentile recherché (entre 0 et 1, ex. : 0.95)
+
+        Returns:
+            durée estimée (en secondes), None si aucune durée enregistrée
+        """
+        if self.__count == 0:
+            return None
+        f_rank = ratio * self.__count
+        f_lower = 0.0
+        i_cumulative = 0
+        for f_bound, i_count in zip(LatencyHistogram.BOUNDS, self.__counts):
+            if i_count and i_cumulative + i_count >= f_rank:
+                # La durée maximale borne l'intervalle (et remplace la borne infinie)
+                f_upper = min(f_bound, self.__max)
+                return f_lower + (f_upper - f_lower) * max(0.0, f_rank - i_cumulative) / i_count
+            i_cumulative += i_count
+            f_lower = f_bound
+        return self.__max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.__count,
+            "sum": self.__sum,
+            "max": self.__max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class RouteMetrics:
+    """Métriques des requêtes d'une route pour une méthode donnée.
+
+    Attributes:
+        latency (LatencyHistogram): durées des tentatives de requête
+        nb_errors (Dict[str, int]): nombre de tentatives en erreur par classe d'erreur
+        nb_retries (int): nombre de nouvelles tentatives
+        nb_coalesced (int): nombre de requêtes regroupées avec une requête identique en cours (sans requête HTTP)
+        nb_hedged (int): nombre de requêtes supplémentaires envoyées car la première tardait (cf. `HedgePolicy`)
+        nb_hedge_wins (int): nombre de requêtes supplémentaires ayant répondu avant la première
+        bytes_sent (int): nombre d'octets envoyés (corps des requêtes)
+        bytes_received (int): nombre d'octets reçus (corps des réponses)
+    """
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.nb_errors: Dict[str, int] = {}
+        self.nb_retries = 0
+        self.nb_coalesced = 0
+        self.nb_hedged = 0
+        self.nb_hedge_wins = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    @property
+    def nb_calls(self) -> int:
+        return self.latency.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nb_calls": self.nb_calls,
+            "latency": self.latency.to_dict(),
+            "nb_errors": dict(self.nb_errors),
+            "nb_retries": self.nb_retries,
+            "nb_coalesced": self.nb_coalesced,
+            "nb_hedged": self.nb_hedged,
+            "nb_hedge_wins": self.nb_hedge_wins,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class Metrics(metaclass=Singleton):
+    """Registre (thread-safe) des métriques des requêtes HTTP, par nom de route et méthode.
+
+    Chaque tentative de requête de l'ApiRequester (route `url` si la requête n'est pas lancée à partir d'une route)
+    et de l'Authentifier (route `token`) est enregistrée : nombre d'appels, histogramme des durées (p50, p95, p99),
+    octets envoyés et reçus, nombre de nouvelles tentatives et erreurs par classe.
+
+    Les métriques sont consultables via `get()` et `to_dict()` et, selon la section `metrics` de la configuration,
+    écrites à la fin du processus en JSON (`json_file`) et au format texte de Prometheus (`prometheus_file`,
+    pour le « textfile collector » de node_exporter).
+
+    Attributes:
+        __enabled (bool): indique si les métriques sont enregistrées
+        __routes (Dict[Tuple[str, str], RouteMetrics]): métriques par (route, méthode)
+    """
+
+    URL_ROUTE = "url"
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__enabled = Config().get_bool("metrics", "enabled", fallback=True)
+        self.__routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        s_json_file = Config().get("metrics", "json_file")
+        s_prometheus_file = Config().get("metrics", "prometheus_file")
+        if s_json_file or s_prometheus_file:
+            atexit.register(self.dump, Path(s_json_file) if s_json_file else None, Path(s_prometheus_file) if s_prometheus_file else None)
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si les métriques sont enregistrées (`metrics.enabled`)."""
+        return self.__enabled
+
+    def __route(self, route_name: Optional[str], method: str) -> RouteMetrics:
+        """Renvoie les métriques d'une route (à appeler sous verrou), en les créant si besoin."""
+        o_key = Metrics.__key(route_name, method)
+        if o_key not in self.__routes:
+            self.__routes[o_key] = RouteMetrics()
+        return self.__routes[o_key]
+
+    @staticmethod
+    def __key(route_name: Optional[str], method: str) -> Tuple[str, str]:
+        """Renvoie la clef (route, méthode) des métriques d'une requête."""
+        return (route_name if route_name is not None else Metrics.URL_ROUTE, method.upper())
+
+    def record(self, route_name: Optional[str], method: str, seconds: float, bytes_sent: int = 0, bytes_received: int = 0, error: Optional[BaseException] = None) -> None:
+        """Enregistre une tentative de requête.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+            method (str): méthode de la requête
+            seconds (float): durée de la tentative (en secondes)
+            bytes_sent (int, optional): nombre d'octets envoyés
+            bytes_received (int, optional): nombre d'octets reçus
+            error (Optional[BaseException], optional): erreur levée par la tentative
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            o_route = self.__route(route_name, method)
+            o_route.latency.add(seconds)
+            o_route.bytes_sent += bytes_sent
+            o_route.bytes_received += bytes_received
+            if error is not None:
+                s_error = error.__class__.__name__
+                o_route.nb_errors[s_error] = o_route.nb_errors.get(s_error, 0) + 1
+
+    def add_retry(self, route_name: Optional[str], method: str) -> None:
+        """Enregistre une nouvelle tentative de requête.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+            method (str): méthode de la requête
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            self.__route(route_name, method).nb_retries += 1
+
+    def add_coalesced(self, route_name: Optional[str], method: str) -> None:
+        """Enregistre une requête regroupée avec une requête identique en cours (réponse partagée, sans requête HTTP).
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+            method (str): méthode de la requête
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            self.__route(route_name, method).nb_coalesced += 1
+
+    def add_hedged(self, route_name: Optional[str], method: str, won: bool) -> None:
+        """Enregistre une requête supplémentaire envoyée car la première tardait (cf. `HedgePolicy`).
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+            method (str): méthode de la requête
+            won (bool): indique si la requête supplémentaire a répondu avant la première
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            o_route = self.__route(route_name, method)
+            o_route.nb_hedged += 1
+            if won:
+                o_route.nb_hedge_wins += 1
+
+    def get(self, route_name: Optional[str], method: str) -> Optional[Dict[str, Any]]:
+        """Renvoie les métriques d'une route.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+            method (str): méthode de la requête
+
+        Returns:
+            métriques de la route (cf. `to_dict()`), None si aucune requête enregistrée
+        """
+        with self.__lock:
+            o_route = self.__routes.get(Metrics.__key(route_name, method))
+            return o_route.to_dict() if o_route is not None else None
+
+    def percentile(self, route_name: Optional[str], method: str, ratio: float) -> Optional[float]:
+        """Renvoie un percentile des durées des requêtes d'une route.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+            method (str): méthode de la requête
+            ratio (float): percentile recherché (entre 0 et 1)
+
+        Returns:
+            durée estimée (en secondes), None si aucune requête enregistrée
+        """
+        with self.__lock:
+            o_route = self.__routes.get(Metrics.__key(route_name, method))
+            return o_route.latency.percentile(ratio) if o_route is not None else None
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Renvoie toutes les métriques.
+
+        Returns:
+            `{route: {méthode: métriques}}`
+        """
+        d_metrics: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with self.__lock:
+            for (s_route, s_method), o_route in sorted(self.__routes.items()):
+                d_metrics.setdefault(s_route, {})[s_method] = o_route.to_dict()
+        return d_metrics
+
+    def reset(self) -> None:
+        """Remet les métriques à zéro."""
+        with self.__lock:
+            self.__routes = {}
+
+    def to_prometheus(self) -> str:
+        """Renvoie les métriques au format texte de Prometheus.
+
+        Returns:
+            métriques au format texte de Prometheus
+        """
+        l_lines: List[str] = []
+
+        def family(name: str, kind: str, description: str) -> None:
+            l_lines.append(f"# HELP sdk_entrepot_gpf_{name} {description}")
+            l_lines.append(f"# TYPE sdk_entrepot_gpf_{name} {kind}")
+
+        def labels(route: str, method: str, **others: str) -> str:
+            d_labels = {"route": route, "method": method, **others}
+            return "{" + ",".join(f'{k}="{v}"' for k, v in d_labels.items()) + "}"
+
+        with self.__lock:
+            l_routes = sorted(self.__routes.items())
+            family("request_duration_seconds", "histogram", "Durée des tentatives de requête")
+            for (s_route, s_method), o_route in l_routes:
+                for f_bound, i_cumulative in o_route.latency.buckets():
+                    s_bound = "+Inf" if math.isinf(f_bound) else f"{f_bound:g}"
+                    l_lines.append(f"sdk_entrepot_gpf_request_duration_seconds_bucket{labels(s_route, s_method, le=s_bound)} {i_cumulative}")
+                l_lines.append(f"sdk_entrepot_gpf_request_duration_seconds_sum{labels(s_route, s_method)} {o_route.latency.sum}")
+                l_lines.append(f"sdk_entrepot_gpf_request_duration_seconds_count{labels(s_route, s_method)} {o_route.latency.count}")
+            family("request_errors_total", "counter", "Nombre de tentatives de requête en erreur par classe d'erreur")
+            for (s_route, s_method), o_route in l_routes:
+                for s_error, i_count in sorted(o_route.nb_errors.items()):
+                    l_lines.append(f"sdk_entrepot_gpf_request_errors_total{labels(s_route, s_method, error=s_error)} {i_count}")
+            for s_name, s_attribute, s_description in [
+                ("request_retries_total", "nb_retries", "Nombre de nouvelles tentatives de requête"),
+                ("request_coalesced_total", "nb_coalesced", "Nombre de requêtes regroupées avec une requête identique en cours"),
+                ("request_hedged_total", "nb_hedged", "Nombre de requêtes supplémentaires envoyées car la première tardait"),
+                ("request_hedge_wins_total", "nb_hedge_wins", "Nombre de requêtes supplémentaires ayant répondu avant la première"),
+                ("request_sent_bytes_total", "bytes_sent", "Nombre d'octets envoyés"),
+                ("request_received_bytes_total", "bytes_received", "Nombre d'octets reçus"),
+            ]:
+                family(s_name, "counter", s_description)
+                for (s_route, s_method), o_route in l_routes:
+                    l_lines.append(f"sdk_entrepot_gpf_{s_name}{labels(s_route, s_method)} {getattr(o_route, s_attribute)}")
+        return "\n".join(l_lines) + "\n"
+
+    def dump(self, json_file: Optional[Path] = None, prometheus_file: Optional[Path] = None) -> None:
+        """Écrit les métriques en JSON et/ou au format texte de Prometheus (écriture atomique).
+
+        Args:
+            json_file (Optional[Path], optional): fichier JSON à écrire.
+            prometheus_file (Optional[Path], optional): fichier texte Prometheus à écrire (extension `.prom`).
+        """
+        for p_file, s_content in [
+            (json_file, None if json_file is None else json.dumps(self.to_dict(), indent=4)),
+            (prometheus_file, None if prometheus_file is None else self.to_prometheus()),
+        ]:
+            if p_file is None or s_content is None:
+                continue
+            try:
+                p_file.parent.mkdir(parents=True, exist_ok=True)
+                p_tmp = p_file.with_name(p_file.name + ".tmp")
+                p_tmp.write_text(s_content, encoding="utf-8")
+                os.replace(p_tmp, p_file)
+            except OSError as e_error:
+                Config().om.warning(f"Écriture des métriques dans {p_file} impossible : {e_error}")
@@ -0,0 +1,57 @@
+from typing import IO, Callable, Dict, Optional, Tuple
+from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
+
+
+class MultipartBody:
+    """Corps multipart (envoi de fichiers) rejouable, lu en flux et avec suivi de l'envoi.
+
+    Un `MultipartEncoder` consomme les fichiers qu'il envoie : une nouvelle tentative de la requête enverrait un corps
+    tronqué. Ce corps enregistre la position initiale de chaque fichier et crée, à chaque tentative (cf. `encoder()`),
+    un nouvel encodeur après avoir replacé les fichiers à cette position : les fichiers déjà ouverts sont relus sans
+    être rouverts ni chargés en mémoire (lecture par blocs par l'encodeur).
+
+    Attributes:
+        __files (Dict[str, Tuple[str, IO[bytes]]]): fichiers à envoyer ({"clef": ("nom", fichier ouvert en binaire)})
+        __positions (Dict[str, int]): positions initiales des fichiers
+        __callback (Optional[Callable[[TransferProgress], None]]): fonction de suivi appelée au fil de l'envoi
+        __progress (TransferProgress): avancement de l'envoi de la dernière tentative
+    """
+
+    def __init__(self, files: Dict[str, Tuple[str, IO[bytes]]], callback: Optional[Callable[[TransferProgress], None]] = None) -> None:
+        self.__files = files
+        self.__positions = {s_key: o_file.tell() for s_key, (_, o_file) in files.items()}
+        self.__callback = callback
+        self.__progress = TransferProgress()
+
+    @property
+    def files(self) -> Dict[str, Tuple[str, IO[bytes]]]:
+        return self.__files
+
+    @property
+    def progress(self) -> TransferProgress:
+        """Avancement de l'envoi de la dernière tentative."""
+        return self.__progress
+
+    def encoder(self) -> MultipartEncoderMonitor:
+        """Crée l'encodeur d'une tentative d'envoi, les fichiers étant replacés à leur position initiale.
+
+        Returns:
+            encodeur (à passer comme corps de la requête, son `content_type` donne l'en-tête `Content-Type`)
+        """
+        for s_key, (_, o_file) in self.__files.items():
+            o_file.seek(self.__positions[s_key])
+        o_encoder = MultipartEncoder(fields=dict(self.__files))
+        o_progress = TransferProgress(o_encoder.len)
+        self.__progress = o_progress
+        l_read = [0]
+
+        def monitor(o_monitor: MultipartEncoderMonitor) -> None:
+            # Le moniteur donne le nombre total d'octets lus : on transmet la différence au suivi
+            o_progress.add(o_monitor.bytes_read - l_read[0])
+            l_read[0] = o_monitor.bytes_read
+            if self.__callback is not None:
+                self.__callback(o_progress)
+
+        return MultipartEncoderMonitor(o_encoder, monitor)
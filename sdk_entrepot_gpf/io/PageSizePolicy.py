@@ -0,0 +1,154 @@
+import threading
+from typing import Dict, Optional
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.pattern.ScopedSingleton import ScopedSingleton
+
+
+class PageSizePolicy(metaclass=ScopedSingleton):
+    """Singleton (thread-safe) négociant la taille des pages des listings, par route.
+
+    Un listing commence avec une grande taille de page (`store_api.nb_limit_max`) puis la taille est adaptée et
+    retenue pour la route (donc pour le type d'entité) :
+
+    * si le serveur renvoie moins d'entités que demandé alors qu'il en reste, il applique un maximum : la taille
+      devient le nombre d'entités reçues ;
+    * si le serveur refuse la taille demandée (400) alors qu'il accepte la taille minimale avec les mêmes filtres,
+      elle est divisée par deux ;
+    * si une page n'est pas reçue à temps (délai d'attente dépassé), elle est divisée par deux.
+
+    Une taille réduite n'est retenue (`retain`) qu'une fois une page reçue avec cette taille.
+
+    Tant que la taille peut être réduite (`can_reduce`, `can_split`), les requêtes de listing ne sont pas retentées
+    en cas de délai d'attente dépassé : la taille est réduite dès le premier dépassement.
+
+    La taille ne descend jamais sous `store_api.nb_limit`, qui reste la taille fixe utilisée si l'adaptation est
+    désactivée (`store_api.adaptive_nb_limit`) ou si une page précise est demandée.
+
+    Attributes:
+        __lock (threading.Lock): verrou protégeant les tailles retenues
+        __adaptive (bool): indique si la taille des pages est adaptée
+        __min_size (int): taille minimale (et taille fixe si la taille n'est pas adaptée)
+        __max_size (int): taille initiale (maximale) des pages
+        __sizes (Dict[str, int]): taille retenue par route
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__adaptive = Config().get_bool("store_api", "adaptive_nb_limit", fallback=True)
+        self.__min_size = max(1, Config().get_int("store_api", "nb_limit"))
+        self.__max_size = max(self.__min_size, Config().get_int("store_api", "nb_limit_max", fallback=self.__min_size))
+        self.__sizes: Dict[str, int] = {}
+
+    @property
+    def min_size(self) -> int:
+        """Taille minimale des pages (`store_api.nb_limit`)."""
+        return self.__min_size
+
+    def get(self, route_name: str) -> int:
+        """Renvoie la taille de page à utiliser pour la route.
+
+        Args:
+            route_name (str): nom de la route de listing
+
+        Returns:
+            taille de page
+        """
+        if not self.__adaptive:
+            return self.__min_size
+        with self.__lock:
+            return self.__sizes.get(route_name, self.__max_size)
+
+    def retain(self, route_name: str, size: int) -> int:
+        """Retient pour la route une taille (plus petite) avec laquelle une page a été reçue.
+
+        Args:
+            route_name (str): nom de la route de listing
+            size (int): nouvelle taille
+
+        Returns:
+            taille retenue
+        """
+        with self.__lock:
+            i_size = min(self.__sizes.get(route_name, self.__max_size), max(self.__min_size, size))
+            self.__sizes[route_name] = i_size
+        Config().om.debug(f"Taille des pages de la route {route_name} : {i_size}")
+        return i_size
+
+    def observe(self, route_name: str, size: int, nb_received: int, length: Optional[int]) -> int:
+        """Analyse la première page d'un listing pour détecter le maximum appliqué par le serveur.
+
+        Args:
+            route_name (str): nom de la route de listing
+            size (int): taille de page demandée
+            nb_received (int): nombre d'entités reçues
+            length (Optional[int]): nombre total d'entités (Content-Range), None s'il n'est pas connu
+
+        Returns:
+            taille de page effective (à utiliser pour les pages suivantes)
+        """
+        if self.__adaptive and 0 < nb_received < size and length is not None and nb_received < length:
+            # Le serveur a plafonné la page
+            with self.__lock:
+                self.__sizes[route_name] = nb_received
+            Config().om.debug(f"Taille des pages de la route {route_name} plafonnée par le serveur : {nb_received}")
+            return nb_received
+        return size
+
+    def can_reduce(self, size: int) -> bool:
+        """Indique si la taille de la première page d'un listing peut être réduite (cf. `reduce`).
+
+        Args:
+            size (int): taille de page
+
+        Returns:
+            True si la taille peut être réduite
+        """
+        return self.__adaptive and size > self.__min_size
+
+    def can_split(self, size: int) -> bool:
+        """Indique si une page peut être récupérée en deux demi-pages (cf. `split`).
+
+        Args:
+            size (int): taille de page
+
+        Returns:
+            True si la taille peut être divisée par deux
+        """
+        return self.__adaptive and size % 2 == 0 and size // 2 >= self.__min_size
+
+    def reduce(self, route_name: str, size: int) -> Optional[int]:
+        """Réduit la taille de la première page d'un listing, refusée par le serveur (400) ou pas reçue à temps.
+        La nouvelle taille n'est retenue qu'une fois la page reçue (cf. `retain`).
+
+        Args:
+            route_name (str): nom de la route de listing
+            size (int): taille de page refusée ou trop lente
+
+        Returns:
+            nouvelle taille à essayer, None si la taille ne peut pas être réduite
+        """
+        if not self.can_reduce(size):
+            return None
+        i_size = max(self.__min_size, size // 2)
+        Config().om.debug(f"Taille des pages de la route {route_name} : essai avec {i_size}")
+        return i_size
+
+    def split(self, route_name: str, size: int) -> Optional[int]:
+        """Réduit la taille de page après un délai d'attente dépassé en cours de listing.
+
+        La nouvelle taille est la moitié de l'ancienne : une page peut ainsi être récupérée en deux demi-pages
+        (pages `2n-1` et `2n`) sans décaler les suivantes. La nouvelle taille n'est retenue qu'une fois les deux
+        demi-pages reçues (cf. `retain`).
+
+        Args:
+            route_name (str): nom de la route de listing
+            size (int): taille de page trop lente
+
+        Returns:
+            nouvelle taille (moitié de l'ancienne), None si la taille ne peut pas être divisée par deux
+        """
+        if not self.can_split(size):
+            return None
+        Config().om.debug(f"Taille des pages de la route {route_name} : essai en demi-pages de {size // 2}")
+        return size // 2
@@ -0,0 +1,45 @@
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+I = TypeVar("I")
+R = TypeVar("R")
+
+
+class ParallelExecutor:
+    """Exécution en parallèle (pool de threads borné) d'une même fonction bloquante sur plusieurs éléments,
+    typiquement des requêtes à l'API (pages d'un listing, ...).
+
+    Chaque appel est exécuté dans une copie du contexte de l'appelant (échéance active, contexte client) et les
+    résultats sont renvoyés dans l'ordre des éléments. En cas d'erreur, les appels pas encore démarrés sont annulés
+    et la première erreur (dans l'ordre des éléments) est levée une fois les appels en cours terminés.
+    """
+
+    @staticmethod
+    def map(function: Callable[[I], R], items: Iterable[I], max_workers: int) -> List[R]:
+        """Applique la fonction à chaque élément, en parallèle.
+
+        Args:
+            function (Callable[[I], R]): fonction bloquante à appliquer
+            items (Iterable[I]): éléments
+            max_workers (int): nombre max d'appels simultanés (1 : appels séquentiels dans le thread courant)
+
+        Returns:
+            résultats dans l'ordre des éléments
+        """
+        l_items = list(items)
+        if max_workers <= 1 or len(l_items) <= 1:
+            return [function(o_item) for o_item in l_items]
+
+        def run_in_context(context: contextvars.Context, item: I) -> R:
+            return context.run(function, item)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(l_items)), thread_name_prefix="sdk_entrepot_gpf_parallel") as o_executor:
+            l_futures: List["Future[R]"] = [o_executor.submit(run_in_context, contextvars.copy_context(), o_item) for o_item in l_items]
+            try:
+                return [o_future.result() for o_future in l_futures]
+            except BaseException:
+                # On n'attend que les appels déjà démarrés
+                for o_future in l_futures:
+                    o_future.cancel()
+                raise
@@ -0,0 +1,207 @@
+import fnmatch
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+
+
+class TokenBucket:
+    """Seau à jetons (thread-safe) limitant un débit de requêtes, avec adaptation du débit (AIMD).
+
+    Chaque requête réserve un jeton ; s'il n'y en a plus, le jeton est emprunté sur le futur et l'appelant attend
+    le temps nécessaire à sa régénération. Les réservations se font sous verrou, dans l'ordre d'arrivée : les
+    appelants concurrents sont donc servis équitablement (premier arrivé, premier servi).
+
+    Un seau sans limite (`rate` infini) ne fait jamais attendre mais mesure le débit observé : s'il reçoit une
+    demande de ralentissement, il se limite à une fraction de ce débit.
+
+    Attributes:
+        __rate (float): débit courant (requêtes par seconde)
+        __max_rate (float): débit maximal (configuré), infini si pas de limite
+        __min_rate (float): débit minimal en cas d'adaptation à la baisse
+        __burst (float): capacité du seau (nombre de requêtes pouvant partir d'un coup)
+        __decrease (float): facteur multiplicatif appliqué au débit en cas de ralentissement demandé par le serveur
+        __increase (float): augmentation du débit (requêtes par seconde) par seconde de requêtes réussies
+        __tokens (float): jetons disponibles (négatif si des requêtes attendent)
+        __last (float): instant de la dernière mise à jour du seau
+        __history (Deque[float]): instants des dernières requêtes (pour mesurer le débit observé)
+    """
+
+    # Fenêtre (en secondes) de mesure du débit observé
+    WINDOW = 1.0
+
+    def __init__(self, rate: float, burst: float = 1, min_rate: float = 0.1, decrease: float = 0.5, increase: float = 0.1) -> None:
+        self.__lock = threading.Lock()
+        self.__max_rate = rate if rate > 0 else math.inf
+        self.__rate = self.__max_rate
+        self.__min_rate = min_rate
+        self.__burst = max(1.0, burst)
+        self.__decrease = decrease
+        self.__increase = increase
+        self.__tokens = self.__burst
+        self.__last = time.monotonic()
+        self.__history: Deque[float] = deque()
+
+    @property
+    def rate(self) -> float:
+        with self.__lock:
+            return self.__rate
+
+    def __refill(self, now: float) -> None:
+        """Régénère les jetons depuis la dernière mise à jour (à appeler sous verrou)."""
+        if math.isinf(self.__rate):
+            self.__tokens = self.__burst
+        else:
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__last) * self.__rate)
+        self.__last = now
+
+    def reserve(self) -> float:
+        """Réserve un jeton pour une requête.
+
+        Returns:
+            délai (en secondes) à attendre avant d'envoyer la requête
+        """
+        with self.__lock:
+            f_now = time.monotonic()
+            self.__refill(f_now)
+            # Mesure du débit observé
+            self.__history.append(f_now)
+            while self.__history and self.__history[0] < f_now - TokenBucket.WINDOW:
+                self.__history.popleft()
+            if math.isinf(self.__rate):
+                return 0.0
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.__rate
+
+    def release(self) -> None:
+        """Rend un jeton réservé (cf. `reserve`) par une requête finalement pas envoyée."""
+        with self.__lock:
+            if not math.isinf(self.__rate):
+                self.__tokens = min(self.__burst, self.__tokens + 1)
+
+    def slow_down(self) -> None:
+        """Diminue le débit (diminution multiplicative), suite à une réponse 429 ou 503 par exemple."""
+        with self.__lock:
+            self.__refill(time.monotonic())
+            if math.isinf(self.__rate):
+                # On part du débit observé
+                f_rate = max(len(self.__history) / TokenBucket.WINDOW, self.__min_rate)
+            else:
+                f_rate = self.__rate
+            self.__rate = max(self.__min_rate, f_rate * self.__decrease)
+            # On repart d'un seau vide pour ne pas relancer une rafale
+            self.__tokens = min(self.__tokens, 0.0)
+
+    def speed_up(self) -> None:
+        """Augmente doucement le débit (augmentation additive) suite à une requête réussie, sans dépasser le débit maximal."""
+        with self.__lock:
+            if not math.isinf(self.__rate):
+                # +increase requêtes/s pour chaque seconde de requêtes réussies
+                self.__rate = min(self.__max_rate, self.__rate + self.__increase / self.__rate)
+
+
+class RateLimiter:
+    """Limiteur de débit des requêtes à l'API : un seau à jetons global et un seau par famille de routes.
+
+    Les familles de routes sont définies dans la section `rate_limit_routes` de la configuration par un motif
+    sur le nom de la route (ex. : `*_list=5`), la première famille correspondant à la route est utilisée.
+
+    Attributes:
+        __global (TokenBucket): seau global
+        __families (List[Tuple[str, TokenBucket]]): seaux par famille de routes (motif, seau)
+        __route_to_bucket (Dict[str, Optional[TokenBucket]]): cache route -> seau de la famille
+    """
+
+    def __init__(self, global_bucket: TokenBucket, families: Optional[List[Tuple[str, TokenBucket]]] = None) -> None:
+        self.__global = global_bucket
+        self.__families: List[Tuple[str, TokenBucket]] = families if families is not None else []
+        self.__route_to_bucket: Dict[str, Optional[TokenBucket]] = {}
+
+    @classmethod
+    def from_config(cls) -> "RateLimiter":
+        """Instancie le limiteur à partir des sections `rate_limit` et `rate_limit_routes` de la configuration.
+
+        Returns:
+            limiteur de débit
+        """
+        f_burst = Config().get_float("rate_limit", "burst", fallback=1)
+        f_min_rate = Config().get_float("rate_limit", "min_rate", fallback=0.1)
+        f_decrease = Config().get_float("rate_limit", "adaptive_decrease", fallback=0.5)
+        f_increase = Config().get_float("rate_limit", "adaptive_increase", fallback=0.1)
+
+        def bucket(rate: Optional[str]) -> TokenBucket:
+            return TokenBucket(float(rate) if rate else 0, f_burst, f_min_rate, f_decrease, f_increase)
+
+        l_families: List[Tuple[str, TokenBucket]] = []
+        o_parser = Config().get_parser()
+        if o_parser.has_section("rate_limit_routes"):
+            for s_pattern in o_parser.options("rate_limit_routes"):
+                l_families.append((s_pattern, bucket(Config().get("rate_limit_routes", s_pattern))))
+        return cls(bucket(Config().get("rate_limit", "global_rate")), l_families)
+
+    def __buckets(self, route_name: Optional[str]) -> List[TokenBucket]:
+        """Renvoie les seaux concernés par une route : le seau global et celui de la famille de la route s'il y en a une.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+
+        Returns:
+            seaux concernés
+        """
+        if route_name is None:
+            return [self.__global]
+        if route_name not in self.__route_to_bucket:
+            self.__route_to_bucket[route_name] = next((o_bucket for s_pattern, o_bucket in self.__families if fnmatch.fnmatchcase(route_name, s_pattern)), None)
+        o_family = self.__route_to_bucket[route_name]
+        return [self.__global] if o_family is None else [self.__global, o_family]
+
+    def acquire(self, route_name: Optional[str] = None) -> float:
+        """Attend si besoin que la requête puisse être envoyée sans dépasser les débits.
+
+        Si l'attente dépasse l'échéance de l'opération en cours (cf. `Deadline`), les jetons réservés sont rendus et
+        l'échéance est levée aussitôt, sans attendre.
+
+        Args:
+            route_name (Optional[str], optional): nom de la route requêtée.
+
+        Raises:
+            DeadlineExceededError: levée si la requête ne peut pas être envoyée avant l'échéance de l'opération en cours
+
+        Returns:
+            délai attendu (en secondes)
+        """
+        l_buckets = self.__buckets(route_name)
+        f_delay = max(o_bucket.reserve() for o_bucket in l_buckets)
+        o_deadline = Deadline.current()
+        if o_deadline is not None and f_delay >= o_deadline.remaining:
+            for o_bucket in l_buckets:
+                o_bucket.release()
+            raise o_deadline.exceeded_error()
+        if f_delay > 0:
+            time.sleep(f_delay)
+        return f_delay
+
+    def slow_down(self, route_name: Optional[str] = None) -> None:
+        """Diminue le débit des seaux concernés par la route, suite à une demande de ralentissement du serveur (429, 503).
+
+        Args:
+            route_name (Optional[str], optional): nom de la route requêtée.
+        """
+        Config().om.debug(f"Ralentissement demandé par le serveur (route {route_name}) : diminution du débit des requêtes.")
+        for o_bucket in self.__buckets(route_name):
+            o_bucket.slow_down()
+
+    def speed_up(self, route_name: Optional[str] = None) -> None:
+        """Augmente doucement le débit des seaux concernés par la route, suite à une requête réussie.
+
+        Args:
+            route_name (Optional[str], optional): nom de la route requêtée.
+        """
+        for o_bucket in self.__buckets(route_name):
+            o_bucket.speed_up()
@@ -0,0 +1,508 @@
+from abc import ABC, abstractmethod
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class CachedResponse:
+    """Réponse HTTP mise en cache : contenu, en-têtes et validateurs (`ETag`, `Last-Modified`).
+
+    Attributes:
+        url (str): url de la requête (sans les paramètres)
+        status_code (int): code retour de la réponse
+        headers (Dict[str, str]): en-têtes de la réponse
+        content (bytes): contenu de la réponse
+        encoding (Optional[str]): encodage du contenu
+        stored_at (float): instant (horloge murale) où la réponse a été stockée ou revalidée
+    """
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes, encoding: Optional[str], stored_at: Optional[float] = None) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    @classmethod
+    def from_response(cls, url: str, response: requests.Response) -> "CachedResponse":
+        """Instancie une réponse mise en cache à partir d'une réponse HTTP.
+
+        Args:
+            url (str): url de la requête (sans les paramètres)
+            response (requests.Response): réponse HTTP
+
+        Returns:
+            réponse mise en cache
+        """
+        return cls(url, response.status_code, dict(response.headers), response.content, response.encoding)
+
+    def to_response(self) -> requests.Response:
+        """Construit une nouvelle réponse HTTP à partir de la réponse mise en cache.
+
+        Returns:
+            réponse HTTP
+        """
+        o_response = requests.Response()
+        o_response.status_code = self.status_code
+        o_response.headers = CaseInsensitiveDict(self.headers)
+        o_response._content = self.content  # pylint:disable=protected-access
+        o_response.encoding = self.encoding
+        o_response.url = self.url
+        o_response.reason = "OK"
+        return o_response
+
+    def validators(self) -> Dict[str, str]:
+        """Renvoie les en-têtes de requête conditionnelle correspondant aux validateurs de la réponse.
+
+        Returns:
+            en-têtes `If-None-Match` et/ou `If-Modified-Since` (vide si la réponse n'a pas de validateur)
+        """
+        d_headers: Dict[str, str] = {}
+        d_response_headers = CaseInsensitiveDict(self.headers)
+        if "ETag" in d_response_headers:
+            d_headers["If-None-Match"] = d_response_headers["ETag"]
+        if "Last-Modified" in d_response_headers:
+            d_headers["If-Modified-Since"] = d_response_headers["Last-Modified"]
+        return d_headers
+
+    def revalidate(self, headers: Any) -> None:
+        """Met à jour la réponse suite à une réponse 304 (Not Modified) : date de stockage et validateurs éventuellement renvoyés.
+
+        Args:
+            headers (Any): en-têtes de la réponse 304
+        """
+        self.stored_at = time.time()
+        for s_header in ["ETag", "Last-Modified"]:
+            if s_header in headers:
+                self.headers[s_header] = headers[s_header]
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class ResponseCacheBackend(ABC):
+    """Stockage des réponses mises en cache (niveau du cache des réponses)."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Récupère une réponse stockée.
+
+        Args:
+            key (str): clef de cache
+
+        Returns:
+            réponse stockée ou None
+        """
+
+    @abstractmethod
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Stocke une réponse.
+
+        Args:
+            key (str): clef de cache
+            entry (CachedResponse): réponse à stocker
+        """
+
+    @abstractmethod
+    def invalidate(self, url: str) -> None:
+        """Supprime les réponses liées à une ressource modifiée : la ressource elle-même, ses ressources parentes et ses sous-ressources.
+
+        Args:
+            url (str): url de la ressource modifiée
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Supprime toutes les réponses stockées."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Nombre de réponses stockées."""
+
+    @staticmethod
+    def related(url_1: str, url_2: str) -> bool:
+        """Indique si deux urls désignent la même ressource ou si l'une est une sous-ressource de l'autre.
+
+        Args:
+            url_1 (str): première url
+            url_2 (str): seconde url
+
+        Returns:
+            True si les urls sont liées
+        """
+        url_1 = url_1.rstrip("/")
+        url_2 = url_2.rstrip("/")
+        return url_1 == url_2 or url_1.startswith(url_2 + "/") or url_2.startswith(url_1 + "/")
+
+
+class MemoryCacheBackend(ResponseCacheBackend):
+    """Stockage (thread-safe) des réponses en mémoire, à éviction LRU.
+
+    Attributes:
+        __max_entries (int): nombre max de réponses stockées
+        __entries (OrderedDict[str, CachedResponse]): réponses stockées, de la moins récemment utilisée à la plus récemment utilisée
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self.__lock = threading.Lock()
+        self.__max_entries = max_entries
+        self.__entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self.__lock:
+            o_entry = self.__entries.get(key)
+            if o_entry is not None:
+                self.__entries.move_to_end(key)
+            return o_entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        with self.__lock:
+            for s_key in [s_key for s_key, o_entry in self.__entries.items() if self.related(url, o_entry.url)]:
+                del self.__entries[s_key]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+
+class DiskCacheBackend(ResponseCacheBackend):
+    """Stockage des réponses sur disque, partagé entre plusieurs exécutions (et plusieurs processus).
+
+    Chaque réponse est stockée dans deux fichiers nommés d'après l'empreinte de sa clef : `<empreinte>.json`
+    (url, code retour, en-têtes, ...) et `<empreinte>.bin` (contenu). Les fichiers sont écrits de manière atomique
+    (fichier temporaire puis renommage). Au-delà de `max_entries` réponses, les moins récemment utilisées sont supprimées.
+    L'espace de nom (ex. : identifiant de l'utilisateur) est pris en compte dans l'empreinte pour ne pas partager
+    de réponses entre utilisateurs utilisant le même répertoire.
+
+    Un index par espace de nom (`index-<empreinte>.idx` : empreinte de la clef -> url) permet d'invalider les réponses
+    d'une url en ne lisant qu'un fichier, sans toucher aux réponses des autres espaces de nom.
+
+    Attributes:
+        __directory (Path): répertoire de stockage
+        __max_entries (int): nombre max de réponses stockées
+        __namespace (str): espace de nom des clefs
+        __index_path (Path): index des réponses de l'espace de nom
+    """
+
+    def __init__(self, directory: Path, max_entries: int = 1000, namespace: str = "") -> None:
+        self.__lock = threading.Lock()
+        self.__directory = directory
+        self.__max_entries = max_entries
+        self.__namespace = namespace
+        self.__directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.__index_path = self.__directory / f"index-{hashlib.sha256(namespace.encode('utf-8')).hexdigest()}.idx"
+
+    def __hash(self, key: str) -> str:
+        """Renvoie l'empreinte d'une clef (dans l'espace de nom), qui nomme ses fichiers."""
+        return hashlib.sha256(f"{self.__namespace}|{key}".encode("utf-8")).hexdigest()
+
+    def __paths(self, key: str) -> Tuple[Path, Path]:
+        """Renvoie les chemins des fichiers (métadonnées, contenu) d'une clef."""
+        s_hash = self.__hash(key)
+        return self.__directory / f"{s_hash}.json", self.__directory / f"{s_hash}.bin"
+
+    def __read_index(self) -> Dict[str, str]:
+        """Lit l'index de l'espace de nom (empreinte -> url), vide s'il n'existe pas ou est illisible."""
+        try:
+            d_index = json.loads(self.__index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return d_index if isinstance(d_index, dict) else {}
+
+    @staticmethod
+    def __write(path: Path, content: bytes) -> None:
+        """Écrit un fichier de manière atomique."""
+        p_tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        p_tmp.write_bytes(content)
+        os.replace(p_tmp, path)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        p_meta, p_content = self.__paths(key)
+        try:
+            d_meta = json.loads(p_meta.read_text(encoding="utf-8"))
+            o_content = p_content.read_bytes()
+            # Mise à jour de la date d'utilisation (pour l'éviction)
+            os.utime(p_meta)
+        except (OSError, ValueError):
+            return None
+        if d_meta.get("key") != key:
+            return None
+        return CachedResponse(d_meta["url"], d_meta["status_code"], d_meta["headers"], o_content, d_meta["encoding"], d_meta["stored_at"])
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        p_meta, p_content = self.__paths(key)
+        d_meta = {
+            "key": key,
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "encoding": entry.encoding,
+            "stored_at": entry.stored_at,
+        }
+        try:
+            with self.__lock:
+                # Contenu écrit avant les métadonnées : une réponse n'est visible qu'une fois complète
+                self.__write(p_content, entry.content)
+                self.__write(p_meta, json.dumps(d_meta).encode("utf-8"))
+                self.__evict()
+                d_index = self.__read_index()
+                d_index[p_meta.stem] = entry.url
+                # Nettoyage des réponses évincées (ou supprimées par une autre exécution)
+                if len(d_index) > 2 * self.__max_entries:
+                    d_index = {s_hash: s_url for s_hash, s_url in d_index.items() if (self.__directory / f"{s_hash}.json").exists()}
+                self.__write(self.__index_path, json.dumps(d_index).encode("utf-8"))
+        except OSError as e_error:
+            Config().om.warning(f"Impossible d'écrire dans le cache disque des réponses ({e_error}).")
+
+    def __evict(self) -> None:
+        """Supprime les réponses les moins récemment utilisées au-delà du nombre max (à appeler sous verrou)."""
+        l_metas = list(self.__directory.glob("*.json"))
+        if len(l_metas) <= self.__max_entries:
+            return
+        l_metas.sort(key=self.__mtime)
+        for p_meta in l_metas[: len(l_metas) - self.__max_entries]:
+            self.__remove(p_meta)
+
+    @staticmethod
+    def __mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def __remove(path_meta: Path) -> None:
+        """Supprime une réponse (métadonnées puis contenu)."""
+        for p_file in [path_meta, path_meta.with_suffix(".bin")]:
+            DiskCacheBackend.__remove_file(p_file)
+
+    @staticmethod
+    def __remove_file(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def invalidate(self, url: str) -> None:
+        with self.__lock:
+            d_index = self.__read_index()
+            l_hashes = [s_hash for s_hash, s_url in d_index.items() if self.related(url, s_url)]
+            if not l_hashes:
+                return
+            for s_hash in l_hashes:
+                self.__remove(self.__directory / f"{s_hash}.json")
+                del d_index[s_hash]
+            try:
+                self.__write(self.__index_path, json.dumps(d_index).encode("utf-8"))
+            except OSError as e_error:
+                Config().om.warning(f"Impossible d'écrire dans le cache disque des réponses ({e_error}).")
+
+    def clear(self) -> None:
+        with self.__lock:
+            for p_meta in self.__directory.glob("*.json"):
+                self.__remove(p_meta)
+            for p_index in self.__directory.glob("index-*.idx"):
+                self.__remove_file(p_index)
+
+    def __len__(self) -> int:
+        return len(list(self.__directory.glob("*.json")))
+
+
+class ResponseCache:
+    """Cache des réponses aux requêtes GET de l'API, composé d'un ou plusieurs niveaux de stockage
+    (en mémoire, à éviction LRU, puis éventuellement sur disque).
+
+    Deux modes de mise en cache, selon la route :
+
+    * durée de vie (section `response_cache_ttl`) : la réponse est réutilisée sans requête pendant la durée indiquée,
+      puis revalidée par requête conditionnelle si l'API a renvoyé un validateur ;
+    * requête conditionnelle (`conditional_routes`) : la requête est rejouée de manière conditionnelle
+      (`If-None-Match` / `If-Modified-Since`) : si l'API répond 304, le contenu en cache est réutilisé.
+      Si la réponse n'a pas de validateur, elle est réutilisée sans requête pendant `conditional_ttl` secondes.
+
+    Toute requête de modification (POST, PUT, PATCH, DELETE) invalide les réponses des ressources liées (cf. `invalidate`).
+
+    Attributes:
+        __backends (List[ResponseCacheBackend]): niveaux de stockage, du plus rapide au plus lent
+        __conditional_routes (List[str]): motifs des routes revalidées par requête conditionnelle
+        __conditional_ttl (float): durée de réutilisation (en secondes) d'une réponse sans validateur
+        __route_ttls (List[Tuple[str, float]]): durées de vie par motif de route
+        __route_to_ttl (Dict[str, Optional[float]]): cache route -> durée de vie (None si la route n'est pas mise en cache)
+    """
+
+    def __init__(
+        self,
+        backends: Optional[List[ResponseCacheBackend]] = None,
+        conditional_routes: Optional[List[str]] = None,
+        conditional_ttl: float = 0,
+        route_ttls: Optional[List[Tuple[str, float]]] = None,
+    ) -> None:
+        self.__backends: List[ResponseCacheBackend] = backends if backends is not None else [MemoryCacheBackend()]
+        self.__conditional_routes: List[str] = conditional_routes if conditional_routes is not None else []
+        self.__conditional_ttl = conditional_ttl
+        self.__route_ttls: List[Tuple[str, float]] = route_ttls if route_ttls is not None else []
+        self.__route_to_ttl: Dict[str, Optional[float]] = {}
+
+    @classmethod
+    def from_config(cls) -> "ResponseCache":
+        """Instancie le cache à partir des sections `response_cache` et `response_cache_ttl` de la configuration.
+
+        Returns:
+            cache des réponses
+        """
+        l_backends: List[ResponseCacheBackend] = [MemoryCacheBackend(Config().get_int("response_cache", "max_entries", fallback=1000))]
+        s_directory = Config().get("response_cache", "disk_directory")
+        if s_directory:
+            # Les réponses dépendent de l'utilisateur connecté
+            s_namespace = "|".join(str(Config().get("store_authentification", s_option, fallback="")) for s_option in ["token_url", "client_id", "login"])
+            l_backends.append(DiskCacheBackend(Path(s_directory).expanduser(), Config().get_int("response_cache", "disk_max_entries", fallback=1000), s_namespace))
+        s_routes = Config().get("response_cache", "conditional_routes")
+        l_route_ttls: List[Tuple[str, float]] = []
+        o_parser = Config().get_parser()
+        if o_parser.has_section("response_cache_ttl"):
+            for s_pattern in o_parser.options("response_cache_ttl"):
+                l_route_ttls.append((s_pattern, Config().get_float("response_cache_ttl", s_pattern)))
+        return cls(
+            l_backends,
+            [s_route.strip() for s_route in s_routes.split(";") if s_route.strip()] if s_routes else [],
+            Config().get_float("response_cache", "conditional_ttl", fallback=0),
+            l_route_ttls,
+        )
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Calcule la clef de cache d'une requête.
+
+        Args:
+            url (str): url de la requête
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête
+
+        Returns:
+            clef de cache
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items(), key=lambda t_item: str(t_item[0])), doseq=True)}"
+
+    def route_ttl(self, route_name: Optional[str]) -> Optional[float]:
+        """Renvoie la durée de vie des réponses d'une route : celle du premier motif de la section `response_cache_ttl`
+        correspondant, 0 pour les routes revalidées systématiquement (`conditional_routes`), None si la route n'est pas mise en cache.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+
+        Returns:
+            durée de vie (en secondes) ou None
+        """
+        if route_name is None:
+            return None
+        if route_name not in self.__route_to_ttl:
+            f_ttl = next((f_ttl for s_pattern, f_ttl in self.__route_ttls if fnmatch.fnmatchcase(route_name, s_pattern)), None)
+            if f_ttl is None and any(fnmatch.fnmatchcase(route_name, s_pattern) for s_pattern in self.__conditional_routes):
+                f_ttl = 0.0
+            self.__route_to_ttl[route_name] = f_ttl
+        return self.__route_to_ttl[route_name]
+
+    def is_cacheable(self, route_name: Optional[str]) -> bool:
+        """Indique si les réponses de la route sont mises en cache.
+
+        Args:
+            route_name (Optional[str]): nom de la route (None si requête directe sur une URL)
+
+        Returns:
+            True si les réponses sont mises en cache
+        """
+        return self.route_ttl(route_name) is not None
+
+    def __ttl(self, entry: CachedResponse, route_name: Optional[str]) -> float:
+        """Durée pendant laquelle une réponse peut être réutilisée sans requête."""
+        f_ttl = self.route_ttl(route_name) or 0.0
+        if not entry.validators():
+            f_ttl = max(f_ttl, self.__conditional_ttl)
+        return f_ttl
+
+    def is_fresh(self, entry: CachedResponse, route_name: Optional[str]) -> bool:
+        """Indique si une réponse en cache peut être réutilisée sans requête.
+
+        Args:
+            entry (CachedResponse): réponse en cache
+            route_name (Optional[str]): nom de la route
+
+        Returns:
+            True si la réponse peut être réutilisée directement
+        """
+        return entry.age < self.__ttl(entry, route_name)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Récupère une réponse en cache, en la remontant dans les niveaux plus rapides si elle est trouvée dans un niveau plus lent.
+
+        Args:
+            key (str): clef de cache
+
+        Returns:
+            réponse en cache ou None
+        """
+        for i_level, o_backend in enumerate(self.__backends):
+            o_entry = o_backend.get(key)
+            if o_entry is not None:
+                for o_faster in self.__backends[:i_level]:
+                    o_faster.put(key, o_entry)
+                return o_entry
+        return None
+
+    def put(self, key: str, entry: CachedResponse, route_name: Optional[str]) -> None:
+        """Stocke une réponse dans tous les niveaux du cache.
+
+        Les réponses sans validateur ne sont stockées que si elles peuvent être réutilisées (durée de vie > 0).
+
+        Args:
+            key (str): clef de cache
+            entry (CachedResponse): réponse à stocker
+            route_name (Optional[str]): nom de la route
+        """
+        if not entry.validators() and self.__ttl(entry, route_name) <= 0:
+            return
+        for o_backend in self.__backends:
+            o_backend.put(key, entry)
+
+    def invalidate(self, url: str) -> None:
+        """Invalide les réponses liées à une ressource modifiée : la ressource elle-même, ses ressources parentes
+        (ex. : `.../uploads/{id}` pour une modification de `.../uploads/{id}/tags`) et ses sous-ressources.
+
+        Args:
+            url (str): url de la ressource modifiée
+        """
+        for o_backend in self.__backends:
+            o_backend.invalidate(url)
+
+    def clear(self) -> None:
+        """Vide le cache (tous les niveaux)."""
+        for o_backend in self.__backends:
+            o_backend.clear()
+
+    def __len__(self) -> int:
+        return len(self.__backends[0])
@@ -0,0 +1,327 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import InternalServerError, NotAuthorizedError, StatusCodeError
+
+
+class RetryStats:
+    """Statistiques (thread-safe) des nouvelles tentatives effectuées selon une politique de tentatives.
+
+    Attributes:
+        __lock (threading.Lock): verrou protégeant les compteurs
+        __nb_retries (Dict[str, int]): nombre de nouvelles tentatives par catégorie d'erreur
+        __nb_give_up (int): nombre d'appels abandonnés (nombre de tentatives, budget ou délai épuisé)
+        __sec_sleep (float): temps total passé à attendre entre deux tentatives (en secondes)
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__nb_retries: Dict[str, int] = {}
+        self.__nb_give_up = 0
+        self.__sec_sleep = 0.0
+
+    def add_retry(self, category: str, delay: float) -> None:
+        """Enregistre une nouvelle tentative.
+
+        Args:
+            category (str): catégorie de l'erreur ayant déclenché la nouvelle tentative
+            delay (float): délai attendu avant la nouvelle tentative (en secondes)
+        """
+        with self.__lock:
+            self.__nb_retries[category] = self.__nb_retries.get(category, 0) + 1
+            self.__sec_sleep += delay
+
+    def add_give_up(self) -> None:
+        """Enregistre l'abandon d'un appel."""
+        with self.__lock:
+            self.__nb_give_up += 1
+
+    @property
+    def nb_retries(self) -> int:
+        with self.__lock:
+            return sum(self.__nb_retries.values())
+
+    @property
+    def sec_sleep(self) -> float:
+        with self.__lock:
+            return self.__sec_sleep
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Renvoie les statistiques sous forme de dictionnaire.
+
+        Returns:
+            `{"nb_retries": int, "nb_retries_by_category": {catégorie: int}, "nb_give_up": int, "sec_sleep": float}`
+        """
+        with self.__lock:
+            return {
+                "nb_retries": sum(self.__nb_retries.values()),
+                "nb_retries_by_category": dict(self.__nb_retries),
+                "nb_give_up": self.__nb_give_up,
+                "sec_sleep": self.__sec_sleep,
+            }
+
+    def reset(self) -> None:
+        """Remet les statistiques à zéro."""
+        with self.__lock:
+            self.__nb_retries = {}
+            self.__nb_give_up = 0
+            self.__sec_sleep = 0.0
+
+
+class RetryPolicy:
+    """Politique de nouvelles tentatives : attente exponentielle avec gigue totale (« full jitter »),
+    respect de l'en-tête `Retry-After` (réponses 429 et 503), budget de tentatives par catégorie d'erreur
+    et délai total maximal par appel.
+
+    Une politique est partagée par tous les appels ; l'état propre à un appel est porté par un `RetryAttempts` (cf. `start()`).
+
+    Attributes:
+        __nb_attempts (int): nombre maximal de tentatives par appel (première tentative comprise)
+        __sec_base (float): délai de base de l'attente exponentielle (en secondes)
+        __sec_max (float): plafond de l'attente exponentielle (en secondes)
+        __sec_deadline (float): délai total maximal par appel, 0 si pas de limite (en secondes)
+        __budgets (Dict[str, int]): nombre maximal de nouvelles tentatives par catégorie d'erreur (pas de limite si absent)
+        __stats (RetryStats): statistiques des tentatives
+    """
+
+    # Catégories d'erreurs
+    THROTTLING = "throttling"
+    SERVER_ERROR = "server_error"
+    CLIENT_ERROR = "client_error"
+    NETWORK = "network"
+    CATEGORIES = [THROTTLING, SERVER_ERROR, CLIENT_ERROR, NETWORK]
+
+    # Codes retour pour lesquels l'en-tête Retry-After est pris en compte
+    RETRY_AFTER_STATUS_CODES = [429, 503]
+
+    def __init__(self, nb_attempts: int, sec_base: float, sec_max: float, sec_deadline: float = 0, budgets: Optional[Dict[str, int]] = None) -> None:
+        self.__nb_attempts = nb_attempts
+        self.__sec_base = sec_base
+        self.__sec_max = sec_max
+        self.__sec_deadline = sec_deadline
+        self.__budgets: Dict[str, int] = budgets if budgets is not None else {}
+        self.__stats = RetryStats()
+
+    @classmethod
+    def from_config(cls, section: str, nb_attempts: Optional[int] = None) -> "RetryPolicy":
+        """Instancie une politique à partir de la configuration.
+
+        Les paramètres sont lus dans la section indiquée puis, s'ils n'y sont pas définis, dans la section `store_api`.
+
+        Args:
+            section (str): section de la configuration à lire
+            nb_attempts (Optional[int], optional): surcharge du nombre maximal de tentatives.
+
+        Returns:
+            politique de tentatives
+        """
+
+        def get(option: str) -> Optional[str]:
+            return Config().get(section, option, fallback=Config().get("store_api", option))
+
+        d_budgets: Dict[str, int] = {}
+        for s_category in cls.CATEGORIES:
+            s_budget = get(f"retry_budget_{s_category}")
+            if s_budget is not None:
+                d_budgets[s_category] = int(s_budget)
+        return cls(
+            nb_attempts if nb_attempts is not None else int(get("nb_attempts") or 1),
+            float(get("sec_between_attempt") or 0),
+            float(get("sec_max_between_attempt") or 0),
+            float(get("sec_retry_deadline") or 0),
+            d_budgets,
+        )
+
+    @property
+    def nb_attempts(self) -> int:
+        return self.__nb_attempts
+
+    @property
+    def stats(self) -> RetryStats:
+        return self.__stats
+
+    def start(self) -> "RetryAttempts":
+        """Débute un appel.
+
+        Returns:
+            suivi des tentatives de l'appel
+        """
+        return RetryAttempts(self)
+
+    def backoff(self, nb_retries: int) -> float:
+        """Calcule l'attente avant une nouvelle tentative : tirage uniforme entre 0 et `min(max, base * 2^nb_retries)`.
+
+        Args:
+            nb_retries (int): nombre de nouvelles tentatives déjà effectuées
+
+        Returns:
+            délai d'attente (en secondes)
+        """
+        f_ceiling = self.__sec_base * 2**nb_retries
+        if self.__sec_max > 0:
+            f_ceiling = min(self.__sec_max, f_ceiling)
+        return random.uniform(0, f_ceiling)
+
+    def budget(self, category: str) -> Optional[int]:
+        """Renvoie le nombre maximal de nouvelles tentatives pour la catégorie donnée.
+
+        Args:
+            category (str): catégorie d'erreur
+
+        Returns:
+            budget de la catégorie, None si pas de limite
+        """
+        return self.__budgets.get(category)
+
+    @property
+    def sec_deadline(self) -> float:
+        return self.__sec_deadline
+
+    @staticmethod
+    def status_code(error: BaseException) -> Optional[int]:
+        """Renvoie le code retour HTTP associé à une erreur, s'il est connu.
+
+        Args:
+            error (BaseException): erreur levée
+
+        Returns:
+            code retour ou None
+        """
+        if isinstance(error, StatusCodeError):
+            return error.status_code
+        if isinstance(error, InternalServerError):
+            return 500
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return int(error.response.status_code)
+        return None
+
+    @staticmethod
+    def category(error: BaseException) -> str:
+        """Détermine la catégorie d'une erreur.
+
+        Args:
+            error (BaseException): erreur levée
+
+        Returns:
+            catégorie de l'erreur
+        """
+        i_status_code = RetryPolicy.status_code(error)
+        if i_status_code in RetryPolicy.RETRY_AFTER_STATUS_CODES:
+            return RetryPolicy.THROTTLING
+        if i_status_code is not None and i_status_code >= 500:
+            return RetryPolicy.SERVER_ERROR
+        if i_status_code is not None or isinstance(error, NotAuthorizedError):
+            return RetryPolicy.CLIENT_ERROR
+        if isinstance(error, requests.RequestException):
+            return RetryPolicy.NETWORK
+        return RetryPolicy.SERVER_ERROR
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """Renvoie le délai demandé par le serveur via l'en-tête `Retry-After` (réponses 429 et 503 seulement).
+
+        Args:
+            error (BaseException): erreur levée
+
+        Returns:
+            délai en secondes, None si non indiqué ou non parsable
+        """
+        if RetryPolicy.status_code(error) not in RetryPolicy.RETRY_AFTER_STATUS_CODES:
+            return None
+        s_value: Optional[str] = None
+        if isinstance(error, StatusCodeError):
+            s_value = error.headers.get("Retry-After")
+        elif isinstance(error, requests.HTTPError) and error.response is not None:
+            s_value = error.response.headers.get("Retry-After")
+        if s_value is None:
+            return None
+        s_value = s_value.strip()
+        # Soit un nombre de secondes...
+        if s_value.isdigit():
+            return float(s_value)
+        # ... soit une date HTTP
+        try:
+            o_date = parsedate_to_datetime(s_value)
+        except (TypeError, ValueError):
+            return None
+        if o_date.tzinfo is None:
+            o_date = o_date.replace(tzinfo=timezone.utc)
+        return max(0.0, (o_date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryAttempts:
+    """Suivi des tentatives d'un appel selon une politique de tentatives.
+
+    Attributes:
+        __policy (RetryPolicy): politique appliquée
+        __nb_attempts (int): nombre de tentatives effectuées
+        __nb_retries (Dict[str, int]): nombre de nouvelles tentatives par catégorie d'erreur
+        __start (float): instant de début de l'appel (horloge monotone)
+        __deadline (Optional[Deadline]): échéance ayant arrêté les tentatives, None si elles n'ont pas été arrêtées par une échéance
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.__policy = policy
+        self.__nb_attempts = 1
+        self.__nb_retries: Dict[str, int] = {}
+        self.__start = time.monotonic()
+        self.__deadline: Optional[Deadline] = None
+
+    @property
+    def nb_attempts(self) -> int:
+        return self.__nb_attempts
+
+    def next_delay(self, error: BaseException) -> Optional[float]:
+        """Indique, suite à l'échec de la tentative courante, s'il faut retenter et après quel délai.
+
+        Args:
+            error (BaseException): erreur levée par la tentative courante
+
+        Returns:
+            délai à attendre avant la nouvelle tentative (en secondes), None s'il faut abandonner
+        """
+        s_category = RetryPolicy.category(error)
+        i_nb_retries = self.__nb_retries.get(s_category, 0)
+        i_budget = self.__policy.budget(s_category)
+        # Nombre total de tentatives ou budget de la catégorie épuisé
+        if self.__nb_attempts >= self.__policy.nb_attempts or (i_budget is not None and i_nb_retries >= i_budget):
+            self.__policy.stats.add_give_up()
+            return None
+        # Délai : celui demandé par le serveur sinon attente exponentielle avec gigue
+        f_delay = RetryPolicy.retry_after(error)
+        if f_delay is None:
+            f_delay = self.__policy.backoff(sum(self.__nb_retries.values()))
+        # Délai total de l'appel ou échéance de l'opération en cours (cf. `Deadline`) dépassé
+        o_deadline = Deadline.current()
+        if o_deadline is not None and f_delay >= o_deadline.remaining:
+            self.__deadline = o_deadline
+            self.__policy.stats.add_give_up()
+            return None
+        if self.__policy.sec_deadline > 0 and time.monotonic() - self.__start + f_delay > self.__policy.sec_deadline:
+            self.__policy.stats.add_give_up()
+            return None
+        self.__nb_attempts += 1
+        self.__nb_retries[s_category] = i_nb_retries + 1
+        self.__policy.stats.add_retry(s_category, f_delay)
+        return f_delay
+
+    def give_up_error(self, message: str) -> GpfSdkError:
+        """Construit l'erreur à lever quand les tentatives sont abandonnées (`next_delay` a renvoyé None).
+
+        Args:
+            message (str): message si l'abandon n'est pas dû à l'échéance de l'opération en cours
+
+        Returns:
+            `DeadlineExceededError` si l'échéance de l'opération en cours (cf. `Deadline`) a arrêté les tentatives, `GpfSdkError` sinon
+        """
+        if self.__deadline is not None:
+            return self.__deadline.exceeded_error()
+        return GpfSdkError(message)
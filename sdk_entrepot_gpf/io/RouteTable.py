@@ -0,0 +1,141 @@
+import configparser
+import json
+import string
+from typing import Any, Dict, List, Optional, Tuple
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class Route:
+    """Route de l'API précompilée : gabarit d'url découpé, liste des paramètres obligatoires et en-tête additionnel.
+
+    Attributes:
+        __name (str): nom de la route
+        __template (str): gabarit de l'url (ex. : `https://.../datastores/{datastore}/uploads/{upload}`)
+        __parts (List[Tuple[str, Optional[str]]]): gabarit découpé en (texte littéral, nom du paramètre suivant ou None)
+        __params (List[str]): paramètres obligatoires de la route
+        __header (Dict[str, str]): en-tête additionnel de la route
+        __simple (bool): True si le gabarit ne contient que des paramètres simples (sinon on utilise `str.format`)
+    """
+
+    def __init__(self, name: str, template: str, header: Optional[Dict[str, str]] = None) -> None:
+        self.__name = name
+        self.__template = template
+        self.__header: Dict[str, str] = header if header is not None else {}
+        self.__parts: List[Tuple[str, Optional[str]]] = []
+        self.__params: List[str] = []
+        self.__simple = True
+        for s_literal, s_field, s_format_spec, s_conversion in string.Formatter().parse(template):
+            self.__parts.append((s_literal, s_field))
+            if s_field is None:
+                continue
+            if s_format_spec or s_conversion or not s_field.isidentifier():
+                # Formatage avancé (ex. : `{a.b}`, `{a!r}`, `{a:>3}`) : on s'en remet à str.format
+                self.__simple = False
+            if s_field not in self.__params:
+                self.__params.append(s_field)
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def template(self) -> str:
+        return self.__template
+
+    @property
+    def params(self) -> List[str]:
+        return list(self.__params)
+
+    @property
+    def header(self) -> Dict[str, str]:
+        return dict(self.__header)
+
+    def url(self, route_params: Dict[str, Any]) -> str:
+        """Construit l'url de la route à partir des paramètres (équivalent à `template.format(**route_params)`).
+
+        Args:
+            route_params (Dict[str, Any]): paramètres de la route
+
+        Raises:
+            KeyError: levée si un paramètre obligatoire n'est pas fourni
+
+        Returns:
+            url de la route
+        """
+        if not self.__simple:
+            return self.__template.format(**route_params)
+        return "".join(s_literal if s_field is None else s_literal + str(route_params[s_field]) for s_literal, s_field in self.__parts)
+
+
+class RouteTable:
+    """Table des routes de l'API, précompilée à partir de la section `routing` de la configuration.
+
+    L'interpolation des valeurs (`${...}`), le découpage des gabarits et le parsing des en-têtes (`<route>_header`)
+    sont faits une seule fois, à la construction de la table.
+
+    Les routes dont la valeur ne peut pas être interpolée ne sont pas précompilées : l'erreur est levée lors de leur utilisation.
+
+    Attributes:
+        __version (int): version de la configuration à partir de laquelle la table a été construite
+        __routes (Dict[str, Route]): routes par nom
+        __invalid_routes (List[str]): routes dont la valeur n'a pas pu être interpolée
+    """
+
+    HEADER_SUFFIX = "_header"
+
+    def __init__(self, routes: Dict[str, Route], version: int = -1, invalid_routes: Optional[List[str]] = None) -> None:
+        self.__routes = routes
+        self.__version = version
+        self.__invalid_routes: List[str] = invalid_routes if invalid_routes is not None else []
+
+    @classmethod
+    def from_config(cls) -> "RouteTable":
+        """Construit la table à partir de la section `routing` de la configuration courante.
+
+        Returns:
+            table des routes
+        """
+        d_routes: Dict[str, Route] = {}
+        l_invalid_routes: List[str] = []
+        o_parser = Config().get_parser()
+        if o_parser.has_section("routing"):
+            l_options = o_parser.options("routing")
+            for s_option in l_options:
+                if s_option.endswith(RouteTable.HEADER_SUFFIX) and s_option[: -len(RouteTable.HEADER_SUFFIX)] in l_options:
+                    continue
+                try:
+                    s_template = Config().get("routing", s_option)
+                    s_header = Config().get("routing", s_option + RouteTable.HEADER_SUFFIX)
+                except configparser.Error:
+                    l_invalid_routes.append(s_option)
+                    continue
+                if s_template is not None:
+                    d_routes[s_option] = Route(s_option, s_template, json.loads(s_header) if s_header is not None else None)
+        return cls(d_routes, Config().version, l_invalid_routes)
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    def get(self, route_name: str) -> Optional[Route]:
+        """Renvoie une route à partir de son nom.
+
+        Args:
+            route_name (str): nom de la route
+
+        Raises:
+            configparser.Error: levée si la valeur de la route ne peut pas être interpolée
+
+        Returns:
+            route ou None si elle n'est pas définie
+        """
+        s_option = route_name.lower()
+        if s_option in self.__invalid_routes:
+            # On relit la valeur pour lever l'erreur d'interpolation
+            Config().get("routing", s_option)
+            Config().get("routing", s_option + RouteTable.HEADER_SUFFIX)
+        return self.__routes.get(s_option)
+
+    def __len__(self) -> int:
+        return len(self.__routes)
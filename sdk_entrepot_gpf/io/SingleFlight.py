@@ -0,0 +1,130 @@
+import math
+import threading
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import ApiError, DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class Flight(Generic[T]):
+    """Appel en cours, partagé par tous les appelants demandant la même clef.
+
+    Attributes:
+        done (threading.Event): événement signalé à la fin de l'appel
+        result (Optional[T]): résultat de l'appel (si succès)
+        error (Optional[BaseException]): erreur levée par l'appel (si échec)
+        nb_followers (int): nombre d'appelants ayant rejoint l'appel en cours
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.nb_followers = 0
+
+
+class SingleFlight(Generic[T]):
+    """Regroupement (« single-flight ») d'appels identiques simultanés : un seul appel est exécuté par clef à un
+    instant donné, les appelants arrivant pendant son exécution attendent et reçoivent son résultat.
+
+    Seules les erreurs renvoyées par le serveur (cf. `shared_error`) sont partagées. Si l'appel échoue pour une raison
+    propre à l'appelant qui l'a exécuté (échéance dépassée, interruption, ...), les appelants en attente relancent
+    l'appel : l'un d'eux l'exécute, les autres attendent à nouveau.
+
+    Aucun résultat n'est conservé une fois l'appel terminé : un appel lancé après la fin du précédent est exécuté
+    à nouveau. L'attente d'un appelant respecte l'échéance active dans son contexte (cf. `Deadline`).
+
+    Attributes:
+        __lock (threading.Lock): verrou protégeant les appels en cours
+        __flights (Dict[str, Flight[T]]): appels en cours par clef
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__flights: Dict[str, Flight[T]] = {}
+
+    def run(self, key: str, function: Callable[[], T]) -> Tuple[T, bool]:
+        """Exécute la fonction, ou attend la fin de l'appel en cours pour la même clef.
+
+        Args:
+            key (str): clef identifiant l'appel
+            function (Callable[[], T]): fonction à exécuter si aucun appel n'est en cours pour cette clef
+
+        Raises:
+            DeadlineExceededError: levée si l'échéance active est dépassée pendant l'attente
+
+        Returns:
+            résultat de l'appel et True s'il a été obtenu par un autre appelant (résultat partagé)
+        """
+        while True:
+            with self.__lock:
+                o_flight = self.__flights.get(key)
+                b_follower = o_flight is not None
+                if o_flight is None:
+                    o_flight = self.__flights[key] = Flight()
+                else:
+                    o_flight.nb_followers += 1
+            if not b_follower:
+                return self.__lead(key, o_flight, function), False
+            SingleFlight.__wait(o_flight)
+            if o_flight.error is None:
+                return o_flight.result, True  # type: ignore
+            if SingleFlight.shared_error(o_flight.error):
+                raise o_flight.error
+            # Échec propre à l'appelant ayant exécuté l'appel : on relance l'appel
+
+    def __lead(self, key: str, flight: Flight[T], function: Callable[[], T]) -> T:
+        """Exécute l'appel pour tous les appelants de la clef.
+
+        Args:
+            key (str): clef identifiant l'appel
+            flight (Flight[T]): appel en cours
+            function (Callable[[], T]): fonction à exécuter
+
+        Returns:
+            résultat de l'appel
+        """
+        try:
+            flight.result = function()
+        except BaseException as e_error:
+            flight.error = e_error
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+            flight.done.set()
+        return flight.result
+
+    @staticmethod
+    def __wait(flight: Flight[T]) -> None:
+        """Attend la fin d'un appel en cours, au plus jusqu'à l'échéance active.
+
+        Args:
+            flight (Flight[T]): appel en cours
+        """
+        o_deadline = Deadline.current()
+        while not flight.done.wait(None if o_deadline is None or math.isinf(o_deadline.remaining) else max(o_deadline.remaining, 0)):
+            Deadline.check_current()
+
+    @staticmethod
+    def shared_error(error: BaseException) -> bool:
+        """Indique si l'erreur d'un appel est partagée avec les appelants en attente : seules les erreurs renvoyées par
+        le serveur (`ApiError`, éventuellement encapsulée dans une `GpfSdkError` après épuisement des tentatives) le sont.
+
+        Args:
+            error (BaseException): erreur levée par l'appel
+
+        Returns:
+            True si l'erreur est partagée, False si les appelants en attente doivent relancer l'appel
+        """
+        if isinstance(error, ApiError):
+            return True
+        return isinstance(error, GpfSdkError) and not isinstance(error, DeadlineExceededError) and isinstance(error.__cause__, ApiError)
+
+    def __len__(self) -> int:
+        """Nombre d'appels en cours."""
+        with self.__lock:
+            return len(self.__flights)
@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import Optional
+
+from sdk_entrepot_gpf.helper.FileHelper import FileHelper
+
+
+class TransferProgress:
+    """Avancement (thread-safe) d'un transfert de fichier (téléchargement ou envoi), passé aux fonctions de suivi.
+
+    Attributes:
+        __total (Optional[int]): taille totale à transférer en octets (None si inconnue)
+        __done (int): nombre d'octets transférés
+        __start (float): instant de début du transfert (horloge monotone)
+    """
+
+    def __init__(self, total: Optional[int] = None, done: int = 0) -> None:
+        self.__lock = threading.Lock()
+        self.__total = total
+        self.__done = done
+        self.__start = time.monotonic()
+        # Octets déjà présents au début du transfert (reprise) : non comptés dans le débit
+        self.__initial = done
+
+    def add(self, nb_bytes: int) -> None:
+        """Enregistre des octets transférés.
+
+        Args:
+            nb_bytes (int): nombre d'octets transférés
+        """
+        with self.__lock:
+            self.__done += nb_bytes
+
+    @property
+    def total(self) -> Optional[int]:
+        return self.__total
+
+    @property
+    def done(self) -> int:
+        with self.__lock:
+            return self.__done
+
+    @property
+    def elapsed(self) -> float:
+        """Durée du transfert (en secondes)."""
+        return time.monotonic() - self.__start
+
+    @property
+    def speed(self) -> float:
+        """Débit moyen du transfert (en octets par seconde)."""
+        f_elapsed = self.elapsed
+        with self.__lock:
+            i_transferred = self.__done - self.__initial
+        return i_transferred / f_elapsed if f_elapsed > 0 else 0.0
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Part transférée (entre 0 et 1), None si la taille totale est inconnue."""
+        if not self.__total:
+            return None
+        return min(1.0, self.done / self.__total)
+
+    def __str__(self) -> str:
+        s_total = f" / {FileHelper.format_size(self.__total)}" if self.__total else ""
+        return f"{FileHelper.format_size(self.done)}{s_total} ({FileHelper.format_size(int(self.speed))}/s)"
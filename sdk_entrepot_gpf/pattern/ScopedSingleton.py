@@ -0,0 +1,114 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+
+
+class SingletonScope:
+    """Portée d'instances des singletons « à portée » (cf. `ScopedSingleton`) : une fois la portée activée
+    (`with o_scope.activate(): ...`), ces singletons renvoient l'instance propre à la portée au lieu de l'instance du processus.
+
+    La portée active est portée par une variable de contexte (`contextvars`) : elle suit l'appelant dans les threads
+    lancés avec une copie du contexte (AsyncApiRequester, téléchargements parallèles) et chaque thread ou tâche asyncio
+    peut utiliser sa propre portée.
+
+    Attributes:
+        __instances (Dict[type, Any]): instances créées dans la portée, par classe
+        __lock (threading.RLock): verrou protégeant la création des instances
+    """
+
+    # Portée active dans le contexte courant
+    __current: ContextVar[Optional["SingletonScope"]] = ContextVar("sdk_entrepot_gpf_singleton_scope", default=None)
+
+    def __init__(self) -> None:
+        self.__instances: Dict[type, Any] = {}
+        # Verrou réentrant : la création d'une instance peut créer les instances dont elle dépend
+        self.__lock = threading.RLock()
+
+    def instance(self, cls: type, factory: Callable[[], Any]) -> Any:
+        """Renvoie l'instance de la classe dans la portée, en la créant si besoin.
+
+        Args:
+            cls (type): classe du singleton
+            factory (Callable[[], Any]): fonction créant l'instance (appelée dans la portée)
+
+        Returns:
+            instance de la classe propre à la portée
+        """
+        # Instance déjà créée : pas besoin du verrou
+        o_instance = self.__instances.get(cls)
+        if o_instance is not None:
+            return o_instance
+        with self.__lock:
+            if cls not in self.__instances:
+                with self.activate():
+                    self.__instances[cls] = factory()
+            return self.__instances[cls]
+
+    def set_instance(self, cls: type, instance: Any) -> None:
+        """Définit l'instance d'une classe dans la portée (ex. : configuration propre à la portée).
+
+        Args:
+            cls (type): classe du singleton
+            instance (Any): instance à utiliser dans la portée
+        """
+        with self.__lock:
+            self.__instances[cls] = instance
+
+    def instances(self) -> Dict[type, Any]:
+        """Renvoie les instances créées dans la portée.
+
+        Returns:
+            instances par classe
+        """
+        with self.__lock:
+            return dict(self.__instances)
+
+    @contextmanager
+    def activate(self) -> Iterator["SingletonScope"]:
+        """Active la portée dans le contexte courant le temps d'un bloc `with` (la portée englobante est ensuite restaurée).
+
+        Yields:
+            la portée
+        """
+        o_token = SingletonScope.__current.set(self)
+        try:
+            yield self
+        finally:
+            SingletonScope.__current.reset(o_token)
+
+    @staticmethod
+    def current() -> Optional["SingletonScope"]:
+        """Renvoie la portée active dans le contexte courant.
+
+        Returns:
+            portée active, None si ce sont les instances du processus qui sont utilisées
+        """
+        return SingletonScope.__current.get()
+
+
+class ScopedSingleton(Singleton):
+    """Singleton dont l'instance dépend de la portée active (cf. `SingletonScope`) : en dehors de toute portée,
+    c'est un singleton classique (instance unique du processus), dans une portée l'instance propre à celle-ci est
+    renvoyée (créée à la première demande).
+
+    exemple :
+        class MyClass(metaclass=ScopedSingleton):
+            def __init__(self):
+                pass
+        with SingletonScope().activate():
+            MyClass() != MyClass() en dehors de la portée
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Fonction pour vérifier s'il faut instancier ou pas le singleton (dans la portée active).
+
+        Returns:
+            object: objet instancié
+        """
+        o_scope = SingletonScope.current()
+        if o_scope is None:
+            return super().__call__(*args, **kwargs)
+        return o_scope.instance(cls, lambda: type.__call__(cls, *args, **kwargs))
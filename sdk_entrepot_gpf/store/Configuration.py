@@ -8,6 +8,7 @@ from sdk_entrepot_gpf.store.interface.CommentInterface import CommentInterface
 from sdk_entrepot_gpf.store.interface.EventInterface import EventInterface
 from sdk_entrepot_gpf.store.interface.FullEditInterface import FullEditInterface
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 
 
 class Configuration(TagInterface, CommentInterface, EventInterface, FullEditInterface, StoreEntity):
@@ -35,7 +36,7 @@ class Configuration(TagInterface, CommentInterface, EventInterface, FullEditInte
             route_params={"datastore": self.datastore, self._entity_name: self.id},
         )
         # Instanciation de chaque élément renvoyé dans la liste
-        l_offerings: List[Offering] = [Offering(i) for i in o_response.json()]
+        l_offerings: List[Offering] = [Offering(i) for i in JsonConverter().loads(o_response.content)]
 
         return l_offerings
 
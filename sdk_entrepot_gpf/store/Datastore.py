@@ -1,8 +1,9 @@
 import re
-from typing import Dict, List, Optional, Type, TypeVar
+from typing import Dict, Generator, List, Optional, Type, TypeVar
 from sdk_entrepot_gpf.Errors import GpfSdkError
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.Config import Config
 
@@ -15,6 +16,20 @@ class Datastore(StoreEntity):
     _entity_name = "datastore"
     _entity_title = "entrepôt"
 
+    @classmethod
+    def api_iter(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, datastore: Optional[str] = None) -> Generator[T, None, None]:
+        """Parcourt les entrepôts de l'API respectant les paramètres donnés (liste non paginée, cf. `api_list`).
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            datastore: Identifiant du datastore
+
+        Yields:
+            entités retournées par l'API
+        """
+        yield from cls.api_list(infos_filter, tags_filter, datastore=datastore)
+
     @classmethod
     def api_list(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None) -> List[T]:
         """Liste les entités de l'API respectant les paramètres donnés.
@@ -40,7 +55,7 @@ class Datastore(StoreEntity):
         # On liste les communautés de l'utilisateur
         o_response = ApiRequester().route_request("user_get")
         # Pour chacune d'elles
-        for d_communities_member in o_response.json()["communities_member"]:
+        for d_communities_member in JsonConverter().loads(o_response.content)["communities_member"]:
             # On récupère le nom et le nom technique
             s_name = d_communities_member["community"]["name"]
             s_technical_name = d_communities_member["community"]["technical_name"]
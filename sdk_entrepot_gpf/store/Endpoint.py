@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Generator, List, Optional, Type
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity, T
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
@@ -11,6 +12,20 @@ class Endpoint(StoreEntity):
     _entity_name = "endpoint"
     _entity_title = "point de montage"
 
+    @classmethod
+    def api_iter(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, datastore: Optional[str] = None) -> Generator[T, None, None]:
+        """Parcourt les points de montage de l'API respectant les paramètres donnés (liste non paginée, cf. `api_list`).
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            datastore: Identifiant du datastore
+
+        Yields:
+            entités retournées par l'API
+        """
+        yield from cls.api_list(infos_filter, tags_filter, datastore=datastore)
+
     @classmethod
     def api_list(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None) -> List[T]:
         """Liste les points de montage de l'API respectant les paramètres donnés.
@@ -35,7 +50,7 @@ class Endpoint(StoreEntity):
         l_endpoints: List[T] = []
 
         # Pour chaque endpoints en dictionnaire
-        for d_endpoint in o_response.json()["endpoints"]:
+        for d_endpoint in JsonConverter().loads(o_response.content)["endpoints"]:
             # On suppose qu'il est ok
             b_ok = True
             # On vérifie s'il respecte les critère d'attributs
@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Type, TypeVar
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.pattern.ScopedSingleton import ScopedSingleton
+
+if TYPE_CHECKING:
+    from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
+
+T = TypeVar("T", bound="StoreEntity")
+
+
+class IdentityMap(metaclass=ScopedSingleton):
+    """Singleton (thread-safe) retenant les entités récupérées, identifiées par (datastore, type d'entité, id).
+
+    Optionnel (section `identity_map`, ou `enable()` / `session()`), il permet de renvoyer la même instance pour une
+    même entité lors d'une exécution (résolveurs, actions, suppressions en cascade, ...) :
+
+    * `api_get` renvoie l'instance retenue sans requête si elle est fraîche (récupérée depuis moins de `sec_ttl`
+      secondes) ; sinon l'entité est récupérée et l'instance retenue est mise à jour ;
+    * `api_list` et `api_iter` renvoient les instances retenues, mises à jour avec les propriétés listées (les
+      listings n'en renvoyant qu'une partie, l'instance est périmée si elles ont changé) ;
+    * `api_create` et `api_update` retiennent l'entité (et rafraîchissent l'instance retenue) ;
+    * `api_delete` oublie l'entité ; une modification (édition, étiquettes, commentaires) ou un changement de statut
+      (ouverture, fermeture ou vérification d'une livraison, lancement ou annulation d'une exécution) la rend périmée.
+
+    Les entités les moins récemment utilisées sont évincées au-delà de `max_entries` entités. Comme les autres
+    singletons du SDK, chaque contexte client (cf. `ClientContext`) a sa propre instance.
+
+    Attributes:
+        __lock (threading.Lock): verrou protégeant les entités retenues
+        __enabled (bool): indique si les entités sont retenues
+        __max_entries (int): nombre max d'entités retenues
+        __sec_ttl (float): durée (en secondes) pendant laquelle une entité retenue est considérée comme fraîche
+        __entries (OrderedDict[Tuple[Optional[str], str, str], Tuple[StoreEntity, float]]): entités retenues et date
+            (horloge monotone) de leur dernière récupération, de la moins à la plus récemment utilisée
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__enabled = Config().get_bool("identity_map", "enabled", fallback=False)
+        self.__max_entries = max(1, Config().get_int("identity_map", "max_entries", fallback=1000))
+        self.__sec_ttl = Config().get_float("identity_map", "sec_ttl", fallback=60)
+        self.__entries: "OrderedDict[Tuple[Optional[str], str, str], Tuple[StoreEntity, float]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    def enable(self) -> None:
+        """Active la rétention des entités."""
+        self.__enabled = True
+
+    def disable(self) -> None:
+        """Désactive la rétention des entités et oublie les entités retenues."""
+        self.__enabled = False
+        self.clear()
+
+    @contextmanager
+    def session(self) -> Iterator["IdentityMap"]:
+        """Active la rétention des entités le temps d'un bloc `with` ; les entités retenues sont oubliées à la fin du bloc.
+
+        Yields:
+            l'IdentityMap
+        """
+        b_enabled = self.__enabled
+        self.enable()
+        try:
+            yield self
+        finally:
+            if b_enabled:
+                self.clear()
+            else:
+                self.disable()
+
+    def clear(self) -> None:
+        """Oublie toutes les entités retenues."""
+        with self.__lock:
+            self.__entries.clear()
+
+    @staticmethod
+    def __key(entity_type: Type["StoreEntity"], id_: str, datastore: Optional[str]) -> Tuple[Optional[str], str, str]:
+        # Sans datastore, c'est le datastore par défaut qui est requêté (cf. `ApiRequester.route_request`)
+        s_datastore = datastore or Config().get("store_api", "datastore", fallback=None)
+        return (s_datastore, entity_type.entity_name(), id_)
+
+    def get(self, entity_type: Type[T], id_: str, datastore: Optional[str] = None, fresh: bool = True) -> Optional[T]:
+        """Renvoie l'instance retenue pour une entité.
+
+        Args:
+            entity_type (Type[T]): classe de l'entité
+            id_ (str): identifiant de l'entité
+            datastore (Optional[str], optional): identifiant du datastore
+            fresh (bool, optional): ne renvoyer l'instance que si elle est fraîche
+
+        Returns:
+            instance retenue, None si l'entité n'est pas retenue (ou pas fraîche si `fresh`)
+        """
+        if not self.__enabled:
+            return None
+        o_key = IdentityMap.__key(entity_type, id_, datastore)
+        with self.__lock:
+            o_entry = self.__entries.get(o_key)
+            if o_entry is None or not isinstance(o_entry[0], entity_type):
+                return None
+            self.__entries.move_to_end(o_key)
+        if fresh and time.monotonic() - o_entry[1] >= self.__sec_ttl:
+            return None
+        return o_entry[0]
+
+    def register(self, entity: T) -> T:
+        """Retient une entité qui vient d'être récupérée depuis l'API.
+
+        Si une autre instance est déjà retenue pour cette entité, c'est elle qui est renvoyée (et qui reste
+        retenue) : ses propriétés doivent alors être mises à jour par l'appelant.
+
+        Args:
+            entity (T): entité récupérée
+
+        Returns:
+            instance retenue pour l'entité
+        """
+        if not self.__enabled:
+            return entity
+        o_key = IdentityMap.__key(type(entity), entity.id, entity.datastore)
+        with self.__lock:
+            o_entry = self.__entries.get(o_key)
+            o_entity = o_entry[0] if o_entry is not None and isinstance(o_entry[0], type(entity)) else entity
+            self.__entries[o_key] = (o_entity, time.monotonic())
+            self.__entries.move_to_end(o_key)
+            # Éviction des entités les moins récemment utilisées
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+        return o_entity
+
+    def invalidate(self, entity: "StoreEntity") -> None:
+        """Rend périmée l'instance retenue pour une entité modifiée : elle sera récupérée à nouveau par `api_get`.
+
+        Args:
+            entity (StoreEntity): entité modifiée
+        """
+        o_key = IdentityMap.__key(type(entity), entity.id, entity.datastore)
+        with self.__lock:
+            o_entry = self.__entries.get(o_key)
+            if o_entry is not None:
+                self.__entries[o_key] = (o_entry[0], float("-inf"))
+
+    def remove(self, entity: "StoreEntity") -> None:
+        """Oublie une entité (supprimée).
+
+        Args:
+            entity (StoreEntity): entité supprimée
+        """
+        with self.__lock:
+            self.__entries.pop(IdentityMap.__key(type(entity), entity.id, entity.datastore), None)
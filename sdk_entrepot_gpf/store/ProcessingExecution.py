@@ -2,6 +2,7 @@ from datetime import datetime
 import json
 from typing import Optional
 
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.store.interface.CsfInterface import CsfInterface
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
@@ -61,6 +62,9 @@ class ProcessingExecution(CsfInterface, StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
 
+        # Le statut a changé : l'instance retenue est périmée
+        IdentityMap().invalidate(self)
+
     def api_abort(self) -> None:
         """Annule l'exécution du traitement sur l'API."""
         # Génération du nom de la route
@@ -73,6 +77,9 @@ class ProcessingExecution(CsfInterface, StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
 
+        # Le statut a changé : l'instance retenue est périmée
+        IdentityMap().invalidate(self)
+
     @property
     def launch(self) -> Optional[datetime]:
         """Récupère la datetime de lancement de l'exécution du traitement.
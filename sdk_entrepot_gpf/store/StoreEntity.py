@@ -1,13 +1,26 @@
+import contextvars
 import json
+import math
 from abc import ABC
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Sequence, Tuple, Type, TypeVar
 from datetime import datetime
 from dateutil import parser
+import requests
 
+from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import BadRequestError, NotFoundError
+from sdk_entrepot_gpf.io.PageSizePolicy import PageSizePolicy
+from sdk_entrepot_gpf.io.ParallelExecutor import ParallelExecutor
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
 
 T = TypeVar("T", bound="StoreEntity")
 
@@ -98,7 +111,7 @@ class StoreEntity(ABC):
             data=data,
         )
         # Instanciation
-        return cls(o_response.json(), datastore=s_datastore)
+        return StoreEntity._identify(cls(JsonConverter().loads(o_response.content), datastore=s_datastore))
 
     @classmethod
     def api_get(cls: Type[T], id_: str, datastore: Optional[str] = None) -> T:
@@ -111,6 +124,10 @@ class StoreEntity(ABC):
         Returns:
             (StoreEntity): L'entité instanciée correspondante
         """
+        # Instance retenue et fraîche (cf. IdentityMap)
+        o_entity = IdentityMap().get(cls, id_, datastore)
+        if o_entity is not None:
+            return o_entity
         # Génération du nom de la route
         s_route = f"{cls._entity_name}_get"
         # Requête
@@ -119,7 +136,20 @@ class StoreEntity(ABC):
             route_params={"datastore": datastore, cls._entity_name: id_},
         )
         # Instanciation
-        return cls(o_response.json(), datastore)
+        return StoreEntity._identify(cls(JsonConverter().loads(o_response.content), datastore))
+
+    @classmethod
+    def api_get_many(cls: Type[T], ids: List[str], datastore: Optional[str] = None) -> List[T]:
+        """Récupère plusieurs entités depuis l'API, en parallèle (`store_api.batch_max_workers` requêtes simultanées au plus).
+
+        Args:
+            ids: Identifiants des entités
+            datastore: Identifiant du datastore
+
+        Returns:
+            (List[StoreEntity]): Les entités instanciées, dans l'ordre des identifiants
+        """
+        return ParallelExecutor.map(lambda id_: cls.api_get(id_, datastore), ids, Config().get_int("store_api", "batch_max_workers", fallback=8))
 
     @classmethod
     def api_list(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None) -> List[T]:
@@ -134,45 +164,220 @@ class StoreEntity(ABC):
         Returns:
             (List[StoreEntity]): liste des entités retournées par l'API
         """
-        # Nombre d'éléments max à lister par requête
-        i_limit = Config().get_int("store_api", "nb_limit")
+        # Fusion des filtres sur les attributs et les tags
+        d_params = cls._api_list_params(infos_filter, tags_filter)
+
+        # Échéance du listing (section deadline), propagée à toutes les requêtes
+        with Deadline.from_config("api_list", f"liste des entités {cls._entity_name}"):
+            # Page précise demandée : taille de page fixe (store_api.nb_limit)
+            if page is not None:
+                return cls._api_list_page(d_params, page, Config().get_int("store_api", "nb_limit"), datastore)[0]
+            # Première page : elle fixe la taille des pages (cf. PageSizePolicy) et indique le nombre total d'entités
+            l_page, i_length, i_limit = cls._api_list_first_page(d_params, datastore)
+            # Liste pour stocker les entités
+            l_entities: List[T] = list(l_page)
+            i_page = 1
+            # Les pages suivantes sont récupérées en parallèle
+            if i_length is not None and i_length > len(l_entities):
+                i_page = math.ceil(i_length / i_limit)
+                for l_page, i_length in ParallelExecutor.map(
+                    lambda i: cls._api_list_pages(d_params, i, i_limit, datastore), range(2, i_page + 1), Config().get_int("store_api", "list_max_workers", fallback=8)
+                ):
+                    l_entities += l_page
+            # Si des entités ont été ajoutées entre-temps, on requête la suite page après page
+            # tant que le Content-Range indique qu'il en reste et que la dernière page n'était pas vide
+            while l_page and i_length is not None and len(l_entities) < i_length:
+                i_page += 1
+                l_page, i_length = cls._api_list_pages(d_params, i_page, i_limit, datastore)
+                l_entities += l_page
+
+        # On renvoie la liste des entités récupérées
+        return l_entities
+
+    @classmethod
+    def api_iter(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, datastore: Optional[str] = None) -> Generator[T, None, None]:
+        """Parcourt les entités de l'API respectant les paramètres donnés, page par page, sans les garder en mémoire.
+
+        Pendant que l'appelant traite une page, les `store_api.list_read_ahead` pages suivantes sont récupérées en
+        arrière-plan : au plus `1 + list_read_ahead` pages sont en mémoire, quel que soit le nombre d'entités.
+        Avec `list_read_ahead = 0`, la page suivante n'est récupérée (dans le thread de l'appelant) qu'une fois la
+        page courante traitée. Si l'appelant arrête le parcours (`break`, `close()`), les pages demandées d'avance
+        sont abandonnées.
+
+        Contrairement à `api_list`, aucune échéance globale n'est appliquée (le rythme dépend de l'appelant) :
+        chaque requête respecte l'échéance active dans le contexte de l'appelant.
 
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            datastore: Identifiant du datastore
+
+        Yields:
+            (StoreEntity): entités retournées par l'API
+        """
+        # Nombre de pages récupérées d'avance (0 : pas de récupération en arrière-plan)
+        i_read_ahead = max(0, Config().get_int("store_api", "list_read_ahead", fallback=1))
+        d_params = cls._api_list_params(infos_filter, tags_filter)
+
+        def request_page(o_context: contextvars.Context, i_page: int) -> Tuple[List[T], Optional[int]]:
+            return o_context.run(cls._api_list_pages, d_params, i_page, i_limit, datastore)
+
+        # Première page : elle fixe la taille des pages (cf. PageSizePolicy) et indique le nombre total d'entités
+        l_page, i_length, i_limit = cls._api_list_first_page(d_params, datastore)
+        i_next_page = 2
+        if i_read_ahead == 0:
+            # Pages récupérées une à une, tant que le Content-Range indique qu'il en reste
+            while True:
+                yield from l_page
+                if not l_page or i_length is None or (i_next_page - 1) * i_limit >= i_length:
+                    return
+                l_page, i_length = cls._api_list_pages(d_params, i_next_page, i_limit, datastore)
+                i_next_page += 1
+        # Pages demandées d'avance (dans l'ordre)
+        l_futures: Deque["Future[Tuple[List[T], Optional[int]]]"] = deque()
+        o_executor = ThreadPoolExecutor(max_workers=i_read_ahead, thread_name_prefix="sdk_entrepot_gpf_read_ahead")
+        try:
+            while True:
+                # On demande les pages suivantes tant que le Content-Range indique qu'il en reste
+                while len(l_futures) < i_read_ahead and l_page and i_length is not None and (i_next_page - 1) * i_limit < i_length:
+                    l_futures.append(o_executor.submit(request_page, contextvars.copy_context(), i_next_page))
+                    i_next_page += 1
+                yield from l_page
+                if not l_futures:
+                    return
+                l_page, i_length = l_futures.popleft().result()
+        finally:
+            # Parcours terminé ou arrêté par l'appelant : on abandonne les pages demandées d'avance
+            for o_future in l_futures:
+                o_future.cancel()
+            o_executor.shutdown(wait=False)
+
+    @staticmethod
+    def _api_list_params(infos_filter: Optional[Dict[str, str]], tags_filter: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Fusionne les filtres sur les attributs et les tags en paramètres de la requête de listing.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+
+        Returns:
+            paramètres de la requête
+        """
         # Gestion des paramètres nuls
         infos_filter = infos_filter if infos_filter is not None else {}
         tags_filter = tags_filter if tags_filter is not None else {}
+        return {**infos_filter, **{f"tags[{k}]": v for k, v in tags_filter.items()}}
 
-        # Fusion des filtres sur les attributs et les tags
-        d_params: Dict[str, Any] = {**infos_filter, **{f"tags[{k}]": v for k, v in tags_filter.items()}}
+    @classmethod
+    def _api_list_page(cls: Type[T], params: Dict[str, Any], page: int, limit: int, datastore: Optional[str], retry_timeout: bool = True) -> Tuple[List[T], Optional[int]]:
+        """Récupère une page du listing des entités.
 
-        # Génération du nom de la route
-        s_route = f"{cls._entity_name}_list"
+        Args:
+            params: paramètres de la requête (filtres)
+            page: numéro de la page
+            limit: taille de la page
+            datastore: Identifiant du datastore
+            retry_timeout: si False, la requête n'est pas retentée si le délai d'attente est dépassé
 
-        # Liste pour stocker les entités
-        l_entities: List[T] = []
+        Returns:
+            entités de la page et nombre total d'entités indiqué par le Content-Range de la réponse (None s'il est absent ou non analysable)
+        """
+        # On liste les entités à la bonne page
+        o_response = ApiRequester().route_request(
+            f"{cls._entity_name}_list",
+            route_params={"datastore": datastore},
+            params={**params, **{"page": page, "limit": limit}},
+            retry_timeout=retry_timeout,
+        )
+        l_page = [cls._listed(d_entity, datastore) for d_entity in JsonConverter().loads(o_response.content)]
+        return l_page, ApiRequester.range_length(o_response.headers.get("Content-Range"))
 
-        # Numéro de la page demandée
-        i_page = 1 if page is None else page
+    @classmethod
+    def _listed(cls: Type[T], listed_dict: Dict[str, Any], datastore: Optional[str]) -> T:
+        """Renvoie l'entité correspondant à un élément d'un listing : l'instance retenue s'il y en a une (cf. `IdentityMap`),
+        mise à jour avec les propriétés listées. Si elles ont changé côté serveur, l'instance retenue est périmée : ses
+        autres propriétés seront récupérées à nouveau par `api_get`.
 
-        # Flag indiquant s'il faut requêter la prochaine page
-        b_next_page = True
+        Args:
+            listed_dict: propriétés de l'entité renvoyées par le listing
+            datastore: Identifiant du datastore
 
-        # On requête tant qu'on est à la page spécifiquement demandée ou qu'on veut toutes les pages et que la dernière n'était pas vide
-        while i_page == page or (page is None and b_next_page is True):
-            # On liste les entités à la bonne page
-            o_response = ApiRequester().route_request(
-                s_route,
-                route_params={"datastore": datastore},
-                params={**d_params, **{"page": i_page, "limit": i_limit}},
-            )
-            # On les ajoute à la liste
-            l_entities += [cls(i, datastore) for i in o_response.json()]
-            # On regarde le Content-Range de la réponse pour savoir si on doit refaire une requête pour récupérer la fin
-            b_next_page = ApiRequester.range_next_page(o_response.headers.get("Content-Range"), len(l_entities))
-            # On passe à la page suivante
-            i_page += 1
+        Returns:
+            entité
+        """
+        o_entity = IdentityMap().get(cls, str(listed_dict["_id"]), datastore, fresh=False)
+        if o_entity is None:
+            return cls(listed_dict, datastore)
+        d_store_api = o_entity._store_api_dict  # pylint:disable=protected-access
+        if any(s_key not in d_store_api or d_store_api[s_key] != o_value for s_key, o_value in listed_dict.items()):
+            o_entity._store_api_dict = {**d_store_api, **listed_dict}  # pylint:disable=protected-access
+            IdentityMap().invalidate(o_entity)
+        return o_entity
 
-        # On renvoie la liste des entités récupérées
-        return l_entities
+    @classmethod
+    def _api_list_first_page(cls: Type[T], params: Dict[str, Any], datastore: Optional[str]) -> Tuple[List[T], Optional[int], int]:
+        """Récupère la première page du listing des entités en négociant la taille des pages (cf. `PageSizePolicy`) :
+        si la page n'est pas reçue à temps, ou si la taille est refusée par le serveur (400) alors que la taille
+        minimale est acceptée avec les mêmes filtres, la requête est refaite avec une taille réduite. La taille réduite
+        n'est retenue pour la route qu'une fois la page reçue. Tant que la taille peut être réduite, un délai
+        d'attente dépassé n'est pas retenté : la taille est réduite dès le premier dépassement.
+
+        Args:
+            params: paramètres de la requête (filtres)
+            datastore: Identifiant du datastore
+
+        Returns:
+            entités de la page, nombre total d'entités (None s'il n'est pas connu) et taille des pages à utiliser pour la suite
+        """
+        s_route = f"{cls._entity_name}_list"
+        i_limit = PageSizePolicy().get(s_route)
+        b_limit_checked = False
+        while True:
+            try:
+                l_page, i_length = cls._api_list_page(params, 1, i_limit, datastore, retry_timeout=not PageSizePolicy().can_reduce(i_limit))
+            except GpfSdkError as e_error:
+                i_new_limit = PageSizePolicy().reduce(s_route, i_limit) if isinstance(e_error.__cause__, (BadRequestError, requests.Timeout)) else None
+                if i_new_limit is None:
+                    raise
+                if isinstance(e_error.__cause__, BadRequestError) and not b_limit_checked:
+                    # Le refus peut venir des filtres : la taille n'est réduite que si la taille minimale est acceptée
+                    # (sinon l'erreur de cette requête est levée)
+                    cls._api_list_page(params, 1, PageSizePolicy().min_size, datastore)
+                    b_limit_checked = True
+                Config().om.warning(f"Listing des entités {cls._entity_name} : nouvel essai avec des pages de {i_new_limit} éléments.")
+                i_limit = i_new_limit
+                continue
+            if i_limit < PageSizePolicy().get(s_route):
+                PageSizePolicy().retain(s_route, i_limit)
+            return l_page, i_length, PageSizePolicy().observe(s_route, i_limit, len(l_page), i_length)
+
+    @classmethod
+    def _api_list_pages(cls: Type[T], params: Dict[str, Any], page: int, limit: int, datastore: Optional[str]) -> Tuple[List[T], Optional[int]]:
+        """Récupère une page du listing des entités ; si elle n'est pas reçue à temps, elle est récupérée en deux
+        demi-pages (cf. `PageSizePolicy.split`), la taille moitié étant retenue pour la route une fois les deux
+        demi-pages reçues. Tant que la page peut être divisée, un délai d'attente dépassé n'est pas retenté.
+
+        Args:
+            params: paramètres de la requête (filtres)
+            page: numéro de la page
+            limit: taille de la page
+            datastore: Identifiant du datastore
+
+        Returns:
+            entités de la page et nombre total d'entités (None s'il n'est pas connu)
+        """
+        try:
+            return cls._api_list_page(params, page, limit, datastore, retry_timeout=not PageSizePolicy().can_split(limit))
+        except GpfSdkError as e_error:
+            s_route = f"{cls._entity_name}_list"
+            i_half = PageSizePolicy().split(s_route, limit) if isinstance(e_error.__cause__, requests.Timeout) else None
+            if i_half is None:
+                raise
+            # Les pages 2n-1 et 2n de taille moitié couvrent la page n
+            l_first, _ = cls._api_list_pages(params, 2 * page - 1, i_half, datastore)
+            l_second, i_length = cls._api_list_pages(params, 2 * page, i_half, datastore)
+            PageSizePolicy().retain(s_route, i_half)
+            return l_first + l_second, i_length
 
     def api_delete(self) -> None:
         """Supprime l'entité de l'API."""
@@ -183,6 +388,7 @@ class StoreEntity(ABC):
             method=ApiRequester.DELETE,
             route_params={"datastore": self.datastore, self._entity_name: self.id},
         )
+        IdentityMap().remove(self)
 
     def api_update(self) -> None:
         """Met à jour l'instance Python représentant l'entité en récupérant les infos à jour sur l'API.
@@ -191,12 +397,99 @@ class StoreEntity(ABC):
         # Génération du nom de la route
         s_route = f"{self._entity_name}_get"
         # Requête
-        o_response = ApiRequester().route_request(
-            s_route,
-            route_params={"datastore": self.datastore, self._entity_name: self.id},
-        )
+        try:
+            o_response = ApiRequester().route_request(
+                s_route,
+                route_params={"datastore": self.datastore, self._entity_name: self.id},
+            )
+        except NotFoundError:
+            # L'entité n'existe plus
+            IdentityMap().remove(self)
+            raise
         # Mise à jour du stockage local
-        self._store_api_dict = o_response.json()
+        self._store_api_dict = JsonConverter().loads(o_response.content)
+        StoreEntity._identify(self)
+
+    @staticmethod
+    def _identify(entity: T) -> T:
+        """Retient une entité qui vient d'être récupérée depuis l'API (cf. `IdentityMap`) : si une autre instance est
+        déjà retenue pour cette entité, ses propriétés sont mises à jour et c'est elle qui est renvoyée.
+
+        Args:
+            entity: entité récupérée
+
+        Returns:
+            (StoreEntity): instance retenue pour l'entité
+        """
+        o_entity = IdentityMap().register(entity)
+        if o_entity is not entity:
+            o_entity._store_api_dict = entity._store_api_dict  # pylint:disable=protected-access
+        return o_entity
+
+    @staticmethod
+    def api_update_many(entities: Sequence["StoreEntity"]) -> None:
+        """Met à jour plusieurs instances (cf. `api_update`) en récupérant les infos à jour sur l'API, en parallèle
+        (`store_api.batch_max_workers` requêtes simultanées au plus).
+
+        Args:
+            entities: entités à mettre à jour (de types éventuellement différents)
+        """
+        ParallelExecutor.map(lambda o_entity: o_entity.api_update(), entities, Config().get_int("store_api", "batch_max_workers", fallback=8))
+
+    ##############################################################
+    # Fonctions asynchrones (asyncio) d'interface avec l'API
+    ##############################################################
+
+    @classmethod
+    async def api_create_async(cls: Type[T], data: Optional[Dict[str, Any]], route_params: Optional[Dict[str, Any]] = None) -> T:
+        """Pendant asyncio de `api_create` : crée une nouvelle entité dans l'API sans bloquer la boucle d'événements.
+
+        Args:
+            data: Données nécessaires pour la création.
+            route_params: Paramètres de résolution de la route.
+
+        Returns:
+            (StoreEntity): Entité créée
+        """
+        return await AsyncApiRequester().run_sync(cls.api_create, data, route_params=route_params)
+
+    @classmethod
+    async def api_get_async(cls: Type[T], id_: str, datastore: Optional[str] = None) -> T:
+        """Pendant asyncio de `api_get` : récupère une entité depuis l'API sans bloquer la boucle d'événements.
+
+        Args:
+            id_: Identifiant de l'entité
+            datastore: Identifiant du datastore
+
+        Returns:
+            (StoreEntity): L'entité instanciée correspondante
+        """
+        return await AsyncApiRequester().run_sync(cls.api_get, id_, datastore=datastore)
+
+    @classmethod
+    async def api_list_async(
+        cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None
+    ) -> List[T]:
+        """Pendant asyncio de `api_list` : liste les entités de l'API sans bloquer la boucle d'événements.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            page: Numéro page à récupérer, toutes si None.
+            datastore: Identifiant du datastore
+
+        Returns:
+            (List[StoreEntity]): liste des entités retournées par l'API
+        """
+        return await AsyncApiRequester().run_sync(cls.api_list, infos_filter=infos_filter, tags_filter=tags_filter, page=page, datastore=datastore)
+
+    async def api_delete_async(self) -> None:
+        """Pendant asyncio de `api_delete` : supprime l'entité de l'API sans bloquer la boucle d'événements."""
+        await AsyncApiRequester().run_sync(self.api_delete)
+
+    async def api_update_async(self) -> None:
+        """Pendant asyncio de `api_update` : met à jour l'instance Python sans bloquer la boucle d'événements."""
+        await AsyncApiRequester().run_sync(self.api_update)
 
     @staticmethod
     def filter_dict_from_str(filters: Optional[str]) -> Dict[str, str]:
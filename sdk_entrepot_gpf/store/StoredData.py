@@ -1,5 +1,7 @@
 from typing import List
 
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.ParallelExecutor import ParallelExecutor
 from sdk_entrepot_gpf.store.Configuration import Configuration
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.store.interface.TagInterface import TagInterface
@@ -33,9 +35,9 @@ class StoredData(TagInterface, CommentInterface, SharingInterface, EventInterfac
 
         # liste des configurations
         l_configuration = Configuration.api_list({"stored_data": self.id})
-        for o_configuration in l_configuration:
-            # pour chaque configuration on récupère les offerings
-            l_offering = o_configuration.api_list_offerings()
+        # pour chaque configuration on récupère les offerings (en parallèle)
+        l_offerings = ParallelExecutor.map(lambda o_configuration: o_configuration.api_list_offerings(), l_configuration, Config().get_int("store_api", "batch_max_workers", fallback=8))
+        for o_configuration, l_offering in zip(l_configuration, l_offerings):
             l_entities += l_offering
             l_entities.append(o_configuration)
         # ajout de la stored_data
@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.store.interface.TagInterface import TagInterface
 from sdk_entrepot_gpf.store.interface.CommentInterface import CommentInterface
@@ -8,7 +9,9 @@ from sdk_entrepot_gpf.store.interface.SharingInterface import SharingInterface
 from sdk_entrepot_gpf.store.interface.EventInterface import EventInterface
 from sdk_entrepot_gpf.store.interface.PartialEditInterface import PartialEditInterface
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
 
 
@@ -31,12 +34,13 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
     STATUS_UNSTABLE = "UNSTABLE"
     STATUS_DELETED = "DELETED"
 
-    def api_push_data_file(self, file_path: Path, api_path: str) -> None:
+    def api_push_data_file(self, file_path: Path, api_path: str, callback: Optional[Callable[[TransferProgress], None]] = None) -> None:
         """Téléverse via l'API un fichier de donnée associé à cette Livraison.
 
         Args:
             file_path: chemin local vers le fichier à envoyer
             api_path: chemin distant du dossier où déposer le fichier
+            callback: fonction de suivi de l'envoi (octets envoyés, débit)
         """
         # Génération du nom de la route
         s_route = f"{self._entity_name}_push_data"
@@ -51,6 +55,7 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             route_params={"datastore": self.datastore, self._entity_name: self.id},
             params={"path": api_path + "/" + file_path.name},
             method=ApiRequester.POST,
+            callback=callback,
         )
 
     def api_delete_data_file(self, api_path: str) -> None:
@@ -70,11 +75,12 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             params={"path": api_path},
         )
 
-    def api_push_md5_file(self, file_path: Path) -> None:
+    def api_push_md5_file(self, file_path: Path, callback: Optional[Callable[[TransferProgress], None]] = None) -> None:
         """Téléverse via l'API un fichier de clefs associé à cette Livraison.
 
         Args:
             file_path: chemin local vers le fichier à envoyer
+            callback: fonction de suivi de l'envoi (octets envoyés, débit)
         """
         # Génération du nom de la route
         s_route = f"{self._entity_name}_push_md5"
@@ -88,6 +94,7 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             s_file_key,
             route_params={"datastore": self.datastore, self._entity_name: self.id},
             method=ApiRequester.POST,
+            callback=callback,
         )
 
     def api_delete_md5_file(self, api_path: str) -> None:
@@ -119,6 +126,8 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             route_params={"datastore": self.datastore, self._entity_name: self.id},
         )
 
+        # Le statut a changé : l'instance retenue est périmée
+        IdentityMap().invalidate(self)
         # Mise à jour du stockage local (_store_api_dict)
         self.api_update()
 
@@ -134,6 +143,8 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             route_params={"datastore": self.datastore, self._entity_name: self.id},
         )
 
+        # Le statut a changé : l'instance retenue est périmée
+        IdentityMap().invalidate(self)
         # Mise à jour du stockage local (_store_api_dict)
         self.api_update()
 
@@ -164,7 +175,7 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
         )
 
         # Retour de l'arborescence
-        l_tree: List[Dict[str, Any]] = o_response.json()
+        l_tree: List[Dict[str, Any]] = JsonConverter().loads(o_response.content)
         return l_tree
 
     def api_list_checks(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -182,7 +193,7 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             route_params={"datastore": self.datastore, self._entity_name: self.id},
         )
 
-        d_list_checks: Dict[str, List[Dict[str, Any]]] = o_response.json()
+        d_list_checks: Dict[str, List[Dict[str, Any]]] = JsonConverter().loads(o_response.content)
         return d_list_checks
 
     def api_run_checks(self, check_ids: List[str]) -> None:
@@ -201,3 +212,6 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             method=ApiRequester.POST,
             data=check_ids,
         )
+
+        # Le statut a changé : l'instance retenue est périmée
+        IdentityMap().invalidate(self)
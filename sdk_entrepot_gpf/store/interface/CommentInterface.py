@@ -1,5 +1,7 @@
 from typing import Any, Dict, List
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 
 
@@ -21,6 +23,7 @@ class CommentInterface(StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
             data=comment_data,
         )
+        IdentityMap().invalidate(self)
 
     def api_list_comments(self) -> List[Dict[str, Any]]:
         """Liste les commentaires de l'entité.
@@ -35,7 +38,7 @@ class CommentInterface(StoreEntity):
             s_route,
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
-        l_comments: List[Dict[str, Any]] = o_response.json()
+        l_comments: List[Dict[str, Any]] = JsonConverter().loads(o_response.content)
         return l_comments
 
     def api_edit_comment(self, id_: str, comment_data: Dict[str, str]) -> None:
@@ -54,6 +57,7 @@ class CommentInterface(StoreEntity):
             route_params={self._entity_name: self.id, "comment": id_, "datastore": self.datastore},
             data=comment_data,
         )
+        IdentityMap().invalidate(self)
 
     def api_remove_comment(self, id_: str) -> None:
         """Supprime un commentaire de l'entité.
@@ -69,3 +73,4 @@ class CommentInterface(StoreEntity):
             method=ApiRequester.DELETE,
             route_params={self._entity_name: self.id, "comment": id_, "datastore": self.datastore},
         )
+        IdentityMap().invalidate(self)
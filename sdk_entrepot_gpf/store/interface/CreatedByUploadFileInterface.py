@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Type, TypeVar
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
@@ -50,4 +51,4 @@ class CreatedByUploadFileInterface(StoreEntity):
         )
 
         # Instanciation
-        return cls(o_response.json(), datastore=s_datastore)
+        return cls(JsonConverter().loads(o_response.content), datastore=s_datastore)
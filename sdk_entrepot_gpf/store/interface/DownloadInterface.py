@@ -1,29 +1,46 @@
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
 
 
 class DownloadInterface(StoreEntity):
     """Interface de StoreEntity pour gérer les téléchargements"""
 
-    def api_download(self, file_path: Path, datastore: Optional[str] = None) -> None:
+    def api_download(
+        self,
+        file_path: Path,
+        datastore: Optional[str] = None,
+        checksum: Optional[str] = None,
+        checksum_algorithm: str = "md5",
+        callback: Optional[Callable[[TransferProgress], None]] = None,
+    ) -> TransferProgress:
         """Télécharge le Fichier Statique et l'enregistre localement.
 
+        Le téléchargement se fait en flux (mémoire constante) et le fichier n'est créé qu'une fois complet, cf. `ApiRequester.route_download_file`.
+
         Args:
             file_path: chemin local où enregistrer le fichier
             datastore (Optional[str]): id du datastore à utiliser. Si None, le datastore sera récupéré dans configuration. Defaults to None.
+            checksum (Optional[str]): empreinte attendue du fichier, vérifiée pendant le téléchargement. Defaults to None.
+            checksum_algorithm (str): algorithme de l'empreinte (cf. `hashlib`). Defaults to "md5".
+            callback (Optional[Callable[[TransferProgress], None]]): fonction de suivi (octets téléchargés, débit). Defaults to None.
+
+        Returns:
+            avancement final du téléchargement (taille, durée, débit)
         """
         if not datastore:
             datastore = self.datastore
 
         s_route = f"{self._entity_name}_download"
-        # Requête "get" à l'API
-        o_response = ApiRequester().route_request(
+        # Téléchargement en flux depuis l'API
+        return ApiRequester().route_download_file(
             s_route,
+            file_path,
             route_params={self._entity_name: self.id, "datastore": datastore},
+            checksum=checksum,
+            checksum_algorithm=checksum_algorithm,
+            callback=callback,
         )
-
-        with file_path.open("wb", encoding="UTF-8") as o_out_file:
-            o_out_file.write(o_response.content)
@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 
 
 class EventInterface(StoreEntity):
@@ -20,5 +21,5 @@ class EventInterface(StoreEntity):
             s_route,
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
-        l_events: List[Dict[str, Any]] = o_response.json()
+        l_events: List[Dict[str, Any]] = JsonConverter().loads(o_response.content)
         return l_events
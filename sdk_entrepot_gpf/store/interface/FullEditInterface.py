@@ -1,4 +1,5 @@
 from typing import Any, Dict
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
 
@@ -20,6 +21,7 @@ class FullEditInterface(StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
 
+        IdentityMap().invalidate(self)
         # Mise à jour du stockage local (_store_api_dict)
         self.api_update()
 
@@ -2,6 +2,7 @@ from typing import Dict, List
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 
 
 class SharingInterface(StoreEntity):
@@ -36,7 +37,7 @@ class SharingInterface(StoreEntity):
             s_route,
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
-        l_sharings: List[Dict[str, str]] = o_response.json()
+        l_sharings: List[Dict[str, str]] = JsonConverter().loads(o_response.content)
 
         return l_sharings
 
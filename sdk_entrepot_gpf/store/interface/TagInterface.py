@@ -1,6 +1,7 @@
 from typing import Dict, List
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
 
@@ -39,6 +40,7 @@ class TagInterface(StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
             data=tags_data,
         )
+        IdentityMap().invalidate(self)
 
     def api_remove_tags(self, tag_keys: List[str]) -> None:
         """Supprime des tags de l'entité.
@@ -56,3 +58,4 @@ class TagInterface(StoreEntity):
             # dans les paramètres (params), on met en clé "tag[]" et en valeur la liste des tags :
             params={"tags[]": tag_keys},
         )
+        IdentityMap().invalidate(self)
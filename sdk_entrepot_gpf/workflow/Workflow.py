@@ -10,6 +10,7 @@ from sdk_entrepot_gpf.store.ProcessingExecution import ProcessingExecution
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.workflow.Errors import WorkflowError
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
 from sdk_entrepot_gpf.workflow.action.ActionAbstract import ActionAbstract
 from sdk_entrepot_gpf.workflow.action.CopyConfigurationAction import CopyConfigurationAction
 from sdk_entrepot_gpf.workflow.action.DeleteAction import DeleteAction
@@ -92,49 +93,51 @@ class Workflow:
         d_step_definition = self.__get_step_definition(step_name, comments, tags, datastore if datastore else self.__datastore)
         # initialisation des actions parentes
         o_parent_action: Optional[ActionAbstract] = None
-        # Pour chaque action définie dans le workflow, instanciation de l'objet Action puis création sur l'entrepôt
-        for d_action_raw in d_step_definition["actions"]:
-            # création de l'action
-            o_action = Workflow.generate(step_name, d_action_raw, o_parent_action, behavior)
-            # choix du datastore
-            ## datastore donné en paramètre
-            ## sinon datastore du workflow au niveau de l'action
-            ## sinon datastore du workflow au niveau de l'étape
-            ## sinon datastore du workflow au niveau global (self.__datastore)
-            # NB: si None il sera récupérer dans la configuration
-            s_use_datastore = datastore if datastore else o_action.definition_dict.get("datastore", d_step_definition.get("datastore", self.__datastore))
-
-            # résolution
-            o_action.resolve(datastore=s_use_datastore)
-            # exécution de l'action
-            Config().om.info(f"Exécution de l'action '{o_action.workflow_context}-{o_action.index}'...")
-            o_action.run(s_use_datastore)
-            # on attend la fin de l'exécution si besoin
-            if isinstance(o_action, ProcessingExecutionAction):
-                s_status = o_action.monitoring_until_end(callback=callback, ctrl_c_action=ctrl_c_action)
-                if s_status != ProcessingExecution.STATUS_SUCCESS:
-                    s_error_message = f"L'exécution de traitement {o_action} ne s'est pas bien passée. Sortie {s_status}."
-                    Config().om.error(s_error_message)
-                    raise WorkflowError(s_error_message)
-
-            # On récupère l'entité créée par l'Action
-            if isinstance(o_action, ProcessingExecutionAction):
-                # Ajout de upload et/ou stored_data
-                if o_action.upload is not None:
-                    l_store_entity.append(o_action.upload)
-                if o_action.stored_data is not None:
-                    l_store_entity.append(o_action.stored_data)
-            elif isinstance(o_action, ConfigurationAction):
-                if o_action.configuration is not None:
-                    l_store_entity.append(o_action.configuration)
-            elif isinstance(o_action, OfferingAction):
-                if o_action.offering is not None:
-                    l_store_entity.append(o_action.offering)
-
-            # Message de fin
-            Config().om.info(f"Exécution de l'action '{o_action.workflow_context}-{o_action.index}' : terminée")
-            # cette action sera la parente de la suivante
-            o_parent_action = o_action
+        # Échéance de l'étape (section deadline), propagée à toutes les requêtes
+        with Deadline.from_config("workflow_step", f"étape {step_name}"):
+            # Pour chaque action définie dans le workflow, instanciation de l'objet Action puis création sur l'entrepôt
+            for d_action_raw in d_step_definition["actions"]:
+                # création de l'action
+                o_action = Workflow.generate(step_name, d_action_raw, o_parent_action, behavior)
+                # choix du datastore
+                ## datastore donné en paramètre
+                ## sinon datastore du workflow au niveau de l'action
+                ## sinon datastore du workflow au niveau de l'étape
+                ## sinon datastore du workflow au niveau global (self.__datastore)
+                # NB: si None il sera récupérer dans la configuration
+                s_use_datastore = datastore if datastore else o_action.definition_dict.get("datastore", d_step_definition.get("datastore", self.__datastore))
+
+                # résolution
+                o_action.resolve(datastore=s_use_datastore)
+                # exécution de l'action
+                Config().om.info(f"Exécution de l'action '{o_action.workflow_context}-{o_action.index}'...")
+                o_action.run(s_use_datastore)
+                # on attend la fin de l'exécution si besoin
+                if isinstance(o_action, ProcessingExecutionAction):
+                    s_status = o_action.monitoring_until_end(callback=callback, ctrl_c_action=ctrl_c_action)
+                    if s_status != ProcessingExecution.STATUS_SUCCESS:
+                        s_error_message = f"L'exécution de traitement {o_action} ne s'est pas bien passée. Sortie {s_status}."
+                        Config().om.error(s_error_message)
+                        raise WorkflowError(s_error_message)
+
+                # On récupère l'entité créée par l'Action
+                if isinstance(o_action, ProcessingExecutionAction):
+                    # Ajout de upload et/ou stored_data
+                    if o_action.upload is not None:
+                        l_store_entity.append(o_action.upload)
+                    if o_action.stored_data is not None:
+                        l_store_entity.append(o_action.stored_data)
+                elif isinstance(o_action, ConfigurationAction):
+                    if o_action.configuration is not None:
+                        l_store_entity.append(o_action.configuration)
+                elif isinstance(o_action, OfferingAction):
+                    if o_action.offering is not None:
+                        l_store_entity.append(o_action.offering)
+
+                # Message de fin
+                Config().om.info(f"Exécution de l'action '{o_action.workflow_context}-{o_action.index}' : terminée")
+                # cette action sera la parente de la suivante
+                o_parent_action = o_action
         # Retour de la liste
         return l_store_entity
 
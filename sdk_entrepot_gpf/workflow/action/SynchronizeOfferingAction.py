@@ -50,8 +50,8 @@ class SynchronizeOfferingAction(ActionAbstract):
                 l_stored_data = [d_data["stored_data"] for d_data in o_config["type_infos"]["used_data"]]
                 if d_filter_infos.get("stored_data", l_stored_data[0]) in l_stored_data:
                     l_config_offering = o_config.api_list_offerings()
+                    Offering.api_update_many(l_config_offering)
                     for o_offering in l_config_offering:
-                        o_offering.api_update()
                         if (
                             d_filter_infos.get("type", o_offering["type"]) == o_offering["type"]
                             and d_filter_infos.get("endpoint", o_offering["endpoint"]["_id"]) == o_offering["endpoint"]["_id"]
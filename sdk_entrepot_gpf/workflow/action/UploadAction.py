@@ -7,6 +7,7 @@ from sdk_entrepot_gpf.store.CheckExecution import CheckExecution
 from sdk_entrepot_gpf.store.Upload import Upload
 from sdk_entrepot_gpf.io.Dataset import Dataset
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
 from sdk_entrepot_gpf.workflow.action.ActionAbstract import ActionAbstract
 
 
@@ -43,31 +44,33 @@ class UploadAction:
         Returns:
             livraison créée
         """
-        Config().om.info("Création et complétion d'une livraison...")
-        # Création de la livraison
-        self.__create_upload(datastore)
-
-        # Cas livraison fermé = déjà traité : on sort
-        if self.upload and not self.upload.is_open():
-            return self.upload
-
-        # Ajout des tags
-        self.__add_tags()
-        # Ajout des commentaires
-        self.__add_comments()
-        # Envoie des fichiers de données
-        self.__push_data_files()
-        # Envoie des fichiers md5
-        self.__push_md5_files()
-        # Fermeture de la livraison
-        self.__close()
-        # Affiche et retourne la livraison
-        if self.upload is not None:
-            # Affichage
-            Config().om.info(f"Livraison créée et complétée : {self.__upload}")
-            Config().om.info("Création et complétion d'une livraison : terminé")
-            # Retour
-            return self.upload
+        # Échéance de l'opération (section deadline), propagée à toutes les requêtes
+        with Deadline.from_config("upload_action", "création et complétion d'une livraison"):
+            Config().om.info("Création et complétion d'une livraison...")
+            # Création de la livraison
+            self.__create_upload(datastore)
+
+            # Cas livraison fermé = déjà traité : on sort
+            if self.upload and not self.upload.is_open():
+                return self.upload
+
+            # Ajout des tags
+            self.__add_tags()
+            # Ajout des commentaires
+            self.__add_comments()
+            # Envoie des fichiers de données
+            self.__push_data_files()
+            # Envoie des fichiers md5
+            self.__push_md5_files()
+            # Fermeture de la livraison
+            self.__close()
+            # Affiche et retourne la livraison
+            if self.upload is not None:
+                # Affichage
+                Config().om.info(f"Livraison créée et complétée : {self.__upload}")
+                Config().om.info("Création et complétion d'une livraison : terminé")
+                # Retour
+                return self.upload
         # On ne devrait pas arriver ici...
         raise GpfSdkError("Erreur à la création de la livraison.")
 
@@ -94,18 +94,16 @@ class StoreEntityResolver(AbstractResolver):
             return l_entities[0].to_json()
         if d_groups["number_dict"] == "ALL":
             # json de toutes les entités trouvées
-            l_res1 = []
-            for o_entity in l_entities:
-                o_entity.api_update()
-                l_res1.append(o_entity.get_store_properties())
-            return json.dumps(l_res1)
+            StoreEntity.api_update_many(l_entities)
+            return json.dumps([o_entity.get_store_properties() for o_entity in l_entities])
         try:
             if not d_groups["number_selected"] or d_groups["number_selected"] == "ONE":
                 # une seule entité à traiter, affichage d'une info ou d'un tag
                 return self._get_info_or_tag(l_entities[0], d_groups)
             if d_groups["number_selected"] == "ALL":
                 # affichage d'une info ou d'un tag pour toutes les entités trouvées
-                l_res2 = [self._get_info_or_tag(o_entity, d_groups) for o_entity in l_entities]
+                StoreEntity.api_update_many(l_entities)
+                l_res2 = [self._get_info_or_tag(o_entity, d_groups, update=False) for o_entity in l_entities]
                 if d_groups["selected_field_type"] == "tags":
                     l_res2 = list(set(l_res2))
                 return json.dumps(l_res2)
@@ -114,8 +112,9 @@ class StoreEntityResolver(AbstractResolver):
 
         raise ResolverError(self.name, string_to_solve)
 
-    def _get_info_or_tag(self, o_entity: StoreEntity, d_groups: Dict[str, Any]) -> str:
-        o_entity.api_update()
+    def _get_info_or_tag(self, o_entity: StoreEntity, d_groups: Dict[str, Any], update: bool = True) -> str:
+        if update:
+            o_entity.api_update()
         s_selected_field = d_groups["selected_field"]
         # On doit envoyer une info ?
         if d_groups["selected_field_type"] == "infos":
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
 from sdk_entrepot_gpf.workflow.resolver.AbstractResolver import AbstractResolver
 from sdk_entrepot_gpf.workflow.resolver.Errors import ResolveUserError
 
@@ -25,7 +26,7 @@ class UserResolver(AbstractResolver):
         super().__init__(name)
         # On récupère les infos sur l'API
         o_response = ApiRequester().route_request("user_get")
-        self.__user_data: Dict[str, Any] = o_response.json()
+        self.__user_data: Dict[str, Any] = JsonConverter().loads(o_response.content)
 
     def resolve(self, string_to_solve: str, **kwargs: Any) -> Any:
         """Récupération de l'utilisateur courant et récupération d'une des ces informations.
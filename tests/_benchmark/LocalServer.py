@@ -0,0 +1,115 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler répondant un JSON minimal à toutes les requêtes, en gardant la connexion ouverte (HTTP/1.1).
+
+    Si le serveur simule un listing (`nb_entities`), les requêtes avec un paramètre `limit` reçoivent une page
+    d'entités et un en-tête Content-Range.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: "LocalServer"
+
+    def setup(self) -> None:
+        super().setup()
+        # Désactivation de Nagle : en-têtes et corps sont écrits séparément, on ne veut pas attendre l'ACK retardé
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.count_connection()
+
+    def __answer(self) -> None:
+        # On consomme le corps éventuel de la requête
+        i_length = int(self.headers.get("Content-Length", 0))
+        if i_length:
+            self.rfile.read(i_length)
+        self.server.count_request()
+        d_headers: Dict[str, str] = {}
+        d_query = parse_qs(urlparse(self.path).query)
+        if self.server.nb_entities and "limit" in d_query:
+            i_page = int(d_query.get("page", ["1"])[0])
+            i_limit = int(d_query["limit"][0])
+            if self.server.max_limit is not None:
+                i_limit = min(i_limit, self.server.max_limit)
+            i_start = (i_page - 1) * i_limit
+            i_end = min(i_page * i_limit, self.server.nb_entities)
+            l_entities: List[Dict[str, str]] = [{"_id": f"{i:08d}"} for i in range(i_start, i_end)]
+            # Durée de traitement : coût fixe par requête et coût par entité
+            time.sleep(self.server.sec_latency + self.server.sec_per_entity * len(l_entities))
+            o_body = json.dumps(l_entities).encode("UTF-8")
+            d_headers["Content-Range"] = f"{i_start + 1}-{i_end}/{self.server.nb_entities}" if l_entities else f"*/{self.server.nb_entities}"
+        else:
+            o_body = json.dumps({"path": self.path}).encode("UTF-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        for s_key, s_value in d_headers.items():
+            self.send_header(s_key, s_value)
+        self.send_header("Content-Length", str(len(o_body)))
+        self.end_headers()
+        self.wfile.write(o_body)
+
+    def do_GET(self) -> None:  # pylint:disable=invalid-name
+        self.__answer()
+
+    def do_POST(self) -> None:  # pylint:disable=invalid-name
+        self.__answer()
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint:disable=redefined-builtin
+        # Pas de log sur la sortie standard
+        return None
+
+
+class LocalServer(ThreadingHTTPServer):
+    """Serveur HTTP local servant de substitut à l'API pour les benchmarks.
+
+    S'utilise comme gestionnaire de contexte : le serveur est lancé dans un thread à l'entrée et arrêté à la sortie.
+
+    Args:
+        nb_entities (int, optional): nombre d'entités du listing simulé (0 : pas de listing)
+        max_limit (Optional[int], optional): taille maximale des pages appliquée par le serveur
+        sec_latency (float, optional): durée de traitement fixe d'une page du listing (en secondes)
+        sec_per_entity (float, optional): durée de traitement par entité d'une page du listing (en secondes)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, nb_entities: int = 0, max_limit: Optional[int] = None, sec_latency: float = 0.0, sec_per_entity: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.__lock = threading.Lock()
+        self.nb_entities = nb_entities
+        self.max_limit = max_limit
+        self.sec_latency = sec_latency
+        self.sec_per_entity = sec_per_entity
+        self.nb_connections = 0
+        self.nb_requests = 0
+        self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count_connection(self) -> None:
+        with self.__lock:
+            self.nb_connections += 1
+
+    def count_request(self) -> None:
+        with self.__lock:
+            self.nb_requests += 1
+
+    def reset_counters(self) -> None:
+        with self.__lock:
+            self.nb_connections = 0
+            self.nb_requests = 0
+
+    def __enter__(self) -> "LocalServer":
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,67 @@
+"""Benchmark de la taille des pages des listings (`StoreEntity.api_list`).
+
+Compare le nombre de requêtes et la durée d'un listing complet selon la taille des pages : tailles fixes
+(`store_api.adaptive_nb_limit=false`, comportement historique avec `nb_limit=10`) et taille négociée
+(`PageSizePolicy` : grande taille initiale, maximum détecté sur la première page puis retenu pour la route).
+Le serveur local simule un listing avec une taille de page maximale et un coût fixe par requête.
+
+cmd : python3 -m tests._benchmark.PageSizeBenchmark [nb_entities]
+"""
+
+import sys
+import time
+from typing import Any, Dict
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.io.ClientContext import ClientContext
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.store.Upload import Upload
+from tests._benchmark.LocalServer import LocalServer
+
+# Taille maximale des pages appliquée par le serveur simulé
+SERVER_MAX_LIMIT = 200
+# Coût fixe d'une requête et coût par entité côté serveur (en secondes)
+SEC_LATENCY = 0.02
+SEC_PER_ENTITY = 0.0001
+
+
+def measure(server: LocalServer, name: str, settings: Dict[str, Any], nb_listings: int = 1) -> None:
+    """Liste toutes les entités dans un contexte client configuré et affiche le nombre de requêtes et la durée.
+
+    Args:
+        server (LocalServer): serveur local requêté
+        name (str): nom de la mesure
+        settings (Dict[str, Any]): paramètres de la section `store_api`
+        nb_listings (int, optional): nombre de listings successifs (la taille négociée est retenue entre eux)
+    """
+    o_client = ClientContext(name, {"store_api": {"root_url": server.url, **settings}})
+    try:
+        with o_client.activate():
+            for i in range(nb_listings):
+                server.reset_counters()
+                f_start = time.perf_counter()
+                l_uploads = Upload.api_list(datastore="benchmark")
+                f_duration = time.perf_counter() - f_start
+                assert len(l_uploads) == server.nb_entities
+                Config().om.info(f"{name:<28} listing {i + 1} : {server.nb_requests:>4} requêtes, {f_duration:.3f} s")
+    finally:
+        o_client.close()
+
+
+def main(nb_entities: int) -> None:
+    """Lance le benchmark.
+
+    Args:
+        nb_entities (int): nombre d'entités à lister
+    """
+    with patch.object(Authentifier, "get_access_token_string", return_value="benchmark_token"), LocalServer(nb_entities, SERVER_MAX_LIMIT, SEC_LATENCY, SEC_PER_ENTITY) as o_server:
+        Config().om.info(f"{nb_entities} entités, pages de {SERVER_MAX_LIMIT} entités max côté serveur")
+        for i_size in [10, 50, 100, 200]:
+            measure(o_server, f"taille fixe {i_size}", {"nb_limit": i_size, "adaptive_nb_limit": "false"})
+        measure(o_server, "taille fixe 10 séquentiel", {"nb_limit": 10, "adaptive_nb_limit": "false", "list_max_workers": 1})
+        measure(o_server, "taille négociée (max 1000)", {"nb_limit": 10, "adaptive_nb_limit": "true", "nb_limit_max": 1000}, nb_listings=2)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
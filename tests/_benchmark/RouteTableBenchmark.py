@@ -0,0 +1,74 @@
+"""Micro-benchmark de la construction des requêtes par l'ApiRequester (hors réseau).
+
+Compare le surcoût par appel de `route_request` (résolution de la route, formatage de l'url et de l'en-tête)
+entre la lecture de la configuration à chaque appel (comportement historique) et la table des routes précompilée.
+La requête HTTP elle-même est neutralisée (`url_request` est remplacée par une fonction ne faisant rien).
+
+cmd : python3 -m tests._benchmark.RouteTableBenchmark [nb_calls]
+"""
+
+import json
+import sys
+import time
+from typing import Any, Callable, Dict
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.RouteTable import RouteTable
+
+ROUTE_NAME = "upload_push_md5"
+ROUTE_PARAMS = {"datastore": "benchmark_datastore", "upload": "benchmark_upload"}
+
+
+def measure(nb_calls: int, function: Callable[[], Any]) -> float:
+    """Exécute `nb_calls` fois `function` et renvoie la durée moyenne d'un appel.
+
+    Args:
+        nb_calls (int): nombre d'appels
+        function (Callable[[], Any]): fonction à mesurer
+
+    Returns:
+        durée moyenne d'un appel (en microsecondes)
+    """
+    f_start = time.perf_counter()
+    for _ in range(nb_calls):
+        function()
+    return (time.perf_counter() - f_start) / nb_calls * 1e6
+
+
+def config_lookup() -> Dict[str, Any]:
+    """Résolution historique de la route : lecture (et interpolation) de la configuration à chaque appel."""
+    s_route = Config().get("routing", ROUTE_NAME, fallback=None)
+    assert s_route is not None
+    s_url = s_route.format(**ROUTE_PARAMS)
+    s_header = Config().get("routing", ROUTE_NAME + "_header", fallback=None)
+    return {"url": s_url, "header": json.loads(s_header) if s_header is not None else {}}
+
+
+def route_table_lookup(route_table: RouteTable) -> Dict[str, Any]:
+    """Résolution de la route via la table précompilée."""
+    o_route = route_table.get(ROUTE_NAME)
+    assert o_route is not None
+    return {"url": o_route.url(ROUTE_PARAMS), "header": o_route.header}
+
+
+def main(nb_calls: int) -> None:
+    """Lance le benchmark.
+
+    Args:
+        nb_calls (int): nombre d'appels par mesure
+    """
+    o_route_table = RouteTable.from_config()
+    assert config_lookup() == route_table_lookup(o_route_table)
+    f_before = measure(nb_calls, config_lookup)
+    f_after = measure(nb_calls, lambda: route_table_lookup(o_route_table))
+    Config().om.info(f"Résolution de la route - avant : {f_before:.2f} µs/appel ; après : {f_after:.2f} µs/appel ; gain x{f_before / f_after:.1f}")
+    # Surcoût complet de route_request (hors réseau)
+    with patch.object(ApiRequester(), "url_request", return_value=None):
+        f_request = measure(nb_calls, lambda: ApiRequester().route_request(ROUTE_NAME, dict(ROUTE_PARAMS)))
+    Config().om.info(f"route_request (hors réseau) : {f_request:.2f} µs/appel")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
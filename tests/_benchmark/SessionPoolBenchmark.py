@@ -0,0 +1,58 @@
+"""Benchmark du pool de connexions de l'ApiRequester.
+
+Compare le nombre de requêtes par seconde obtenu en ouvrant une connexion par requête (`requests.request`,
+comportement historique) et en passant par la session partagée de l'ApiRequester (connexions keep-alive).
+
+cmd : python3 -m tests._benchmark.SessionPoolBenchmark [nb_requests]
+"""
+
+import sys
+import time
+from typing import Callable
+from unittest.mock import patch
+
+import requests
+
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from tests._benchmark.LocalServer import LocalServer
+
+
+def measure(server: LocalServer, nb_requests: int, function: Callable[[str], requests.Response]) -> float:
+    """Exécute `nb_requests` requêtes via `function` et renvoie le nombre de requêtes par seconde.
+
+    Args:
+        server (LocalServer): serveur local requêté
+        nb_requests (int): nombre de requêtes à effectuer
+        function (Callable[[str], requests.Response]): fonction effectuant une requête à partir de l'url
+
+    Returns:
+        nombre de requêtes par seconde
+    """
+    server.reset_counters()
+    f_start = time.perf_counter()
+    for i in range(nb_requests):
+        function(f"{server.url}/test/{i}")
+    f_duration = time.perf_counter() - f_start
+    Config().om.info(f"    {nb_requests} requêtes, {server.nb_connections} connexion(s) TCP, {f_duration:.3f} s")
+    return nb_requests / f_duration
+
+
+def main(nb_requests: int) -> None:
+    """Lance le benchmark.
+
+    Args:
+        nb_requests (int): nombre de requêtes par mesure
+    """
+    with patch.object(Authentifier, "get_access_token_string", return_value="benchmark_token"), LocalServer() as o_server:
+        Config().om.info("Avant : une connexion par requête (requests.request)")
+        f_before = measure(o_server, nb_requests, lambda s_url: requests.request("GET", s_url, headers=Authentifier().get_http_header(json_content_type=True)))
+        Config().om.info("Après : session partagée de l'ApiRequester (keep-alive)")
+        with ApiRequester() as o_requester:
+            f_after = measure(o_server, nb_requests, o_requester.url_request)
+    Config().om.info(f"Avant : {f_before:.0f} req/s ; après : {f_after:.0f} req/s ; gain x{f_after / f_before:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1 @@
+"""Benchmarks (lancés à la main, non exécutés par les tests unitaires)."""
@@ -0,0 +1,44 @@
+import asyncio
+from typing import Dict, List
+from unittest.mock import call, patch
+
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.auth.AsyncAuthentifier import AsyncAuthentifier
+from tests.GpfTestCase import GpfTestCase
+
+
+class AsyncAuthentifierTestCase(GpfTestCase):
+    """Tests AsyncAuthentifier class.
+
+    cmd : python3 -m unittest -b tests.auth.AsyncAuthentifierTestCase
+    """
+
+    def test_get_http_header(self) -> None:
+        """Vérifie le bon fonctionnement de get_http_header (et donc de get_access_token_string)."""
+
+        async def get_headers() -> List[Dict[str, str]]:
+            return list(await asyncio.gather(AsyncAuthentifier().get_http_header(), AsyncAuthentifier().get_http_header(json_content_type=True)))
+
+        with patch.object(Authentifier, "get_access_token_string", return_value="test_token") as o_mock_method:
+            l_headers = asyncio.run(get_headers())
+        self.assertDictEqual(l_headers[0], {"Authorization": "Bearer test_token"})
+        self.assertDictEqual(l_headers[1], {"Authorization": "Bearer test_token", "content-type": "application/json"})
+        self.assertEqual(o_mock_method.call_count, 2)
+
+    def test_get_access_token_string_valid(self) -> None:
+        """Vérifie qu'un jeton valide est renvoyé sans passer par le pool de threads."""
+
+        async def get_tokens() -> List[str]:
+            return list(await asyncio.gather(*[AsyncAuthentifier().get_access_token_string() for _ in range(10)]))
+
+        with patch.object(Authentifier, "get_current_access_token_string", return_value="test_token"), patch.object(Authentifier, "get_access_token_string") as o_mock_method:
+            l_tokens = asyncio.run(get_tokens())
+        self.assertListEqual(l_tokens, ["test_token"] * 10)
+        o_mock_method.assert_not_called()
+
+    def test_revoke_token(self) -> None:
+        """Vérifie que revoke_token révoque le jeton de l'Authentifier."""
+        with patch.object(Authentifier, "revoke_token", return_value=None) as o_mock_method:
+            AsyncAuthentifier().revoke_token()
+            AsyncAuthentifier().revoke_token("test_token")
+        self.assertListEqual(o_mock_method.call_args_list, [call(None), call("test_token")])
@@ -1,9 +1,21 @@
-from unittest.mock import patch
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import PropertyMock, patch
 from http import HTTPStatus
 import requests_mock
 
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError
+from sdk_entrepot_gpf.io.RetryPolicy import RetryAttempts
+from sdk_entrepot_gpf.auth.AsyncAuthentifier import AsyncAuthentifier
 from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.auth.Token import Token
+from sdk_entrepot_gpf.auth.TokenCache import TokenCache
 from sdk_entrepot_gpf.auth.Errors import AuthentificationError
 from tests.GpfTestCase import GpfTestCase
 
@@ -107,6 +119,25 @@ class AuthentifierTestCase(GpfTestCase):
             # On a dû faire 4 requêtes
             self.assertEqual(o_mock.call_count, 4, "o_mock.call_count == 4")
 
+    def test_get_access_token_string_deadline(self) -> None:
+        """Vérifie que l'échéance de l'opération en cours réduit l'attente entre deux tentatives et est levée telle quelle si elle arrête les tentatives."""
+        with requests_mock.Mocker() as o_mock, patch("time.sleep", return_value=None) as o_mock_sleep:
+            o_mock.post(AuthentifierTestCase.url, status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+            # Attente avant la nouvelle tentative au-delà de l'échéance
+            with patch("random.uniform", return_value=100.0), Deadline(30, "liste"):
+                with self.assertRaises(DeadlineExceededError) as o_arc:
+                    Authentifier().get_access_token_string()
+            self.assertIn("liste", o_arc.exception.message)
+            self.assertEqual(o_mock.call_count, 1)
+            o_mock_sleep.assert_not_called()
+            # Attente réduite au temps restant
+            o_mock.reset_mock()
+            o_mock.post(AuthentifierTestCase.url, [{"status_code": HTTPStatus.INTERNAL_SERVER_ERROR}, {"json": AuthentifierTestCase.valid_token}])
+            with patch.object(RetryAttempts, "next_delay", return_value=100.0), Deadline(30):
+                self.assertEqual(Authentifier().get_access_token_string(), "test_token")
+            o_mock_sleep.assert_called_once()
+            self.assertTrue(29 < o_mock_sleep.call_args.args[0] <= 30)
+
     def test_get_http_header(self) -> None:
         """Vérifie le bon fonctionnement de test_get_http_header."""
         # On mock get_access_token_string qui est déjà testée
@@ -154,3 +185,178 @@ class AuthentifierTestCase(GpfTestCase):
             self.assertEqual(s_token, "test_token")
             # On a dû faire une seconde requête
             self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+
+    def test_refresh_ahead(self) -> None:
+        """Vérifie le renouvellement anticipé du jeton, et l'utilisation du jeton actuel si ce renouvellement échoue."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(
+                AuthentifierTestCase.url,
+                [
+                    {"json": {"access_token": "token_1", "expires_in": 300}},
+                    {"json": {"access_token": "token_2", "expires_in": 300}},
+                    {"status_code": HTTPStatus.INTERNAL_SERVER_ERROR},
+                ],
+            )
+            self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+            # Jeton valide hors de la marge (30 s par défaut) : pas de requête
+            with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=31):
+                self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+            # Jeton expirant dans la marge : renouvellement anticipé
+            with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=29):
+                self.assertEqual(Authentifier().get_access_token_string(), "token_2")
+                self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+                # Échec du renouvellement anticipé : le jeton actuel, encore valide, est utilisé
+                self.assertEqual(Authentifier().get_access_token_string(), "token_2")
+                self.assertEqual(o_mock.call_count, 6, "o_mock.call_count == 6")
+
+    def test_background_refresh(self) -> None:
+        """Vérifie le renouvellement du jeton en arrière-plan."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(AuthentifierTestCase.url, [{"json": {"access_token": "token_1", "expires_in": 300}}, {"json": {"access_token": "token_2", "expires_in": 300}}])
+            # Le thread récupère le jeton immédiatement puis attend qu'il soit à renouveler
+            Authentifier().start_background_refresh()
+            o_refresher = Authentifier()._Authentifier__refresher  # type: ignore
+            while Authentifier()._Authentifier__last_token is None:  # type: ignore
+                time.sleep(0.001)
+            self.assertTrue(o_refresher.running)
+            self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+            Authentifier().stop_background_refresh()
+            self.assertFalse(o_refresher.running)
+            # Délai avant le prochain renouvellement : expiration moins la marge
+            with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=300):
+                self.assertEqual(Authentifier()._Authentifier__background_refresh(), 270)  # type: ignore
+            # Jeton à renouveler
+            with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=10):
+                self.assertEqual(Authentifier()._Authentifier__background_refresh(), -20)  # type: ignore
+            self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+
+    def test_refresh_token(self) -> None:
+        """Vérifie le renouvellement via le grant refresh_token et le retour au grant complet s'il est refusé ou expiré."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(
+                AuthentifierTestCase.url,
+                [
+                    {"json": {"access_token": "token_1", "expires_in": 300, "refresh_token": "refresh_1", "refresh_expires_in": 1800}},
+                    {"json": {"access_token": "token_2", "expires_in": 300, "refresh_token": "refresh_2", "refresh_expires_in": 1800}},
+                    {"status_code": HTTPStatus.BAD_REQUEST, "json": {"error": "invalid_grant"}},
+                    {"json": {"access_token": "token_3", "expires_in": 300, "refresh_token": "refresh_3", "refresh_expires_in": 2}},
+                    {"json": {"access_token": "token_4", "expires_in": 300}},
+                ],
+            )
+            s_full_grant = "grant_type=password&username=TEST_LOGIN&password=TEST_PASSWORD&client_id=TEST_CLIENT_ID&client_secret=TEST_CLIENT_SECRET"
+            s_refresh_grant = "grant_type=refresh_token&client_id=TEST_CLIENT_ID&client_secret=TEST_CLIENT_SECRET&refresh_token="
+            self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+            self.assertEqual(o_mock.request_history[0].text, s_full_grant)
+            with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=10):
+                # Rafraîchissement
+                self.assertEqual(Authentifier().get_access_token_string(), "token_2")
+                self.assertEqual(o_mock.request_history[1].text, s_refresh_grant + "refresh_1")
+                # Rafraîchissement refusé : grant complet
+                self.assertEqual(Authentifier().get_access_token_string(), "token_3")
+                self.assertEqual(o_mock.request_history[2].text, s_refresh_grant + "refresh_2")
+                self.assertEqual(o_mock.request_history[3].text, s_full_grant)
+                # Jeton de rafraîchissement expirant : grant complet
+                self.assertEqual(Authentifier().get_access_token_string(), "token_4")
+                self.assertEqual(o_mock.request_history[4].text, s_full_grant)
+            self.assertEqual(o_mock.call_count, 5, "o_mock.call_count == 5")
+
+    def test_revoke_token_refresh(self) -> None:
+        """Vérifie que la révocation du jeton conserve le jeton de rafraîchissement (y compris dans le cache disque)."""
+        s_refresh_grant = "grant_type=refresh_token&client_id=TEST_CLIENT_ID&client_secret=TEST_CLIENT_SECRET&refresh_token="
+        with tempfile.TemporaryDirectory() as s_dir, requests_mock.Mocker() as o_mock:
+            o_mock.post(
+                AuthentifierTestCase.url,
+                [
+                    {"json": {"access_token": "token_1", "expires_in": 300, "refresh_token": "refresh_1", "refresh_expires_in": 1800}},
+                    {"json": {"access_token": "token_2", "expires_in": 300, "refresh_token": "refresh_2", "refresh_expires_in": 1800}},
+                    {"json": {"access_token": "token_3", "expires_in": 300, "refresh_token": "refresh_3", "refresh_expires_in": 1800}},
+                ],
+            )
+            with patch.object(TokenCache, "from_config", return_value=TokenCache(Path(s_dir), "namespace")):
+                self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+                # Jeton refusé par l'API : nouveau jeton obtenu par rafraîchissement
+                Authentifier().revoke_token("token_1")
+                self.assertIsNone(Authentifier().get_current_access_token_string())
+                self.assertEqual(Authentifier().get_access_token_string(), "token_2")
+                self.assertEqual(o_mock.request_history[1].text, s_refresh_grant + "refresh_1")
+                # Nouvelle « exécution » après une révocation : le jeton de rafraîchissement stocké est utilisé
+                Authentifier().revoke_token()
+                Authentifier._instance = None
+                self.assertEqual(Authentifier().get_access_token_string(), "token_3")
+                self.assertEqual(o_mock.request_history[2].text, s_refresh_grant + "refresh_2")
+            self.assertEqual(o_mock.call_count, 3, "o_mock.call_count == 3")
+
+    def test_token_cache(self) -> None:
+        """Vérifie la réutilisation du jeton stocké sur disque par une nouvelle exécution, et sa suppression à la révocation (sans jeton de rafraîchissement)."""
+        with tempfile.TemporaryDirectory() as s_dir, requests_mock.Mocker() as o_mock:
+            o_mock.post(AuthentifierTestCase.url, json=AuthentifierTestCase.valid_token)
+            with patch.object(TokenCache, "from_config", return_value=TokenCache(Path(s_dir), "namespace")):
+                self.assertEqual(Authentifier().get_access_token_string(), "test_token")
+                self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+                # Nouvelle « exécution » : le jeton est relu sur disque, sans requête
+                Authentifier._instance = None
+                self.assertEqual(Authentifier().get_access_token_string(), "test_token")
+                self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+                # La révocation supprime le jeton stocké
+                Authentifier().revoke_token()
+                Authentifier._instance = None
+                self.assertEqual(Authentifier().get_access_token_string(), "test_token")
+                self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+
+    def test_concurrent_token_acquisition(self) -> None:
+        """Test de charge : des threads et des coroutines demandant simultanément le jeton ne provoquent qu'une requête."""
+        i_nb_threads = 32
+        o_barrier = threading.Barrier(i_nb_threads + 1)
+        l_tokens: List[str] = []
+
+        def json_callback(o_request: Any, o_context: Any) -> Dict[str, Any]:  # pylint:disable=unused-argument
+            # Requête lente : tous les appelants arrivent pendant la récupération
+            time.sleep(0.05)
+            return AuthentifierTestCase.valid_token
+
+        def get_token() -> None:
+            o_barrier.wait()
+            l_tokens.append(Authentifier().get_access_token_string())
+
+        async def get_tokens_async() -> List[str]:
+            return list(await asyncio.gather(*[AsyncAuthentifier().get_access_token_string() for _ in range(i_nb_threads)]))
+
+        def get_tokens_loop() -> None:
+            o_barrier.wait()
+            l_tokens.extend(asyncio.run(get_tokens_async()))
+
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(AuthentifierTestCase.url, json=json_callback)
+            l_threads = [threading.Thread(target=get_token) for _ in range(i_nb_threads)] + [threading.Thread(target=get_tokens_loop)]
+            for o_thread in l_threads:
+                o_thread.start()
+            for o_thread in l_threads:
+                o_thread.join()
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+        self.assertListEqual(l_tokens, ["test_token"] * 2 * i_nb_threads)
+
+    def test_refresh_ahead_not_blocking(self) -> None:
+        """Pendant un renouvellement anticipé par un autre appelant, le jeton actuel est utilisé sans attendre."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(AuthentifierTestCase.url, json=AuthentifierTestCase.valid_token)
+            Authentifier().get_access_token_string()
+            o_lock = Authentifier()._Authentifier__lock  # type: ignore
+            with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=10), o_lock:
+                self.assertEqual(Authentifier().get_access_token_string(), "test_token")
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+
+    def test_revoke_token_replaced(self) -> None:
+        """Un jeton refusé déjà remplacé par un autre appelant n'entraîne pas la révocation du jeton actuel."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(AuthentifierTestCase.url, [{"json": {"access_token": "token_1", "expires_in": 300}}, {"json": {"access_token": "token_2", "expires_in": 300}}])
+            self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+            # Jeton refusé obsolète : rien à révoquer
+            Authentifier().revoke_token("token_0")
+            self.assertEqual(Authentifier().get_access_token_string(), "token_1")
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+            # Jeton refusé actuel : révocation
+            Authentifier().revoke_token("token_1")
+            self.assertEqual(Authentifier().get_access_token_string(), "token_2")
+            self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
@@ -0,0 +1,64 @@
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.auth.Token import Token
+from sdk_entrepot_gpf.auth.TokenCache import TokenCache
+from sdk_entrepot_gpf.io.Config import Config
+from tests.GpfTestCase import GpfTestCase
+
+
+class TokenCacheTestCase(GpfTestCase):
+    """Tests TokenCache class.
+
+    cmd : python3 -m unittest -b tests.auth.TokenCacheTestCase
+    """
+
+    token = {"access_token": "test_token", "expires_in": 300, "refresh_token": "test_refresh", "refresh_expires_in": 1800}
+
+    def test_save_load(self) -> None:
+        """Stockage et relecture du jeton (mêmes dates d'expiration), séparation des comptes et suppression."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_dir = Path(s_dir) / "cache"
+            o_cache = TokenCache(p_dir, "url|password|client|login")
+            self.assertIsNone(o_cache.load())
+            o_token = Token(TokenCacheTestCase.token, time.time() - 100)
+            o_cache.save(o_token)
+            o_loaded = o_cache.load()
+            assert o_loaded is not None
+            self.assertEqual(o_loaded.get_access_string(), "test_token")
+            self.assertEqual(o_loaded.get_refresh_string(), "test_refresh")
+            self.assertAlmostEqual(o_loaded.expires_in, o_token.expires_in, delta=1)
+            self.assertTrue(190 < o_loaded.expires_in <= 200)
+            # Droits restreints
+            if os.name == "posix":
+                self.assertEqual(stat.S_IMODE(p_dir.stat().st_mode), 0o700)
+                self.assertEqual(stat.S_IMODE(o_cache.path.stat().st_mode), 0o600)
+            # Autre compte : autre fichier
+            self.assertIsNone(TokenCache(p_dir, "url|password|client|other").load())
+            o_cache.clear()
+            self.assertIsNone(o_cache.load())
+            o_cache.clear()
+
+    def test_load_permissions(self) -> None:
+        """Un fichier accessible à d'autres utilisateurs est ignoré."""
+        if os.name != "posix":
+            self.skipTest("Droits POSIX")
+        with tempfile.TemporaryDirectory() as s_dir:
+            o_cache = TokenCache(Path(s_dir), "namespace")
+            o_cache.save(Token(TokenCacheTestCase.token))
+            os.chmod(o_cache.path, 0o644)
+            self.assertIsNone(o_cache.load())
+
+    def test_from_config(self) -> None:
+        """Le cache n'est utilisé que si un répertoire est configuré."""
+        self.assertIsNone(TokenCache.from_config())
+        with tempfile.TemporaryDirectory() as s_dir:
+            d_config = {"token_cache_directory": s_dir, "token_url": "url", "grant_type": "password", "client_id": "client", "login": "login"}
+            with patch.object(Config(), "get", side_effect=lambda s, o, fallback=None: d_config.get(o, fallback)):
+                o_cache = TokenCache.from_config()
+            assert o_cache is not None
+            self.assertEqual(o_cache.path.parent, Path(s_dir))
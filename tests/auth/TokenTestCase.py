@@ -1,3 +1,6 @@
+import time
+from unittest.mock import PropertyMock, patch
+
 from sdk_entrepot_gpf.auth.Token import Token
 from tests.GpfTestCase import GpfTestCase
 
@@ -34,3 +37,45 @@ class TokenTestCase(GpfTestCase):
         o_token = Token(TokenTestCase.invalid_token)
         # On vérifie que c'est bien non valide
         self.assertEqual(o_token.is_valid(), False)
+
+    def test_refresh_margin(self) -> None:
+        """Vérifie la marge de renouvellement anticipé (au plus la moitié de la durée de validité)."""
+        o_token = Token(TokenTestCase.valid_token)
+        self.assertTrue(280 < o_token.expires_in <= 300)
+        self.assertEqual(o_token.refresh_margin(30), 30)
+        self.assertEqual(o_token.refresh_margin(600), 150)
+        # Jeton expirant dans 100 s
+        with patch.object(Token, "expires_in", new_callable=PropertyMock, return_value=100):
+            self.assertTrue(o_token.is_valid())
+            self.assertTrue(o_token.is_valid(30))
+            # Marge plafonnée à 150 s : jeton à renouveler
+            self.assertFalse(o_token.is_valid(600))
+
+    def test_get_refresh_string(self) -> None:
+        """Vérifie le bon fonctionnement de get_refresh_string."""
+        # Pas de jeton de rafraîchissement
+        self.assertIsNone(Token(TokenTestCase.valid_token).get_refresh_string())
+        # Jeton de rafraîchissement valide, sans expiration (jeton « offline ») ou expirant
+        self.assertEqual(Token({**TokenTestCase.valid_token, "refresh_token": "refresh", "refresh_expires_in": 1800}).get_refresh_string(), "refresh")
+        self.assertEqual(Token({**TokenTestCase.valid_token, "refresh_token": "refresh", "refresh_expires_in": 0}).get_refresh_string(), "refresh")
+        self.assertIsNone(Token({**TokenTestCase.valid_token, "refresh_token": "refresh", "refresh_expires_in": 3}).get_refresh_string())
+
+    def test_revoked(self) -> None:
+        """Vérifie que la révocation expire le jeton d'accès en conservant le jeton de rafraîchissement (y compris sérialisé)."""
+        o_token = Token({**TokenTestCase.valid_token, "refresh_token": "refresh", "refresh_expires_in": 1800}, time.time() - 100)
+        o_revoked = o_token.revoked()
+        self.assertTrue(o_token.is_valid())
+        self.assertFalse(o_revoked.is_valid())
+        self.assertEqual(o_revoked.get_refresh_string(), "refresh")
+        o_loaded = Token.from_dict(o_revoked.to_dict())
+        self.assertFalse(o_loaded.is_valid())
+        self.assertEqual(o_loaded.get_refresh_string(), "refresh")
+
+    def test_to_dict(self) -> None:
+        """Vérifie la sérialisation du jeton (dates d'expiration conservées)."""
+        o_token = Token(TokenTestCase.valid_token, time.time() - 100)
+        d_token = o_token.to_dict()
+        self.assertDictEqual(d_token["token"], TokenTestCase.valid_token)
+        o_loaded = Token.from_dict(d_token)
+        self.assertAlmostEqual(o_loaded.expires_in, o_token.expires_in, delta=1)
+        self.assertTrue(190 < o_loaded.expires_in <= 200)
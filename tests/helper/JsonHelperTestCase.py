@@ -93,6 +93,10 @@ class JsonHelperTestCase(GpfTestCase):
         self.assertEqual(d_data["name"], "json parsable")
         self.assertEqual(d_data["title"], "il y a une virgule !")
 
+        # Parsable avec commentaires (JSONC) : le backend JSON échoue, JsoncParser prend le relais
+        d_data = JsonHelper.loads('{\n  // commentaire\n  "name": "jsonc parsable"\n}', "valide")
+        self.assertEqual(d_data["name"], "jsonc parsable")
+
     def test_validate_dict(self) -> None:
         """validate_dict ok quand c'est valide / pas valide (json ou schéma)."""
         # Propriétés générales
@@ -1,17 +1,29 @@
+import hashlib
 from http import HTTPStatus
 from io import BufferedReader
-import json
+import math
 from pathlib import Path
-from typing import Dict, Tuple
-from unittest.mock import patch, mock_open
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
 import requests
 import requests_mock
+from requests.adapters import HTTPAdapter
 
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.auth.Authentifier import Authentifier
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
-from sdk_entrepot_gpf.io.Errors import NotFoundError, RouteNotFoundError, ConflictError
+from sdk_entrepot_gpf.io.HedgePolicy import HedgePolicy
+from sdk_entrepot_gpf.io.Metrics import Metrics
+from sdk_entrepot_gpf.io.RateLimiter import RateLimiter
+from sdk_entrepot_gpf.io.ResponseCache import ResponseCache
+from sdk_entrepot_gpf.io.RetryPolicy import RetryAttempts
+from sdk_entrepot_gpf.io.RouteTable import RouteTable
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError, InternalServerError, NotFoundError, RouteNotFoundError, ConflictError, RangeNotSatisfiableError
 from tests.GpfTestCase import GpfTestCase
 
 # pylint:disable=protected-access
@@ -77,7 +89,7 @@ class ApiRequesterTestCase(GpfTestCase):
             )
             # Vérification sur o_mock_request
             s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42"
-            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {})
+            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, route_name="test_create", stream=False, retry_timeout=True)
             # Vérification sur la réponse renvoyée par la fonction : ça doit être celle renvoyée par url_request
             self.assertEqual(o_fct_response, o_api_response)
 
@@ -98,7 +110,7 @@ class ApiRequesterTestCase(GpfTestCase):
             )
             # Vérification sur o_mock_request
             s_url = "https://api.test.io/api/v1/datastores/OTHER_DATASTORE/create/42"
-            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {})
+            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, route_name="test_create", stream=False, retry_timeout=True)
             # Vérification sur la réponse renvoyée par la fonction : ça doit être celle renvoyée par url_request
             self.assertEqual(o_fct_response, o_api_response)
 
@@ -129,9 +141,8 @@ class ApiRequesterTestCase(GpfTestCase):
             self.assertEqual(o_history[0].url, self.url + self.encoded_param, "check url")
             # Requête 1 : vérification du type
             self.assertEqual(o_history[0].method.lower(), "get", "method == get")
-            # Requête 1 : vérification du corps de requête
-            s_text = json.dumps(self.data)
-            self.assertEqual(o_history[0].text, s_text, "check text")
+            # Requête 1 : vérification du corps de requête (JSON, mise en forme selon le backend JSON)
+            self.assertDictEqual(o_history[0].json(), self.data, "check text")
 
     def test_url_request_post(self) -> None:
         """Test de url_request dans le cadre d'une requête post."""
@@ -151,9 +162,8 @@ class ApiRequesterTestCase(GpfTestCase):
             self.assertEqual(o_history[0].url, self.url + self.encoded_param, "check url")
             # Requête 1 : vérification du type
             self.assertEqual(o_history[0].method.lower(), "post", "method == post")
-            # Requête 1 : vérification du corps de requête
-            s_text = json.dumps(self.data)
-            self.assertEqual(o_history[0].text, s_text, "check text")
+            # Requête 1 : vérification du corps de requête (JSON, mise en forme selon le backend JSON)
+            self.assertDictEqual(o_history[0].json(), self.data, "check text")
 
     def test_url_request_internal_server_error(self) -> None:
         """Test de url_request dans le cadre de 3 erreurs internes de suite."""
@@ -208,6 +218,17 @@ class ApiRequesterTestCase(GpfTestCase):
             # On a dû faire 1 seule requête
             self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
 
+    def test_url_request_range_not_satisfiable(self) -> None:
+        """Test de url_request dans le cadre d'une erreur 416 (plage non satisfiable) : pas de nouvelle tentative."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, headers={"Content-Range": "bytes */0"})
+            with self.assertRaises(RangeNotSatisfiableError) as o_arc:
+                ApiRequester().url_request(self.url, ApiRequester.GET, header={"Range": "bytes=0-"})
+            self.assertEqual(o_arc.exception.status_code, 416)
+            self.assertEqual(o_arc.exception.headers["Content-Range"], "bytes */0")
+            # On a dû faire 1 seule requête
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+
     def test_url_request_not_found(self) -> None:
         """Test de url_request dans le cadre d'une erreur 404 (not found)."""
         # On mock...
@@ -288,21 +309,324 @@ class ApiRequesterTestCase(GpfTestCase):
         # Content-Range non parsable : on doit s'arrêter
         self.assertFalse(ApiRequester.range_next_page("non_parsable", 0))
 
+    def test_range_length(self) -> None:
+        """Test de range_length."""
+        self.assertEqual(ApiRequester.range_length("1-10/5000"), 5000)
+        self.assertIsNone(ApiRequester.range_length(None))
+        self.assertIsNone(ApiRequester.range_length("non_parsable"))
+
     def test_route_upload_file(self) -> None:
-        """test de route_upload_file"""
-        p_file = Path("rep/file")
-        s_path_api = "key"
-        s_route_name = "route_mane"
-        d_route_params = None
-        s_method = "POST"
-        d_params = None
-        d_data = None
-
-        o_open = mock_open()
-        o_tuple_file = (p_file.name, o_open.return_value)
-        o_dict_files = {s_path_api: o_tuple_file}
-        with patch.object(Path, "open", return_value=o_open.return_value) as o_mock_open:
-            with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request:
-                ApiRequester().route_upload_file(s_route_name, p_file, s_path_api, d_route_params, s_method, d_params, d_data)
-                o_mock_open.assert_called_once_with("rb")
-                o_mock_request.assert_called_once_with(s_route_name, route_params=d_route_params, method=s_method, params=d_params, data=d_data, files=o_dict_files)
+        """Test de route_upload_file : envoi en flux, corps complet renvoyé à chaque tentative et suivi de l'envoi."""
+        s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42"
+        b_content = b"contenu du fichier " * 10000
+        l_bodies: List[bytes] = []
+
+        def callback(o_request: requests.PreparedRequest, o_context: Any) -> str:
+            # Le corps est lu en flux (encodeur multipart)
+            l_bodies.append(o_request.body.read())  # type: ignore
+            o_context.status_code = 500 if len(l_bodies) == 1 else 201
+            return "{}"
+
+        with tempfile.TemporaryDirectory() as s_dir, requests_mock.Mocker() as o_mock:
+            p_file = Path(s_dir) / "file.txt"
+            p_file.write_bytes(b_content)
+            o_mock.post(s_url, text=callback)
+            l_progress: List[Tuple[int, Optional[int]]] = []
+            with patch.object(Path, "open", wraps=p_file.open) as o_mock_open:
+                ApiRequester().route_upload_file("test_create", p_file, "file", route_params={"id": 42}, callback=lambda o_p: l_progress.append((o_p.done, o_p.total)))
+            # Fichier ouvert une seule fois
+            o_mock_open.assert_called_once_with("rb")
+        # Erreur 500 puis succès : le fichier est renvoyé en entier à la seconde tentative
+        self.assertEqual(len(l_bodies), 2)
+        self.assertEqual(l_bodies[0].count(b_content), 1)
+        self.assertEqual(l_bodies[1].count(b_content), 1)
+        self.assertIn(b'name="file"; filename="file.txt"', l_bodies[1])
+        self.assertTrue(o_mock.request_history[1].headers["Content-Type"].startswith("multipart/form-data; boundary="))
+        # Suivi de l'envoi : le corps entier est lu à chaque tentative
+        self.assertEqual(l_progress[-1], (len(l_bodies[1]), len(l_bodies[1])))
+
+    def test_timeouts(self) -> None:
+        """Délais d'attente selon le type de requête, réduits par l'échéance active qui arrête aussi les tentatives."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, json=self.response)
+            ApiRequester().url_request(self.url, ApiRequester.GET)
+            self.assertEqual(o_mock.request_history[-1].timeout, (10.0, 60.0))
+            ApiRequester().url_request(self.url, ApiRequester.GET, stream=True)
+            self.assertEqual(o_mock.request_history[-1].timeout, (10.0, 120.0))
+            with patch("time.monotonic", return_value=100.0):
+                o_deadline = Deadline(5, "test")
+            with o_deadline, patch("time.monotonic", return_value=97.0):
+                ApiRequester().url_request(self.url, ApiRequester.GET)
+                self.assertEqual(o_mock.request_history[-1].timeout, (8.0, 8.0))
+            # Échéance dépassée : pas de requête
+            i_count = o_mock.call_count
+            with o_deadline, patch("time.monotonic", return_value=106.0):
+                with self.assertRaises(DeadlineExceededError):
+                    ApiRequester().url_request(self.url, ApiRequester.GET)
+            self.assertEqual(o_mock.call_count, i_count)
+
+    def test_session(self) -> None:
+        """Test de la session partagée : réutilisation, pool de connexions et fermeture."""
+        o_requester = ApiRequester()
+        o_requester.close()
+        # La session est réutilisée d'un appel à l'autre
+        o_session = o_requester.session
+        self.assertIs(o_requester.session, o_session)
+        # Le pool de connexions est bien monté pour http et https
+        for s_prefix in ["http://", "https://"]:
+            o_adapter = o_session.get_adapter(s_prefix + "api.test.io")
+            self.assertIsInstance(o_adapter, HTTPAdapter)
+            self.assertEqual(o_adapter._pool_connections, 10)  # type: ignore
+            # Dimensionné selon le plus grand nombre de requêtes simultanées (async_max_workers)
+            self.assertEqual(o_adapter._pool_maxsize, 32)  # type: ignore
+        # Les requêtes passent par la session
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, json=self.response)
+            with patch.object(o_session, "close", wraps=o_session.close) as o_mock_close:
+                # Utilisation comme gestionnaire de contexte : la session est fermée en sortie
+                with ApiRequester() as o_requester_ctx:
+                    o_requester_ctx.url_request(self.url, ApiRequester.GET)
+                o_mock_close.assert_called_once_with()
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+        # Après fermeture, une nouvelle session est créée
+        self.assertIsNot(o_requester.session, o_session)
+
+    def test_url_request_retry_after(self) -> None:
+        """Test de url_request dans le cadre d'une réponse 429 avec en-tête Retry-After."""
+        ApiRequester().retry_stats.reset()
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(
+                self.url,
+                [
+                    {"status_code": HTTPStatus.TOO_MANY_REQUESTS, "headers": {"Retry-After": "2"}},
+                    {"status_code": HTTPStatus.OK, "json": self.response},
+                ],
+            )
+            with patch("time.sleep", return_value=None) as o_mock_sleep, patch.object(RateLimiter, "slow_down", return_value=None) as o_mock_slow_down:
+                o_response = ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_create")
+            # Le délai demandé par le serveur a été respecté
+            o_mock_sleep.assert_called_once_with(2.0)
+            # Le débit a été diminué
+            o_mock_slow_down.assert_called_once_with("test_create")
+            self.assertDictEqual(o_response.json(), self.response)
+            self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+        # Les statistiques ont été mises à jour
+        d_stats = ApiRequester().retry_stats.to_dict()
+        self.assertDictEqual(d_stats["nb_retries_by_category"], {"throttling": 1})
+        self.assertEqual(d_stats["sec_sleep"], 2.0)
+
+    def test_url_request_deadline(self) -> None:
+        """Test de url_request quand l'échéance de l'opération arrête les tentatives : attente réduite puis DeadlineExceededError."""
+        with requests_mock.Mocker() as o_mock, patch("time.sleep", return_value=None) as o_mock_sleep:
+            o_mock.get(self.url, status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+            # Attente avant la nouvelle tentative au-delà de l'échéance
+            with patch("random.uniform", return_value=100.0), Deadline(30, "liste"):
+                with self.assertRaises(DeadlineExceededError) as o_arc:
+                    ApiRequester().url_request(self.url, ApiRequester.GET)
+            self.assertIn("liste", o_arc.exception.message)
+            self.assertIsInstance(o_arc.exception.__cause__, InternalServerError)
+            self.assertEqual(o_mock.call_count, 1)
+            o_mock_sleep.assert_not_called()
+            # Attente réduite au temps restant
+            o_mock.reset_mock()
+            o_mock.get(self.url, [{"status_code": HTTPStatus.INTERNAL_SERVER_ERROR}, {"status_code": HTTPStatus.OK, "json": self.response}])
+            with patch.object(RetryAttempts, "next_delay", return_value=100.0), Deadline(30):
+                ApiRequester().url_request(self.url, ApiRequester.GET)
+            o_mock_sleep.assert_called_once()
+            self.assertTrue(29 < o_mock_sleep.call_args.args[0] <= 30)
+
+    def test_url_request_retry_timeout(self) -> None:
+        """Test de url_request avec un délai d'attente dépassé : retenté par défaut, levé aussitôt si demandé."""
+        with requests_mock.Mocker() as o_mock, patch("time.sleep", return_value=None):
+            o_mock.get(self.url, [{"exc": requests.ReadTimeout}, {"status_code": HTTPStatus.OK, "json": self.response}])
+            self.assertDictEqual(ApiRequester().url_request(self.url, ApiRequester.GET).json(), self.response)
+            self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+            o_mock.reset_mock()
+            o_mock.get(self.url, [{"exc": requests.ReadTimeout}, {"status_code": HTTPStatus.OK, "json": self.response}])
+            with self.assertRaises(GpfSdkError) as o_arc:
+                ApiRequester().url_request(self.url, ApiRequester.GET, retry_timeout=False)
+            self.assertIsInstance(o_arc.exception.__cause__, requests.Timeout)
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+
+    def test_url_request_conditional(self) -> None:
+        """Test de url_request avec cache des réponses : désactivé par défaut, requête conditionnelle, réponse 304 et invalidation."""
+        d_etag = {"ETag": '"v1"'}
+        # Par défaut, aucune route n'est mise en cache
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, json=self.response, headers=d_etag)
+            for _ in range(2):
+                ApiRequester().url_request(self.url, ApiRequester.GET, route_name="upload_get")
+            self.assertNotIn("If-None-Match", o_mock.request_history[1].headers)
+            self.assertEqual(len(ApiRequester().response_cache), 0)
+        o_cache = ApiRequester().response_cache
+        ApiRequester().response_cache = ResponseCache(conditional_routes=["*_get"])
+        try:
+            with requests_mock.Mocker() as o_mock:
+                o_mock.get(self.url, [{"status_code": HTTPStatus.OK, "json": self.response, "headers": d_etag}, {"status_code": HTTPStatus.NOT_MODIFIED}])
+                o_mock.patch(self.url, json=self.response)
+                # Première requête : pas de requête conditionnelle, la réponse est mise en cache
+                o_response = ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_get")
+                self.assertDictEqual(o_response.json(), self.response)
+                self.assertNotIn("If-None-Match", o_mock.request_history[0].headers)
+                # Seconde requête : requête conditionnelle, l'API répond 304 et on renvoie la réponse en cache
+                o_response = ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_get")
+                self.assertEqual(o_mock.request_history[1].headers["If-None-Match"], '"v1"')
+                self.assertEqual(o_response.status_code, HTTPStatus.OK)
+                self.assertDictEqual(o_response.json(), self.response)
+                # Une modification de la ressource invalide le cache
+                ApiRequester().url_request(self.url, ApiRequester.PATCH, route_name="test_update")
+                self.assertEqual(len(ApiRequester().response_cache), 0)
+                # Route non concernée par le cache : pas de mise en cache
+                ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_list")
+                self.assertEqual(len(ApiRequester().response_cache), 0)
+        finally:
+            ApiRequester().response_cache = o_cache
+
+    def test_url_request_route_ttl(self) -> None:
+        """Test de url_request avec une durée de vie définie pour la route : pas de requête tant que la réponse est récente."""
+        o_cache = ApiRequester().response_cache
+        ApiRequester().response_cache = ResponseCache(route_ttls=[("test_static", 60)])
+        try:
+            with requests_mock.Mocker() as o_mock:
+                o_mock.get(self.url, json=self.response)
+                for _ in range(3):
+                    o_response = ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_static")
+                    self.assertDictEqual(o_response.json(), self.response)
+                self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+                # Invalidation explicite : nouvelle requête
+                ApiRequester().response_cache.invalidate(self.url)
+                ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_static")
+                self.assertEqual(o_mock.call_count, 2, "o_mock.call_count == 2")
+        finally:
+            ApiRequester().response_cache = o_cache
+
+    def test_route_table(self) -> None:
+        """Test de la table des routes : réutilisée d'une requête à l'autre, reconstruite après toute modification de la configuration."""
+        s_route = str(Config().get_parser().get("routing", "test_create", raw=True))
+        with patch.object(ApiRequester(), "url_request", return_value=GpfTestCase.get_response()) as o_mock_url_request, patch.object(
+            RouteTable, "from_config", wraps=RouteTable.from_config
+        ) as o_mock_from_config:
+            ApiRequester()._ApiRequester__route_table = None  # type: ignore
+            ApiRequester().route_request("test_create", {"id": 1})
+            ApiRequester().route_request("test_create", {"id": 2})
+            o_mock_from_config.assert_called_once_with()
+            Config().read(GpfTestCase.conf_dir_path / "test_requester.ini")
+            ApiRequester().route_request("test_create", {"id": 3})
+            self.assertEqual(o_mock_from_config.call_count, 2)
+            # Route surchargée directement dans le parser (cf. ClientContext) : prise en compte
+            try:
+                Config().get_parser().read_dict({"routing": {"test_create": "https://other.test.io/create/{id}"}})
+                ApiRequester().route_request("test_create", {"id": 4})
+                self.assertEqual(o_mock_url_request.call_args.args[0], "https://other.test.io/create/4")
+                self.assertEqual(o_mock_from_config.call_count, 3)
+            finally:
+                Config().get_parser().set("routing", "test_create", s_route)
+            ApiRequester().route_request("test_create", {"id": 5})
+            self.assertEqual(o_mock_url_request.call_args.args[0], "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/5")
+
+    def test_route_download_file(self) -> None:
+        """Test de route_download_file : téléchargement en flux, fichier temporaire renommé, empreinte et suivi."""
+        s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42"
+        b_content = b"contenu du fichier " * 1000
+        s_md5 = hashlib.md5(b_content).hexdigest()
+        with tempfile.TemporaryDirectory() as s_dir, requests_mock.Mocker() as o_mock, patch.object(ApiRequester(), "_ApiRequester__download_chunk_size", 1024):
+            p_file = Path(s_dir) / "output.txt"
+            o_mock.get(s_url, content=b_content, headers={"Content-Length": str(len(b_content))})
+            # Téléchargement avec vérification de l'empreinte et suivi
+            l_progress: List[Tuple[int, Optional[int]]] = []
+            o_progress = ApiRequester().route_download_file("test_create", p_file, route_params={"id": 42}, checksum=s_md5.upper(), callback=lambda o_p: l_progress.append((o_p.done, o_p.total)))
+            # Requête en flux
+            self.assertTrue(o_mock.request_history[0].stream)
+            self.assertEqual(p_file.read_bytes(), b_content)
+            self.assertFalse(p_file.with_name("output.txt.part").exists())
+            # Suivi appelé après chaque bloc
+            self.assertEqual(len(l_progress), math.ceil(len(b_content) / 1024))
+            self.assertEqual(l_progress[-1], (len(b_content), len(b_content)))
+            self.assertEqual(o_progress.done, len(b_content))
+            self.assertEqual(o_progress.ratio, 1.0)
+            # Empreinte invalide : erreur, le fichier existant n'est pas écrasé et le fichier temporaire est supprimé
+            p_file.write_bytes(b"ancien contenu")
+            with self.assertRaises(GpfSdkError):
+                ApiRequester().route_download_file("test_create", p_file, route_params={"id": 42}, checksum="invalide")
+            self.assertEqual(p_file.read_bytes(), b"ancien contenu")
+            self.assertListEqual(list(Path(s_dir).iterdir()), [p_file])
+
+    def test_url_request_coalesced(self) -> None:
+        """Test de url_request : les requêtes GET identiques simultanées partagent une seule requête HTTP."""
+        Metrics().reset()
+        o_started = threading.Event()
+        o_release = threading.Event()
+        l_responses: List[requests.Response] = []
+
+        def json_callback(o_request: Any, o_context: Any) -> Dict[str, Any]:  # pylint:disable=unused-argument
+            o_started.set()
+            o_release.wait()
+            return self.response
+
+        def get() -> None:
+            l_responses.append(ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_list"))
+
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, json=json_callback)
+            l_threads = [threading.Thread(target=get) for _ in range(4)]
+            l_threads[0].start()
+            o_started.wait()
+            for o_thread in l_threads[1:]:
+                o_thread.start()
+            o_single_flight = ApiRequester()._ApiRequester__single_flight  # type: ignore
+            while len(o_single_flight._SingleFlight__flights) != 1 or next(iter(o_single_flight._SingleFlight__flights.values())).nb_followers < 3:
+                time.sleep(0.001)
+            o_release.set()
+            for o_thread in l_threads:
+                o_thread.join()
+            self.assertEqual(o_mock.call_count, 1, "o_mock.call_count == 1")
+        # Chaque appelant a sa propre réponse
+        self.assertEqual(len({id(o_response) for o_response in l_responses}), 4)
+        for o_response in l_responses:
+            self.assertDictEqual(o_response.json(), self.response)
+        d_metrics = Metrics().get("test_list", "GET")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_calls"], 1)
+        self.assertEqual(d_metrics["nb_coalesced"], 3)
+
+    def test_url_request_hedged(self) -> None:
+        """Test de url_request : une requête GET lente est doublée, la première réponse reçue est utilisée."""
+        Metrics().reset()
+        for _ in range(20):
+            Metrics().record("test_get", "GET", 0.01)
+        o_release = threading.Event()
+        l_calls: List[str] = []
+        l_responses: List[requests.Response] = []
+
+        # requests_mock sérialise les requêtes : on remplace directement l'exécution d'une tentative
+        def url_request(url: str, method: str, **kwargs: Any) -> requests.Response:  # pylint:disable=unused-argument
+            l_calls.append(method)
+            o_response = requests.Response()
+            l_responses.append(o_response)
+            o_response.status_code = 200
+            if len(l_calls) == 1:
+                # Première requête lente
+                o_release.wait(5)
+                o_response._content = b"premiere"
+            else:
+                o_response._content = b"supplementaire"
+            return o_response
+
+        with patch.object(ApiRequester(), "_ApiRequester__hedge_policy", HedgePolicy(["test_get"], max_extra=1, min_samples=20)):
+            with patch.object(ApiRequester(), "_ApiRequester__url_request", side_effect=url_request), patch.object(requests.Response, "close", autospec=True) as o_mock_close:
+                # Requête doublée
+                o_response = ApiRequester().url_request(self.url, ApiRequester.GET, route_name="test_get")
+                o_release.set()
+                self.assertEqual(o_response.content, b"supplementaire")
+                self.assertListEqual(l_calls, ["GET", "GET"])
+                # La réponse perdante est fermée dès sa réception
+                while not o_mock_close.called:
+                    time.sleep(0.001)
+                o_mock_close.assert_called_once_with(l_responses[0])
+                # Requêtes de modification jamais doublées
+                ApiRequester().url_request(self.url, ApiRequester.POST, route_name="test_get", data={"k": "v"})
+                self.assertListEqual(l_calls, ["GET", "GET", "POST"])
+        d_metrics = Metrics().get("test_get", "GET")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_hedged"], 1)
+        self.assertEqual(d_metrics["nb_hedge_wins"], 1)
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
+from sdk_entrepot_gpf.io.Errors import NotFoundError
+from tests.GpfTestCase import GpfTestCase
+
+
+class AsyncApiRequesterTestCase(GpfTestCase):
+    """Tests AsyncApiRequester class.
+
+    cmd : python3 -m unittest -b tests.io.AsyncApiRequesterTestCase
+    """
+
+    def test_route_request(self) -> None:
+        """Test de route_request : délégation à l'ApiRequester hors de la boucle d'événements."""
+        o_response = GpfTestCase.get_response(json={"key": "value"})
+        l_threads: List[threading.Thread] = []
+
+        def record_thread(*args: object, **kwargs: object) -> object:  # pylint:disable=unused-argument
+            l_threads.append(threading.current_thread())
+            return o_response
+
+        with patch.object(ApiRequester, "route_request", side_effect=record_thread) as o_mock_request:
+            o_result = asyncio.run(AsyncApiRequester().route_request("test_create", {"id": 42}, ApiRequester.POST, params={"p": 1}, data={"d": 2}))
+        self.assertEqual(o_result, o_response)
+        o_mock_request.assert_called_once_with("test_create", route_params={"id": 42}, method=ApiRequester.POST, params={"p": 1}, data={"d": 2}, files=None)
+        # La requête a été exécutée dans un autre thread que celui de la boucle
+        self.assertIsNot(l_threads[0], threading.current_thread())
+
+    def test_url_request(self) -> None:
+        """Test de url_request : les erreurs de l'ApiRequester sont propagées telles quelles."""
+        o_error = NotFoundError("url", "GET", None, None, "{}")
+        with patch.object(ApiRequester, "url_request", side_effect=o_error) as o_mock_request:
+            with self.assertRaises(NotFoundError):
+                asyncio.run(AsyncApiRequester().url_request("url"))
+        o_mock_request.assert_called_once_with("url", "GET", None, None, None, {})
+
+    def test_route_upload_file(self) -> None:
+        """Test de route_upload_file."""
+        p_file = Path("rep/file")
+        with patch.object(ApiRequester, "route_upload_file", return_value=None) as o_mock_request:
+            asyncio.run(AsyncApiRequester().route_upload_file("route", p_file, "key"))
+        o_mock_request.assert_called_once_with("route", p_file, "key", route_params=None, method="POST", params=None, data=None, callback=None)
+
+    def test_concurrency(self) -> None:
+        """Plusieurs requêtes lancées depuis une même boucle sont exécutées simultanément."""
+        i_nb = 5
+        o_barrier = threading.Barrier(i_nb, timeout=5)
+
+        def wait_others(*args: object, **kwargs: object) -> int:  # pylint:disable=unused-argument
+            # Chaque requête attend que toutes les autres soient lancées : ne passe que si elles sont concurrentes
+            return o_barrier.wait()
+
+        async def run_all() -> List[object]:
+            async with AsyncApiRequester() as o_requester:
+                return list(await asyncio.gather(*[o_requester.url_request(f"url_{i}") for i in range(i_nb)]))
+
+        with patch.object(ApiRequester, "url_request", side_effect=wait_others):
+            l_results = asyncio.run(run_all())
+        self.assertCountEqual(l_results, list(range(i_nb)))
+
+    def test_executor_threads(self) -> None:
+        """Le pool de threads n'est créé qu'une fois, même depuis plusieurs boucles d'événements simultanées."""
+        l_threads: List[str] = []
+
+        def record(*args: object, **kwargs: object) -> None:  # pylint:disable=unused-argument
+            l_threads.append(threading.current_thread().name)
+
+        def run_loop() -> None:
+            asyncio.run(AsyncApiRequester().url_request("url"))
+
+        AsyncApiRequester().close()
+        try:
+            with patch.object(ApiRequester, "url_request", side_effect=record), patch("sdk_entrepot_gpf.io.AsyncApiRequester.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as o_mock_executor:
+                l_loops = [threading.Thread(target=run_loop) for _ in range(8)]
+                for o_thread in l_loops:
+                    o_thread.start()
+                for o_thread in l_loops:
+                    o_thread.join()
+            o_mock_executor.assert_called_once()
+            self.assertEqual(len(l_threads), 8)
+        finally:
+            AsyncApiRequester().close()
@@ -0,0 +1,105 @@
+import threading
+from typing import Any, Dict, List
+from urllib.parse import parse_qs
+
+import requests_mock
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.ClientContext import ClientContext
+from sdk_entrepot_gpf.io.Config import Config
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class ClientContextTestCase(GpfTestCase):
+    """Tests ClientContext class.
+
+    cmd : python3 -m unittest -b tests.io.ClientContextTestCase
+    """
+
+    token_url = "https://sso.geopf.fr/realms/geoplateforme/protocol/openid-connect/token"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """fonction lancée une fois avant tous les tests de la classe"""
+        super().setUpClass()
+        # Configuration par défaut
+        Config._instance = None
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe"""
+        ClientContext.register("producteur_a", {"store_authentification": {"login": "LOGIN_A", "password": "PASSWORD_A"}}, datastore="DATASTORE_A")
+        ClientContext.register("producteur_b", {"store_authentification": {"login": "LOGIN_B", "password": "PASSWORD_B"}}, datastore="DATASTORE_B")
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe"""
+        for s_name in ClientContext.names():
+            ClientContext.unregister(s_name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """fonction lancée une fois après tous les tests de la classe"""
+        super().tearDownClass()
+        Config._instance = None
+
+    def test_instances(self) -> None:
+        """Chaque contexte a sa propre configuration et ses propres instances des singletons."""
+        self.assertListEqual(ClientContext.names(), ["producteur_a", "producteur_b"])
+        self.assertIsNone(ClientContext.current())
+        with ClientContext.use("producteur_a") as o_client_a:
+            self.assertIs(ClientContext.current(), o_client_a)
+            self.assertEqual(Config().get("store_api", "datastore"), "DATASTORE_A")
+            self.assertEqual(Config().get("store_authentification", "login"), "LOGIN_A")
+            # Paramètres non surchargés : ceux de la configuration courante
+            self.assertEqual(Config().get("store_api", "root_url"), "https://data.geopf.fr/api")
+            self.assertIs(ApiRequester(), o_client_a.api_requester)
+            self.assertIs(Authentifier(), o_client_a.authentifier)
+            with ClientContext.use("producteur_b") as o_client_b:
+                self.assertEqual(Config().get("store_api", "datastore"), "DATASTORE_B")
+                self.assertIs(ApiRequester(), o_client_b.api_requester)
+            self.assertIs(Config(), o_client_a.config)
+        self.assertIsNone(ClientContext.current())
+        self.assertEqual(Config().get("store_api", "datastore"), "DATASTORE_ID_TO_MODIFY")
+        self.assertEqual(len({id(ApiRequester()), id(o_client_a.api_requester), id(o_client_b.api_requester)}), 3)
+        self.assertEqual(len({id(Authentifier()), id(o_client_a.authentifier), id(o_client_b.authentifier)}), 3)
+        # Sélection pour un appel
+        self.assertEqual(o_client_b.run(Config().get, "store_api", "datastore"), "DATASTORE_ID_TO_MODIFY")
+        self.assertEqual(o_client_b.run(lambda: Config().get("store_api", "datastore")), "DATASTORE_B")
+        # Contexte inconnu
+        with self.assertRaises(GpfSdkError):
+            ClientContext.get("inconnu")
+
+    def test_concurrent_requests(self) -> None:
+        """Des threads utilisant des contextes différents requêtent simultanément, chacun avec son jeton et son entrepôt."""
+        l_errors: List[str] = []
+
+        def token_callback(o_request: Any, o_context: Any) -> Dict[str, Any]:  # pylint:disable=unused-argument
+            s_login = parse_qs(o_request.text)["username"][0]
+            return {"access_token": f"token_{s_login}", "expires_in": 300}
+
+        def request(s_name: str, s_datastore: str) -> None:
+            with ClientContext.use(s_name):
+                for _ in range(5):
+                    o_response = ApiRequester().route_request("datastore_get")
+                    if o_response.json()["datastore"] != s_datastore:
+                        l_errors.append(s_name)
+
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(ClientContextTestCase.token_url, json=token_callback)
+            for s_datastore in ["DATASTORE_A", "DATASTORE_B"]:
+                o_mock.get(f"https://data.geopf.fr/api/datastores/{s_datastore}", json={"datastore": s_datastore})
+            l_threads = [threading.Thread(target=request, args=t_args) for t_args in [("producteur_a", "DATASTORE_A"), ("producteur_b", "DATASTORE_B")] * 4]
+            for o_thread in l_threads:
+                o_thread.start()
+            for o_thread in l_threads:
+                o_thread.join()
+            self.assertListEqual(l_errors, [])
+            # Un jeton par contexte, utilisé pour les requêtes de son entrepôt
+            self.assertEqual(len([o_request for o_request in o_mock.request_history if o_request.method == "POST"]), 2)
+            for o_request in o_mock.request_history:
+                if o_request.method == "GET":
+                    s_login = "LOGIN_A" if o_request.url.endswith("DATASTORE_A") else "LOGIN_B"
+                    self.assertEqual(o_request.headers["Authorization"], f"Bearer token_{s_login}")
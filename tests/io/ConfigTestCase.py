@@ -36,6 +36,38 @@ class ConfigTestCase(GpfTestCase):
         self.assertEqual(o_parser.get("store_authentification", "password"), "TEST_PASSWORD")
         self.assertEqual(o_parser.get("store_api", "datastore"), "TEST_DATASTORE")
 
+    def test_version(self) -> None:
+        """Vérifie que la version de la configuration change à chaque modification et d'une instance à l'autre."""
+        i_version = Config().version
+        self.assertEqual(Config().version, i_version)
+        Config().get("store_api", "root_url")
+        self.assertEqual(Config().version, i_version)
+        Config().read(GpfTestCase.conf_dir_path / "test_overload.ini")
+        self.assertNotEqual(Config().version, i_version)
+        # Modifications directes du parser
+        o_parser = Config().get_parser()
+        i_version = Config().version
+        o_parser.read_dict({"test_version": {"key": "value"}})
+        self.assertNotEqual(Config().version, i_version)
+        i_version = Config().version
+        o_parser.set("test_version", "key", "other")
+        self.assertNotEqual(Config().version, i_version)
+        i_version = Config().version
+        o_parser["test_version"]["key"] = "third"
+        self.assertNotEqual(Config().version, i_version)
+        i_version = Config().version
+        o_parser.read_string("[test_version]\nkey=fourth\n")
+        self.assertNotEqual(Config().version, i_version)
+        i_version = Config().version
+        o_parser.remove_option("test_version", "key")
+        self.assertNotEqual(Config().version, i_version)
+        i_version = Config().version
+        o_parser.remove_section("test_version")
+        self.assertNotEqual(Config().version, i_version)
+        i_version = Config().version
+        Config._instance = None
+        self.assertNotEqual(Config().version, i_version)
+
     def test_get(self) -> None:
         """Vérifie le bon fonctionnement de get, get_int, get_float et get_bool."""
         Config().read(GpfTestCase.conf_dir_path / "test_value_type.ini")
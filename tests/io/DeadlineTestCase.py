@@ -0,0 +1,100 @@
+import contextvars
+import math
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from tests.GpfTestCase import GpfTestCase
+
+
+class DeadlineTestCase(GpfTestCase):
+    """Tests Deadline class.
+
+    cmd : python3 -m unittest -b tests.io.DeadlineTestCase
+    """
+
+    def test_deadline(self) -> None:
+        """Vérifie le temps restant, le dépassement et l'imbrication des échéances."""
+        self.assertIsNone(Deadline.current())
+        Deadline.check_current()
+        with patch("time.monotonic", return_value=100.0):
+            o_outer = Deadline(10, "externe")
+            o_inner = Deadline(30, "interne")
+            o_short = Deadline(2, "courte")
+        with patch("time.monotonic", return_value=105.0):
+            self.assertEqual(o_outer.remaining, 5.0)
+            self.assertFalse(o_outer.expired)
+            with o_outer:
+                self.assertIs(Deadline.current(), o_outer)
+                # Échéance interne plus lointaine : l'échéance externe reste active
+                with o_inner:
+                    self.assertIs(Deadline.current(), o_outer)
+                # Échéance interne plus proche : elle devient active
+                with o_short:
+                    self.assertIs(Deadline.current(), o_short)
+                    with self.assertRaises(DeadlineExceededError) as o_arc:
+                        Deadline.check_current()
+                    self.assertIn("courte", o_arc.exception.message)
+                self.assertIs(Deadline.current(), o_outer)
+                # Propagation aux contextes copiés (threads)
+                self.assertIs(contextvars.copy_context().run(Deadline.current), o_outer)
+        self.assertIsNone(Deadline.current())
+        # Pas de limite
+        self.assertTrue(math.isinf(Deadline(0).remaining))
+
+    def test_clamp(self) -> None:
+        """Les délais d'attente sont réduits au temps restant."""
+        self.assertEqual(Deadline.clamp((10, None)), (10, None))
+        with patch("time.monotonic", return_value=100.0):
+            o_deadline = Deadline(5)
+            with o_deadline:
+                self.assertEqual(Deadline.clamp((10, None)), (5, 5))
+                self.assertEqual(Deadline.clamp((2, 60)), (2, 5))
+        with Deadline(0):
+            self.assertEqual(Deadline.clamp((10, None)), (10, None))
+
+    def test_clamp_delay(self) -> None:
+        """Les attentes sont réduites au temps restant."""
+        self.assertEqual(Deadline.clamp_delay(10), 10)
+        with patch("time.monotonic", return_value=100.0):
+            o_deadline = Deadline(5)
+            with o_deadline:
+                self.assertEqual(Deadline.clamp_delay(10), 5)
+                self.assertEqual(Deadline.clamp_delay(2), 2)
+        with patch("time.monotonic", return_value=106.0), o_deadline:
+            self.assertEqual(Deadline.clamp_delay(2), 0)
+
+    def test_from_config(self) -> None:
+        """Lecture des échéances et des délais d'attente dans la configuration."""
+        self.assertTrue(math.isinf(Deadline.from_config("api_list", "liste").remaining))
+        self.assertEqual(Deadline.timeout_from_config("store_api"), (10.0, 60.0))
+        self.assertEqual(Deadline.timeout_from_config("store_api", "upload"), (10.0, 600.0))
+        self.assertEqual(Deadline.timeout_from_config("store_api", "download"), (10.0, 120.0))
+        # Valeurs de la section store_api par défaut, surchargées par section, 0 : pas de limite
+        with patch.object(
+            Config(), "get", side_effect=lambda s, o, fallback=None: {"store_authentification": {"sec_timeout_read": "0"}, "store_api": {"sec_timeout_connect": "3"}}.get(s, {}).get(o, fallback)
+        ):
+            self.assertEqual(Deadline.timeout_from_config("store_authentification"), (3.0, None))
+
+    def test_retry_policy(self) -> None:
+        """Aucune nouvelle tentative si l'attente avant celle-ci dépasse l'échéance."""
+        o_policy = RetryPolicy(5, 10, 10)
+        with patch("random.uniform", return_value=3.0):
+            self.assertIsNotNone(o_policy.start().next_delay(ConnectionError()))
+            with Deadline(60):
+                self.assertIsNotNone(o_policy.start().next_delay(ConnectionError()))
+            with Deadline(2, "courte"):
+                o_attempts = o_policy.start()
+                self.assertIsNone(o_attempts.next_delay(ConnectionError()))
+                # Abandon dû à l'échéance
+                self.assertIsInstance(o_attempts.give_up_error("échec"), DeadlineExceededError)
+                self.assertIn("courte", o_attempts.give_up_error("échec").message)
+        # Abandon dû au nombre de tentatives
+        o_attempts = RetryPolicy(1, 10, 10).start()
+        with Deadline(2):
+            self.assertIsNone(o_attempts.next_delay(ConnectionError()))
+        o_error = o_attempts.give_up_error("échec")
+        self.assertNotIsInstance(o_error, DeadlineExceededError)
+        self.assertEqual(o_error.message, "échec")
@@ -0,0 +1,204 @@
+import hashlib
+import io
+import json
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest.mock import patch
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.Errors import RangeNotSatisfiableError
+from sdk_entrepot_gpf.io.FileDownloader import DownloadState, FileDownloader, Segment
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from tests.GpfTestCase import GpfTestCase
+
+
+class CutStream(io.BytesIO):
+    """Flux coupé (erreur réseau) après un certain nombre d'octets."""
+
+    def __init__(self, content: bytes, cut: Optional[int]) -> None:
+        super().__init__(content)
+        self.cut = cut
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if self.cut is not None and self.tell() >= self.cut:
+            raise requests.exceptions.ConnectionError("coupure")
+        if self.cut is not None and size is not None and size >= 0:
+            size = min(size, self.cut - self.tell())
+        return super().read(size)
+
+
+class FakeServer:
+    """Serveur simulé gérant (ou non) les requêtes Range et If-Range, avec coupures programmables."""
+
+    def __init__(self, content: bytes, etag: str = '"v1"', ranges: bool = True, raise_errors: bool = False) -> None:
+        self.content = content
+        self.etag = etag
+        self.ranges = ranges
+        # Erreurs levées comme par l'ApiRequester (après épuisement des tentatives) au lieu d'être renvoyées
+        self.raise_errors = raise_errors
+        self.headers: List[Dict[str, str]] = []
+        # Coupures : position de début de la requête -> nombre d'octets envoyés avant la coupure
+        self.cuts: Dict[int, int] = {}
+        self.lock = threading.Lock()
+
+    def request(self, header: Dict[str, str]) -> requests.Response:
+        """Répond à une requête selon ses en-têtes `Range` et `If-Range`."""
+        with self.lock:
+            self.headers.append(header)
+        o_response = requests.Response()
+        o_response.headers["ETag"] = self.etag
+        o_match = re.match(r"bytes=(\d+)-(\d*)", header.get("Range", ""))
+        if not self.ranges or o_match is None or header.get("If-Range", self.etag) != self.etag:
+            o_response.status_code = 200
+            o_response.headers["Content-Length"] = str(len(self.content))
+            o_response.raw = CutStream(self.content, None)
+            return o_response
+        i_start = int(o_match.group(1))
+        if i_start >= len(self.content):
+            # Plage non satisfiable (fichier vide)
+            o_response.status_code = 416
+            o_response.headers["Content-Range"] = f"bytes */{len(self.content)}"
+            o_response.raw = CutStream(b"", None)
+            if self.raise_errors:
+                raise RangeNotSatisfiableError("url", "GET", None, None, 416, "", o_response.headers)
+            return o_response
+        i_end = int(o_match.group(2)) if o_match.group(2) else len(self.content) - 1
+        o_response.status_code = 206
+        o_response.headers["Content-Range"] = f"bytes {i_start}-{i_end}/{len(self.content)}"
+        with self.lock:
+            i_cut = self.cuts.pop(i_start, None)
+        o_response.raw = CutStream(self.content[i_start : i_end + 1], i_cut)
+        return o_response
+
+
+class FileDownloaderTestCase(GpfTestCase):
+    """Tests FileDownloader class.
+
+    cmd : python3 -m unittest -b tests.io.FileDownloaderTestCase
+    """
+
+    content = bytes(range(256)) * 40
+
+    def test_download_segments(self) -> None:
+        """Téléchargement en segments parallèles, vérification de l'empreinte et suivi."""
+        o_server = FakeServer(self.content)
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_file = Path(s_dir) / "file.bin"
+            l_done: List[int] = []
+            o_downloader = FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000)
+            o_progress = o_downloader.download(hashlib.md5(self.content).hexdigest(), callback=lambda o_p: l_done.append(o_p.done))
+            self.assertEqual(p_file.read_bytes(), self.content)
+            self.assertListEqual(list(Path(s_dir).iterdir()), [p_file])
+            self.assertEqual(o_progress.done, len(self.content))
+            self.assertEqual(o_progress.total, len(self.content))
+            self.assertEqual(max(l_done), len(self.content))
+        # Première requête sur tout le fichier puis une requête par segment supplémentaire (avec If-Range)
+        self.assertEqual(o_server.headers[0], {"Range": "bytes=0-"})
+        self.assertCountEqual(
+            o_server.headers[1:],
+            [{"Range": f"bytes={i}-{i + 2559}", "If-Range": '"v1"'} for i in [2560, 5120, 7680]],
+        )
+
+    def test_download_single_stream(self) -> None:
+        """Serveur sans requêtes Range : un seul flux, empreinte calculée pendant le téléchargement."""
+        o_server = FakeServer(self.content, ranges=False)
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_file = Path(s_dir) / "file.bin"
+            o_progress = FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000).download(hashlib.sha256(self.content).hexdigest(), "sha256")
+            self.assertEqual(p_file.read_bytes(), self.content)
+            self.assertEqual(o_progress.total, len(self.content))
+            self.assertEqual(len(o_server.headers), 1)
+            # Empreinte invalide : erreur, fichiers temporaires supprimés
+            p_file.unlink()
+            with self.assertRaises(GpfSdkError):
+                FileDownloader(o_server.request, p_file, 512).download("invalide")
+            self.assertListEqual(list(Path(s_dir).iterdir()), [])
+
+    def test_download_empty(self) -> None:
+        """Fichier vide : plage refusée (416), réponse renvoyée ou levée, puis fichier redemandé sans Range."""
+        for b_raise_errors in [False, True]:
+            o_server = FakeServer(b"", raise_errors=b_raise_errors)
+            with tempfile.TemporaryDirectory() as s_dir:
+                p_file = Path(s_dir) / "file.bin"
+                o_progress = FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000).download(checksum=hashlib.md5(b"").hexdigest())
+                self.assertEqual(p_file.read_bytes(), b"")
+                self.assertEqual(o_progress.done, 0)
+                self.assertListEqual([d_header.get("Range") for d_header in o_server.headers], ["bytes=0-", None])
+                self.assertFalse(p_file.with_name("file.bin.part").exists())
+                self.assertFalse(p_file.with_name("file.bin.part.json").exists())
+        # Erreur 416 chaînée : reconnue ; autre erreur : propagée
+        e_error = GpfSdkError("erreur")
+        e_error.__cause__ = RangeNotSatisfiableError("url", "GET", None, None, 416, "")
+        self.assertTrue(FileDownloader.range_not_satisfiable(e_error))
+        self.assertFalse(FileDownloader.range_not_satisfiable(GpfSdkError("erreur")))
+
+    def test_retry_segment(self) -> None:
+        """Segment coupé : la partie restante est redemandée à partir du dernier octet reçu."""
+        o_server = FakeServer(self.content)
+        o_server.cuts[5120] = 1000
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_file = Path(s_dir) / "file.bin"
+            FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000, retry_policy=RetryPolicy(2, 0, 0)).download(hashlib.md5(self.content).hexdigest())
+            self.assertEqual(p_file.read_bytes(), self.content)
+        self.assertIn({"Range": "bytes=6120-7679", "If-Range": '"v1"'}, o_server.headers)
+        self.assertEqual(len(o_server.headers), 5)
+
+    def test_save_state(self) -> None:
+        """L'état n'est pas enregistré à chaque bloc, mais après un volume ou une durée, et à la fin de chaque segment."""
+        o_server = FakeServer(self.content)
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_file = Path(s_dir) / "file.bin"
+            with patch.object(DownloadState, "save", side_effect=DownloadState.save, autospec=True) as o_mock_save:
+                FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000).download()
+            self.assertEqual(p_file.read_bytes(), self.content)
+            # 20 blocs : un enregistrement initial puis un par segment terminé
+            self.assertEqual(o_mock_save.call_count, 5)
+            # Enregistrement après save_bytes octets ou save_interval secondes
+            o_state = DownloadState(Path(s_dir) / "state.part.json", 100, None, True, [Segment(0, 99)])
+            with patch.object(DownloadState, "save_bytes", 10), patch.object(DownloadState, "save", autospec=True) as o_mock_save:
+                o_state.checkpoint(6)
+                o_mock_save.assert_not_called()
+                o_state.checkpoint(6)
+                o_mock_save.assert_called_once_with(o_state)
+            with patch.object(DownloadState, "save_interval", 0.0), patch.object(DownloadState, "save", autospec=True) as o_mock_save:
+                o_state.checkpoint(1)
+                o_mock_save.assert_called_once_with(o_state)
+
+    def test_resume(self) -> None:
+        """Téléchargement interrompu puis repris là où il s'était arrêté ; repris de zéro si le fichier a changé."""
+        o_server = FakeServer(self.content)
+        o_server.cuts[7680] = 1024
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_file = Path(s_dir) / "file.bin"
+            o_downloader = FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                o_downloader.download()
+            # Fichier temporaire et état conservés
+            self.assertFalse(p_file.exists())
+            d_state = json.loads(o_downloader.state_path.read_text(encoding="utf-8"))
+            self.assertEqual(d_state["total"], len(self.content))
+            self.assertEqual(d_state["validator"], '"v1"')
+            self.assertEqual(d_state["segments"][3], [7680, 10239, 1024])
+            # Reprise : seule la partie manquante est demandée
+            o_server.headers = []
+            FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000).download(hashlib.md5(self.content).hexdigest())
+            self.assertEqual(p_file.read_bytes(), self.content)
+            self.assertListEqual(o_server.headers, [{"Range": "bytes=8704-10239", "If-Range": '"v1"'}])
+            self.assertListEqual(list(Path(s_dir).iterdir()), [p_file])
+
+            # Fichier modifié côté serveur entre les deux téléchargements : nouveau téléchargement complet
+            p_file.unlink()
+            o_server.cuts[7680] = 1024
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000).download()
+            o_server.content = self.content[::-1]
+            o_server.etag = '"v2"'
+            o_server.headers = []
+            FileDownloader(o_server.request, p_file, 512, nb_segments=4, segment_min_size=1000).download(hashlib.md5(self.content[::-1]).hexdigest())
+            self.assertEqual(p_file.read_bytes(), self.content[::-1])
+            self.assertEqual(o_server.headers[1], {"Range": "bytes=0-"})
+            self.assertListEqual(list(Path(s_dir).iterdir()), [p_file])
@@ -0,0 +1,180 @@
+import threading
+import time
+from typing import List
+from unittest.mock import PropertyMock, patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import InternalServerError
+from sdk_entrepot_gpf.io.HedgePolicy import HedgePolicy
+from sdk_entrepot_gpf.io.Metrics import Metrics
+from tests.GpfTestCase import GpfTestCase
+
+
+class HedgePolicyTestCase(GpfTestCase):
+    """Tests HedgePolicy class.
+
+    cmd : python3 -m unittest -b tests.io.HedgePolicyTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe"""
+        Metrics().reset()
+
+    @staticmethod
+    def record(route_name: str, nb_calls: int, seconds: float = 0.01) -> None:
+        """Enregistre des durées de requêtes pour une route."""
+        for _ in range(nb_calls):
+            Metrics().record(route_name, "GET", seconds)
+
+    def test_from_config(self) -> None:
+        """Les requêtes couvertes sont désactivées par défaut."""
+        self.assertIsNone(HedgePolicy.from_config())
+
+    def test_delay(self) -> None:
+        """Le délai est le percentile observé de la route, une fois assez de durées mesurées."""
+        o_policy = HedgePolicy(["*_get", "*_list"], 0.95, 0.05, 20, 0.05)
+        self.assertTrue(o_policy.is_hedged("datastore_get"))
+        self.assertFalse(o_policy.is_hedged("datastore_create"))
+        self.assertFalse(o_policy.is_hedged(None))
+        # Pas assez de durées mesurées
+        HedgePolicyTestCase.record("datastore_get", 19, 0.2)
+        self.assertIsNone(o_policy.delay("datastore_get", "GET"))
+        HedgePolicyTestCase.record("datastore_get", 1, 0.2)
+        f_delay = o_policy.delay("datastore_get", "GET")
+        assert f_delay is not None
+        self.assertTrue(0.1 < f_delay <= 0.2, f_delay)
+        # Délai minimal
+        HedgePolicyTestCase.record("upload_list", 20, 0.001)
+        self.assertEqual(o_policy.delay("upload_list", "GET"), 0.05)
+        # Route non concernée
+        HedgePolicyTestCase.record("upload_create", 20)
+        self.assertIsNone(o_policy.delay("upload_create", "GET"))
+
+    def test_delay_without_metrics(self) -> None:
+        """Sans métriques, le délai fixe est utilisé ; sans délai fixe, aucune requête n'est couverte et c'est signalé."""
+        with patch.object(Metrics, "enabled", new_callable=PropertyMock, return_value=False), patch.object(Config().om, "warning") as o_mock_warning:
+            o_policy = HedgePolicy(["*_get"], min_delay=0.05)
+            o_mock_warning.assert_called_once()
+            self.assertIn("aucune requête ne sera couverte", o_mock_warning.call_args.args[0])
+            self.assertIsNone(o_policy.delay("datastore_get", "GET"))
+            o_mock_warning.reset_mock()
+            o_policy = HedgePolicy(["*_get"], min_delay=0.05, fallback_delay=0.5)
+            o_mock_warning.assert_called_once()
+            self.assertEqual(o_policy.delay("datastore_get", "GET"), 0.5)
+            self.assertIsNone(o_policy.delay("datastore_create", "GET"))
+            self.assertEqual(HedgePolicy(["*_get"], min_delay=0.05, fallback_delay=0.01).delay("datastore_get", "GET"), 0.05)
+        # Avec métriques : pas d'avertissement
+        with patch.object(Config().om, "warning") as o_mock_warning:
+            HedgePolicy(["*_get"])
+            o_mock_warning.assert_not_called()
+
+    def test_run(self) -> None:
+        """Une requête lente est doublée, la première réponse reçue est utilisée."""
+        HedgePolicyTestCase.record("test_get", 20)
+        o_policy = HedgePolicy(["test_get"], max_extra=1, min_samples=20)
+        o_release = threading.Event()
+        l_calls: List[str] = []
+
+        # Requête rapide : pas de requête supplémentaire
+        self.assertEqual(o_policy.run("test_get", "GET", lambda: "rapide"), "rapide")
+
+        def slow() -> str:
+            l_calls.append("slow")
+            o_release.wait(5)
+            return "lente"
+
+        def hedge() -> str:
+            l_calls.append("hedge")
+            return "supplémentaire"
+
+        l_discarded: List[str] = []
+        o_discarded = threading.Event()
+
+        def discard(s_result: str) -> None:
+            l_discarded.append(s_result)
+            o_discarded.set()
+
+        self.assertEqual(o_policy.run("test_get", "GET", slow, hedge, discard), "supplémentaire")
+        self.assertListEqual(l_discarded, [])
+        o_release.set()
+        self.assertListEqual(l_calls, ["slow", "hedge"])
+        # Le résultat de la requête perdante est libéré dès sa réception
+        o_discarded.wait(5)
+        self.assertListEqual(l_discarded, ["lente"])
+        d_metrics = Metrics().get("test_get", "GET")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_hedged"], 1)
+        self.assertEqual(d_metrics["nb_hedge_wins"], 1)
+
+    def test_run_error(self) -> None:
+        """Si la première requête terminée échoue, la réponse de l'autre est attendue ; si les deux échouent, l'erreur est levée."""
+        HedgePolicyTestCase.record("test_get", 20)
+        o_policy = HedgePolicy(["test_get"], max_extra=1, min_samples=20)
+
+        def error() -> str:
+            time.sleep(0.1)
+            raise InternalServerError("url", "GET", None, None)
+
+        def hedge() -> str:
+            time.sleep(0.2)
+            return "supplémentaire"
+
+        self.assertEqual(o_policy.run("test_get", "GET", error, hedge), "supplémentaire")
+        with self.assertRaises(InternalServerError):
+            o_policy.run("test_get", "GET", error)
+        d_metrics = Metrics().get("test_get", "GET")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_hedged"], 2)
+        self.assertEqual(d_metrics["nb_hedge_wins"], 1)
+
+    def test_run_budget(self) -> None:
+        """Le nombre de requêtes supplémentaires est plafonné, les requêtes non couvertes sont exécutées directement."""
+        HedgePolicyTestCase.record("test_get", 20)
+        o_policy = HedgePolicy(["test_get"], max_extra=0.25, min_samples=20)
+        l_threads: List[str] = []
+        l_calls: List[str] = []
+
+        def slow() -> str:
+            l_threads.append(threading.current_thread().name)
+            time.sleep(0.05)
+            return "lente"
+
+        def hedge() -> str:
+            l_calls.append("hedge")
+            return "supplémentaire"
+
+        l_results = [o_policy.run("test_get", "GET", slow, hedge) for _ in range(8)]
+        # 25 % de 8 requêtes : 2 requêtes supplémentaires au plus
+        self.assertEqual(len(l_calls), 2)
+        self.assertEqual(l_results.count("supplémentaire"), 2)
+        # Les 3 premières requêtes (budget insuffisant) sont exécutées dans le thread appelant
+        self.assertListEqual(l_threads[:3], [threading.current_thread().name] * 3)
+        # La 4e dans le pool de threads de la politique
+        self.assertTrue(l_threads[3].startswith("sdk_entrepot_gpf_hedged_request"), l_threads)
+        o_policy.close()
+
+    def test_run_workers(self) -> None:
+        """Les requêtes couvertes partagent un pool de threads borné : s'il est occupé, la requête est exécutée directement."""
+        HedgePolicyTestCase.record("test_get", 20)
+        o_policy = HedgePolicy(["test_get"], max_extra=1, min_samples=20, max_workers=2)
+        o_release = threading.Event()
+        l_threads: List[str] = []
+        l_results: List[str] = []
+
+        def slow() -> str:
+            l_threads.append(threading.current_thread().name)
+            o_release.wait(5)
+            return "lente"
+
+        # Requête lente doublée : les 2 threads du pool sont occupés
+        o_thread = threading.Thread(target=lambda: l_results.append(o_policy.run("test_get", "GET", slow)))
+        o_thread.start()
+        while len(l_threads) < 2:
+            time.sleep(0.001)
+        # Pool occupé : requête exécutée dans le thread appelant, sans couverture
+        self.assertEqual(o_policy.run("test_get", "GET", lambda: "rapide"), "rapide")
+        o_release.set()
+        o_thread.join()
+        self.assertListEqual(l_results, ["lente"])
+        self.assertTrue(all(s_name.startswith("sdk_entrepot_gpf_hedged_request") for s_name in l_threads), l_threads)
+        o_policy.close()
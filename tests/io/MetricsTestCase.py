@@ -0,0 +1,101 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import requests_mock
+
+from sdk_entrepot_gpf.auth.Authentifier import Authentifier
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Errors import InternalServerError
+from sdk_entrepot_gpf.io.Metrics import LatencyHistogram, Metrics
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class MetricsTestCase(GpfTestCase):
+    """Tests Metrics class.
+
+    cmd : python3 -m unittest -b tests.io.MetricsTestCase
+    """
+
+    def setUp(self) -> None:
+        Metrics().reset()
+
+    def test_histogram(self) -> None:
+        """Estimation des percentiles par intervalle."""
+        o_histogram = LatencyHistogram()
+        self.assertIsNone(o_histogram.percentile(0.5))
+        for _ in range(90):
+            o_histogram.add(0.02)
+        for _ in range(10):
+            o_histogram.add(4.0)
+        self.assertEqual(o_histogram.count, 100)
+        self.assertAlmostEqual(o_histogram.sum, 41.8)
+        # p50 : dans l'intervalle ]0.01, 0.025] (borné par la durée maximale observée)
+        f_p50 = o_histogram.percentile(0.5)
+        assert f_p50 is not None
+        self.assertTrue(0.01 < f_p50 <= 0.025)
+        # p95 et p99 : dans l'intervalle ]2.5, 5] borné par la durée maximale (4)
+        f_p99 = o_histogram.percentile(0.99)
+        assert f_p99 is not None
+        self.assertTrue(2.5 < f_p99 <= 4.0)
+        self.assertEqual(o_histogram.buckets()[2], (0.025, 90))
+        self.assertEqual(o_histogram.buckets()[-1][1], 100)
+
+    def test_record(self) -> None:
+        """Enregistrement des tentatives, consultation et export (JSON et Prometheus)."""
+        Metrics().record("datastore_get", "get", 0.1, 0, 2048)
+        Metrics().record("datastore_get", "GET", 0.3, 0, 0, InternalServerError("url", "GET", None, None))
+        Metrics().add_retry("datastore_get", "GET")
+        Metrics().record(None, "POST", 0.2, 10, 20)
+        d_metrics = Metrics().get("datastore_get", "GET")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_calls"], 2)
+        self.assertEqual(d_metrics["nb_retries"], 1)
+        self.assertEqual(d_metrics["bytes_received"], 2048)
+        self.assertDictEqual(d_metrics["nb_errors"], {"InternalServerError": 1})
+        self.assertIsNotNone(Metrics().percentile("datastore_get", "GET", 0.95))
+        self.assertIsNone(Metrics().get("datastore_get", "DELETE"))
+        self.assertListEqual(list(Metrics().to_dict()), ["datastore_get", "url"])
+        # Format texte de Prometheus
+        s_prometheus = Metrics().to_prometheus()
+        self.assertIn('sdk_entrepot_gpf_request_duration_seconds_bucket{route="datastore_get",method="GET",le="+Inf"} 2', s_prometheus)
+        self.assertIn('sdk_entrepot_gpf_request_errors_total{route="datastore_get",method="GET",error="InternalServerError"} 1', s_prometheus)
+        self.assertIn('sdk_entrepot_gpf_request_sent_bytes_total{route="url",method="POST"} 10', s_prometheus)
+        self.assertIn("# TYPE sdk_entrepot_gpf_request_retries_total counter", s_prometheus)
+        # Écriture des fichiers
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_json = Path(s_dir) / "metrics" / "metrics.json"
+            p_prometheus = Path(s_dir) / "sdk.prom"
+            Metrics().dump(p_json, p_prometheus)
+            self.assertEqual(json.loads(p_json.read_text(encoding="utf-8"))["datastore_get"]["GET"]["nb_calls"], 2)
+            self.assertEqual(p_prometheus.read_text(encoding="utf-8"), s_prometheus)
+            self.assertListEqual(sorted(p.name for p in Path(s_dir).iterdir()), ["metrics", "sdk.prom"])
+
+    def test_api_requester(self) -> None:
+        """Les tentatives de l'ApiRequester sont enregistrées par route et méthode."""
+        s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42"
+        with requests_mock.Mocker() as o_mock, patch("time.sleep"), patch.object(Authentifier, "get_http_header", return_value={}):
+            o_mock.post(s_url, [{"status_code": 500}, {"json": {"_id": "42"}}])
+            ApiRequester().url_request(s_url, ApiRequester.POST, data={"k": "v"}, route_name="test_create")
+        d_metrics = Metrics().get("test_create", "POST")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_calls"], 2)
+        self.assertEqual(d_metrics["nb_retries"], 1)
+        self.assertDictEqual(d_metrics["nb_errors"], {"InternalServerError": 1})
+        self.assertEqual(d_metrics["bytes_sent"], 2 * len(b'{"k":"v"}'))
+        self.assertEqual(d_metrics["bytes_received"], len(b'{"_id": "42"}'))
+
+    def test_authentifier(self) -> None:
+        """Les récupérations de jeton de l'Authentifier sont enregistrées."""
+        Authentifier._instance = None
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post("https://sso.geopf.fr/realms/geoplateforme/protocol/openid-connect/token", json={"access_token": "jeton", "expires_in": 300})
+            Authentifier().get_access_token_string()
+        d_metrics = Metrics().get(Authentifier.METRICS_ROUTE, "POST")
+        assert d_metrics is not None
+        self.assertEqual(d_metrics["nb_calls"], 1)
+        self.assertGreater(d_metrics["bytes_sent"], 0)
+        Authentifier._instance = None
@@ -0,0 +1,49 @@
+import tempfile
+from typing import IO, List
+
+from sdk_entrepot_gpf.io.MultipartBody import MultipartBody
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
+from tests.GpfTestCase import GpfTestCase
+
+
+class MultipartBodyTestCase(GpfTestCase):
+    """Tests MultipartBody class.
+
+    cmd : python3 -m unittest -b tests.io.MultipartBodyTestCase
+    """
+
+    def test_encoder(self) -> None:
+        """Chaque encodeur renvoie le corps complet (fichier replacé à sa position initiale) et suit l'envoi."""
+        with tempfile.TemporaryFile() as o_file:
+            o_file.write(b"entete" + b"x" * 100000)
+            o_file.seek(6)
+            self.__check_encoder(o_file)
+
+    def __check_encoder(self, o_file: IO[bytes]) -> None:
+        """Vérifie deux tentatives d'envoi successives d'un fichier ouvert."""
+        l_done: List[int] = []
+
+        def callback(o_progress: TransferProgress) -> None:
+            l_done.append(o_progress.done)
+
+        o_body = MultipartBody({"file": ("file.bin", o_file)}, callback)
+        self.assertDictEqual(o_body.files, {"file": ("file.bin", o_file)})
+        l_contents = []
+        for _ in range(2):
+            l_done.clear()
+            o_encoder = o_body.encoder()
+            self.assertTrue(o_encoder.content_type.startswith("multipart/form-data; boundary="))
+            # Lecture par blocs, comme le fait requests
+            b_content = b""
+            b_chunk = o_encoder.read(8192)
+            while b_chunk:
+                b_content += b_chunk
+                b_chunk = o_encoder.read(8192)
+            l_contents.append(b_content)
+            self.assertEqual(b_content.count(b"x" * 100000), 1)
+            self.assertNotIn(b"entete", b_content)
+            # Suivi : repart de zéro à chaque tentative, jusqu'à la taille du corps
+            self.assertGreater(len(l_done), 1)
+            self.assertEqual(l_done[-1], len(b_content))
+            self.assertEqual(o_body.progress.total, len(b_content))
+        self.assertEqual(len(l_contents[0]), len(l_contents[1]))
@@ -0,0 +1,78 @@
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.PageSizePolicy import PageSizePolicy
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class PageSizePolicyTestCase(GpfTestCase):
+    """Tests PageSizePolicy class.
+
+    cmd : python3 -m unittest -b tests.io.PageSizePolicyTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe"""
+        PageSizePolicy._instance = None
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe"""
+        PageSizePolicy._instance = None
+
+    def test_get(self) -> None:
+        """Les listings commencent avec la taille maximale, retenue par route."""
+        self.assertEqual(PageSizePolicy().get("upload_list"), 100)
+        # Maximum appliqué par le serveur
+        self.assertEqual(PageSizePolicy().observe("upload_list", 100, 25, 60), 25)
+        self.assertEqual(PageSizePolicy().get("upload_list"), 25)
+        self.assertEqual(PageSizePolicy().get("stored_data_list"), 100)
+
+    def test_observe(self) -> None:
+        """Un maximum n'est détecté que si des entités restent à lister."""
+        # Dernière page (ou seule page) : pas de maximum
+        self.assertEqual(PageSizePolicy().observe("upload_list", 100, 25, 25), 100)
+        self.assertEqual(PageSizePolicy().observe("upload_list", 100, 0, 0), 100)
+        # Nombre total inconnu
+        self.assertEqual(PageSizePolicy().observe("upload_list", 100, 25, None), 100)
+        self.assertEqual(PageSizePolicy().get("upload_list"), 100)
+
+    def test_reduce(self) -> None:
+        """La taille refusée est divisée par deux, sans descendre sous le minimum, et retenue seulement une fois une page reçue."""
+        self.assertEqual(PageSizePolicy().min_size, 10)
+        self.assertEqual(PageSizePolicy().reduce("upload_list", 100), 50)
+        self.assertEqual(PageSizePolicy().reduce("upload_list", 50), 25)
+        self.assertEqual(PageSizePolicy().reduce("upload_list", 25), 12)
+        self.assertEqual(PageSizePolicy().reduce("upload_list", 12), 10)
+        self.assertIsNone(PageSizePolicy().reduce("upload_list", 10))
+        self.assertEqual(PageSizePolicy().get("upload_list"), 100)
+        self.assertEqual(PageSizePolicy().retain("upload_list", 25), 25)
+        self.assertEqual(PageSizePolicy().get("upload_list"), 25)
+        # Jamais plus grande ni sous le minimum
+        self.assertEqual(PageSizePolicy().retain("upload_list", 50), 25)
+        self.assertEqual(PageSizePolicy().retain("upload_list", 5), 10)
+        self.assertTrue(PageSizePolicy().can_reduce(11))
+        self.assertFalse(PageSizePolicy().can_reduce(10))
+
+    def test_split(self) -> None:
+        """La taille n'est divisée en demi-pages que si c'est possible."""
+        self.assertEqual(PageSizePolicy().split("upload_list", 100), 50)
+        self.assertEqual(PageSizePolicy().get("upload_list"), 100)
+        # Taille impaire ou moitié inférieure au minimum
+        self.assertIsNone(PageSizePolicy().split("upload_list", 25))
+        self.assertIsNone(PageSizePolicy().split("upload_list", 18))
+        self.assertEqual(PageSizePolicy().split("upload_list", 20), 10)
+        self.assertTrue(PageSizePolicy().can_split(20))
+        self.assertFalse(PageSizePolicy().can_split(25))
+        self.assertFalse(PageSizePolicy().can_split(18))
+
+    def test_not_adaptive(self) -> None:
+        """Sans adaptation, la taille fixe `nb_limit` est utilisée."""
+        Config().get_parser().read_dict({"store_api": {"adaptive_nb_limit": "false"}})
+        try:
+            self.assertEqual(PageSizePolicy().get("upload_list"), 10)
+            self.assertEqual(PageSizePolicy().observe("upload_list", 10, 5, 60), 10)
+            self.assertIsNone(PageSizePolicy().reduce("upload_list", 10))
+            self.assertIsNone(PageSizePolicy().split("upload_list", 10))
+            self.assertFalse(PageSizePolicy().can_reduce(100))
+        finally:
+            Config._instance = None
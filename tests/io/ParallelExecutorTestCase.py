@@ -0,0 +1,52 @@
+import threading
+import time
+from typing import List
+
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.ParallelExecutor import ParallelExecutor
+from tests.GpfTestCase import GpfTestCase
+
+
+class ParallelExecutorTestCase(GpfTestCase):
+    """Tests ParallelExecutor class.
+
+    cmd : python3 -m unittest -b tests.io.ParallelExecutorTestCase
+    """
+
+    def test_map(self) -> None:
+        """Les appels sont faits en parallèle dans le contexte de l'appelant, les résultats sont dans l'ordre des éléments."""
+        l_threads: List[str] = []
+
+        def function(i_item: int) -> int:
+            l_threads.append(threading.current_thread().name)
+            # Les premiers éléments sont les plus lents
+            time.sleep(0.01 * (5 - i_item))
+            # Échéance de l'appelant propagée
+            assert Deadline.current() is not None
+            return i_item * 2
+
+        with Deadline(10, "test"):
+            self.assertListEqual(ParallelExecutor.map(function, range(5), 3), [0, 2, 4, 6, 8])
+        self.assertNotIn(threading.current_thread().name, l_threads)
+        self.assertEqual(len(set(l_threads)), 3)
+        # Un seul appel simultané : appels dans le thread courant
+        l_threads.clear()
+        with Deadline(10, "test"):
+            self.assertListEqual(ParallelExecutor.map(function, range(3), 1), [0, 2, 4])
+        self.assertListEqual(l_threads, [threading.current_thread().name] * 3)
+
+    def test_map_error(self) -> None:
+        """La première erreur est levée et les appels pas encore démarrés sont annulés."""
+        l_items: List[int] = []
+
+        def function(i_item: int) -> int:
+            l_items.append(i_item)
+            if i_item == 0:
+                time.sleep(0.05)
+                raise ValueError("erreur")
+            time.sleep(0.05)
+            return i_item
+
+        with self.assertRaises(ValueError):
+            ParallelExecutor.map(function, range(20), 2)
+        self.assertLess(len(l_items), 20)
@@ -0,0 +1,146 @@
+import math
+import threading
+import time
+from typing import List
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError
+from sdk_entrepot_gpf.io.RateLimiter import RateLimiter, TokenBucket
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class RateLimiterTestCase(GpfTestCase):
+    """Tests RateLimiter and TokenBucket classes.
+
+    cmd : python3 -m unittest -b tests.io.RateLimiterTestCase
+    """
+
+    def test_token_bucket_reserve(self) -> None:
+        """Vérifie les réservations : rafale autorisée puis attente proportionnelle à la position dans la file."""
+        with patch("time.monotonic", return_value=100.0):
+            o_bucket = TokenBucket(rate=2, burst=2)
+            # Les 2 premières requêtes partent immédiatement
+            self.assertEqual(o_bucket.reserve(), 0)
+            self.assertEqual(o_bucket.reserve(), 0)
+            # Les suivantes attendent chacune leur tour : 0,5 s, 1 s, 1,5 s
+            self.assertEqual(o_bucket.reserve(), 0.5)
+            self.assertEqual(o_bucket.reserve(), 1)
+            self.assertEqual(o_bucket.reserve(), 1.5)
+        # Les jetons se régénèrent avec le temps (dette de 3 jetons remboursée en 1,5 s)
+        with patch("time.monotonic", return_value=102.0):
+            self.assertEqual(o_bucket.reserve(), 0)
+        # Un seau sans limite ne fait jamais attendre
+        o_unlimited = TokenBucket(rate=0)
+        self.assertTrue(math.isinf(o_unlimited.rate))
+        for _ in range(10):
+            self.assertEqual(o_unlimited.reserve(), 0)
+
+    def test_token_bucket_adaptive(self) -> None:
+        """Vérifie l'adaptation du débit : diminution multiplicative puis augmentation additive plafonnée."""
+        o_bucket = TokenBucket(rate=10, min_rate=1, decrease=0.5, increase=1)
+        o_bucket.slow_down()
+        self.assertEqual(o_bucket.rate, 5)
+        o_bucket.slow_down()
+        o_bucket.slow_down()
+        o_bucket.slow_down()
+        # Débit minimal
+        self.assertEqual(o_bucket.rate, 1)
+        # Augmentation : +increase/rate par requête réussie
+        o_bucket.speed_up()
+        self.assertEqual(o_bucket.rate, 2)
+        for _ in range(1000):
+            o_bucket.speed_up()
+        # Plafond au débit configuré
+        self.assertEqual(o_bucket.rate, 10)
+        # Seau sans limite : limité à une fraction du débit observé
+        o_unlimited = TokenBucket(rate=0, decrease=0.5)
+        with patch("time.monotonic", return_value=100.0):
+            for _ in range(8):
+                o_unlimited.reserve()
+            o_unlimited.slow_down()
+        self.assertEqual(o_unlimited.rate, 4)
+
+    def test_token_bucket_fairness(self) -> None:
+        """Vérifie que des appelants concurrents sont servis dans l'ordre d'arrivée avec le débit demandé."""
+        o_bucket = TokenBucket(rate=50)
+        l_delays: List[float] = []
+        o_lock = threading.Lock()
+
+        def worker() -> None:
+            f_delay = o_bucket.reserve()
+            with o_lock:
+                l_delays.append(f_delay)
+
+        l_threads = [threading.Thread(target=worker) for i in range(10)]
+        for o_thread in l_threads:
+            o_thread.start()
+        for o_thread in l_threads:
+            o_thread.join()
+        # Chaque appelant a un créneau distinct espacé de 1/50 s
+        l_delays.sort()
+        for i in range(1, len(l_delays)):
+            self.assertAlmostEqual(l_delays[i] - l_delays[i - 1], 0.02, delta=0.005)
+
+    def test_rate_limiter(self) -> None:
+        """Vérifie la sélection des seaux (global et famille de routes) et la lecture de la configuration."""
+        Config().get_parser().read_dict(
+            {
+                "rate_limit": {"global_rate": "100", "burst": "1", "min_rate": "1", "adaptive_decrease": "0.5", "adaptive_increase": "0.1"},
+                "rate_limit_routes": {"upload_push_data": "2", "*_list": "10"},
+            }
+        )
+        try:
+            o_limiter = RateLimiter.from_config()
+        finally:
+            Config._instance = None
+        o_global = o_limiter._RateLimiter__global  # type: ignore
+        l_families = o_limiter._RateLimiter__families  # type: ignore
+        self.assertEqual(o_global.rate, 100)
+        self.assertListEqual([s_pattern for s_pattern, _o_bucket in l_families], ["upload_push_data", "*_list"])
+        # Ralentissement sur une route d'une famille : seau global et seau de la famille
+        o_limiter.slow_down("upload_list")
+        self.assertEqual(o_global.rate, 50)
+        self.assertEqual(l_families[1][1].rate, 5)
+        self.assertEqual(l_families[0][1].rate, 2)
+        # Route hors famille ou requête directe : seau global seulement
+        o_limiter.slow_down("upload_get")
+        o_limiter.slow_down()
+        self.assertEqual(o_global.rate, 12.5)
+        self.assertEqual(l_families[1][1].rate, 5)
+        o_limiter.speed_up("upload_list")
+        self.assertEqual(l_families[1][1].rate, 5.02)
+        # Attente effective (limite de la famille à 2 requêtes/s)
+        o_limiter = RateLimiter(TokenBucket(0), [("upload_push_data", TokenBucket(2))])
+        with patch("time.sleep", return_value=None) as o_mock_sleep:
+            self.assertEqual(o_limiter.acquire("upload_push_data"), 0)
+            f_delay = o_limiter.acquire("upload_push_data")
+        self.assertAlmostEqual(f_delay, 0.5, delta=0.01)
+        o_mock_sleep.assert_called_once_with(f_delay)
+        # Pas de configuration : pas de limite
+        o_limiter = RateLimiter.from_config()
+        f_start = time.perf_counter()
+        for _ in range(100):
+            o_limiter.acquire("upload_list")
+        self.assertLess(time.perf_counter() - f_start, 0.5)
+
+    def test_rate_limiter_deadline(self) -> None:
+        """Vérifie que l'attente d'un jeton ne dépasse pas l'échéance de l'opération en cours : échéance levée sans attendre et jeton rendu."""
+        o_bucket = TokenBucket(0.1)
+        o_limiter = RateLimiter(o_bucket)
+        with patch("time.sleep", return_value=None) as o_mock_sleep:
+            self.assertEqual(o_limiter.acquire(), 0)
+            # Prochain jeton dans 10 s : au-delà de l'échéance
+            with Deadline(5, "liste"):
+                with self.assertRaises(DeadlineExceededError) as o_arc:
+                    o_limiter.acquire()
+            self.assertIn("liste", o_arc.exception.message)
+            o_mock_sleep.assert_not_called()
+            # Le jeton a été rendu : l'attente suivante n'est pas allongée
+            with Deadline(30):
+                f_delay = o_limiter.acquire()
+            self.assertAlmostEqual(f_delay, 10, delta=0.1)
+            o_mock_sleep.assert_called_once_with(f_delay)
@@ -0,0 +1,188 @@
+import json
+import os
+from pathlib import Path
+import tempfile
+from unittest.mock import patch
+import requests
+
+from sdk_entrepot_gpf.io.ResponseCache import CachedResponse, DiskCacheBackend, MemoryCacheBackend, ResponseCache
+from tests.GpfTestCase import GpfTestCase
+
+
+class ResponseCacheTestCase(GpfTestCase):
+    """Tests ResponseCache and CachedResponse classes.
+
+    cmd : python3 -m unittest -b tests.io.ResponseCacheTestCase
+    """
+
+    url = "https://api.test.io/datastores/1/uploads/1"
+
+    def test_cached_response(self) -> None:
+        """Vérifie la conversion depuis et vers une réponse HTTP, les validateurs et la revalidation."""
+        o_response = requests.Response()
+        o_response.status_code = 200
+        o_response.headers["ETag"] = '"v1"'
+        o_response.headers["Last-Modified"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        o_response._content = b'{"key": "value"}'  # pylint:disable=protected-access
+        o_cached = CachedResponse.from_response(self.url, o_response)
+        self.assertDictEqual(o_cached.validators(), {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        # Une nouvelle réponse est construite à chaque fois
+        o_new_response = o_cached.to_response()
+        self.assertIsNot(o_new_response, o_cached.to_response())
+        self.assertDictEqual(o_new_response.json(), {"key": "value"})
+        self.assertEqual(o_new_response.headers["etag"], '"v1"')
+        # Revalidation : mise à jour de la date et des validateurs renvoyés
+        with patch("time.time", return_value=o_cached.stored_at + 10):
+            o_cached.revalidate({"ETag": '"v2"'})
+            self.assertEqual(o_cached.age, 0)
+        self.assertEqual(o_cached.validators()["If-None-Match"], '"v2"')
+        # Réponse sans validateur
+        self.assertDictEqual(CachedResponse(self.url, 200, {}, b"", None).validators(), {})
+
+    def test_key_and_routes(self) -> None:
+        """Vérifie la clef de cache (paramètres triés) et la sélection des routes."""
+        self.assertEqual(ResponseCache.key(self.url), self.url)
+        self.assertEqual(ResponseCache.key(self.url, {"b": 2, "a": ["x", "y"]}), f"{self.url}?a=x&a=y&b=2")
+        o_cache = ResponseCache(conditional_routes=["*_get", "user_me"])
+        self.assertTrue(o_cache.is_cacheable("upload_get"))
+        self.assertTrue(o_cache.is_cacheable("user_me"))
+        self.assertFalse(o_cache.is_cacheable("upload_list"))
+        self.assertFalse(o_cache.is_cacheable(None))
+
+    def test_route_ttl(self) -> None:
+        """Vérifie les durées de vie par route : première durée correspondante, puis routes revalidées systématiquement."""
+        o_cache = ResponseCache(conditional_routes=["*_get"], route_ttls=[("processing_get", 300), ("tms_*", 3600)])
+        self.assertEqual(o_cache.route_ttl("processing_get"), 300)
+        self.assertEqual(o_cache.route_ttl("tms_list"), 3600)
+        self.assertEqual(o_cache.route_ttl("upload_get"), 0)
+        self.assertIsNone(o_cache.route_ttl("upload_list"))
+        self.assertIsNone(o_cache.route_ttl(None))
+        # Une réponse avec validateur est réutilisée pendant la durée de vie de la route, puis revalidée
+        o_cached = CachedResponse(self.url, 200, {"ETag": '"v1"'}, b"{}", None, stored_at=100.0)
+        with patch("time.time", return_value=350.0):
+            self.assertTrue(o_cache.is_fresh(o_cached, "processing_get"))
+            self.assertFalse(o_cache.is_fresh(o_cached, "upload_get"))
+        with patch("time.time", return_value=450.0):
+            self.assertFalse(o_cache.is_fresh(o_cached, "processing_get"))
+
+    def test_ttl(self) -> None:
+        """Vérifie la réutilisation sans requête des réponses sans validateur."""
+        o_cached = CachedResponse(self.url, 200, {}, b"{}", None, stored_at=100.0)
+        # Sans durée de réutilisation, les réponses sans validateur ne sont pas stockées
+        o_cache = ResponseCache(conditional_routes=["*_get"], conditional_ttl=0)
+        o_cache.put("key", o_cached, "upload_get")
+        self.assertIsNone(o_cache.get("key"))
+        # Avec une durée de réutilisation, elles le sont et restent fraîches pendant cette durée
+        o_cache = ResponseCache(conditional_routes=["*_get"], conditional_ttl=1)
+        o_cache.put("key", o_cached, "upload_get")
+        self.assertIs(o_cache.get("key"), o_cached)
+        with patch("time.time", return_value=100.5):
+            self.assertTrue(o_cache.is_fresh(o_cached, "upload_get"))
+        with patch("time.time", return_value=101.5):
+            self.assertFalse(o_cache.is_fresh(o_cached, "upload_get"))
+        # Une réponse avec validateur est toujours revalidée
+        self.assertFalse(o_cache.is_fresh(CachedResponse(self.url, 200, {"ETag": '"v1"'}, b"{}", None), "upload_get"))
+
+    def test_memory_backend(self) -> None:
+        """Vérifie l'éviction de la réponse la moins récemment utilisée."""
+        o_backend = MemoryCacheBackend(max_entries=2)
+        for s_key in ["a", "b"]:
+            o_backend.put(s_key, CachedResponse(f"{self.url}/{s_key}", 200, {"ETag": s_key}, b"", None))
+        # Utilisation de "a" : c'est "b" qui sera évincée
+        self.assertIsNotNone(o_backend.get("a"))
+        o_backend.put("c", CachedResponse(f"{self.url}/c", 200, {"ETag": "c"}, b"", None))
+        self.assertEqual(len(o_backend), 2)
+        self.assertIsNone(o_backend.get("b"))
+        self.assertIsNotNone(o_backend.get("a"))
+        self.assertIsNotNone(o_backend.get("c"))
+        o_backend.clear()
+        self.assertEqual(len(o_backend), 0)
+
+    def test_disk_backend(self) -> None:
+        """Vérifie le stockage sur disque : persistance entre instances, espace de nom, éviction et invalidation."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_dir = Path(s_dir) / "cache"
+            o_backend = DiskCacheBackend(p_dir, max_entries=2, namespace="user_1")
+            o_cached = CachedResponse(self.url, 200, {"ETag": '"v1"'}, b'{"key": "value"}', "utf-8", stored_at=100.0)
+            o_backend.put("a", o_cached)
+            # Une autre instance (autre exécution) retrouve la réponse...
+            o_read = DiskCacheBackend(p_dir, max_entries=2, namespace="user_1").get("a")
+            assert o_read is not None
+            self.assertEqual(o_read.url, self.url)
+            self.assertEqual(o_read.content, o_cached.content)
+            self.assertEqual(o_read.encoding, "utf-8")
+            self.assertEqual(o_read.stored_at, 100.0)
+            self.assertDictEqual(o_read.validators(), {"If-None-Match": '"v1"'})
+            # ... mais pas pour un autre utilisateur
+            self.assertIsNone(DiskCacheBackend(p_dir, namespace="user_2").get("a"))
+            # Éviction de la moins récemment utilisée
+            o_backend.put("b", CachedResponse(f"{self.url}/b", 200, {}, b"", None))
+            for p_meta in p_dir.glob("*.json"):
+                i_time = 0 if json.loads(p_meta.read_text(encoding="utf-8"))["key"] == "b" else 1
+                os.utime(p_meta, (i_time, i_time))
+            o_backend.put("c", CachedResponse("https://api.test.io/other", 200, {}, b"", None))
+            self.assertEqual(len(o_backend), 2)
+            self.assertIsNone(o_backend.get("b"))
+            self.assertEqual(len(list(p_dir.glob("*.bin"))), 2)
+            # Invalidation
+            o_backend.invalidate(self.url)
+            self.assertIsNone(o_backend.get("a"))
+            self.assertIsNotNone(o_backend.get("c"))
+            o_backend.clear()
+            self.assertEqual(len(o_backend), 0)
+
+    def test_disk_backend_invalidate(self) -> None:
+        """Vérifie que l'invalidation passe par l'index de l'espace de nom, sans lire les métadonnées ni toucher aux autres espaces de nom."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_dir = Path(s_dir) / "cache"
+            o_backend_1 = DiskCacheBackend(p_dir, namespace="user_1")
+            o_backend_2 = DiskCacheBackend(p_dir, namespace="user_2")
+            o_backend_1.put("a", CachedResponse(self.url, 200, {}, b"", None))
+            o_backend_1.put("b", CachedResponse("https://api.test.io/other", 200, {}, b"", None))
+            o_backend_2.put("a", CachedResponse(self.url, 200, {}, b"", None))
+            # L'index n'est pas compté comme une réponse
+            self.assertEqual(len(list(p_dir.glob("*.idx"))), 2)
+            self.assertEqual(len(o_backend_1), 3)
+            with patch.object(Path, "read_text", side_effect=Path.read_text, autospec=True) as o_mock_read:
+                # Autre instance (autre exécution) : l'index est relu depuis le disque
+                DiskCacheBackend(p_dir, namespace="user_1").invalidate(self.url)
+            self.assertListEqual([o_call.args[0].suffix for o_call in o_mock_read.call_args_list], [".idx"])
+            self.assertIsNone(o_backend_1.get("a"))
+            self.assertIsNotNone(o_backend_1.get("b"))
+            self.assertIsNotNone(o_backend_2.get("a"))
+            # Url sans réponse : rien à faire
+            o_backend_1.invalidate(self.url)
+            self.assertIsNotNone(o_backend_2.get("a"))
+            o_backend_1.clear()
+            self.assertEqual(len(list(p_dir.glob("*.idx"))), 0)
+
+    def test_backends(self) -> None:
+        """Vérifie l'utilisation de plusieurs niveaux : écriture dans tous les niveaux, remontée des réponses lues dans un niveau lent."""
+        o_memory = MemoryCacheBackend()
+        o_slow = MemoryCacheBackend()
+        o_cache = ResponseCache([o_memory, o_slow], conditional_routes=["*_get"])
+        o_cached = CachedResponse(self.url, 200, {"ETag": '"v1"'}, b"{}", None)
+        o_cache.put("key", o_cached, "upload_get")
+        self.assertEqual((len(o_memory), len(o_slow)), (1, 1))
+        o_memory.clear()
+        self.assertIs(o_cache.get("key"), o_cached)
+        self.assertIs(o_memory.get("key"), o_cached)
+        o_cache.clear()
+        self.assertEqual((len(o_memory), len(o_slow)), (0, 0))
+
+    def test_invalidate(self) -> None:
+        """Vérifie l'invalidation des réponses liées à une ressource modifiée."""
+        o_cache = ResponseCache(conditional_routes=["*"])
+        d_urls = {
+            "upload": self.url,
+            "upload_params": self.url,
+            "parent": "https://api.test.io/datastores/1",
+            "tags": f"{self.url}/tags",
+            "other": "https://api.test.io/datastores/1/uploads/10",
+        }
+        for s_key, s_url in d_urls.items():
+            o_cache.put(s_key, CachedResponse(s_url, 200, {"ETag": s_key}, b"", None), "upload_get")
+        # Modification de l'upload : l'upload (quels que soient les paramètres), son parent et ses sous-ressources sont invalidés
+        o_cache.invalidate(self.url + "/")
+        self.assertEqual(len(o_cache), 1)
+        self.assertIsNotNone(o_cache.get("other"))
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+import requests
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import InternalServerError, NotAuthorizedError, StatusCodeError
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class RetryPolicyTestCase(GpfTestCase):
+    """Tests RetryPolicy class.
+
+    cmd : python3 -m unittest -b tests.io.RetryPolicyTestCase
+    """
+
+    @staticmethod
+    def status_code_error(status_code: int, retry_after: str = "") -> StatusCodeError:
+        """Instancie une StatusCodeError avec éventuellement un en-tête Retry-After."""
+        return StatusCodeError("url", "GET", None, None, status_code, "", {"Retry-After": retry_after} if retry_after else None)
+
+    def test_category(self) -> None:
+        """Vérifie le classement des erreurs par catégorie."""
+        self.assertEqual(RetryPolicy.category(self.status_code_error(429)), RetryPolicy.THROTTLING)
+        self.assertEqual(RetryPolicy.category(self.status_code_error(503)), RetryPolicy.THROTTLING)
+        self.assertEqual(RetryPolicy.category(self.status_code_error(502)), RetryPolicy.SERVER_ERROR)
+        self.assertEqual(RetryPolicy.category(InternalServerError("url", "GET", None, None)), RetryPolicy.SERVER_ERROR)
+        self.assertEqual(RetryPolicy.category(NotAuthorizedError("url", "GET", None, None, "")), RetryPolicy.CLIENT_ERROR)
+        self.assertEqual(RetryPolicy.category(self.status_code_error(418)), RetryPolicy.CLIENT_ERROR)
+        self.assertEqual(RetryPolicy.category(requests.ConnectionError()), RetryPolicy.NETWORK)
+        self.assertEqual(RetryPolicy.category(ValueError()), RetryPolicy.SERVER_ERROR)
+        # Erreur HTTP avec réponse (cas de l'authentification)
+        o_response = GpfTestCase.get_response(status_code=503)
+        self.assertEqual(RetryPolicy.category(requests.HTTPError(response=o_response)), RetryPolicy.THROTTLING)
+
+    def test_retry_after(self) -> None:
+        """Vérifie la lecture de l'en-tête Retry-After."""
+        # En secondes
+        self.assertEqual(RetryPolicy.retry_after(self.status_code_error(429, "12")), 12)
+        # En date HTTP
+        s_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+        f_delay = RetryPolicy.retry_after(self.status_code_error(503, s_date))
+        assert f_delay is not None
+        self.assertTrue(50 < f_delay <= 60)
+        # Date passée : pas d'attente
+        s_date = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=60), usegmt=True)
+        self.assertEqual(RetryPolicy.retry_after(self.status_code_error(503, s_date)), 0)
+        # Non parsable, absent ou code non concerné
+        self.assertIsNone(RetryPolicy.retry_after(self.status_code_error(429, "demain")))
+        self.assertIsNone(RetryPolicy.retry_after(self.status_code_error(429)))
+        self.assertIsNone(RetryPolicy.retry_after(self.status_code_error(502, "12")))
+        # Erreur HTTP avec réponse
+        o_response = GpfTestCase.get_response(status_code=429, headers={"Retry-After": "3"})
+        self.assertEqual(RetryPolicy.retry_after(requests.HTTPError(response=o_response)), 3)
+
+    def test_backoff(self) -> None:
+        """Vérifie l'attente exponentielle avec gigue totale."""
+        o_policy = RetryPolicy(10, 1, 5)
+        with patch("random.uniform", side_effect=lambda a, b: b) as o_mock_uniform:
+            self.assertEqual(o_policy.backoff(0), 1)
+            self.assertEqual(o_policy.backoff(1), 2)
+            self.assertEqual(o_policy.backoff(2), 4)
+            # Plafond
+            self.assertEqual(o_policy.backoff(3), 5)
+            # Gigue totale : tirage entre 0 et le plafond
+            o_mock_uniform.assert_called_with(0, 5)
+        # Sans plafond
+        with patch("random.uniform", side_effect=lambda a, b: b):
+            self.assertEqual(RetryPolicy(10, 1, 0).backoff(5), 32)
+
+    def test_next_delay(self) -> None:
+        """Vérifie les décisions de nouvelle tentative : nombre de tentatives, budget, Retry-After et statistiques."""
+        o_policy = RetryPolicy(4, 1, 30, budgets={RetryPolicy.CLIENT_ERROR: 1})
+        o_attempts = o_policy.start()
+        with patch("random.uniform", side_effect=lambda a, b: b):
+            # Erreur serveur : attente exponentielle
+            self.assertEqual(o_attempts.next_delay(InternalServerError("url", "GET", None, None)), 1)
+            # Retry-After respecté
+            self.assertEqual(o_attempts.next_delay(self.status_code_error(429, "7")), 7)
+            self.assertEqual(o_attempts.next_delay(self.status_code_error(401)), 4)
+            self.assertEqual(o_attempts.nb_attempts, 4)
+            # Nombre total de tentatives atteint
+            self.assertIsNone(o_attempts.next_delay(InternalServerError("url", "GET", None, None)))
+            # Budget client_error atteint : une seule nouvelle tentative par appel
+            o_other_attempts = o_policy.start()
+            self.assertEqual(o_other_attempts.next_delay(self.status_code_error(403)), 1)
+            self.assertIsNone(o_other_attempts.next_delay(self.status_code_error(401)))
+        # Statistiques
+        d_stats = o_policy.stats.to_dict()
+        self.assertEqual(d_stats["nb_retries"], 4)
+        self.assertDictEqual(d_stats["nb_retries_by_category"], {RetryPolicy.SERVER_ERROR: 1, RetryPolicy.THROTTLING: 1, RetryPolicy.CLIENT_ERROR: 2})
+        self.assertEqual(d_stats["nb_give_up"], 2)
+        self.assertEqual(d_stats["sec_sleep"], 13)
+        self.assertEqual(o_policy.stats.nb_retries, 4)
+        self.assertEqual(o_policy.stats.sec_sleep, 13)
+        o_policy.stats.reset()
+        self.assertEqual(o_policy.stats.nb_retries, 0)
+
+    def test_deadline(self) -> None:
+        """Vérifie l'abandon si le délai total de l'appel est dépassé."""
+        o_attempts = RetryPolicy(10, 0, 0, sec_deadline=5).start()
+        self.assertIsNone(o_attempts.next_delay(self.status_code_error(429, "6")))
+        o_attempts = RetryPolicy(10, 0, 0, sec_deadline=5).start()
+        self.assertEqual(o_attempts.next_delay(self.status_code_error(429, "4")), 4)
+
+    def test_from_config(self) -> None:
+        """Vérifie la lecture de la configuration avec repli sur la section store_api."""
+        Config().get_parser().read_dict(
+            {
+                "store_api": {"nb_attempts": "3", "sec_between_attempt": "0.5", "sec_max_between_attempt": "8", "sec_retry_deadline": "60", "retry_budget_network": "1"},
+                "test_retry": {"nb_attempts": "2", "retry_budget_network": "", "retry_budget_throttling": "4"},
+            }
+        )
+        try:
+            o_policy = RetryPolicy.from_config("store_api")
+            self.assertEqual(o_policy.nb_attempts, 3)
+            self.assertEqual(o_policy.sec_deadline, 60)
+            self.assertEqual(o_policy.budget(RetryPolicy.NETWORK), 1)
+            self.assertEqual(o_policy.budget(RetryPolicy.CLIENT_ERROR), 2)
+            self.assertIsNone(o_policy.budget(RetryPolicy.THROTTLING))
+            with patch("random.uniform", side_effect=lambda a, b: b):
+                self.assertEqual(o_policy.backoff(10), 8)
+            # Section spécifique : surcharge, repli sur store_api et surcharge du nombre de tentatives
+            o_policy = RetryPolicy.from_config("test_retry")
+            self.assertEqual(o_policy.nb_attempts, 2)
+            self.assertEqual(o_policy.sec_deadline, 60)
+            self.assertIsNone(o_policy.budget(RetryPolicy.NETWORK))
+            self.assertEqual(o_policy.budget(RetryPolicy.THROTTLING), 4)
+            self.assertEqual(RetryPolicy.from_config("test_retry", nb_attempts=7).nb_attempts, 7)
+        finally:
+            Config._instance = None
@@ -0,0 +1,80 @@
+import configparser
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.RouteTable import Route, RouteTable
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class RouteTableTestCase(GpfTestCase):
+    """Tests RouteTable and Route classes.
+
+    cmd : python3 -m unittest -b tests.io.RouteTableTestCase
+    """
+
+    def setUp(self) -> None:
+        # On détruit le singleton Config
+        Config._instance = None
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        # On ne garde pas la configuration modifiée pour les autres tests
+        Config._instance = None
+
+    def test_route(self) -> None:
+        """Vérifie le découpage du gabarit et la construction de l'url."""
+        o_route = Route("upload_get", "https://api.test.io/datastores/{datastore}/uploads/{upload}", {"Accept": "application/json"})
+        self.assertEqual(o_route.name, "upload_get")
+        self.assertListEqual(o_route.params, ["datastore", "upload"])
+        self.assertDictEqual(o_route.header, {"Accept": "application/json"})
+        # L'en-tête renvoyé est une copie
+        o_route.header["Accept"] = "text/plain"
+        self.assertDictEqual(o_route.header, {"Accept": "application/json"})
+        # Même résultat que str.format, paramètres en trop ignorés
+        d_params = {"datastore": "ds", "upload": 42, "other": "x"}
+        self.assertEqual(o_route.url(d_params), o_route.template.format(**d_params))
+        # Paramètre manquant : KeyError comme str.format
+        with self.assertRaises(KeyError):
+            o_route.url({"datastore": "ds"})
+        # Gabarit avancé : on passe par str.format
+        o_route = Route("advanced", "https://api.test.io/{a!r}/{b:>3}")
+        self.assertEqual(o_route.url({"a": "x", "b": 1}), "https://api.test.io/'x'/  1")
+        # Pas de paramètre
+        self.assertEqual(Route("static", "https://api.test.io/users/me").url({}), "https://api.test.io/users/me")
+
+    def test_from_config(self) -> None:
+        """Vérifie la construction de la table depuis la configuration : interpolation, en-têtes et erreurs."""
+        Config().get_parser().read_dict(
+            {
+                "routing": {
+                    "test_route": "${store_api:root_url}/test/{id}",
+                    "test_route_header": '{"Accept": "application/xml"}',
+                    "test_invalid": "${store_api:not_existing}/test",
+                }
+            }
+        )
+        o_table = RouteTable.from_config()
+        self.assertEqual(o_table.version, Config().version)
+        o_route = o_table.get("test_route")
+        assert o_route is not None
+        self.assertEqual(o_route.url({"id": 1}), f"{Config().get('store_api', 'root_url')}/test/1")
+        self.assertDictEqual(o_route.header, {"Accept": "application/xml"})
+        # L'en-tête n'est pas une route
+        self.assertIsNone(o_table.get("test_route_header"))
+        # Les routes de la configuration par défaut sont présentes
+        self.assertIsNotNone(o_table.get("upload_get"))
+        self.assertIsNone(o_table.get("not_existing"))
+        # L'erreur d'interpolation n'est levée qu'à l'utilisation de la route concernée
+        with self.assertRaises(configparser.InterpolationError):
+            o_table.get("test_invalid")
+
+    def test_no_config_lookup(self) -> None:
+        """Vérifie que la configuration n'est pas relue tant qu'aucun nouveau fichier n'est lu."""
+        o_table = RouteTable.from_config()
+        with patch.object(Config, "get", side_effect=AssertionError("Config.get ne doit pas être appelé")):
+            o_route = o_table.get("upload_get")
+            assert o_route is not None
+            o_route.url({"datastore": "ds", "upload": "up"})
@@ -0,0 +1,149 @@
+import threading
+import time
+from typing import Any, List
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.Deadline import Deadline
+from sdk_entrepot_gpf.io.Errors import DeadlineExceededError, InternalServerError
+from sdk_entrepot_gpf.io.SingleFlight import SingleFlight
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class SingleFlightTestCase(GpfTestCase):
+    """Tests SingleFlight class.
+
+    cmd : python3 -m unittest -b tests.io.SingleFlightTestCase
+    """
+
+    @staticmethod
+    def wait_followers(single_flight: SingleFlight[Any], key: str, nb_followers: int) -> None:
+        """Attend que des appelants aient rejoint l'appel en cours."""
+        while single_flight._SingleFlight__flights[key].nb_followers < nb_followers:  # type: ignore
+            time.sleep(0.001)
+
+    def test_run(self) -> None:
+        """Les appels simultanés d'une même clef partagent un seul appel, les appels suivants sont à nouveau exécutés."""
+        o_single_flight: SingleFlight[int] = SingleFlight()
+        o_started = threading.Event()
+        o_release = threading.Event()
+        l_calls: List[str] = []
+        l_results: List[Any] = []
+
+        def function() -> int:
+            l_calls.append("call")
+            o_started.set()
+            o_release.wait()
+            return 42
+
+        def call() -> None:
+            l_results.append(o_single_flight.run("key", function))
+
+        o_leader = threading.Thread(target=call)
+        o_leader.start()
+        o_started.wait()
+        l_followers = [threading.Thread(target=call) for _ in range(3)]
+        for o_thread in l_followers:
+            o_thread.start()
+        self.wait_followers(o_single_flight, "key", 3)
+        # Une autre clef n'est pas regroupée
+        self.assertEqual(o_single_flight.run("other", lambda: 1), (1, False))
+        o_release.set()
+        for o_thread in [o_leader, *l_followers]:
+            o_thread.join()
+        self.assertListEqual(l_calls, ["call"])
+        self.assertListEqual(sorted(l_results), [(42, False), (42, True), (42, True), (42, True)])
+        self.assertEqual(len(o_single_flight), 0)
+        # Appel terminé : nouvel appel
+        self.assertEqual(o_single_flight.run("key", function), (42, False))
+        self.assertEqual(len(l_calls), 2)
+
+    def test_run_error(self) -> None:
+        """L'erreur du serveur est propagée à tous les appelants ; un appelant n'attend pas au-delà de son échéance."""
+        o_single_flight: SingleFlight[int] = SingleFlight()
+        o_started = threading.Event()
+        o_release = threading.Event()
+        l_errors: List[BaseException] = []
+
+        def function() -> int:
+            o_started.set()
+            o_release.wait()
+            raise InternalServerError("url", "GET", None, None)
+
+        def call() -> None:
+            try:
+                o_single_flight.run("key", function)
+            except InternalServerError as e_error:
+                l_errors.append(e_error)
+
+        o_leader = threading.Thread(target=call)
+        o_leader.start()
+        o_started.wait()
+        # Échéance dépassée pendant l'attente
+        with Deadline(0.01, "attente"):
+            with self.assertRaises(DeadlineExceededError):
+                o_single_flight.run("key", function)
+        o_follower = threading.Thread(target=call)
+        o_follower.start()
+        self.wait_followers(o_single_flight, "key", 2)
+        o_release.set()
+        o_leader.join()
+        o_follower.join()
+        self.assertEqual(len(l_errors), 2)
+        self.assertIs(l_errors[0], l_errors[1])
+
+    def test_run_leader_error(self) -> None:
+        """Une erreur propre à l'appelant exécutant l'appel n'est pas partagée : un appelant en attente relance l'appel."""
+        o_single_flight: SingleFlight[int] = SingleFlight()
+        o_started = threading.Event()
+        o_release = threading.Event()
+        l_calls: List[str] = []
+        l_results: List[Any] = []
+
+        def leader_function() -> int:
+            l_calls.append("leader")
+            o_started.set()
+            o_release.wait()
+            raise DeadlineExceededError("échéance de l'appelant")
+
+        def follower_function() -> int:
+            l_calls.append("follower")
+            # Les deux autres appelants en attente rejoignent le nouvel appel
+            self.wait_followers(o_single_flight, "key", 2)
+            return 42
+
+        def lead() -> None:
+            with self.assertRaises(DeadlineExceededError):
+                o_single_flight.run("key", leader_function)
+
+        def follow() -> None:
+            l_results.append(o_single_flight.run("key", follower_function))
+
+        o_leader = threading.Thread(target=lead)
+        o_leader.start()
+        o_started.wait()
+        l_followers = [threading.Thread(target=follow) for _ in range(3)]
+        for o_thread in l_followers:
+            o_thread.start()
+        self.wait_followers(o_single_flight, "key", 3)
+        o_release.set()
+        for o_thread in [o_leader, *l_followers]:
+            o_thread.join()
+        # Un seul appelant en attente a relancé l'appel, les autres ont reçu son résultat
+        self.assertListEqual(l_calls, ["leader", "follower"])
+        self.assertListEqual(sorted(l_results), [(42, False), (42, True), (42, True)])
+        self.assertEqual(len(o_single_flight), 0)
+
+    def test_shared_error(self) -> None:
+        """Seules les erreurs du serveur sont partagées."""
+        e_server = InternalServerError("url", "GET", None, None)
+        self.assertTrue(SingleFlight.shared_error(e_server))
+        e_error = GpfSdkError("L'exécution d'une requête a échoué après 3 tentatives.")
+        e_error.__cause__ = e_server
+        self.assertTrue(SingleFlight.shared_error(e_error))
+        e_deadline = DeadlineExceededError("échéance")
+        e_deadline.__cause__ = e_server
+        self.assertFalse(SingleFlight.shared_error(e_deadline))
+        self.assertFalse(SingleFlight.shared_error(GpfSdkError("erreur")))
+        self.assertFalse(SingleFlight.shared_error(ValueError("erreur")))
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.TransferProgress import TransferProgress
+from tests.GpfTestCase import GpfTestCase
+
+
+class TransferProgressTestCase(GpfTestCase):
+    """Tests TransferProgress class.
+
+    cmd : python3 -m unittest -b tests.io.TransferProgressTestCase
+    """
+
+    def test_progress(self) -> None:
+        """Vérifie le suivi : octets transférés, part transférée et débit (hors octets déjà présents)."""
+        with patch("time.monotonic", return_value=100.0):
+            o_progress = TransferProgress(total=4096, done=1024)
+        o_progress.add(2048)
+        self.assertEqual(o_progress.done, 3072)
+        self.assertEqual(o_progress.total, 4096)
+        self.assertEqual(o_progress.ratio, 0.75)
+        with patch("time.monotonic", return_value=102.0):
+            self.assertEqual(o_progress.elapsed, 2.0)
+            self.assertEqual(o_progress.speed, 1024.0)
+            self.assertEqual(str(o_progress), "3.00 KO / 4.00 KO (1.00 KO/s)")
+        # Taille totale inconnue
+        o_progress = TransferProgress()
+        o_progress.add(10)
+        self.assertIsNone(o_progress.ratio)
+        self.assertTrue(str(o_progress).startswith("10 octets ("))
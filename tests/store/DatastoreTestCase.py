@@ -37,6 +37,13 @@ class DatastoreTestCase(GpfTestCase):
                 self.assertEqual(o_entity["name"], DatastoreTestCase.json_request["communities_member"][i - 1]["community"]["name"])
                 self.assertEqual(o_entity["technical_name"], DatastoreTestCase.json_request["communities_member"][i - 1]["community"]["technical_name"])
 
+    def test_api_iter(self) -> None:
+        """Vérifie que api_iter parcourt la liste (non paginée) de api_list."""
+        o_response = GpfTestCase.get_response(json=DatastoreTestCase.json_request)
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            self.assertListEqual([o_entity.id for o_entity in Datastore.api_iter(infos_filter={"name": "ds2"})], ["2"])
+            o_mock_request.assert_called_once_with("user_get")
+
     def test_api_list_filer_name(self) -> None:
         """Vérifie le bon fonctionnement de api_list quand on fait un filtre sur le nom."""
         # On a une réponse renvoyant 2 entités et on ne doit en conserver qu'une
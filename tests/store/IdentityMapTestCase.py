@@ -0,0 +1,177 @@
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import NotFoundError
+from sdk_entrepot_gpf.store.IdentityMap import IdentityMap
+from sdk_entrepot_gpf.store.ProcessingExecution import ProcessingExecution
+from sdk_entrepot_gpf.store.StoredData import StoredData
+from sdk_entrepot_gpf.store.Upload import Upload
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class IdentityMapTestCase(GpfTestCase):
+    """Tests IdentityMap class.
+
+    cmd : python3 -m unittest -b tests.store.IdentityMapTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe"""
+        IdentityMap._instance = None
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe"""
+        IdentityMap._instance = None
+
+    def test_disabled(self) -> None:
+        """Désactivée par défaut : aucune entité n'est retenue."""
+        o_upload = Upload({"_id": "1"}, "datastore")
+        self.assertFalse(IdentityMap().enabled)
+        self.assertIs(IdentityMap().register(o_upload), o_upload)
+        self.assertIsNone(IdentityMap().get(Upload, "1", "datastore"))
+        self.assertEqual(len(IdentityMap()), 0)
+
+    def test_register_get(self) -> None:
+        """Une instance par (datastore, type d'entité, id)."""
+        IdentityMap().enable()
+        o_upload = Upload({"_id": "1"}, "datastore")
+        self.assertIs(IdentityMap().register(o_upload), o_upload)
+        self.assertIs(IdentityMap().get(Upload, "1", "datastore"), o_upload)
+        # L'instance déjà retenue est renvoyée
+        self.assertIs(IdentityMap().register(Upload({"_id": "1"}, "datastore")), o_upload)
+        # Autre datastore, autre type d'entité
+        self.assertIsNone(IdentityMap().get(Upload, "1", "autre_datastore"))
+        self.assertIsNone(IdentityMap().get(StoredData, "1", "datastore"))
+        o_stored_data = StoredData({"_id": "1"}, "datastore")
+        self.assertIs(IdentityMap().register(o_stored_data), o_stored_data)
+        self.assertEqual(len(IdentityMap()), 2)
+
+    def test_default_datastore(self) -> None:
+        """Sans datastore, l'entité est identifiée par le datastore par défaut."""
+        IdentityMap().enable()
+        s_default = Config().get_str("store_api", "datastore")
+        o_upload = IdentityMap().register(Upload({"_id": "1"}))
+        self.assertIs(IdentityMap().get(Upload, "1", s_default), o_upload)
+        self.assertIs(IdentityMap().register(Upload({"_id": "1"}, s_default)), o_upload)
+        o_response = GpfTestCase.get_response(json={"_id": "42"})
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            o_stored_data = StoredData.api_get("42")
+            self.assertIs(StoredData.api_get("42", s_default), o_stored_data)
+        o_mock_request.assert_called_once()
+        # Invalidation via l'autre écriture du datastore
+        IdentityMap().remove(StoredData({"_id": "42"}, s_default))
+        self.assertIsNone(IdentityMap().get(StoredData, "42", fresh=False))
+
+    def test_freshness(self) -> None:
+        """Une entité périmée n'est renvoyée que si la fraîcheur n'est pas demandée."""
+        IdentityMap().enable()
+        o_upload = IdentityMap().register(Upload({"_id": "1"}))
+        with patch("time.monotonic", return_value=1e9):
+            self.assertIsNone(IdentityMap().get(Upload, "1"))
+            self.assertIs(IdentityMap().get(Upload, "1", fresh=False), o_upload)
+            # Nouvelle récupération : l'entité est à nouveau fraîche
+            IdentityMap().register(Upload({"_id": "1"}))
+            self.assertIs(IdentityMap().get(Upload, "1"), o_upload)
+        # Invalidation : entité périmée mais toujours retenue
+        IdentityMap().invalidate(o_upload)
+        self.assertIsNone(IdentityMap().get(Upload, "1"))
+        self.assertIs(IdentityMap().get(Upload, "1", fresh=False), o_upload)
+        # Suppression : entité oubliée
+        IdentityMap().remove(o_upload)
+        self.assertIsNone(IdentityMap().get(Upload, "1", fresh=False))
+
+    def test_lru(self) -> None:
+        """Les entités les moins récemment utilisées sont évincées."""
+        Config().get_parser().read_dict({"identity_map": {"max_entries": "2"}})
+        try:
+            IdentityMap().enable()
+            o_upload_1 = IdentityMap().register(Upload({"_id": "1"}))
+            IdentityMap().register(Upload({"_id": "2"}))
+            # Utilisation de 1 : c'est 2 qui est évincée
+            self.assertIs(IdentityMap().get(Upload, "1"), o_upload_1)
+            IdentityMap().register(Upload({"_id": "3"}))
+            self.assertEqual(len(IdentityMap()), 2)
+            self.assertIsNone(IdentityMap().get(Upload, "2"))
+            self.assertIs(IdentityMap().get(Upload, "1"), o_upload_1)
+        finally:
+            Config._instance = None
+
+    def test_session(self) -> None:
+        """La session active la rétention le temps d'un bloc puis oublie les entités."""
+        with IdentityMap().session() as o_identity_map:
+            self.assertTrue(o_identity_map.enabled)
+            IdentityMap().register(Upload({"_id": "1"}))
+            self.assertEqual(len(IdentityMap()), 1)
+        self.assertFalse(IdentityMap().enabled)
+        self.assertEqual(len(IdentityMap()), 0)
+
+    def test_store_entity(self) -> None:
+        """Utilisation par les fonctions d'API des entités."""
+        o_response_1 = GpfTestCase.get_response(json={"_id": "1", "name": "nom 1", "tags": {"k": "v"}})
+        o_response_2 = GpfTestCase.get_response(json={"_id": "1", "name": "nom 2", "tags": {}})
+        o_response_list = GpfTestCase.get_response(json=[{"_id": "1"}, {"_id": "2"}], headers={"Content-Range": "1-2/2"})
+        with IdentityMap().session():
+            with patch.object(ApiRequester(), "route_request", return_value=o_response_1) as o_mock_request:
+                o_stored_data = StoredData.api_get("1", datastore="datastore")
+                # Entité fraîche : même instance, sans requête
+                self.assertIs(StoredData.api_get("1", datastore="datastore"), o_stored_data)
+                o_mock_request.assert_called_once()
+            # Listing sans changement : instance retenue renvoyée, toujours fraîche
+            with patch.object(ApiRequester(), "route_request", return_value=o_response_list):
+                l_stored_data = StoredData.api_list(datastore="datastore")
+            self.assertIs(l_stored_data[0], o_stored_data)
+            self.assertEqual(o_stored_data["name"], "nom 1")
+            self.assertIs(IdentityMap().get(StoredData, "1", "datastore"), o_stored_data)
+            # Listing avec changement : propriétés listées fusionnées, instance périmée
+            o_response_list = GpfTestCase.get_response(json=[{"_id": "1", "status": "GENERATED"}], headers={"Content-Range": "1-1/1"})
+            with patch.object(ApiRequester(), "route_request", return_value=o_response_list):
+                l_stored_data = list(StoredData.api_iter(datastore="datastore"))
+            self.assertIs(l_stored_data[0], o_stored_data)
+            self.assertEqual(o_stored_data["name"], "nom 1")
+            self.assertEqual(o_stored_data["status"], "GENERATED")
+            self.assertIsNone(IdentityMap().get(StoredData, "1", "datastore"))
+            # Modification des étiquettes : l'entité est récupérée à nouveau, dans la même instance
+            with patch.object(ApiRequester(), "route_request", return_value=o_response_2) as o_mock_request:
+                o_stored_data.api_remove_tags(["k"])
+                self.assertIs(StoredData.api_get("1", datastore="datastore"), o_stored_data)
+                self.assertEqual(o_mock_request.call_count, 2)
+            self.assertEqual(o_stored_data["name"], "nom 2")
+            # api_update d'une autre instance : l'instance retenue est mise à jour
+            o_other = StoredData({"_id": "1"}, "datastore")
+            with patch.object(ApiRequester(), "route_request", return_value=o_response_1):
+                o_other.api_update()
+            self.assertEqual(o_stored_data["name"], "nom 1")
+            # Suppression : l'entité est oubliée
+            with patch.object(ApiRequester(), "route_request", return_value=None):
+                o_stored_data.api_delete()
+            self.assertIsNone(IdentityMap().get(StoredData, "1", "datastore", fresh=False))
+            # 404 lors d'une mise à jour : l'entité est oubliée
+            IdentityMap().register(o_stored_data)
+            with patch.object(ApiRequester(), "route_request", side_effect=NotFoundError("url", "GET", None, None, "non trouvé")):
+                with self.assertRaises(NotFoundError):
+                    o_stored_data.api_update()
+            self.assertIsNone(IdentityMap().get(StoredData, "1", "datastore", fresh=False))
+
+    def test_status_change(self) -> None:
+        """Un changement de statut (livraison, exécution) rend l'instance retenue périmée."""
+        with IdentityMap().session():
+            o_upload = Upload({"_id": "1"}, "datastore")
+            o_response = GpfTestCase.get_response(json={"_id": "1", "status": "OPEN"})
+            for s_function in ["api_open", "api_close", "api_run_checks"]:
+                IdentityMap().register(o_upload)
+                # api_update est neutralisé pour vérifier l'invalidation seule
+                with patch.object(ApiRequester(), "route_request", return_value=o_response), patch.object(Upload, "api_update"):
+                    if s_function == "api_run_checks":
+                        o_upload.api_run_checks(["check"])
+                    else:
+                        getattr(o_upload, s_function)()
+                self.assertIsNone(IdentityMap().get(Upload, "1", "datastore"), s_function)
+            o_execution = ProcessingExecution({"_id": "1"}, "datastore")
+            for s_function in ["api_launch", "api_abort"]:
+                IdentityMap().register(o_execution)
+                with patch.object(ApiRequester(), "route_request", return_value=o_response):
+                    getattr(o_execution, s_function)()
+                self.assertIsNone(IdentityMap().get(ProcessingExecution, "1", "datastore"), s_function)
@@ -1,11 +1,19 @@
+import asyncio
 import json
+import threading
 import time
-from typing import List
+from typing import Any, Dict, List, Set
 from unittest.mock import MagicMock, Mock, call, patch
 
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import BadRequestError, InternalServerError
+from sdk_entrepot_gpf.io.PageSizePolicy import PageSizePolicy
 from tests.GpfTestCase import GpfTestCase
 
 
@@ -15,6 +23,11 @@ class StoreEntityTestCase(GpfTestCase):
     cmd : python3 -m unittest -b tests.store.StoreEntityTestCase
     """
 
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe"""
+        # Tailles de pages négociées oubliées entre les tests
+        PageSizePolicy._instance = None  # pylint:disable=protected-access
+
     def test_init_getters(self) -> None:
         """Vérifie le bon fonctionnement du constructeur et des getters."""
         # Donnée renvoyée par l'API
@@ -201,8 +214,8 @@ class StoreEntityTestCase(GpfTestCase):
             self.assertListEqual(
                 o_mock_request.call_args_list,
                 [
-                    call("store_entity_list", route_params={"datastore": None}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 10}),
-                    call("store_entity_list", route_params={"datastore": None}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 2, "limit": 10}),
+                    call("store_entity_list", route_params={"datastore": None}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 100}, retry_timeout=False),
+                    call("store_entity_list", route_params={"datastore": None}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 2, "limit": 10}, retry_timeout=True),
                 ],
             )
             # Vérifications sur l_entities
@@ -224,7 +237,7 @@ class StoreEntityTestCase(GpfTestCase):
             self.assertListEqual(
                 o_mock_request.call_args_list,
                 [
-                    call("store_entity_list", route_params={"datastore": None}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 10}),
+                    call("store_entity_list", route_params={"datastore": None}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 10}, retry_timeout=True),
                 ],
             )
             # Vérifications sur l_entities
@@ -234,6 +247,186 @@ class StoreEntityTestCase(GpfTestCase):
                 self.assertIsInstance(o_entity, StoreEntity)
                 self.assertEqual(o_entity.id, str(i))
 
+    def test_api_list_concurrent(self) -> None:
+        """Vérifie que api_list récupère les pages suivant la première en parallèle, dans l'ordre des pages."""
+        l_threads: Set[str] = set()
+        d_total = {"nb": 45}
+
+        def route_request(*args: Any, **kwargs: Any) -> Any:  # pylint:disable=unused-argument
+            i_page = kwargs["params"]["page"]
+            l_threads.add(threading.current_thread().name)
+            # Les premières pages répondent plus lentement que les suivantes
+            time.sleep(0.01 * (6 - i_page))
+            i_min = (i_page - 1) * 10 + 1
+            i_max = min(i_page * 10, d_total["nb"])
+            return GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(i_min, i_max + 1)], headers={"Content-Range": f"{i_min}-{i_max}/{d_total['nb']}"})
+
+        # 45 entités : 1 page puis 4 pages en parallèle
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request) as o_mock_request:
+            l_entities = StoreEntity.api_list()
+        self.assertEqual(o_mock_request.call_count, 5)
+        self.assertListEqual([o_entity.id for o_entity in l_entities], [str(i) for i in range(1, 46)])
+        self.assertGreater(len(l_threads), 2)
+
+        # Entités ajoutées pendant le listing : la suite est récupérée page après page
+        d_calls: Dict[int, int] = {}
+
+        def route_request_growing(*args: Any, **kwargs: Any) -> Any:
+            i_page = kwargs["params"]["page"]
+            d_calls[i_page] = d_calls.get(i_page, 0) + 1
+            d_total["nb"] = 45 if i_page == 1 else 57
+            return route_request(*args, **kwargs)
+
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request_growing):
+            l_entities = StoreEntity.api_list()
+        self.assertDictEqual(d_calls, {1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1})
+        self.assertListEqual([o_entity.id for o_entity in l_entities], [str(i) for i in range(1, 58)])
+
+        # Erreur sur une page : propagée
+        def route_request_error(*args: Any, **kwargs: Any) -> Any:
+            if kwargs["params"]["page"] == 3:
+                raise InternalServerError("url", "GET", None, None)
+            d_total["nb"] = 45
+            return route_request(*args, **kwargs)
+
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request_error):
+            with self.assertRaises(InternalServerError):
+                StoreEntity.api_list()
+
+    def test_api_list_page_size(self) -> None:
+        """Vérifie que api_list négocie la taille des pages : maximum du serveur, refus (400) et délai dépassé."""
+        l_limits: List[int] = []
+        l_retry_timeouts: List[bool] = []
+        # Les réponses sont construites via requests_mock, qui ne supporte pas les appels simultanés
+        o_lock = threading.Lock()
+
+        def error(e_cause: Exception) -> GpfSdkError:
+            e_error = GpfSdkError("L'exécution d'une requête a échoué.")
+            e_error.__cause__ = e_cause
+            return e_error
+
+        def route_request(*args: Any, **kwargs: Any) -> Any:  # pylint:disable=unused-argument
+            i_page, i_limit = kwargs["params"]["page"], kwargs["params"]["limit"]
+            l_limits.append(i_limit)
+            # Tant que la taille peut être réduite, un délai dépassé n'est pas retenté par l'ApiRequester
+            l_retry_timeouts.append(kwargs["retry_timeout"])
+            # Taille refusée au-delà de 50, pages plafonnées à 20 éléments, pages de 20 trop lentes sauf la première
+            if i_limit > 50:
+                raise error(BadRequestError("url", "GET", None, None, "limit trop grand"))
+            if i_page > 1 and i_limit == 20:
+                raise error(requests.ReadTimeout())
+            i_limit = min(i_limit, 20)
+            i_min = (i_page - 1) * i_limit + 1
+            i_max = min(i_page * i_limit, 50)
+            with o_lock:
+                return GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(i_min, i_max + 1)], headers={"Content-Range": f"{i_min}-{i_max}/50"})
+
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request):
+            l_entities = StoreEntity.api_list()
+        self.assertListEqual([o_entity.id for o_entity in l_entities], [str(i) for i in range(1, 51)])
+        # 100 refusé (10 accepté : c'est bien la taille qui est refusée), 50 plafonné à 20, puis pages 2 et 3 de 20
+        # trop lentes : récupérées en demi-pages de 10
+        self.assertListEqual(l_limits[:3], [100, 10, 50])
+        self.assertListEqual(sorted(l_limits[3:]), [10, 10, 10, 10, 20, 20])
+        self.assertListEqual(l_retry_timeouts[:3], [False, True, False])
+        self.assertListEqual([b for i, b in zip(l_limits, l_retry_timeouts) if i == 10], [True] * 5)
+        # Taille retenue pour la route
+        self.assertEqual(PageSizePolicy().get("store_entity_list"), 10)
+        l_limits.clear()
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request):
+            l_entities = StoreEntity.api_list()
+        self.assertListEqual([o_entity.id for o_entity in l_entities], [str(i) for i in range(1, 51)])
+        self.assertListEqual(l_limits, [10] * 5)
+
+    def test_api_list_bad_request(self) -> None:
+        """Vérifie qu'un refus (400) qui ne concerne pas la taille des pages (filtre invalide) est levé sans réduire la taille."""
+        e_error = GpfSdkError("L'exécution d'une requête a échoué.")
+        e_error.__cause__ = BadRequestError("url", "GET", None, None, "filtre invalide")
+        with patch.object(ApiRequester(), "route_request", side_effect=e_error) as o_mock_request:
+            with self.assertRaises(GpfSdkError) as o_arc:
+                StoreEntity.api_list(infos_filter={"k": "invalide"})
+        self.assertIs(o_arc.exception, e_error)
+        # Une seule vérification avec la taille minimale
+        self.assertListEqual([o_call.kwargs["params"]["limit"] for o_call in o_mock_request.call_args_list], [100, 10])
+        self.assertEqual(PageSizePolicy().get("store_entity_list"), 100)
+
+    def test_api_iter(self) -> None:
+        """Vérifie que api_iter parcourt les entités page par page en récupérant la page suivante d'avance."""
+        l_pages: List[int] = []
+        o_page_requested = threading.Event()
+
+        def route_request(*args: Any, **kwargs: Any) -> Any:  # pylint:disable=unused-argument
+            i_page = kwargs["params"]["page"]
+            l_pages.append(i_page)
+            o_page_requested.set()
+            i_min = (i_page - 1) * 10 + 1
+            i_max = min(i_page * 10, 45)
+            return GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(i_min, i_max + 1)], headers={"Content-Range": f"{i_min}-{i_max}/45"})
+
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request) as o_mock_request:
+            # Parcours complet, dans l'ordre
+            self.assertListEqual([o_entity.id for o_entity in StoreEntity.api_iter(infos_filter={"k": "v"}, datastore="datastore1")], [str(i) for i in range(1, 46)])
+            self.assertListEqual(l_pages, [1, 2, 3, 4, 5])
+            self.assertEqual(
+                o_mock_request.call_args_list[0],
+                call("store_entity_list", route_params={"datastore": "datastore1"}, params={"k": "v", "page": 1, "limit": 100}, retry_timeout=False),
+            )
+
+            # La page suivante est demandée pendant le traitement de la page courante, pas plus
+            l_pages.clear()
+            o_page_requested.clear()
+            o_iterator = StoreEntity.api_iter()
+            self.assertEqual(next(o_iterator).id, "1")
+            # Page 2 demandée d'avance
+            while len(l_pages) < 2:
+                o_page_requested.wait(1)
+            self.assertListEqual(l_pages, [1, 2])
+            for _ in range(10):
+                next(o_iterator)
+            # On est sur la page 2 : page 3 demandée d'avance
+            while len(l_pages) < 3:
+                time.sleep(0.001)
+            # Arrêt du parcours par l'appelant : aucune autre page n'est demandée
+            o_iterator.close()
+            time.sleep(0.05)
+            self.assertListEqual(l_pages, [1, 2, 3])
+
+        # Sans Content-Range : une seule page
+        o_response = GpfTestCase.get_response(json=[{"_id": "1"}, {"_id": "2"}])
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            self.assertListEqual([o_entity.id for o_entity in StoreEntity.api_iter()], ["1", "2"])
+            o_mock_request.assert_called_once()
+
+    def test_api_iter_no_read_ahead(self) -> None:
+        """Vérifie que api_iter sans récupération d'avance ne demande la page suivante qu'une fois la page courante traitée."""
+        l_pages: List[int] = []
+        l_responses = [
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(i_page * 10 - 9, min(i_page * 10, 25) + 1)], headers={"Content-Range": f"{i_page * 10 - 9}-{min(i_page * 10, 25)}/25"})
+            for i_page in range(1, 4)
+        ]
+
+        def route_request(*args: Any, **kwargs: Any) -> Any:  # pylint:disable=unused-argument
+            l_pages.append(kwargs["params"]["page"])
+            # Récupération dans le thread de l'appelant
+            self.assertIs(threading.current_thread(), threading.main_thread())
+            return l_responses[kwargs["params"]["page"] - 1]
+
+        Config().get_parser().read_dict({"store_api": {"list_read_ahead": "0", "adaptive_nb_limit": "false"}})
+        try:
+            with patch.object(ApiRequester(), "route_request", side_effect=route_request):
+                o_iterator = StoreEntity.api_iter()
+                self.assertEqual(next(o_iterator).id, "1")
+                for _ in range(9):
+                    next(o_iterator)
+                self.assertListEqual(l_pages, [1])
+                # Page courante traitée : la page suivante est demandée
+                self.assertEqual(next(o_iterator).id, "11")
+                self.assertListEqual(l_pages, [1, 2])
+                self.assertListEqual([o_entity.id for o_entity in o_iterator], [str(i) for i in range(12, 26)])
+                self.assertListEqual(l_pages, [1, 2, 3])
+        finally:
+            Config._instance = None  # pylint:disable=protected-access
+
     def test_api_list_no_loop(self) -> None:
         """Vérifie le bon fonctionnement de api_list si on demande tout mais qu'on ne doit pas boucler.
         On ne doit pas boucler si Content-Range indique qu'on a tout récupéré, ou qu'il n'est pas défini ou qu'il est non parsable.
@@ -249,7 +442,8 @@ class StoreEntityTestCase(GpfTestCase):
             o_mock_request.assert_called_once_with(
                 "store_entity_list",
                 route_params={"datastore": "datastore1"},
-                params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 10},
+                params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 100},
+                retry_timeout=False,
             )
             # Vérifications sur l_entities
             self.assertIsInstance(l_entities, list)
@@ -268,7 +462,8 @@ class StoreEntityTestCase(GpfTestCase):
             o_mock_request.assert_called_once_with(
                 "store_entity_list",
                 route_params={"datastore": "datastore1"},
-                params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 10},
+                params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 100},
+                retry_timeout=False,
             )
             # Vérifications sur l_entities
             self.assertIsInstance(l_entities, list)
@@ -287,7 +482,8 @@ class StoreEntityTestCase(GpfTestCase):
             o_mock_request.assert_called_once_with(
                 "store_entity_list",
                 route_params={"datastore": "datastore1"},
-                params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 10},
+                params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": 1, "limit": 100},
+                retry_timeout=False,
             )
             # Vérifications sur l_entities
             self.assertIsInstance(l_entities, list)
@@ -337,6 +533,51 @@ class StoreEntityTestCase(GpfTestCase):
             # Vérification que les infos de l'entité sont maj
             self.assertDictEqual(o_store_entity.get_store_properties(), d_new_data)
 
+    def test_api_get_many(self) -> None:
+        """Vérifie que api_get_many récupère les entités en parallèle, dans l'ordre des identifiants."""
+        l_ids = [f"id_{i}" for i in range(10)]
+        # Réponses construites à l'avance : requests_mock ne supporte pas les appels simultanés
+        d_responses = {s_id: GpfTestCase.get_response(json={"_id": s_id}) for s_id in l_ids}
+        l_threads: Set[str] = set()
+
+        def route_request(*args: Any, **kwargs: Any) -> Any:  # pylint:disable=unused-argument
+            l_threads.add(threading.current_thread().name)
+            s_id = kwargs["route_params"]["store_entity"]
+            # Les premières entités répondent plus lentement que les suivantes
+            time.sleep(0.002 * (10 - int(s_id[3:])))
+            return d_responses[s_id]
+
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request) as o_mock_request:
+            l_entities = StoreEntity.api_get_many(l_ids, datastore="datastore_id")
+        self.assertListEqual([o_entity.id for o_entity in l_entities], l_ids)
+        self.assertTrue(all(o_entity.datastore == "datastore_id" for o_entity in l_entities))
+        self.assertEqual(o_mock_request.call_count, 10)
+        o_mock_request.assert_any_call("store_entity_get", route_params={"datastore": "datastore_id", "store_entity": "id_0"})
+        self.assertGreater(len(l_threads), 1)
+        # Liste vide : aucune requête
+        with patch.object(ApiRequester(), "route_request") as o_mock_request:
+            self.assertListEqual(StoreEntity.api_get_many([]), [])
+        o_mock_request.assert_not_called()
+
+    def test_api_update_many(self) -> None:
+        """Vérifie que api_update_many met à jour toutes les entités, et lève l'erreur d'une requête en échec."""
+        l_entities = [StoreEntity({"_id": f"id_{i}", "name": "ancien nom"}) for i in range(5)]
+        d_responses = {o_entity.id: GpfTestCase.get_response(json={"_id": o_entity.id, "name": f"nouveau nom {o_entity.id}"}) for o_entity in l_entities}
+
+        def route_request(*args: Any, **kwargs: Any) -> Any:  # pylint:disable=unused-argument
+            return d_responses[kwargs["route_params"]["store_entity"]]
+
+        with patch.object(ApiRequester(), "route_request", side_effect=route_request) as o_mock_request:
+            StoreEntity.api_update_many(l_entities)
+        self.assertEqual(o_mock_request.call_count, 5)
+        for o_entity in l_entities:
+            self.assertEqual(o_entity["name"], f"nouveau nom {o_entity.id}")
+        # Erreur sur une des entités
+        e_error = InternalServerError("url", "GET", None, None)
+        with patch.object(ApiRequester(), "route_request", side_effect=[e_error, *d_responses.values()][:5]):
+            with self.assertRaises(InternalServerError):
+                StoreEntity.api_update_many(l_entities)
+
     def test_eq(self) -> None:
         """Vérifie le bon fonctionnement de eq."""
         # Instanciation d'une Store entity
@@ -471,3 +712,24 @@ class StoreEntityTestCase(GpfTestCase):
         with self.assertRaises(StoreEntityError) as o_arc:
             o_store_entity.edit({"key": "val"})
         self.assertEqual("Il est impossible d'éditer cette entité.", o_arc.exception.message)
+
+    def test_api_async(self) -> None:
+        """Vérifie que les variantes asynchrones délèguent aux fonctions synchrones."""
+        o_entity = StoreEntity({"_id": "123456789"}, "datastore_1")
+
+        async def run_all() -> None:
+            await StoreEntity.api_create_async({"key": "value"}, route_params={"datastore": "datastore_1"})
+            await StoreEntity.api_get_async("123456789", datastore="datastore_1")
+            await StoreEntity.api_list_async(infos_filter={"k": "v"}, page=2, datastore="datastore_1")
+            await o_entity.api_delete_async()
+            await o_entity.api_update_async()
+
+        with patch.object(StoreEntity, "api_create", return_value=o_entity) as o_mock_create, patch.object(StoreEntity, "api_get", return_value=o_entity) as o_mock_get, patch.object(
+            StoreEntity, "api_list", return_value=[o_entity]
+        ) as o_mock_list, patch.object(StoreEntity, "api_delete", return_value=None) as o_mock_delete, patch.object(StoreEntity, "api_update", return_value=None) as o_mock_update:
+            asyncio.run(run_all())
+        o_mock_create.assert_called_once_with({"key": "value"}, route_params={"datastore": "datastore_1"})
+        o_mock_get.assert_called_once_with("123456789", datastore="datastore_1")
+        o_mock_list.assert_called_once_with(infos_filter={"k": "v"}, tags_filter=None, page=2, datastore="datastore_1")
+        o_mock_delete.assert_called_once_with()
+        o_mock_update.assert_called_once_with()
@@ -39,6 +39,7 @@ class UploadTestCase(GpfTestCase):
                 route_params={"datastore": "id_datastore", "upload": "id_de_test"},
                 params={"path": s_api_path + "/" + p_file_path.name},
                 method=ApiRequester.POST,
+                callback=None,
             )
 
     def test_api_push_md5_file(self) -> None:
@@ -63,6 +64,7 @@ class UploadTestCase(GpfTestCase):
                 s_key_file,
                 route_params={"datastore": None, "upload": "id_de_test"},
                 method=ApiRequester.POST,
+                callback=None,
             )
 
     def test_api_delete_data_file_1(self) -> None:
@@ -115,6 +115,8 @@ class UploadActionTestCase(GpfTestCase):
                 return "STOP"
             if b == "status_open":
                 return "OPEN"
+            if a == "deadline":
+                return "0"
             raise Exception("cas non prévu", a, b)
 
         l_return_api_list_comments = [{"text": "commentaire existe"}] if comment_exist else []